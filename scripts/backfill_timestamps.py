@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Backfill timestamp columns.
+
+Rewrites text timestamps of the date-windowed models (see
+studio.services.timestamps.TIMESTAMP_COLUMNS) into the canonical UTC form,
+so database-side range filters see them in chronological order.
+
+With --convert, the columns are then altered to timestamptz. Deploy that
+together with datetime annotations on the affected model fields and
+NATIVE_TIMESTAMPS=true.
+
+Usage:
+    python scripts/backfill_timestamps.py [--dry-run] [--convert]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 1000
+
+# Values already in the canonical form (2026-01-01T00:00:00.000000+00:00)
+CANONICAL_PATTERN = r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{6}\+00:00$"
+
+# Column types holding ISO-8601 text timestamps (str fields may map to VARCHAR)
+TEXT_TYPES = ("text", "character varying")
+
+
+async def _column_type(conn, table: str, column: str) -> str | None:
+    """Get the data type of a column, or None if it does not exist."""
+    return await conn.fetchval(
+        "SELECT data_type FROM information_schema.columns "
+        "WHERE table_schema = current_schema() AND table_name = $1 "
+        "AND column_name = $2",
+        table,
+        column,
+    )
+
+
+async def backfill_column(conn, table: str, column: str, dry_run: bool) -> int:
+    """
+    Rewrite non-canonical text timestamps of one column, in id order batches.
+
+    Returns:
+        Number of rows rewritten (or to rewrite, on a dry run)
+    """
+    from studio.services.timestamps import format_timestamp
+
+    rewritten = 0
+    last_id = ""
+    while True:
+        rows = await conn.fetch(
+            f'SELECT id, "{column}" AS value FROM "{table}" '
+            f'WHERE id > $1 AND "{column}" IS NOT NULL AND "{column}" <> \'\' '
+            f'AND "{column}" !~ $2 ORDER BY id LIMIT {BATCH_SIZE}',
+            last_id,
+            CANONICAL_PATTERN,
+        )
+        if not rows:
+            break
+        last_id = rows[-1]["id"]
+
+        updates = []
+        for row in rows:
+            try:
+                updates.append((row["id"], format_timestamp(row["value"])))
+            except ValueError:
+                logger.warning(
+                    f"Skipping {table}.{column} of {row['id']}: {row['value']!r}"
+                )
+
+        if updates and not dry_run:
+            await conn.executemany(
+                f'UPDATE "{table}" SET "{column}" = $2 WHERE id = $1', updates
+            )
+        rewritten += len(updates)
+
+    return rewritten
+
+
+async def convert_column(conn, table: str, column: str, data_type: str) -> None:
+    """Alter a text or timestamp column to timestamptz."""
+    if data_type == "timestamp without time zone":
+        using = f"\"{column}\" AT TIME ZONE 'UTC'"
+    else:
+        using = f"NULLIF(\"{column}\", '')::timestamptz"
+
+    await conn.execute(
+        f'ALTER TABLE "{table}" ALTER COLUMN "{column}" TYPE timestamptz '
+        f"USING {using}"
+    )
+
+
+async def backfill_timestamps(dry_run: bool = False, convert: bool = False) -> bool:
+    """Backfill (and optionally convert) all windowed timestamp columns."""
+    # Import after path is set
+    import asyncpg
+
+    from studio.models.indexes import table_name
+    from studio.services.read_repository import get_direct_database_url
+    from studio.services.timestamps import TIMESTAMP_COLUMNS
+
+    conn = await asyncpg.connect(get_direct_database_url())
+    success = True
+    try:
+        for model_name, columns in TIMESTAMP_COLUMNS.items():
+            table = table_name(model_name)
+            for column in columns:
+                data_type = await _column_type(conn, table, column)
+                if data_type is None:
+                    logger.warning(f"✗ {table}.{column} does not exist")
+                    continue
+
+                try:
+                    if data_type in TEXT_TYPES:
+                        count = await backfill_column(conn, table, column, dry_run)
+                        verb = "would rewrite" if dry_run else "rewrote"
+                        logger.info(f"✓ {table}.{column}: {verb} {count} rows")
+
+                    if convert and data_type != "timestamp with time zone":
+                        if dry_run:
+                            logger.info(f"✓ {table}.{column}: would convert")
+                        else:
+                            await convert_column(conn, table, column, data_type)
+                            logger.info(f"✓ {table}.{column}: converted")
+                except asyncpg.PostgresError as e:
+                    logger.error(f"✗ Failed to backfill {table}.{column}: {e}")
+                    success = False
+    finally:
+        await conn.close()
+
+    return success
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--dry-run", action="store_true", help="Only report")
+    parser.add_argument(
+        "--convert", action="store_true", help="Alter columns to timestamptz"
+    )
+    args = parser.parse_args()
+
+    success = asyncio.run(backfill_timestamps(args.dry_run, args.convert))
+    sys.exit(0 if success else 1)
@@ -4,7 +4,8 @@ Agent Execution API
 Endpoints for executing agents with real LLM calls.
 """
 
-import json
+import logging
+import time
 import uuid
 from datetime import UTC, datetime
 
@@ -13,11 +14,30 @@ from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from studio.api.auth import get_current_user
+from studio.container import get_container
 from studio.services.agent_service import AgentService
+from studio.services.billing_service import BillingService
 from studio.services.llm_service import LLMService
+from studio.services.metrics_service import MetricsService
+from studio.services.stream_framer import StreamFramer, encode_event
+from studio.services.token_estimator import TokenEstimator, normalize_usage
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/agents", tags=["agent-execution"])
 
+token_estimator = TokenEstimator()
+
+
+def get_agent_service() -> AgentService:
+    """Get the shared AgentService instance."""
+    return get_container().get(AgentService)
+
+
+def get_llm_service() -> LLMService:
+    """Get the shared LLMService instance."""
+    return get_container().get(LLMService)
+
 
 class ExecuteAgentRequest(BaseModel):
     """Request model for agent execution."""
@@ -40,11 +60,71 @@ class ExecuteAgentResponse(BaseModel):
     timestamp: str = Field(..., description="Response timestamp")
 
 
+async def record_execution_usage(
+    agent: dict,
+    model: str,
+    usage: dict | None,
+    latency_ms: int,
+    status: str = "success",
+    error_message: str | None = None,
+) -> None:
+    """
+    Record provider-reported token usage for an agent execution.
+
+    Writes an ExecutionMetric with the real token counts and cost, and records
+    token and execution usage for billing. Failures are logged, never raised.
+
+    Args:
+        agent: Executed agent
+        model: Normalized model identifier used for pricing
+        usage: Provider usage block from LLMService
+        latency_ms: Execution latency in milliseconds
+        status: Execution status (success, failure)
+        error_message: Optional error message for failed executions
+    """
+    tokens = normalize_usage(usage)
+    cost_usd = token_estimator.estimate_cost(model, tokens["input"], tokens["output"])
+    organization_id = agent["organization_id"]
+    container = get_container()
+
+    try:
+        await container.get(MetricsService).record(
+            {
+                "organization_id": organization_id,
+                "deployment_id": "",
+                "agent_id": agent["id"],
+                "status": status,
+                "latency_ms": latency_ms,
+                "input_tokens": tokens["input"],
+                "output_tokens": tokens["output"],
+                "total_tokens": tokens["total"],
+                "cost_usd": cost_usd,
+                "error_type": "execution_error" if error_message else None,
+                "error_message": error_message,
+            }
+        )
+
+        billing_service = container.get(BillingService)
+        metadata = {"agent_id": agent["id"], "model": model, "cost_usd": cost_usd}
+        await billing_service.record_usage(
+            organization_id, "agent_execution", 1, metadata
+        )
+        if tokens["total"]:
+            # Token pricing is per 1000 tokens
+            await billing_service.record_usage(
+                organization_id, "token", tokens["total"] / 1000, metadata
+            )
+    except Exception as e:
+        logger.warning(f"Failed to record usage for agent {agent.get('id')}: {e}")
+
+
 @router.post("/{agent_id}/execute", response_model=ExecuteAgentResponse)
 async def execute_agent(
     agent_id: str,
     request: ExecuteAgentRequest,
     current_user: dict = Depends(get_current_user),
+    agent_service: AgentService = Depends(get_agent_service),
+    llm_service: LLMService = Depends(get_llm_service),
 ):
     """
     Execute an agent with a user message.
@@ -52,9 +132,6 @@ async def execute_agent(
     This endpoint sends the message to the configured LLM (OpenAI, Anthropic, etc.)
     using the agent's system prompt and configuration.
     """
-    agent_service = AgentService()
-    llm_service = LLMService()
-
     # Get agent details
     agent = await agent_service.get(agent_id)
     if not agent:
@@ -79,6 +156,7 @@ async def execute_agent(
         )
 
     # Execute chat completion
+    start_time = time.time()
     try:
         result = await llm_service.chat_completion(
             model_id=model_id,
@@ -87,8 +165,21 @@ async def execute_agent(
             temperature=agent.get("temperature", 0.7),
             max_tokens=agent.get("max_tokens", 4096),
             conversation_history=request.conversation_history,
+            coalesce=bool(agent.get("coalesce_requests", True)),
+            coalesce_nondeterministic=bool(
+                agent.get("coalesce_nondeterministic", False)
+            ),
         )
 
+        # Coalesced results share one provider call that is billed to its leader
+        if not result.get("coalesced"):
+            await record_execution_usage(
+                agent,
+                llm_service.normalize_model(model_id),
+                result["usage"],
+                int((time.time() - start_time) * 1000),
+            )
+
         return ExecuteAgentResponse(
             content=result["content"],
             model=result["model"],
@@ -109,15 +200,14 @@ async def execute_agent_stream(
     agent_id: str,
     request: ExecuteAgentRequest,
     current_user: dict = Depends(get_current_user),
+    agent_service: AgentService = Depends(get_agent_service),
+    llm_service: LLMService = Depends(get_llm_service),
 ):
     """
     Execute an agent with streaming response.
 
     Returns a Server-Sent Events stream of the agent's response.
     """
-    agent_service = AgentService()
-    llm_service = LLMService()
-
     # Get agent details
     agent = await agent_service.get(agent_id)
     if not agent:
@@ -144,6 +234,7 @@ async def execute_agent_stream(
     async def generate():
         """Generate SSE events from LLM stream."""
         thread_id = str(uuid.uuid4())
+        framer = StreamFramer(thread_id)
 
         try:
             # Send start event
@@ -153,31 +244,43 @@ async def execute_agent_stream(
                 "model": model_id,
                 "timestamp": datetime.now(UTC).isoformat(),
             }
-            yield f"event: start\ndata: {json.dumps(start_event)}\n\n"
+            yield encode_event("start", start_event)
 
-            # Stream content
-            async for chunk in llm_service.chat_completion_stream(
+            # Stream content, coalescing provider deltas into frames
+            start_time = time.time()
+            usage = {}
+            stream = llm_service.chat_completion_stream(
                 model_id=model_id,
                 system_prompt=agent.get("system_prompt", ""),
                 user_message=request.message,
                 temperature=agent.get("temperature", 0.7),
                 max_tokens=agent.get("max_tokens", 4096),
                 conversation_history=request.conversation_history,
-            ):
-                chunk_event = {
-                    "type": "content",
-                    "content": chunk,
-                    "thread_id": thread_id,
-                }
-                yield f"event: content\ndata: {json.dumps(chunk_event)}\n\n"
+                coalesce=bool(agent.get("coalesce_requests", True)),
+                coalesce_nondeterministic=bool(
+                    agent.get("coalesce_nondeterministic", False)
+                ),
+                usage=usage,
+            )
+            async for frame in framer.frames(stream):
+                yield frame
+
+            if not usage.get("coalesced"):
+                await record_execution_usage(
+                    agent,
+                    llm_service.normalize_model(model_id),
+                    usage,
+                    int((time.time() - start_time) * 1000),
+                )
 
             # Send done event
             done_event = {
                 "type": "done",
                 "thread_id": thread_id,
+                "usage": usage,
                 "timestamp": datetime.now(UTC).isoformat(),
             }
-            yield f"event: done\ndata: {json.dumps(done_event)}\n\n"
+            yield encode_event("done", done_event)
 
         except Exception as e:
             error_event = {
@@ -185,7 +288,7 @@ async def execute_agent_stream(
                 "error": str(e),
                 "thread_id": thread_id,
             }
-            yield f"event: error\ndata: {json.dumps(error_event)}\n\n"
+            yield encode_event("error", error_event)
 
     return StreamingResponse(
         generate(),
@@ -202,15 +305,14 @@ async def execute_agent_stream(
 async def check_agent_execution_status(
     agent_id: str,
     current_user: dict = Depends(get_current_user),
+    agent_service: AgentService = Depends(get_agent_service),
+    llm_service: LLMService = Depends(get_llm_service),
 ):
     """
     Check if an agent can be executed.
 
     Returns configuration status for the agent's LLM provider.
     """
-    agent_service = AgentService()
-    llm_service = LLMService()
-
     # Get agent details
     agent = await agent_service.get(agent_id)
     if not agent:
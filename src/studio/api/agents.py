@@ -51,6 +51,8 @@ class CreateAgentRequest(BaseModel):
     system_prompt: str | None = Field(None, max_length=10000)
     temperature: float = Field(default=0.7, ge=0.0, le=2.0)
     max_tokens: int | None = Field(default=0, ge=0)
+    coalesce_requests: bool = Field(default=True)
+    coalesce_nondeterministic: bool = Field(default=False)
 
 
 class UpdateAgentRequest(BaseModel):
@@ -63,6 +65,8 @@ class UpdateAgentRequest(BaseModel):
     temperature: float | None = Field(None, ge=0.0, le=2.0)
     max_tokens: int | None = Field(None, ge=0)
     status: str | None = Field(None, pattern=r"^(draft|active|archived)$")
+    coalesce_requests: bool | None = None
+    coalesce_nondeterministic: bool | None = None
 
 
 class CreateVersionRequest(BaseModel):
@@ -130,6 +134,8 @@ class AgentResponse(BaseModel):
     model_id: str
     temperature: float
     max_tokens: int
+    coalesce_requests: bool = True
+    coalesce_nondeterministic: bool = False
     created_by: str
     created_at: str
     updated_at: str
@@ -187,6 +193,8 @@ class AgentWithDetailsResponse(BaseModel):
     model_id: str
     temperature: float
     max_tokens: int
+    coalesce_requests: bool = True
+    coalesce_nondeterministic: bool = False
     created_by: str
     created_at: str
     updated_at: str
@@ -260,6 +268,8 @@ async def create_agent(
         system_prompt=request.system_prompt or "",
         temperature=request.temperature,
         max_tokens=request.max_tokens or 0,
+        coalesce_requests=request.coalesce_requests,
+        coalesce_nondeterministic=request.coalesce_nondeterministic,
     )
     return AgentResponse(**agent)
 
@@ -313,6 +323,8 @@ async def get_agent(
         model_id=agent["model_id"],
         temperature=agent["temperature"],
         max_tokens=agent.get("max_tokens", 0),
+        coalesce_requests=agent.get("coalesce_requests", True),
+        coalesce_nondeterministic=agent.get("coalesce_nondeterministic", False),
         created_by=agent["created_by"],
         created_at=agent["created_at"],
         updated_at=agent["updated_at"],
@@ -6,9 +6,10 @@ FastAPI router for API key management endpoints.
 
 import logging
 
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel, Field
 
+from studio.container import get_container
 from studio.services.api_key_service import API_KEY_SCOPES, APIKeyService
 from studio.services.rate_limit_service import RateLimitService
 
@@ -90,6 +91,16 @@ def get_current_user(request: Request) -> dict:
     }
 
 
+def get_api_key_service() -> APIKeyService:
+    """Get the shared APIKeyService instance."""
+    return get_container().get(APIKeyService)
+
+
+def get_rate_limit_service() -> RateLimitService:
+    """Get the shared RateLimitService instance."""
+    return get_container().get(RateLimitService)
+
+
 @router.get("/scopes", response_model=APIKeyScopesResponse)
 async def list_available_scopes():
     """
@@ -104,6 +115,7 @@ async def list_available_scopes():
 async def create_api_key(
     data: CreateAPIKeyRequest,
     request: Request,
+    service: APIKeyService = Depends(get_api_key_service),
 ):
     """
     Create a new API key.
@@ -112,7 +124,6 @@ async def create_api_key(
     the full key will be shown - it cannot be retrieved later.
     """
     user = get_current_user(request)
-    service = APIKeyService()
 
     # Validate scopes
     invalid_scopes = [s for s in data.scopes if s not in API_KEY_SCOPES]
@@ -138,28 +149,33 @@ async def create_api_key(
 
 
 @router.get("", response_model=list[APIKeyResponse])
-async def list_api_keys(request: Request):
+async def list_api_keys(
+    request: Request,
+    service: APIKeyService = Depends(get_api_key_service),
+):
     """
     List all API keys for the organization.
 
     Returns key metadata but not the actual key values.
     """
     user = get_current_user(request)
-    service = APIKeyService()
 
     keys = await service.list(user["org_id"])
     return keys
 
 
 @router.get("/{key_id}", response_model=APIKeyResponse)
-async def get_api_key(key_id: str, request: Request):
+async def get_api_key(
+    key_id: str,
+    request: Request,
+    service: APIKeyService = Depends(get_api_key_service),
+):
     """
     Get details of a specific API key.
 
     Returns key metadata but not the actual key value.
     """
     user = get_current_user(request)
-    service = APIKeyService()
 
     try:
         key = await service.get(key_id)
@@ -177,14 +193,17 @@ async def get_api_key(key_id: str, request: Request):
 
 
 @router.delete("/{key_id}")
-async def revoke_api_key(key_id: str, request: Request):
+async def revoke_api_key(
+    key_id: str,
+    request: Request,
+    service: APIKeyService = Depends(get_api_key_service),
+):
     """
     Revoke an API key.
 
     The key will no longer be valid for authentication.
     """
     user = get_current_user(request)
-    service = APIKeyService()
 
     try:
         key = await service.get(key_id)
@@ -204,15 +223,18 @@ async def revoke_api_key(key_id: str, request: Request):
 
 
 @router.get("/{key_id}/usage", response_model=APIKeyUsageResponse)
-async def get_api_key_usage(key_id: str, request: Request):
+async def get_api_key_usage(
+    key_id: str,
+    request: Request,
+    api_key_service: APIKeyService = Depends(get_api_key_service),
+    rate_limit_service: RateLimitService = Depends(get_rate_limit_service),
+):
     """
     Get usage statistics for an API key.
 
     Returns current rate limit usage for the key.
     """
     user = get_current_user(request)
-    api_key_service = APIKeyService()
-    rate_limit_service = RateLimitService()
 
     key = await api_key_service.get(key_id)
     if not key:
@@ -9,6 +9,7 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from kailash.runtime import AsyncLocalRuntime
 from pydantic import BaseModel, EmailStr, Field
 
+from studio.container import get_container
 from studio.services.auth_service import AuthService
 from studio.services.rbac_service import RBACService
 
@@ -20,18 +21,18 @@ security = HTTPBearer()
 
 # Dependency factory functions
 def get_runtime() -> AsyncLocalRuntime:
-    """Get AsyncLocalRuntime for dependency injection."""
-    return AsyncLocalRuntime()
+    """Get the shared AsyncLocalRuntime for dependency injection."""
+    return get_container().runtime
 
 
-def get_auth_service(runtime: AsyncLocalRuntime = Depends(get_runtime)) -> AuthService:
-    """Get AuthService with injected runtime."""
-    return AuthService(runtime=runtime)
+def get_auth_service() -> AuthService:
+    """Get the shared AuthService instance."""
+    return get_container().get(AuthService)
 
 
-def get_rbac_service(runtime: AsyncLocalRuntime = Depends(get_runtime)) -> RBACService:
-    """Get RBACService with injected runtime."""
-    return RBACService(runtime=runtime)
+def get_rbac_service() -> RBACService:
+    """Get the shared RBACService instance."""
+    return get_container().get(RBACService)
 
 
 # Request/Response Models
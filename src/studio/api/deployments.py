@@ -4,15 +4,21 @@ Deployment API Routes
 API endpoints for managing agent deployments.
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
 
+from studio.container import get_container
 from studio.middleware.rbac import require_permission
 from studio.services.deployment_service import DeploymentService
 
 router = APIRouter(prefix="/deployments", tags=["Deployments"])
 
 
+def get_deployment_service() -> DeploymentService:
+    """Get the shared DeploymentService instance."""
+    return get_container().get(DeploymentService)
+
+
 class DeploymentCreate(BaseModel):
     """Create deployment request."""
 
@@ -23,7 +29,9 @@ class DeploymentCreate(BaseModel):
 
 @router.post("")
 async def create_deployment(
-    data: DeploymentCreate, user: dict = require_permission("deployments:create")
+    data: DeploymentCreate,
+    user: dict = require_permission("deployments:create"),
+    service: DeploymentService = Depends(get_deployment_service),
 ):
     """
     Create and start a new deployment.
@@ -31,8 +39,6 @@ async def create_deployment(
     Deploys an agent to the specified gateway.
     Requires deployments:create permission.
     """
-    service = DeploymentService()
-
     try:
         deployment = await service.deploy(
             agent_id=data.agent_id,
@@ -53,6 +59,7 @@ async def list_deployments(
     gateway_id: str | None = None,
     status: str | None = None,
     user: dict = require_permission("deployments:read"),
+    service: DeploymentService = Depends(get_deployment_service),
 ):
     """
     List deployments for the organization.
@@ -60,8 +67,6 @@ async def list_deployments(
     Supports filtering by agent, gateway, and status.
     Requires deployments:read permission.
     """
-    service = DeploymentService()
-
     deployments = await service.list(
         organization_id=user["organization_id"],
         agent_id=agent_id,
@@ -73,15 +78,15 @@ async def list_deployments(
 
 @router.get("/{deployment_id}")
 async def get_deployment(
-    deployment_id: str, user: dict = require_permission("deployments:read")
+    deployment_id: str,
+    user: dict = require_permission("deployments:read"),
+    service: DeploymentService = Depends(get_deployment_service),
 ):
     """
     Get a deployment by ID.
 
     Requires deployments:read permission.
     """
-    service = DeploymentService()
-
     deployment = await service.get(deployment_id)
     if not deployment:
         raise HTTPException(status_code=404, detail="Deployment not found")
@@ -94,7 +99,9 @@ async def get_deployment(
 
 @router.post("/{deployment_id}/stop")
 async def stop_deployment(
-    deployment_id: str, user: dict = require_permission("deployments:delete")
+    deployment_id: str,
+    user: dict = require_permission("deployments:delete"),
+    service: DeploymentService = Depends(get_deployment_service),
 ):
     """
     Stop a deployment.
@@ -102,8 +109,6 @@ async def stop_deployment(
     Stops the agent on the gateway and updates status.
     Requires deployments:delete permission.
     """
-    service = DeploymentService()
-
     # Verify ownership
     deployment = await service.get(deployment_id)
     if not deployment:
@@ -121,7 +126,9 @@ async def stop_deployment(
 
 @router.post("/{deployment_id}/redeploy")
 async def redeploy(
-    deployment_id: str, user: dict = require_permission("deployments:update")
+    deployment_id: str,
+    user: dict = require_permission("deployments:update"),
+    service: DeploymentService = Depends(get_deployment_service),
 ):
     """
     Redeploy an existing deployment.
@@ -129,8 +136,6 @@ async def redeploy(
     Stops current deployment and creates a new one with same parameters.
     Requires deployments:update permission.
     """
-    service = DeploymentService()
-
     # Verify ownership
     deployment = await service.get(deployment_id)
     if not deployment:
@@ -148,7 +153,9 @@ async def redeploy(
 
 @router.get("/{deployment_id}/logs")
 async def get_deployment_logs(
-    deployment_id: str, user: dict = require_permission("deployments:read")
+    deployment_id: str,
+    user: dict = require_permission("deployments:read"),
+    service: DeploymentService = Depends(get_deployment_service),
 ):
     """
     Get logs for a deployment.
@@ -156,8 +163,6 @@ async def get_deployment_logs(
     Returns deployment lifecycle events.
     Requires deployments:read permission.
     """
-    service = DeploymentService()
-
     # Verify ownership
     deployment = await service.get(deployment_id)
     if not deployment:
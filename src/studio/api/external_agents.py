@@ -9,6 +9,7 @@ from kailash.runtime import AsyncLocalRuntime
 from pydantic import BaseModel, Field
 
 from studio.api.auth import require_permission
+from studio.container import get_container
 from studio.services.external_agent_service import ExternalAgentService
 
 router = APIRouter(prefix="/external-agents", tags=["External Agents"])
@@ -16,15 +17,13 @@ router = APIRouter(prefix="/external-agents", tags=["External Agents"])
 
 # Dependency factory functions
 def get_runtime() -> AsyncLocalRuntime:
-    """Get AsyncLocalRuntime for dependency injection."""
-    return AsyncLocalRuntime()
+    """Get the shared AsyncLocalRuntime for dependency injection."""
+    return get_container().runtime
 
 
-def get_external_agent_service(
-    runtime: AsyncLocalRuntime = Depends(get_runtime),
-) -> ExternalAgentService:
-    """Get ExternalAgentService with injected runtime."""
-    return ExternalAgentService(runtime=runtime)
+def get_external_agent_service() -> ExternalAgentService:
+    """Get the shared ExternalAgentService instance."""
+    return get_container().get(ExternalAgentService)
 
 
 # ===================
@@ -896,9 +895,9 @@ async def approve_request(
             )
 
         from studio_kaizen.trust.governance import (
-            ApprovalNotFoundError,
-            ApprovalExpiredError,
             AlreadyDecidedError,
+            ApprovalExpiredError,
+            ApprovalNotFoundError,
             SelfApprovalNotAllowedError,
             UnauthorizedApproverError,
         )
@@ -979,8 +978,8 @@ async def reject_request(
             )
 
         from studio_kaizen.trust.governance import (
-            ApprovalNotFoundError,
             AlreadyDecidedError,
+            ApprovalNotFoundError,
             UnauthorizedApproverError,
         )
 
@@ -4,15 +4,21 @@ Gateway API Routes
 API endpoints for managing Nexus gateways.
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
 
+from studio.container import get_container
 from studio.middleware.rbac import require_permission
 from studio.services.gateway_service import GatewayService
 
 router = APIRouter(prefix="/gateways", tags=["Gateways"])
 
 
+def get_gateway_service() -> GatewayService:
+    """Get the shared GatewayService instance."""
+    return get_container().get(GatewayService)
+
+
 class GatewayCreate(BaseModel):
     """Create gateway request."""
 
@@ -38,15 +44,15 @@ class GatewayUpdate(BaseModel):
 
 @router.post("")
 async def create_gateway(
-    data: GatewayCreate, user: dict = require_permission("deployments:create")
+    data: GatewayCreate,
+    user: dict = require_permission("deployments:create"),
+    service: GatewayService = Depends(get_gateway_service),
 ):
     """
     Create a new gateway.
 
     Requires deployments:create permission.
     """
-    service = GatewayService()
-
     gateway_data = data.model_dump()
     gateway_data["organization_id"] = user["organization_id"]
 
@@ -58,14 +64,13 @@ async def create_gateway(
 async def list_gateways(
     environment: str | None = None,
     user: dict = require_permission("deployments:read"),
+    service: GatewayService = Depends(get_gateway_service),
 ):
     """
     List gateways for the organization.
 
     Requires deployments:read permission.
     """
-    service = GatewayService()
-
     gateways = await service.list(
         organization_id=user["organization_id"], environment=environment
     )
@@ -74,15 +79,15 @@ async def list_gateways(
 
 @router.get("/{gateway_id}")
 async def get_gateway(
-    gateway_id: str, user: dict = require_permission("deployments:read")
+    gateway_id: str,
+    user: dict = require_permission("deployments:read"),
+    service: GatewayService = Depends(get_gateway_service),
 ):
     """
     Get a gateway by ID.
 
     Requires deployments:read permission.
     """
-    service = GatewayService()
-
     gateway = await service.get(gateway_id)
     if not gateway:
         raise HTTPException(status_code=404, detail="Gateway not found")
@@ -98,14 +103,13 @@ async def update_gateway(
     gateway_id: str,
     data: GatewayUpdate,
     user: dict = require_permission("deployments:update"),
+    service: GatewayService = Depends(get_gateway_service),
 ):
     """
     Update a gateway.
 
     Requires deployments:update permission.
     """
-    service = GatewayService()
-
     # Verify ownership
     gateway = await service.get(gateway_id)
     if not gateway:
@@ -123,15 +127,15 @@ async def update_gateway(
 
 @router.delete("/{gateway_id}")
 async def delete_gateway(
-    gateway_id: str, user: dict = require_permission("deployments:delete")
+    gateway_id: str,
+    user: dict = require_permission("deployments:delete"),
+    service: GatewayService = Depends(get_gateway_service),
 ):
     """
     Delete a gateway.
 
     Requires deployments:delete permission.
     """
-    service = GatewayService()
-
     # Verify ownership
     gateway = await service.get(gateway_id)
     if not gateway:
@@ -146,15 +150,15 @@ async def delete_gateway(
 
 @router.post("/{gateway_id}/health")
 async def check_gateway_health(
-    gateway_id: str, user: dict = require_permission("deployments:read")
+    gateway_id: str,
+    user: dict = require_permission("deployments:read"),
+    service: GatewayService = Depends(get_gateway_service),
 ):
     """
     Check health of a gateway.
 
     Requires deployments:read permission.
     """
-    service = GatewayService()
-
     # Verify ownership
     gateway = await service.get(gateway_id)
     if not gateway:
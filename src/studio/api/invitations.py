@@ -9,6 +9,7 @@ from kailash.runtime import AsyncLocalRuntime
 from pydantic import BaseModel, EmailStr, Field
 
 from studio.api.auth import get_current_user
+from studio.container import get_container
 from studio.services.invitation_service import InvitationService
 from studio.services.user_service import UserService
 
@@ -23,8 +24,8 @@ class MessageResponse(BaseModel):
 
 # Dependency factory functions
 def get_runtime() -> AsyncLocalRuntime:
-    """Get AsyncLocalRuntime for dependency injection."""
-    return AsyncLocalRuntime()
+    """Get the shared AsyncLocalRuntime for dependency injection."""
+    return get_container().runtime
 
 
 def get_invitation_service(
@@ -9,6 +9,7 @@ from kailash.runtime import AsyncLocalRuntime
 from pydantic import BaseModel
 
 from studio.api.auth import require_permission
+from studio.container import get_container
 from studio.services.lineage_service import LineageService
 
 router = APIRouter(prefix="/lineage", tags=["Lineage"])
@@ -16,8 +17,8 @@ router = APIRouter(prefix="/lineage", tags=["Lineage"])
 
 # Dependency factory functions
 def get_runtime() -> AsyncLocalRuntime:
-    """Get AsyncLocalRuntime for dependency injection."""
-    return AsyncLocalRuntime()
+    """Get the shared AsyncLocalRuntime for dependency injection."""
+    return get_container().runtime
 
 
 def get_lineage_service(
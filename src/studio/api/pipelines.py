@@ -392,7 +392,7 @@ async def update_node(
     if not update_data:
         raise HTTPException(status_code=400, detail="No fields to update")
 
-    node = await service.update_node(node_id, update_data)
+    node = await service.update_node(node_id, update_data, pipeline_id=pipeline_id)
     if not node:
         raise HTTPException(status_code=404, detail="Node not found")
 
@@ -424,7 +424,7 @@ async def remove_node(
     if not node:
         raise HTTPException(status_code=404, detail="Node not found")
 
-    await service.remove_node(node_id)
+    await service.remove_node(node_id, pipeline_id=pipeline_id)
     return {"message": "Node removed"}
 
 
@@ -503,5 +503,5 @@ async def remove_connection(
     if not connection:
         raise HTTPException(status_code=404, detail="Connection not found")
 
-    await service.remove_connection(connection_id)
+    await service.remove_connection(connection_id, pipeline_id=pipeline_id)
     return {"message": "Connection removed"}
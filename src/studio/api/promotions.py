@@ -8,6 +8,7 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from kailash.runtime import AsyncLocalRuntime
 from pydantic import BaseModel, Field
 
+from studio.container import get_container
 from studio.middleware.rbac import require_permission
 from studio.services.promotion_service import PromotionService
 
@@ -16,8 +17,8 @@ router = APIRouter(prefix="/promotions", tags=["Promotions"])
 
 # Dependency factory functions
 def get_runtime() -> AsyncLocalRuntime:
-    """Get AsyncLocalRuntime for dependency injection."""
-    return AsyncLocalRuntime()
+    """Get the shared AsyncLocalRuntime for dependency injection."""
+    return get_container().runtime
 
 
 def get_promotion_service(
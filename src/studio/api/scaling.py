@@ -8,6 +8,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from kailash.runtime import AsyncLocalRuntime
 from pydantic import BaseModel, Field
 
+from studio.container import get_container
 from studio.services.scaling_service import ScalingService
 
 router = APIRouter(prefix="/scaling", tags=["Scaling"])
@@ -15,8 +16,8 @@ router = APIRouter(prefix="/scaling", tags=["Scaling"])
 
 # Dependency factory functions
 def get_runtime() -> AsyncLocalRuntime:
-    """Get AsyncLocalRuntime for dependency injection."""
-    return AsyncLocalRuntime()
+    """Get the shared AsyncLocalRuntime for dependency injection."""
+    return get_container().runtime
 
 
 def get_scaling_service() -> ScalingService:
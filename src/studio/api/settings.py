@@ -13,6 +13,7 @@ from kailash.workflow.builder import WorkflowBuilder
 from pydantic import BaseModel, Field
 
 from studio.api.auth import get_current_user
+from studio.container import get_container
 
 router = APIRouter(prefix="/settings", tags=["Settings"])
 
@@ -102,8 +103,8 @@ class UpdateUserSettingsRequest(BaseModel):
 
 
 def get_runtime() -> AsyncLocalRuntime:
-    """Get AsyncLocalRuntime for dependency injection."""
-    return AsyncLocalRuntime()
+    """Get the shared AsyncLocalRuntime for dependency injection."""
+    return get_container().runtime
 
 
 @router.get("/organization", response_model=OrganizationSettingsResponse)
@@ -13,6 +13,7 @@ from pydantic import BaseModel
 
 from studio.api.auth import get_current_user
 from studio.config import get_settings
+from studio.container import get_container
 from studio.middleware.rbac import require_role
 from studio.services.auth_service import AuthService
 from studio.services.sso_service import SSOService
@@ -103,18 +104,18 @@ def is_public_email_domain(domain: str) -> bool:
 
 # Dependency factory functions
 def get_runtime() -> AsyncLocalRuntime:
-    """Get AsyncLocalRuntime for dependency injection."""
-    return AsyncLocalRuntime()
+    """Get the shared AsyncLocalRuntime for dependency injection."""
+    return get_container().runtime
 
 
 def get_sso_service() -> SSOService:
-    """Get SSOService instance."""
-    return SSOService()
+    """Get the shared SSOService instance."""
+    return get_container().get(SSOService)
 
 
-def get_auth_service(runtime: AsyncLocalRuntime = Depends(get_runtime)) -> AuthService:
-    """Get AuthService with injected runtime."""
-    return AuthService(runtime=runtime)
+def get_auth_service() -> AuthService:
+    """Get the shared AuthService instance."""
+    return get_container().get(AuthService)
 
 
 # Request/Response models
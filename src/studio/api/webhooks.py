@@ -10,6 +10,7 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from kailash.runtime import AsyncLocalRuntime
 from pydantic import BaseModel, Field
 
+from studio.container import get_container
 from studio.services.webhook_service import WEBHOOK_EVENTS, WebhookService
 
 logger = logging.getLogger(__name__)
@@ -19,8 +20,8 @@ router = APIRouter(prefix="/webhooks", tags=["Webhooks"])
 
 # Dependency factory functions
 def get_runtime() -> AsyncLocalRuntime:
-    """Get AsyncLocalRuntime for dependency injection."""
-    return AsyncLocalRuntime()
+    """Get the shared AsyncLocalRuntime for dependency injection."""
+    return get_container().runtime
 
 
 def get_webhook_service(
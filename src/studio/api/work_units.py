@@ -10,6 +10,7 @@ from pydantic import BaseModel, Field
 
 from studio.api.auth import require_permission
 from studio.services.agent_service import AgentService
+from studio.services.pagination import merge_pages
 from studio.services.pipeline_service import PipelineService
 from studio.services.run_service import RunService
 
@@ -98,6 +99,7 @@ class WorkUnitListResponse(BaseModel):
     page: int
     pageSize: int
     hasMore: bool
+    nextCursor: str | None = None
 
 
 class CreateWorkUnitRequest(BaseModel):
@@ -226,68 +228,95 @@ async def list_work_units(
     tags: str | None = Query(None),
     page: int = Query(1, ge=1),
     pageSize: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None, description="nextCursor of the previous page"),
     current_user: dict = Depends(require_permission("agents:read")),
     agent_service: AgentService = Depends(get_agent_service),
     pipeline_service: PipelineService = Depends(get_pipeline_service),
 ):
     """
     List work units in the current user's organization.
-    Combines agents (atomic) and pipelines (composite) into unified work units.
+    Combines agents (atomic) and pipelines (composite) into unified work units,
+    newest first. Both sources are read after the same merged cursor, so
+    cursor pages cost the same at any depth; page numbers without a cursor
+    read the first page * pageSize units of each source. search filters the
+    units of each page, which may therefore hold fewer than pageSize items.
     """
     org_id = current_user["organization_id"]
-    offset = (page - 1) * pageSize
+    fetch_limit = pageSize if cursor else page * pageSize
 
-    items: list[WorkUnitResponse] = []
+    sources: list[list] = []
+    agent_ids: set[str] = set()
     total = 0
 
-    # Fetch atomic work units (agents)
-    if type in (None, "all", "atomic"):
-        agent_filters = {}
-        if workspaceId:
-            agent_filters["workspace_id"] = workspaceId
-
-        agents_result = await agent_service.list(
-            organization_id=org_id,
-            workspace_id=workspaceId,
-            filters=agent_filters if agent_filters else None,
-            limit=pageSize,
-            offset=offset,
-        )
-
-        for agent in agents_result.get("records", []):
-            # Apply search filter if provided
-            if search and search.lower() not in agent.get("name", "").lower():
-                continue
-            items.append(_agent_to_work_unit(agent))
-        total += agents_result.get("total", 0)
+    try:
+        # Fetch atomic work units (agents)
+        if type in (None, "all", "atomic"):
+            agent_filters = {}
+            if workspaceId:
+                agent_filters["workspace_id"] = workspaceId
+
+            # One extra record per source tells whether the merge has more
+            agents_result = await agent_service.list(
+                organization_id=org_id,
+                workspace_id=workspaceId,
+                filters=agent_filters if agent_filters else None,
+                limit=fetch_limit + 1,
+                cursor=cursor,
+            )
 
-    # Fetch composite work units (pipelines)
-    if type in (None, "all", "composite"):
-        pipeline_filters = {}
-        if workspaceId:
-            pipeline_filters["workspace_id"] = workspaceId
+            agents = agents_result.get("records", [])
+            agent_ids.update(agent["id"] for agent in agents)
+            sources.append(agents)
+            total += agents_result.get("total", 0)
+
+        # Fetch composite work units (pipelines)
+        if type in (None, "all", "composite"):
+            pipeline_filters = {}
+            if workspaceId:
+                pipeline_filters["workspace_id"] = workspaceId
+
+            pipelines_result = await pipeline_service.list(
+                organization_id=org_id,
+                workspace_id=workspaceId,
+                filters=pipeline_filters if pipeline_filters else None,
+                limit=fetch_limit + 1,
+                cursor=cursor,
+            )
 
-        pipelines_result = await pipeline_service.list(
-            organization_id=org_id,
-            workspace_id=workspaceId,
-            filters=pipeline_filters if pipeline_filters else None,
-            limit=pageSize,
-            offset=offset,
+            sources.append(pipelines_result.get("records", []))
+            total += pipelines_result.get("total", 0)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    records, next_cursor = merge_pages(sources, fetch_limit)
+    if not cursor:
+        records = records[(page - 1) * pageSize :]
+
+    # Search only filters the returned page, so the cursor still walks all
+    # units and matches on later pages stay reachable
+    if search:
+        records = [
+            record
+            for record in records
+            if search.lower() in record.get("name", "").lower()
+        ]
+
+    items = [
+        (
+            _agent_to_work_unit(record)
+            if record["id"] in agent_ids
+            else _pipeline_to_work_unit(record)
         )
-
-        for pipeline in pipelines_result.get("records", []):
-            # Apply search filter if provided
-            if search and search.lower() not in pipeline.get("name", "").lower():
-                continue
-            items.append(_pipeline_to_work_unit(pipeline))
-        total += pipelines_result.get("total", 0)
+        for record in records
+    ]
 
     return WorkUnitListResponse(
-        items=items[:pageSize],  # Limit to pageSize
+        items=items,
         total=total,
         page=page,
         pageSize=pageSize,
-        hasMore=len(items) > pageSize or (page * pageSize) < total,
+        hasMore=next_cursor is not None,
+        nextCursor=next_cursor,
     )
 
 
@@ -5,6 +5,8 @@ Handles Workspace CRUD operations following the EATP Ontology.
 Workspaces are purpose-driven collections that can cross departmental boundaries.
 """
 
+import asyncio
+
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field
 
@@ -272,7 +274,13 @@ async def get_workspace(
     """
     Get a workspace by ID with full details.
     """
-    workspace = await workspace_service.get_workspace(workspace_id)
+    # Fetch the workspace, members and work units concurrently; members and
+    # work units are discarded unless the workspace check below passes
+    workspace, members_result, work_units_result = await asyncio.gather(
+        workspace_service.get_workspace(workspace_id),
+        workspace_service.get_members(workspace_id),
+        workspace_service.get_work_units(workspace_id),
+    )
     if not workspace:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -285,10 +293,6 @@ async def get_workspace(
             detail="Not authorized to access this workspace",
         )
 
-    # Fetch members and work units
-    members_result = await workspace_service.get_members(workspace_id)
-    work_units_result = await workspace_service.get_work_units(workspace_id)
-
     members = [
         WorkspaceMemberResponse(
             userId=m.get("user_id", ""),
@@ -30,10 +30,17 @@ class Settings(BaseSettings):
     )
     database_pool_size: int = 10
     database_max_overflow: int = 20
+    # asyncpg pool of hot direct reads (studio.services.read_repository), opened
+    # per worker in addition to the DataFlow pool
+    direct_read_pool_size: int = 4
+    # Timestamp columns converted to timestamptz (scripts/backfill_timestamps.py)
+    native_timestamps: bool = False
 
     # Redis Configuration
     redis_url: str = "redis://localhost:6379"
     redis_expire_seconds: int = 3600
+    # Versioned Redis cache of DataFlow reads (studio.services.query_cache)
+    query_cache_enabled: bool = True
 
     # JWT Authentication - RS256 algorithm
     jwt_secret_key: str = (
@@ -0,0 +1,248 @@
+"""
+Service Container
+
+Process-wide shared resources and service instances.
+The container is created in main.lifespan and injected into API handlers via
+FastAPI dependencies, so requests reuse one workflow runtime, one Redis
+connection pool, one direct-read database pool and pooled HTTP clients instead
+of constructing them (and the services built on them) per request.
+"""
+
+import inspect
+import logging
+from typing import TypeVar
+
+import httpx
+import redis
+from kailash.runtime import AsyncLocalRuntime
+
+from studio.config import get_redis_url
+from studio.services.read_repository import ReadRepository, get_read_repository
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# HTTP client profiles: name -> timeout in seconds
+HTTP_CLIENT_TIMEOUTS = {
+    "default": 30.0,
+    "llm": 120.0,
+}
+
+
+class HTTPClientRegistry:
+    """
+    Named, pooled HTTP clients.
+
+    Each name gets one httpx.AsyncClient, so outbound connections (and their
+    TLS sessions) are kept alive across requests.
+
+    Examples:
+        >>> http = HTTPClientRegistry()
+        >>> client = http.get("llm")
+        >>> await http.aclose()
+    """
+
+    def __init__(self, timeouts: dict[str, float] | None = None):
+        """
+        Initialize the registry.
+
+        Args:
+            timeouts: Timeout in seconds per client name
+        """
+        self.timeouts = {**HTTP_CLIENT_TIMEOUTS, **(timeouts or {})}
+        self._clients: dict[str, httpx.AsyncClient] = {}
+
+    def get(self, name: str = "default") -> httpx.AsyncClient:
+        """
+        Get the shared client for a name, creating it on first use.
+
+        Args:
+            name: Client profile name
+
+        Returns:
+            Shared HTTP client
+        """
+        client = self._clients.get(name)
+        if client is None or client.is_closed:
+            timeout = self.timeouts.get(name, self.timeouts["default"])
+            client = httpx.AsyncClient(timeout=timeout)
+            self._clients[name] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Close all clients."""
+        for name, client in self._clients.items():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"Error closing HTTP client {name}: {e}")
+        self._clients.clear()
+
+
+class ServiceContainer:
+    """
+    Lifecycle-managed holder of shared resources and service singletons.
+
+    Services are constructed on first use with the shared resources their
+    constructors accept (runtime, redis_client, http_client, reads).
+    Services with background components (connections, worker tasks) are
+    started with start(), which awaits their initialize(); aclose() then
+    awaits their close() before the shared resources are released.
+
+    Examples:
+        >>> container = ServiceContainer()
+        >>> await container.start(ExternalAgentService)
+        >>> agent_service = container.get(AgentService)
+        >>> await container.aclose()
+    """
+
+    def __init__(
+        self,
+        runtime: AsyncLocalRuntime | None = None,
+        redis_client=None,
+        http_clients: HTTPClientRegistry | None = None,
+        reads: ReadRepository | None = None,
+    ):
+        """
+        Initialize the container.
+
+        Args:
+            runtime: Shared workflow runtime (created if not provided)
+            redis_client: Shared Redis client (pooled client if not provided)
+            http_clients: Shared HTTP client registry (created if not provided)
+            reads: Shared direct-read repository (process-wide one if not provided)
+        """
+        self.runtime = runtime or AsyncLocalRuntime()
+        self.redis_pool = None
+        if redis_client is None:
+            self.redis_pool = redis.ConnectionPool.from_url(get_redis_url())
+            redis_client = redis.Redis(connection_pool=self.redis_pool)
+        self.redis = redis_client
+        self.http = http_clients or HTTPClientRegistry()
+        self.reads = reads or get_read_repository()
+        self._services: dict[type, object] = {}
+        self._started: list[type] = []
+
+    def get(self, service_cls: type[T]) -> T:
+        """
+        Get the shared instance of a service class.
+
+        Args:
+            service_cls: Service class
+
+        Returns:
+            Service instance, constructed on first use
+        """
+        service = self._services.get(service_cls)
+        if service is None:
+            service = service_cls(**self._resources_for(service_cls))
+            self._services[service_cls] = service
+        return service
+
+    async def start(self, *service_classes: type) -> None:
+        """
+        Get services and initialize them once (called from main.lifespan).
+
+        Each service's async initialize(), if it has one, is awaited on the
+        first start; started services are closed by aclose() in reverse order.
+
+        Args:
+            *service_classes: Service classes to start
+        """
+        for service_cls in service_classes:
+            service = self.get(service_cls)
+            if service_cls in self._started:
+                continue
+            initialize = getattr(service, "initialize", None)
+            if initialize is not None:
+                await initialize()
+            self._started.append(service_cls)
+
+    def _resources_for(self, service_cls: type) -> dict:
+        """Select the shared resources a service constructor accepts."""
+        params = inspect.signature(service_cls).parameters
+        resources = {}
+        if "runtime" in params:
+            resources["runtime"] = self.runtime
+        if "redis_client" in params:
+            resources["redis_client"] = self.redis
+        if "http_client" in params:
+            name = getattr(service_cls, "HTTP_CLIENT", "default")
+            resources["http_client"] = self.http.get(name)
+        if "reads" in params:
+            resources["reads"] = self.reads
+        return resources
+
+    async def aclose(self) -> None:
+        """Close started services, then release pooled connections."""
+        for service_cls in reversed(self._started):
+            close = getattr(self._services.get(service_cls), "close", None)
+            if close is None:
+                continue
+            try:
+                await close()
+            except Exception as e:
+                logger.warning(f"Error closing {service_cls.__name__}: {e}")
+        self._started.clear()
+
+        await self.http.aclose()
+        await self.reads.close()
+        if self.redis_pool is not None:
+            self.redis_pool.disconnect()
+        self._services.clear()
+
+
+_container: ServiceContainer | None = None
+
+
+def init_container(container: ServiceContainer | None = None) -> ServiceContainer:
+    """
+    Install the process-wide container (called from main.lifespan).
+
+    Args:
+        container: Container to install (a new one is created if not provided)
+
+    Returns:
+        Installed container
+    """
+    global _container
+    _container = container or ServiceContainer()
+    return _container
+
+
+async def close_container() -> None:
+    """Close and remove the process-wide container."""
+    global _container
+    if _container is not None:
+        await _container.aclose()
+        _container = None
+
+
+def get_container() -> ServiceContainer:
+    """
+    Get the process-wide container.
+
+    Created lazily when the app lifespan has not run (scripts, tests).
+
+    Returns:
+        Service container
+    """
+    if _container is None:
+        return init_container()
+    return _container
+
+
+# ===================
+# FastAPI Dependencies
+# ===================
+
+
+def get_runtime() -> AsyncLocalRuntime:
+    """Get the shared AsyncLocalRuntime for dependency injection."""
+    return get_container().runtime
+
+
+def get_redis():
+    """Get the shared Redis client for dependency injection."""
+    return get_container().redis
@@ -47,6 +47,7 @@ from studio.api import (
     runs_router,
 )
 from studio.config import get_settings
+from studio.container import close_container, init_container
 from studio.middleware.audit_middleware import AuditMiddleware
 from studio.middleware.auth import AuthMiddleware
 from studio.middleware.csrf import CSRFMiddleware
@@ -54,6 +55,7 @@ from studio.middleware.error_handler import register_exception_handlers
 from studio.middleware.lineage import LineageMiddleware
 from studio.middleware.prometheus import PrometheusMiddleware, get_metrics_endpoint
 from studio.middleware.rate_limit import RateLimitMiddleware
+from studio.services.external_agent_service import ExternalAgentService
 
 # Configure logging
 logging.basicConfig(
@@ -89,11 +91,31 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to create database tables: {e}")
         raise
 
+    # Secondary indexes on hot filter columns (declared with @indexed)
+    from studio.models.indexes import check_indexes, ensure_indexes
+
+    try:
+        await ensure_indexes()
+        missing = await check_indexes()
+        if missing:
+            logger.warning(f"{len(missing)} model indexes missing: {missing}")
+    except Exception as e:
+        logger.error(f"Failed to ensure model indexes: {e}")
+
+    # Shared runtime, Redis pool and HTTP clients for all request handlers
+    app.state.container = init_container()
+
+    # Governance runs background components for the app's lifetime: Redis
+    # counters, write-behind workers and the approval expiry scheduler
+    await app.state.container.start(ExternalAgentService)
+
     yield
 
     # Shutdown
     logger.info(f"Shutting down {settings.app_name}")
 
+    await close_container()
+
     # Close DataFlow connections for proper cleanup
     try:
         await db.close_async()
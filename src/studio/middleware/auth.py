@@ -92,7 +92,7 @@ class AuthMiddleware(BaseHTTPMiddleware):
 
         # Check X-API-Key header
         if api_key_header and api_key_header.startswith("sk_live_"):
-            api_key = await self.api_key_service.validate(api_key_header)
+            api_key = await self.api_key_service.validate(api_key_header, direct=True)
             if api_key:
                 request.state.api_key = api_key
                 request.state.org_id = api_key["organization_id"]
@@ -108,7 +108,7 @@ class AuthMiddleware(BaseHTTPMiddleware):
 
             # Check if it's an API key
             if token.startswith("sk_live_"):
-                api_key = await self.api_key_service.validate(token)
+                api_key = await self.api_key_service.validate(token, direct=True)
                 if api_key:
                     request.state.api_key = api_key
                     request.state.org_id = api_key["organization_id"]
@@ -125,7 +125,9 @@ class AuthMiddleware(BaseHTTPMiddleware):
                     # SECURITY FIX (HIGH-8): Check for stale JWT role
                     # When user role changes, existing JWTs still have old role
                     # Validate against database to prevent privilege escalation
-                    current_user = await self.auth_service.get_user_by_id(user_id)
+                    current_user = await self.auth_service.get_user_by_id(
+                        user_id, direct=True
+                    )
                     if current_user:
                         # Check if user is still in the claimed organization
                         # and has the claimed role
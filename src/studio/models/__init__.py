@@ -31,6 +31,7 @@ db = DataFlow(
     database_url=DATABASE_URL,
     auto_migrate=False,  # Tables created in FastAPI lifespan via create_tables_async()
     enable_caching=False,  # Disable caching globally - invalidation issues in async contexts
+    # (reads are cached with Redis version keys in studio.services.query_cache)
     monitoring=True,  # Correct parameter (enable_metrics is deprecated)
     migration_enabled=False,  # Disable migration system to avoid schema_state_manager errors
 )
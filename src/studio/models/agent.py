@@ -49,6 +49,11 @@ class Agent:
     temperature: float  # 0.0 - 2.0
     max_tokens: int  # 0 means no limit
 
+    # Request coalescing: identical concurrent LLM calls share one provider call.
+    # Sampled calls (temperature > 0) are only coalesced when explicitly allowed.
+    coalesce_requests: bool = True
+    coalesce_nondeterministic: bool = False
+
     # Audit fields
     created_by: str
 
@@ -5,9 +5,11 @@ DataFlow model for API key management with scoped access and rate limiting.
 """
 
 from studio.models import db
+from studio.models.indexes import Index, indexed
 
 
 @db.model
+@indexed(Index("key_prefix"))
 class APIKey:
     """
     API Key model for external service authentication.
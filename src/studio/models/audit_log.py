@@ -5,9 +5,11 @@ Represents audit trail entries for compliance and security monitoring.
 """
 
 from studio.models import db
+from studio.models.indexes import Index, indexed
 
 
 @db.model
+@indexed(Index("organization_id", "created_at"))
 class AuditLog:
     """
     Audit log model for tracking all system activities.
@@ -5,9 +5,11 @@ Represents execution metrics for agent deployments.
 """
 
 from studio.models import db
+from studio.models.indexes import Index, indexed
 
 
 @db.model
+@indexed(Index("organization_id", "created_at"))
 class ExecutionMetric:
     """
     Execution metric model for tracking agent execution performance.
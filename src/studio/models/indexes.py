@@ -0,0 +1,228 @@
+"""
+Model Indexes
+
+Declarative secondary indexes for DataFlow models.
+DataFlow creates tables but no indexes beyond the primary key, so hot filter
+columns are declared on the model with @indexed and created idempotently at
+startup (after create_tables_async()). A startup check then reports any
+declared index that is missing or invalid.
+
+Examples:
+    >>> @db.model
+    ... @indexed(
+    ...     Index("delegatee_id", "status"),
+    ...     Index("delegator_id", where="status = 'active'"),
+    ... )
+    ... class TrustDelegation:
+    ...     ...
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+# PostgreSQL truncates identifiers longer than this
+MAX_IDENTIFIER_LENGTH = 63
+
+
+@dataclass(frozen=True, init=False)
+class Index:
+    """
+    A secondary index on a model's table.
+
+    Attributes:
+        columns: Indexed columns, in order
+        name: Index name (defaults to idx_<table>_<columns>)
+        where: Optional SQL predicate for a partial index
+        unique: Whether the index is unique
+    """
+
+    columns: tuple[str, ...]
+    name: str | None = None
+    where: str | None = None
+    unique: bool = False
+
+    def __init__(
+        self,
+        *columns: str,
+        name: str | None = None,
+        where: str | None = None,
+        unique: bool = False,
+    ):
+        if not columns:
+            raise ValueError("Index requires at least one column")
+        object.__setattr__(self, "columns", tuple(columns))
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "where", where)
+        object.__setattr__(self, "unique", unique)
+
+    def index_name(self, table: str) -> str:
+        """Get the index name for a table."""
+        name = self.name or f"idx_{table}_{'_'.join(self.columns)}"
+        return name[:MAX_IDENTIFIER_LENGTH]
+
+    def create_sql(self, table: str) -> str:
+        """
+        Get the idempotent CREATE INDEX statement for a table.
+
+        CONCURRENTLY keeps writes flowing while an index is built on a large
+        table; IF NOT EXISTS makes repeated startups a no-op.
+        """
+        columns = ", ".join(f'"{column}"' for column in self.columns)
+        sql = (
+            f"CREATE {'UNIQUE ' if self.unique else ''}INDEX CONCURRENTLY "
+            f'IF NOT EXISTS "{self.index_name(table)}" ON "{table}" ({columns})'
+        )
+        if self.where:
+            sql += f" WHERE {self.where}"
+        return sql
+
+
+# Declared indexes by model name
+_MODEL_INDEXES: dict[str, tuple[Index, ...]] = {}
+
+
+def indexed(*indexes: Index):
+    """
+    Declare secondary indexes on a model class.
+
+    Apply below @db.model so the class is registered before DataFlow
+    processes it.
+
+    Args:
+        *indexes: Indexes to create on the model's table
+
+    Returns:
+        Class decorator
+    """
+
+    def decorator(cls):
+        cls.__studio_indexes__ = indexes
+        _MODEL_INDEXES[cls.__name__] = indexes
+        return cls
+
+    return decorator
+
+
+def _pluralize(word: str) -> str:
+    """Pluralize a table name the way DataFlow does."""
+    if word.endswith("s"):
+        return word
+    if word.endswith("y") and len(word) > 1 and word[-2] not in "aeiou":
+        return word[:-1] + "ies"
+    if word.endswith(("x", "z", "ch", "sh")):
+        return word + "es"
+    return word + "s"
+
+
+def table_name(model_name: str) -> str:
+    """
+    Get the DataFlow table name of a model (APIKey -> api_keys).
+
+    Args:
+        model_name: Model class name
+
+    Returns:
+        Table name
+    """
+    name = re.sub(r"(.)([A-Z][a-z]+)", r"\1_\2", model_name)
+    name = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", name).lower()
+    return _pluralize(name)
+
+
+def declared_indexes() -> dict[str, tuple[str, Index]]:
+    """Get all declared (table, index) pairs keyed by index name."""
+    declared = {}
+    for model_name, indexes in _MODEL_INDEXES.items():
+        table = table_name(model_name)
+        for index in indexes:
+            declared[index.index_name(table)] = (table, index)
+    return declared
+
+
+async def _connect(database_url: str | None):
+    """Open a connection, or return None on a non-PostgreSQL database."""
+    if database_url is None:
+        from studio.services.read_repository import get_direct_database_url
+
+        database_url = get_direct_database_url()
+
+    if not database_url.startswith(("postgresql://", "postgres://")):
+        logger.info("Skipping model indexes: not a PostgreSQL database")
+        return None
+    return await asyncpg.connect(database_url)
+
+
+async def ensure_indexes(database_url: str | None = None) -> int:
+    """
+    Create all declared indexes that do not exist yet.
+
+    Failures are logged per index and do not stop startup.
+
+    Args:
+        database_url: PostgreSQL URL (defaults to the DataFlow database)
+
+    Returns:
+        Number of indexes ensured
+    """
+    conn = await _connect(database_url)
+    if conn is None:
+        return 0
+
+    declared = declared_indexes()
+    ensured = 0
+    try:
+        for name, (table, index) in declared.items():
+            try:
+                await conn.execute(index.create_sql(table))
+                ensured += 1
+            except asyncpg.PostgresError as e:
+                logger.error(f"Failed to create index {name} on {table}: {e}")
+    finally:
+        await conn.close()
+
+    logger.info(f"Ensured {ensured}/{len(declared)} model indexes")
+    return ensured
+
+
+async def check_indexes(database_url: str | None = None) -> list[str]:
+    """
+    Report declared indexes that are missing or invalid.
+
+    An interrupted concurrent build leaves an invalid index behind, which
+    IF NOT EXISTS would skip; such indexes are reported as missing.
+
+    Args:
+        database_url: PostgreSQL URL (defaults to the DataFlow database)
+
+    Returns:
+        Names of missing or invalid indexes
+    """
+    conn = await _connect(database_url)
+    if conn is None:
+        return []
+
+    try:
+        rows = await conn.fetch(
+            "SELECT c.relname FROM pg_index i "
+            "JOIN pg_class c ON c.oid = i.indexrelid "
+            "JOIN pg_namespace n ON n.oid = c.relnamespace "
+            "WHERE n.nspname = current_schema() AND i.indisvalid"
+        )
+    finally:
+        await conn.close()
+
+    declared = declared_indexes()
+    existing = {row["relname"] for row in rows}
+    missing = [name for name in declared if name not in existing]
+    for name in missing:
+        table, index = declared[name]
+        logger.warning(
+            f"Missing index {name} on {table} ({', '.join(index.columns)}); "
+            "lookups on these columns will use sequential scans"
+        )
+    return missing
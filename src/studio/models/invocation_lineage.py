@@ -6,9 +6,11 @@ Captures the full chain: external user → external system → Kaizen → extern
 """
 
 from studio.models import db
+from studio.models.indexes import Index, indexed
 
 
 @db.model
+@indexed(Index("trace_id"))
 class InvocationLineage:
     """
     Invocation lineage model for external agent governance.
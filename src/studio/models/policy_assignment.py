@@ -5,9 +5,11 @@ Represents an assignment of a policy to a principal (user, team, or role).
 """
 
 from studio.models import db
+from studio.models.indexes import Index, indexed
 
 
 @db.model
+@indexed(Index("principal_type", "principal_id"))
 class PolicyAssignment:
     """
     PolicyAssignment model for linking policies to principals.
@@ -5,9 +5,11 @@ Execution run record for work units.
 """
 
 from studio.models import db
+from studio.models.indexes import Index, indexed
 
 
 @db.model
+@indexed(Index("organization_id", "created_at"))
 class Run:
     """
     Run model for tracking work unit executions.
@@ -5,9 +5,11 @@ Represents a user's membership in a team.
 """
 
 from studio.models import db
+from studio.models.indexes import Index, indexed
 
 
 @db.model
+@indexed(Index("user_id"))
 class TeamMembership:
     """
     Team membership model for linking users to teams.
@@ -6,9 +6,14 @@ EATP: Delegations can only TIGHTEN constraints, never loosen them.
 """
 
 from studio.models import db
+from studio.models.indexes import Index, indexed
 
 
 @db.model
+@indexed(
+    Index("delegatee_id", "status"),
+    Index("delegator_id", where="status = 'active'"),
+)
 class TrustDelegation:
     """
     Trust delegation model for agent-to-agent trust transfer.
@@ -5,9 +5,11 @@ Tracks resource usage for billing purposes.
 """
 
 from studio.models import db
+from studio.models.indexes import Index, indexed
 
 
 @db.model
+@indexed(Index("organization_id", "recorded_at"))
 class UsageRecord:
     """
     Usage record model for tracking resource consumption.
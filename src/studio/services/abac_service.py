@@ -5,6 +5,7 @@ Handles attribute-based access control operations.
 """
 
 import json
+import logging
 import uuid
 from datetime import UTC, datetime
 from typing import Any
@@ -12,6 +13,11 @@ from typing import Any
 from kailash.runtime import AsyncLocalRuntime
 from kailash.workflow.builder import WorkflowBuilder
 
+from studio.services.cascade import delete_where, execute_cascade
+from studio.services.read_repository import get_read_repository
+
+logger = logging.getLogger(__name__)
+
 # Condition operators for policy evaluation
 CONDITION_OPERATORS = {
     "eq": lambda a, b: a == b,
@@ -53,9 +59,10 @@ class ABACService:
     - Support for allow/deny effects
     """
 
-    def __init__(self, runtime=None):
+    def __init__(self, runtime=None, reads=None):
         """Initialize the ABAC service."""
         self.runtime = runtime or AsyncLocalRuntime()
+        self.reads = reads or get_read_repository()
 
     def _extract_resource_refs(self, conditions: dict) -> list:
         """
@@ -222,7 +229,7 @@ class ABACService:
 
     async def delete_policy(self, policy_id: str) -> bool:
         """
-        Delete a policy and its assignments.
+        Delete a policy and its assignments in one transaction.
 
         Args:
             policy_id: Policy ID
@@ -230,55 +237,16 @@ class ABACService:
         Returns:
             True if deleted
         """
-        # First delete all assignments for this policy
-        await self._delete_policy_assignments(policy_id)
-
-        # Then delete the policy
-        workflow = WorkflowBuilder()
-        workflow.add_node(
-            "PolicyDeleteNode",
-            "delete_policy",
-            {
-                "id": policy_id,
-            },
+        # Delete the assignments and the policy in one transaction
+        await execute_cascade(
+            self.runtime,
+            [
+                delete_where("PolicyAssignment", policy_id=policy_id),
+                delete_where("Policy", id=policy_id),
+            ],
         )
-
-        await self.runtime.execute_workflow_async(workflow.build(), inputs={})
         return True
 
-    async def _delete_policy_assignments(self, policy_id: str) -> None:
-        """Delete all assignments for a policy."""
-        # Get assignments
-        workflow = WorkflowBuilder()
-        workflow.add_node(
-            "PolicyAssignmentListNode",
-            "list_assignments",
-            {
-                "filter": {"policy_id": policy_id},
-                "enable_cache": False,  # Disable cache for fresh data
-            },
-        )
-
-        results, _ = await self.runtime.execute_workflow_async(
-            workflow.build(), inputs={}
-        )
-
-        assignments = results.get("list_assignments", {}).get("records", [])
-
-        # Delete each assignment
-        for assignment in assignments:
-            delete_workflow = WorkflowBuilder()
-            delete_workflow.add_node(
-                "PolicyAssignmentDeleteNode",
-                "delete_assignment",
-                {
-                    "id": assignment["id"],
-                },
-            )
-            await self.runtime.execute_workflow_async(
-                delete_workflow.build(), inputs={}
-            )
-
     async def list_policies(
         self,
         organization_id: str,
@@ -392,7 +360,7 @@ class ABACService:
         await self.runtime.execute_workflow_async(workflow.build(), inputs={})
         return True
 
-    async def get_user_policies(self, user_id: str) -> list[dict]:
+    async def get_user_policies(self, user_id: str, direct: bool = False) -> list[dict]:
         """
         Get all policies applicable to a user.
 
@@ -403,6 +371,8 @@ class ABACService:
 
         Args:
             user_id: User ID
+            direct: Read the user and assignments with prepared statements
+                instead of workflows
 
         Returns:
             List of policy records
@@ -411,22 +381,12 @@ class ABACService:
         seen_ids = set()
 
         # Get user info for role
-        user_workflow = WorkflowBuilder()
-        user_workflow.add_node(
-            "UserReadNode",
-            "read_user",
-            {
-                "id": user_id,
-            },
-        )
-
-        user_results, _ = await self.runtime.execute_workflow_async(
-            user_workflow.build(), inputs={}
-        )
-        user = user_results.get("read_user")
+        user = await self._read_user(user_id, direct)
 
         # Get policies assigned directly to user
-        user_assignments = await self._get_assignments_for_principal("user", user_id)
+        user_assignments = await self._get_assignments_for_principal(
+            "user", user_id, direct
+        )
         for assignment in user_assignments:
             if assignment["policy_id"] not in seen_ids:
                 policy = await self.get_policy(assignment["policy_id"])
@@ -452,7 +412,7 @@ class ABACService:
         memberships = team_results.get("list_memberships", {}).get("records", [])
         for membership in memberships:
             team_assignments = await self._get_assignments_for_principal(
-                "team", membership["team_id"]
+                "team", membership["team_id"], direct
             )
             for assignment in team_assignments:
                 if assignment["policy_id"] not in seen_ids:
@@ -464,7 +424,7 @@ class ABACService:
         # Get policies assigned to user's role
         if user and user.get("role"):
             role_assignments = await self._get_assignments_for_principal(
-                "role", user["role"]
+                "role", user["role"], direct
             )
             for assignment in role_assignments:
                 if assignment["policy_id"] not in seen_ids:
@@ -478,10 +438,40 @@ class ABACService:
 
         return policies
 
+    async def _read_user(self, user_id: str, direct: bool = False) -> dict | None:
+        """Read a user row, directly or through a UserReadNode workflow."""
+        if direct and self.reads.enabled:
+            try:
+                return await self.reads.get_user(user_id)
+            except Exception as e:
+                logger.warning(f"Direct user read failed, using workflow: {e}")
+
+        workflow = WorkflowBuilder()
+        workflow.add_node(
+            "UserReadNode",
+            "read_user",
+            {
+                "id": user_id,
+            },
+        )
+
+        results, _ = await self.runtime.execute_workflow_async(
+            workflow.build(), inputs={}
+        )
+        return results.get("read_user")
+
     async def _get_assignments_for_principal(
-        self, principal_type: str, principal_id: str
+        self, principal_type: str, principal_id: str, direct: bool = False
     ) -> list[dict]:
         """Get all assignments for a principal."""
+        if direct and self.reads.enabled:
+            try:
+                return await self.reads.list_policy_assignments(
+                    principal_type, principal_id
+                )
+            except Exception as e:
+                logger.warning(f"Direct assignment read failed, using workflow: {e}")
+
         workflow = WorkflowBuilder()
         workflow.add_node(
             "PolicyAssignmentListNode",
@@ -532,8 +522,8 @@ class ABACService:
         Returns:
             True if action is allowed, False otherwise
         """
-        # Get all applicable policies for the user
-        policies = await self.get_user_policies(user_id)
+        # Get all applicable policies for the user (hot path: direct reads)
+        policies = await self.get_user_policies(user_id, direct=True)
 
         # If no policies exist, allow by default (RBAC already passed)
         if not policies:
@@ -9,6 +9,8 @@ from datetime import UTC, datetime, timedelta
 from kailash.runtime import AsyncLocalRuntime
 from kailash.workflow.builder import WorkflowBuilder
 
+from studio.services.timestamps import parse_timestamp, time_range
+
 
 class ActivityService:
     """
@@ -32,17 +34,7 @@ class ActivityService:
         Returns:
             Parsed datetime object (always timezone-aware in UTC)
         """
-        if not date_str:
-            raise ValueError("Date string cannot be empty")
-
-        normalized = date_str
-        if normalized.endswith("Z"):
-            normalized = normalized[:-1] + "+00:00"
-
-        parsed = datetime.fromisoformat(normalized)
-        if parsed.tzinfo is None:
-            parsed = parsed.replace(tzinfo=UTC)
-        return parsed
+        return parse_timestamp(date_str)
 
     async def get_team_activity(
         self,
@@ -269,17 +261,19 @@ class ActivityService:
             Summary with counts by event type
         """
         cutoff = datetime.now(UTC) - timedelta(hours=hours)
-        cutoff_str = cutoff.isoformat()
         runs = []
 
-        # Get runs in time period
+        # Get runs in time period (runs start when they are created)
         try:
             workflow = WorkflowBuilder()
             workflow.add_node(
                 "RunListNode",
                 "list_runs",
                 {
-                    "filter": {"organization_id": organization_id},
+                    "filter": {
+                        "organization_id": organization_id,
+                        "created_at": time_range("created_at", cutoff),
+                    },
                     "limit": 10000,  # Get all for aggregation
                 },
             )
@@ -293,17 +287,7 @@ class ActivityService:
             # Table might not exist yet - return empty summary
             runs = []
 
-        # Filter by time
-        recent_runs = []
-        for run in runs:
-            try:
-                run_time = self._parse_iso_date(
-                    run.get("started_at", run.get("created_at", ""))
-                )
-                if run_time >= cutoff:
-                    recent_runs.append(run)
-            except (ValueError, KeyError):
-                pass
+        recent_runs = runs
 
         # Count by status
         total_runs = len(recent_runs)
@@ -4,15 +4,23 @@ Agent Service
 CRUD operations for agents using DataFlow nodes.
 """
 
+import asyncio
 import json
+import logging
 import uuid
 from datetime import UTC, datetime
 
 from kailash.runtime import AsyncLocalRuntime
-from kailash.workflow.builder import WorkflowBuilder
 
 # Import models to register DataFlow nodes
 import studio.models  # noqa: F401
+from studio.services.cascade import delete_where, execute_cascade
+from studio.services.dataloader import DataLoader, group_records
+from studio.services.pagination import keyset_page, keyset_params
+from studio.services.read_repository import get_read_repository
+from studio.services.workflow_templates import execute_node
+
+logger = logging.getLogger(__name__)
 
 
 class AgentService:
@@ -22,9 +30,14 @@ class AgentService:
     Uses DataFlow nodes for all database operations.
     """
 
-    def __init__(self):
+    def __init__(self, runtime=None, reads=None):
         """Initialize the agent service."""
-        self.runtime = AsyncLocalRuntime()
+        self.runtime = runtime or AsyncLocalRuntime()
+        self.reads = reads or get_read_repository()
+        # Batch detail sub-queries of concurrent requests (see get_with_details)
+        self.agent_loader = DataLoader(self.get_many)
+        self.context_loader = DataLoader(self.list_contexts_many)
+        self.tool_loader = DataLoader(self.list_tools_many)
 
     # ===================
     # Agent CRUD
@@ -43,6 +56,8 @@ class AgentService:
         temperature: float = 0.7,
         max_tokens: int = 0,
         status: str = "draft",
+        coalesce_requests: bool = True,
+        coalesce_nondeterministic: bool = False,
     ) -> dict:
         """
         Create a new agent.
@@ -59,6 +74,8 @@ class AgentService:
             temperature: Temperature setting (0.0-2.0)
             max_tokens: Max tokens (0 = no limit)
             status: Status (draft, active, archived)
+            coalesce_requests: Coalesce identical concurrent LLM calls
+            coalesce_nondeterministic: Also coalesce calls with temperature > 0
 
         Returns:
             Created agent data
@@ -66,8 +83,8 @@ class AgentService:
         now = datetime.now(UTC).isoformat()
         agent_id = str(uuid.uuid4())
 
-        workflow = WorkflowBuilder()
-        workflow.add_node(
+        results = await execute_node(
+            self.runtime,
             "AgentCreateNode",
             "create",
             {
@@ -82,31 +99,36 @@ class AgentService:
                 "model_id": model_id,
                 "temperature": temperature,
                 "max_tokens": max_tokens,
+                "coalesce_requests": coalesce_requests,
+                "coalesce_nondeterministic": coalesce_nondeterministic,
                 "created_by": created_by,
                 "created_at": now,
                 "updated_at": now,
             },
         )
 
-        results, _ = await self.runtime.execute_workflow_async(
-            workflow.build(), inputs={}
-        )
-
         return results.get("create", {})
 
-    async def get(self, agent_id: str) -> dict | None:
+    async def get(self, agent_id: str, direct: bool = False) -> dict | None:
         """
         Get an agent by ID.
 
         Args:
             agent_id: Agent ID
+            direct: Read with a prepared statement instead of a workflow
 
         Returns:
             Agent data if found, None otherwise
         """
+        if direct and self.reads.enabled:
+            try:
+                return await self.reads.get_agent(agent_id)
+            except Exception as e:
+                logger.warning(f"Direct agent read failed, using workflow: {e}")
+
         try:
-            workflow = WorkflowBuilder()
-            workflow.add_node(
+            results = await execute_node(
+                self.runtime,
                 "AgentReadNode",
                 "read",
                 {
@@ -114,15 +136,41 @@ class AgentService:
                 },
             )
 
-            results, _ = await self.runtime.execute_workflow_async(
-                workflow.build(), inputs={}
-            )
-
             return results.get("read")
         except Exception:
             # ReadNode throws when record not found
             return None
 
+    async def get_many(self, agent_ids: list[str]) -> dict[str, dict | None]:
+        """
+        Get several agents in a single query.
+
+        Args:
+            agent_ids: Agent IDs (duplicates and empty IDs are ignored)
+
+        Returns:
+            Dict of agent ID to agent data, None for agents not found
+        """
+        ids = list(dict.fromkeys(agent_id for agent_id in agent_ids if agent_id))
+        if not ids:
+            return {}
+
+        results = await execute_node(
+            self.runtime,
+            "AgentListNode",
+            "list",
+            {
+                "filter": {"id": {"$in": ids}},
+                "limit": len(ids),
+                "offset": 0,
+                "enable_cache": False,  # Disable cache to get fresh data
+            },
+        )
+
+        records = results.get("list", {}).get("records", [])
+        agents = {record["id"]: record for record in records}
+        return {agent_id: agents.get(agent_id) for agent_id in ids}
+
     async def update(self, agent_id: str, data: dict) -> dict | None:
         """
         Update an agent.
@@ -136,8 +184,8 @@ class AgentService:
         """
         # NOTE: Do NOT set updated_at - DataFlow manages it automatically
 
-        workflow = WorkflowBuilder()
-        workflow.add_node(
+        results = await execute_node(
+            self.runtime,
             "AgentUpdateNode",
             "update",
             {
@@ -146,10 +194,6 @@ class AgentService:
             },
         )
 
-        results, _ = await self.runtime.execute_workflow_async(
-            workflow.build(), inputs={}
-        )
-
         return await self.get(agent_id)
 
     async def delete(self, agent_id: str) -> bool:
@@ -167,7 +211,8 @@ class AgentService:
 
     async def hard_delete(self, agent_id: str) -> bool:
         """
-        Permanently delete an agent.
+        Permanently delete an agent with its versions, contexts, tools and
+        connector attachments in one transaction.
 
         Args:
             agent_id: Agent ID
@@ -175,17 +220,15 @@ class AgentService:
         Returns:
             True if deleted successfully
         """
-        workflow = WorkflowBuilder()
-        workflow.add_node(
-            "AgentDeleteNode",
-            "delete",
-            {
-                "id": agent_id,
-            },
-        )
-
-        results, _ = await self.runtime.execute_workflow_async(
-            workflow.build(), inputs={}
+        await execute_cascade(
+            self.runtime,
+            [
+                delete_where("ConnectorInstance", agent_id=agent_id),
+                delete_where("AgentTool", agent_id=agent_id),
+                delete_where("AgentContext", agent_id=agent_id),
+                delete_where("AgentVersion", agent_id=agent_id),
+                delete_where("Agent", id=agent_id),
+            ],
         )
 
         return True
@@ -197,22 +240,25 @@ class AgentService:
         filters: dict | None = None,
         limit: int = 50,
         offset: int = 0,
+        cursor: str | None = None,
     ) -> dict:
         """
-        List agents with optional filters.
+        List agents with optional filters, newest first.
 
         Args:
             organization_id: Organization ID
             workspace_id: Optional workspace ID filter
             filters: Optional additional filter conditions
             limit: Maximum records to return
-            offset: Number of records to skip
+            offset: Number of records to skip (ignored with a cursor)
+            cursor: Cursor of the previous page (next_cursor)
 
         Returns:
-            Dict with records and total count
-        """
-        workflow = WorkflowBuilder()
+            Dict with records, total count and next_cursor
 
+        Raises:
+            ValueError: If the cursor is malformed
+        """
         # Build filter
         combined_filters = {"organization_id": organization_id}
         if workspace_id:
@@ -220,24 +266,19 @@ class AgentService:
         if filters:
             combined_filters.update(filters)
 
-        workflow.add_node(
+        results = await execute_node(
+            self.runtime,
             "AgentListNode",
             "list",
-            {
-                "filter": combined_filters,
-                "limit": limit,
-                "offset": offset,
-            },
-        )
-
-        results, _ = await self.runtime.execute_workflow_async(
-            workflow.build(), inputs={}
+            keyset_params(combined_filters, cursor, limit, offset),
         )
 
         list_result = results.get("list", {})
+        records, next_cursor = keyset_page(list_result.get("records", []), limit)
         return {
-            "records": list_result.get("records", []),
+            "records": records,
             "total": list_result.get("count", list_result.get("total", 0)),
+            "next_cursor": next_cursor,
         }
 
     # ===================
@@ -288,8 +329,8 @@ class AgentService:
         now = datetime.now(UTC).isoformat()
         version_id = str(uuid.uuid4())
 
-        workflow = WorkflowBuilder()
-        workflow.add_node(
+        results = await execute_node(
+            self.runtime,
             "AgentVersionCreateNode",
             "create",
             {
@@ -303,10 +344,6 @@ class AgentService:
             },
         )
 
-        results, _ = await self.runtime.execute_workflow_async(
-            workflow.build(), inputs={}
-        )
-
         return results.get("create", {})
 
     async def get_versions(self, agent_id: str) -> list:
@@ -319,8 +356,8 @@ class AgentService:
         Returns:
             List of version records
         """
-        workflow = WorkflowBuilder()
-        workflow.add_node(
+        results = await execute_node(
+            self.runtime,
             "AgentVersionListNode",
             "list",
             {
@@ -331,10 +368,6 @@ class AgentService:
             },
         )
 
-        results, run_id = await self.runtime.execute_workflow_async(
-            workflow.build(), inputs={}
-        )
-
         list_result = results.get("list", {})
         versions = list_result.get("records", [])
 
@@ -351,18 +384,14 @@ class AgentService:
         Returns:
             Version data if found, None otherwise
         """
-        workflow = WorkflowBuilder()
-        workflow.add_node(
-            "AgentVersionReadNode",
-            "read",
-            {
-                "id": version_id,
-            },
-        )
-
         try:
-            results, _ = await self.runtime.execute_workflow_async(
-                workflow.build(), inputs={}
+            results = await execute_node(
+                self.runtime,
+                "AgentVersionReadNode",
+                "read",
+                {
+                    "id": version_id,
+                },
             )
             return results.get("read")
         except Exception:
@@ -425,8 +454,8 @@ class AgentService:
         now = datetime.now(UTC).isoformat()
         context_id = str(uuid.uuid4())
 
-        workflow = WorkflowBuilder()
-        workflow.add_node(
+        results = await execute_node(
+            self.runtime,
             "AgentContextCreateNode",
             "create",
             {
@@ -441,10 +470,6 @@ class AgentService:
             },
         )
 
-        results, _ = await self.runtime.execute_workflow_async(
-            workflow.build(), inputs={}
-        )
-
         return results.get("create", {})
 
     async def update_context(self, context_id: str, data: dict) -> dict | None:
@@ -464,8 +489,8 @@ class AgentService:
         if "is_active" in data:
             data["is_active"] = 1 if data["is_active"] else 0
 
-        workflow = WorkflowBuilder()
-        workflow.add_node(
+        results = await execute_node(
+            self.runtime,
             "AgentContextUpdateNode",
             "update",
             {
@@ -474,22 +499,15 @@ class AgentService:
             },
         )
 
-        results, _ = await self.runtime.execute_workflow_async(
-            workflow.build(), inputs={}
-        )
-
         # Get updated context
-        workflow2 = WorkflowBuilder()
-        workflow2.add_node(
+        results2 = await execute_node(
+            self.runtime,
             "AgentContextReadNode",
             "read",
             {
                 "id": context_id,
             },
         )
-        results2, _ = await self.runtime.execute_workflow_async(
-            workflow2.build(), inputs={}
-        )
         return results2.get("read")
 
     async def remove_context(self, context_id: str) -> bool:
@@ -502,8 +520,8 @@ class AgentService:
         Returns:
             True if deleted
         """
-        workflow = WorkflowBuilder()
-        workflow.add_node(
+        results = await execute_node(
+            self.runtime,
             "AgentContextDeleteNode",
             "delete",
             {
@@ -511,10 +529,6 @@ class AgentService:
             },
         )
 
-        results, _ = await self.runtime.execute_workflow_async(
-            workflow.build(), inputs={}
-        )
-
         return True
 
     async def list_contexts(self, agent_id: str) -> list:
@@ -527,8 +541,8 @@ class AgentService:
         Returns:
             List of context records
         """
-        workflow = WorkflowBuilder()
-        workflow.add_node(
+        results = await execute_node(
+            self.runtime,
             "AgentContextListNode",
             "list",
             {
@@ -538,13 +552,33 @@ class AgentService:
             },
         )
 
-        results, _ = await self.runtime.execute_workflow_async(
-            workflow.build(), inputs={}
-        )
-
         list_result = results.get("list", {})
         return list_result.get("records", [])
 
+    async def list_contexts_many(self, agent_ids: list) -> dict[str, list]:
+        """
+        List the contexts of several agents in a single query.
+
+        Args:
+            agent_ids: Agent IDs
+
+        Returns:
+            Dict mapping each agent ID to its context records
+        """
+        results = await execute_node(
+            self.runtime,
+            "AgentContextListNode",
+            "list",
+            {
+                "filter": {"agent_id": {"$in": agent_ids}},
+                "limit": 1000 * len(agent_ids),
+                "offset": 0,
+            },
+        )
+
+        records = results.get("list", {}).get("records", [])
+        return group_records(records, "agent_id", agent_ids)
+
     async def get_context(self, context_id: str) -> dict | None:
         """
         Get a context by ID.
@@ -555,8 +589,8 @@ class AgentService:
         Returns:
             Context data if found
         """
-        workflow = WorkflowBuilder()
-        workflow.add_node(
+        results = await execute_node(
+            self.runtime,
             "AgentContextReadNode",
             "read",
             {
@@ -564,10 +598,6 @@ class AgentService:
             },
         )
 
-        results, _ = await self.runtime.execute_workflow_async(
-            workflow.build(), inputs={}
-        )
-
         return results.get("read")
 
     # ===================
@@ -600,8 +630,8 @@ class AgentService:
         now = datetime.now(UTC).isoformat()
         tool_id = str(uuid.uuid4())
 
-        workflow = WorkflowBuilder()
-        workflow.add_node(
+        results = await execute_node(
+            self.runtime,
             "AgentToolCreateNode",
             "create",
             {
@@ -616,10 +646,6 @@ class AgentService:
             },
         )
 
-        results, _ = await self.runtime.execute_workflow_async(
-            workflow.build(), inputs={}
-        )
-
         return results.get("create", {})
 
     async def update_tool(self, tool_id: str, data: dict) -> dict | None:
@@ -641,8 +667,8 @@ class AgentService:
         if "config" in data and isinstance(data["config"], dict):
             data["config"] = json.dumps(data["config"])
 
-        workflow = WorkflowBuilder()
-        workflow.add_node(
+        results = await execute_node(
+            self.runtime,
             "AgentToolUpdateNode",
             "update",
             {
@@ -651,22 +677,15 @@ class AgentService:
             },
         )
 
-        results, _ = await self.runtime.execute_workflow_async(
-            workflow.build(), inputs={}
-        )
-
         # Get updated tool
-        workflow2 = WorkflowBuilder()
-        workflow2.add_node(
+        results2 = await execute_node(
+            self.runtime,
             "AgentToolReadNode",
             "read",
             {
                 "id": tool_id,
             },
         )
-        results2, _ = await self.runtime.execute_workflow_async(
-            workflow2.build(), inputs={}
-        )
         return results2.get("read")
 
     async def remove_tool(self, tool_id: str) -> bool:
@@ -679,8 +698,8 @@ class AgentService:
         Returns:
             True if deleted
         """
-        workflow = WorkflowBuilder()
-        workflow.add_node(
+        results = await execute_node(
+            self.runtime,
             "AgentToolDeleteNode",
             "delete",
             {
@@ -688,10 +707,6 @@ class AgentService:
             },
         )
 
-        results, _ = await self.runtime.execute_workflow_async(
-            workflow.build(), inputs={}
-        )
-
         return True
 
     async def list_tools(self, agent_id: str) -> list:
@@ -704,8 +719,8 @@ class AgentService:
         Returns:
             List of tool records
         """
-        workflow = WorkflowBuilder()
-        workflow.add_node(
+        results = await execute_node(
+            self.runtime,
             "AgentToolListNode",
             "list",
             {
@@ -715,13 +730,33 @@ class AgentService:
             },
         )
 
-        results, _ = await self.runtime.execute_workflow_async(
-            workflow.build(), inputs={}
-        )
-
         list_result = results.get("list", {})
         return list_result.get("records", [])
 
+    async def list_tools_many(self, agent_ids: list) -> dict[str, list]:
+        """
+        List the tools of several agents in a single query.
+
+        Args:
+            agent_ids: Agent IDs
+
+        Returns:
+            Dict mapping each agent ID to its tool records
+        """
+        results = await execute_node(
+            self.runtime,
+            "AgentToolListNode",
+            "list",
+            {
+                "filter": {"agent_id": {"$in": agent_ids}},
+                "limit": 1000 * len(agent_ids),
+                "offset": 0,
+            },
+        )
+
+        records = results.get("list", {}).get("records", [])
+        return group_records(records, "agent_id", agent_ids)
+
     async def get_tool(self, tool_id: str) -> dict | None:
         """
         Get a tool by ID.
@@ -732,8 +767,8 @@ class AgentService:
         Returns:
             Tool data if found
         """
-        workflow = WorkflowBuilder()
-        workflow.add_node(
+        results = await execute_node(
+            self.runtime,
             "AgentToolReadNode",
             "read",
             {
@@ -741,10 +776,6 @@ class AgentService:
             },
         )
 
-        results, _ = await self.runtime.execute_workflow_async(
-            workflow.build(), inputs={}
-        )
-
         return results.get("read")
 
     # ===================
@@ -761,14 +792,15 @@ class AgentService:
         Returns:
             Agent data with contexts and tools
         """
-        agent = await self.get(agent_id)
+        # The three queries are independent; loads of concurrent requests
+        # in the same tick are batched into one query per kind
+        agent, contexts, tools = await asyncio.gather(
+            self.agent_loader.load(agent_id),
+            self.context_loader.load(agent_id),
+            self.tool_loader.load(agent_id),
+        )
         if not agent:
             return None
 
-        contexts = await self.list_contexts(agent_id)
-        tools = await self.list_tools(agent_id)
-
-        agent["contexts"] = contexts
-        agent["tools"] = tools
-
-        return agent
+        # Loaded records may be shared with concurrent requests; don't mutate
+        return {**agent, "contexts": contexts, "tools": tools}
@@ -5,6 +5,7 @@ Business logic for API key management including creation, validation, and revoca
 """
 
 import json
+import logging
 import secrets
 import uuid
 from datetime import UTC, datetime
@@ -13,6 +14,10 @@ from kailash.runtime import AsyncLocalRuntime
 from kailash.workflow.builder import WorkflowBuilder
 from passlib.context import CryptContext
 
+from studio.services.read_repository import get_read_repository
+
+logger = logging.getLogger(__name__)
+
 # Password/key hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -42,9 +47,10 @@ class APIKeyService:
     - Rate limit configuration per key
     """
 
-    def __init__(self, runtime=None):
+    def __init__(self, runtime=None, reads=None):
         """Initialize the API key service."""
         self.runtime = runtime or AsyncLocalRuntime()
+        self.reads = reads or get_read_repository()
 
     def _generate_key(self) -> tuple[str, str]:
         """
@@ -267,12 +273,13 @@ class APIKeyService:
 
         await self.runtime.execute_workflow_async(workflow.build(), inputs={})
 
-    async def validate(self, plain_key: str) -> dict | None:
+    async def validate(self, plain_key: str, direct: bool = False) -> dict | None:
         """
         Validate an API key and return its record if valid.
 
         Args:
             plain_key: Plain text API key
+            direct: Look the key up with a prepared statement instead of a workflow
 
         Returns:
             API key record if valid, None otherwise
@@ -288,26 +295,10 @@ class APIKeyService:
         key_prefix = f"{parts[0]}_{parts[1]}_{parts[2]}"
 
         # Find key by prefix
-        workflow = WorkflowBuilder()
-        workflow.add_node(
-            "APIKeyListNode",
-            "find_key",
-            {
-                "filter": {"key_prefix": key_prefix},
-                "limit": 1,
-            },
-        )
-
-        results, _ = await self.runtime.execute_workflow_async(
-            workflow.build(), inputs={}
-        )
-
-        keys = results.get("find_key", {}).get("records", [])
-        if not keys:
+        key = await self._find_by_prefix(key_prefix, direct)
+        if not key:
             return None
 
-        key = keys[0]
-
         # Verify the full key hash
         if not self._verify_key(plain_key, key["key_hash"]):
             return None
@@ -338,6 +329,31 @@ class APIKeyService:
             "created_at": key["created_at"],
         }
 
+    async def _find_by_prefix(self, key_prefix: str, direct: bool) -> dict | None:
+        """Find a key record by prefix, directly or through an APIKeyListNode."""
+        if direct and self.reads.enabled:
+            try:
+                return await self.reads.find_api_key(key_prefix)
+            except Exception as e:
+                logger.warning(f"Direct API key lookup failed, using workflow: {e}")
+
+        workflow = WorkflowBuilder()
+        workflow.add_node(
+            "APIKeyListNode",
+            "find_key",
+            {
+                "filter": {"key_prefix": key_prefix},
+                "limit": 1,
+            },
+        )
+
+        results, _ = await self.runtime.execute_workflow_async(
+            workflow.build(), inputs={}
+        )
+
+        keys = results.get("find_key", {}).get("records", [])
+        return keys[0] if keys else None
+
     async def update_last_used(self, key_id: str) -> None:
         """
         Update the last_used_at timestamp for an API key.
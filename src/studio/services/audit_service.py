@@ -10,7 +10,9 @@ from datetime import UTC, datetime
 
 from dateutil.parser import isoparse
 from kailash.runtime import AsyncLocalRuntime
-from kailash.workflow.builder import WorkflowBuilder
+
+from studio.services.pagination import keyset_page, keyset_params
+from studio.services.workflow_templates import execute_node
 
 
 def _parse_datetime(value: str) -> datetime:
@@ -81,8 +83,8 @@ class AuditService:
         audit_id = str(uuid.uuid4())
         now = datetime.utcnow().isoformat()
 
-        workflow = WorkflowBuilder()
-        workflow.add_node(
+        results = await execute_node(
+            self.runtime,
             "AuditLogCreateNode",
             "create",
             {
@@ -100,10 +102,6 @@ class AuditService:
                 "created_at": now,
             },
         )
-
-        results, _ = await self.runtime.execute_workflow_async(
-            workflow.build(), inputs={}
-        )
         return results.get("create", {})
 
     async def list(
@@ -135,6 +133,53 @@ class AuditService:
         Returns:
             List of audit log entries
         """
+        page = await self.list_page(
+            organization_id,
+            user_id=user_id,
+            action=action,
+            resource_type=resource_type,
+            resource_id=resource_id,
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit,
+            offset=offset,
+        )
+        return page["records"]
+
+    async def list_page(
+        self,
+        organization_id: str,
+        user_id: str = None,
+        action: str = None,
+        resource_type: str = None,
+        resource_id: str = None,
+        start_date: str = None,
+        end_date: str = None,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: str = None,
+    ) -> dict:
+        """
+        List one page of audit logs with filters, newest first.
+
+        Args:
+            organization_id: Filter by organization
+            user_id: Filter by user
+            action: Filter by action type
+            resource_type: Filter by resource type
+            resource_id: Filter by resource ID
+            start_date: Filter by start date (ISO 8601)
+            end_date: Filter by end date (ISO 8601)
+            limit: Maximum number of results
+            offset: Offset for pagination (ignored with a cursor)
+            cursor: Cursor of the previous page (next_cursor)
+
+        Returns:
+            Dict with records and next_cursor
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
         # Build filter
         filters = {"organization_id": organization_id}
 
@@ -154,21 +199,16 @@ class AuditService:
             else:
                 filters["created_at"] = {"$lte": _parse_datetime(end_date)}
 
-        workflow = WorkflowBuilder()
-        workflow.add_node(
+        results = await execute_node(
+            self.runtime,
             "AuditLogListNode",
             "list",
-            {
-                "filter": filters,
-                "limit": limit,
-                "offset": offset,
-            },
+            keyset_params(filters, cursor, limit, offset),
         )
-
-        results, _ = await self.runtime.execute_workflow_async(
-            workflow.build(), inputs={}
+        records, next_cursor = keyset_page(
+            results.get("list", {}).get("records", []), limit
         )
-        return results.get("list", {}).get("records", [])
+        return {"records": records, "next_cursor": next_cursor}
 
     async def get(self, id: str) -> dict | None:
         """
@@ -180,12 +220,9 @@ class AuditService:
         Returns:
             Audit log entry or None
         """
-        workflow = WorkflowBuilder()
-        workflow.add_node("AuditLogReadNode", "read", {"id": id})
-
         try:
-            results, _ = await self.runtime.execute_workflow_async(
-                workflow.build(), inputs={}
+            results = await execute_node(
+                self.runtime, "AuditLogReadNode", "read", {"id": id}
             )
             return results.get("read")
         except Exception:
@@ -203,8 +240,8 @@ class AuditService:
         Returns:
             List of audit log entries for the user
         """
-        workflow = WorkflowBuilder()
-        workflow.add_node(
+        results = await execute_node(
+            self.runtime,
             "AuditLogListNode",
             "list",
             {
@@ -212,10 +249,6 @@ class AuditService:
                 "limit": limit,
             },
         )
-
-        results, _ = await self.runtime.execute_workflow_async(
-            workflow.build(), inputs={}
-        )
         return results.get("list", {}).get("records", [])
 
     async def get_resource_history(self, resource_type: str, resource_id: str) -> list:
@@ -229,8 +262,8 @@ class AuditService:
         Returns:
             List of audit log entries for the resource
         """
-        workflow = WorkflowBuilder()
-        workflow.add_node(
+        results = await execute_node(
+            self.runtime,
             "AuditLogListNode",
             "list",
             {
@@ -240,10 +273,6 @@ class AuditService:
                 },
             },
         )
-
-        results, _ = await self.runtime.execute_workflow_async(
-            workflow.build(), inputs={}
-        )
         return results.get("list", {}).get("records", [])
 
     async def count(
@@ -274,10 +303,7 @@ class AuditService:
         if resource_type:
             filters["resource_type"] = resource_type
 
-        workflow = WorkflowBuilder()
-        workflow.add_node("AuditLogCountNode", "count", {"filter": filters})
-
-        results, _ = await self.runtime.execute_workflow_async(
-            workflow.build(), inputs={}
+        results = await execute_node(
+            self.runtime, "AuditLogCountNode", "count", {"filter": filters}
         )
         return results.get("count", {}).get("count", 0)
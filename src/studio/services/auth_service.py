@@ -11,6 +11,7 @@ EATP Integration:
 """
 
 import json
+import logging
 import uuid
 from datetime import UTC, datetime, timedelta
 
@@ -21,6 +22,9 @@ from kailash.runtime import AsyncLocalRuntime
 from kailash.workflow.builder import WorkflowBuilder
 
 from studio.config import get_redis_url, get_settings
+from studio.services.read_repository import get_read_repository
+
+logger = logging.getLogger(__name__)
 
 
 class AuthService:
@@ -35,11 +39,17 @@ class AuthService:
     - Password hashing with bcrypt
     """
 
-    def __init__(self, runtime: AsyncLocalRuntime | None = None):
+    def __init__(
+        self,
+        runtime: AsyncLocalRuntime | None = None,
+        redis_client=None,
+        reads=None,
+    ):
         """Initialize the authentication service."""
         self.settings = get_settings()
-        self.redis_client = redis.from_url(get_redis_url())
+        self.redis_client = redis_client or redis.from_url(get_redis_url())
         self.runtime = runtime if runtime else AsyncLocalRuntime()
+        self.reads = reads or get_read_repository()
 
         # Use HS256 for development if no RSA keys provided
         if self.settings.jwt_private_key and self.settings.jwt_public_key:
@@ -483,30 +493,18 @@ class AuthService:
             "role": user["role"],
         }
 
-    async def get_user_by_id(self, user_id: str) -> dict | None:
+    async def get_user_by_id(self, user_id: str, direct: bool = False) -> dict | None:
         """
         Get a user by their ID.
 
         Args:
             user_id: User's unique identifier
+            direct: Read with a prepared statement instead of a workflow
 
         Returns:
             User data if found, None otherwise
         """
-        workflow = WorkflowBuilder()
-        workflow.add_node(
-            "UserReadNode",
-            "read_user",
-            {
-                "id": user_id,
-            },
-        )
-
-        results, _ = await self.runtime.execute_workflow_async(
-            workflow.build(), inputs={}
-        )
-
-        user = results.get("read_user")
+        user = await self._read_user(user_id, direct)
         if not user:
             return None
 
@@ -537,6 +535,29 @@ class AuthService:
             "primary_organization_id": user.get("primary_organization_id"),
         }
 
+    async def _read_user(self, user_id: str, direct: bool) -> dict | None:
+        """Read a user row, directly or through a UserReadNode workflow."""
+        if direct and self.reads.enabled:
+            try:
+                return await self.reads.get_user(user_id)
+            except Exception as e:
+                logger.warning(f"Direct user read failed, using workflow: {e}")
+
+        workflow = WorkflowBuilder()
+        workflow.add_node(
+            "UserReadNode",
+            "read_user",
+            {
+                "id": user_id,
+            },
+        )
+
+        results, _ = await self.runtime.execute_workflow_async(
+            workflow.build(), inputs={}
+        )
+
+        return results.get("read_user")
+
     def create_tokens(self, user: dict) -> dict:
         """
         Create access and refresh tokens for a user.
@@ -11,6 +11,8 @@ from datetime import UTC, datetime, timedelta
 from kailash.runtime import AsyncLocalRuntime
 from kailash.workflow.builder import WorkflowBuilder
 
+from studio.services.timestamps import time_range, utc_now
+
 # Pricing configuration
 PRICING = {
     "agent_execution": {"unit": "count", "price": 0.01},
@@ -49,9 +51,9 @@ class BillingService:
     Uses DataFlow nodes for all database operations.
     """
 
-    def __init__(self):
+    def __init__(self, runtime=None):
         """Initialize the billing service."""
-        self.runtime = AsyncLocalRuntime()
+        self.runtime = runtime or AsyncLocalRuntime()
 
     async def record_usage(
         self,
@@ -72,7 +74,7 @@ class BillingService:
         Returns:
             Created usage record
         """
-        now = datetime.now(UTC).isoformat()
+        now = utc_now()
         record_id = str(uuid.uuid4())
 
         # Get pricing for resource type
@@ -131,7 +133,9 @@ class BillingService:
             {
                 "filter": {
                     "organization_id": org_id,
-                    "recorded_at": {"$gte": start_date, "$lte": end_date},
+                    "recorded_at": time_range(
+                        "recorded_at", start_date, end_date, inclusive_end=True
+                    ),
                 },
                 "limit": 10000,
             },
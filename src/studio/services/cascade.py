@@ -0,0 +1,137 @@
+"""
+Cascade Writes
+
+Filtered bulk deletes/updates of an aggregate in a single transaction.
+Instead of listing child records and deleting each with its own workflow,
+every table of the aggregate gets one *BulkDeleteNode (or *BulkUpdateNode)
+with a filter; the nodes run in order inside one TransactionScopeNode, so the
+whole cascade is one workflow execution and either fully applies or rolls
+back.
+"""
+
+from dataclasses import dataclass
+
+from kailash.workflow.builder import WorkflowBuilder
+
+from studio.models.indexes import table_name
+from studio.services.query_cache import bump_model_version
+
+CASCADE_TIMEOUT_SECONDS = 30
+
+
+@dataclass(frozen=True)
+class CascadeStep:
+    """
+    One filtered bulk write of a cascade.
+
+    Attributes:
+        model: DataFlow model name
+        filter: Records to write (DataFlow filter)
+        fields: Fields to set; None deletes the records
+    """
+
+    model: str
+    filter: dict
+    fields: dict | None = None
+
+    @property
+    def node_type(self) -> str:
+        """Get the DataFlow bulk node type of the step."""
+        operation = "Delete" if self.fields is None else "Update"
+        return f"{self.model}Bulk{operation}Node"
+
+    @property
+    def node_id(self) -> str:
+        """Get the default node ID (e.g. "delete_team_memberships")."""
+        verb = "delete" if self.fields is None else "update"
+        return f"{verb}_{table_name(self.model)}"
+
+    def params(self) -> dict:
+        """Get the bulk node parameters."""
+        if self.fields is None:
+            return {"filter": self.filter, "confirmed": True}
+        return {"filter": self.filter, "fields": self.fields}
+
+
+def delete_where(model: str, **filters) -> CascadeStep:
+    """
+    Delete all records of a model matching a filter.
+
+    Examples:
+        >>> delete_where("TeamMembership", team_id=team_id)
+    """
+    return CascadeStep(model, filters)
+
+
+def update_where(model: str, filters: dict, fields: dict) -> CascadeStep:
+    """
+    Update all records of a model matching a filter.
+
+    Examples:
+        >>> update_where("TrustDelegation", {"status": "active"}, {"status": "revoked"})
+    """
+    return CascadeStep(model, filters, fields)
+
+
+def build_cascade(steps: list[CascadeStep]) -> tuple[WorkflowBuilder, list[str]]:
+    """
+    Build the transactional workflow for a cascade.
+
+    Steps run in the given order (children before their parent), chained
+    between a TransactionScopeNode and a TransactionCommitNode.
+
+    Args:
+        steps: Cascade steps
+
+    Returns:
+        (workflow builder, node ID of each step)
+    """
+    workflow = WorkflowBuilder()
+    workflow.add_node(
+        "TransactionScopeNode",
+        "tx",
+        {"timeout": CASCADE_TIMEOUT_SECONDS, "rollback_on_error": True},
+    )
+
+    node_ids = []
+    previous = "tx"
+    for step in steps:
+        node_id = step.node_id
+        if node_id in node_ids:
+            node_id = f"{node_id}_{len(node_ids)}"
+        workflow.add_node(step.node_type, node_id, step.params())
+        workflow.add_connection(previous, "result", node_id, "input")
+        node_ids.append(node_id)
+        previous = node_id
+
+    workflow.add_node("TransactionCommitNode", "commit", {})
+    workflow.add_connection(previous, "result", "commit", "input")
+
+    return workflow, node_ids
+
+
+async def execute_cascade(runtime, steps: list[CascadeStep]) -> dict:
+    """
+    Run cascade steps in one transaction (one workflow execution).
+
+    Cached reads of every touched model are invalidated afterwards, also if
+    the cascade failed.
+
+    Args:
+        runtime: AsyncLocalRuntime
+        steps: Cascade steps, children before their parent
+
+    Returns:
+        Bulk node results keyed by model name (the last step per model wins)
+    """
+    workflow, node_ids = build_cascade(steps)
+    try:
+        results, _ = await runtime.execute_workflow_async(workflow.build(), inputs={})
+    finally:
+        for model in dict.fromkeys(step.model for step in steps):
+            await bump_model_version(model)
+
+    return {
+        step.model: results.get(node_id)
+        for step, node_id in zip(steps, node_ids, strict=True)
+    }
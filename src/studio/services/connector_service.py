@@ -17,6 +17,7 @@ from motor import motor_asyncio
 from redis import asyncio as aioredis
 
 from studio.config import get_settings
+from studio.services.cascade import delete_where, execute_cascade
 
 # Connector types and their providers
 CONNECTOR_TYPES = {
@@ -237,7 +238,7 @@ class ConnectorService:
 
     async def delete(self, connector_id: str) -> bool:
         """
-        Delete a connector.
+        Delete a connector and its agent attachments in one transaction.
 
         Args:
             connector_id: Connector ID
@@ -245,22 +246,14 @@ class ConnectorService:
         Returns:
             True if deleted
         """
-        # First delete all instances
-        instances = await self.list_connector_instances(connector_id)
-        for instance in instances:
-            await self.detach_from_agent(instance["id"])
-
-        workflow = WorkflowBuilder()
-        workflow.add_node(
-            "ConnectorDeleteNode",
-            "delete",
-            {
-                "id": connector_id,
-            },
+        await execute_cascade(
+            self.runtime,
+            [
+                delete_where("ConnectorInstance", connector_id=connector_id),
+                delete_where("Connector", id=connector_id),
+            ],
         )
 
-        await self.runtime.execute_workflow_async(workflow.build(), inputs={})
-
         return True
 
     async def list(
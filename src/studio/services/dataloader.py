@@ -0,0 +1,138 @@
+"""
+Data Loader
+
+DataLoader-style batching of keyed reads.
+Loads requested in the same event loop tick - by the sub-queries of one
+request gathered with asyncio.gather(), or by concurrent requests sharing a
+service - are collected, de-duplicated and fetched with one batch query
+(e.g. a ListNode with an "$in" filter). Results are not kept after the batch
+resolves, so a loader never returns data older than its batch query.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from typing import Any
+
+DATALOADER_MAX_BATCH_SIZE = 100
+
+BatchLoadFn = Callable[[list], Awaitable[dict]]
+
+
+class DataLoader:
+    """
+    Batches and de-duplicates loads by key within an event loop tick.
+
+    The batch function receives the unique keys of a tick and returns a dict
+    of results by key; keys missing from it resolve to None. If it raises,
+    every load of the batch raises the same error.
+
+    Examples:
+        >>> agents = DataLoader(agent_service.get_many)
+        >>> first, second = await asyncio.gather(
+        ...     agents.load("agent-1"), agents.load("agent-2")
+        ... )  # one AgentListNode query
+    """
+
+    def __init__(
+        self,
+        batch_load: BatchLoadFn,
+        max_batch_size: int = DATALOADER_MAX_BATCH_SIZE,
+    ):
+        """
+        Initialize the loader.
+
+        Args:
+            batch_load: Async function mapping a list of keys to {key: result}
+            max_batch_size: Maximum keys per batch query
+        """
+        self.batch_load = batch_load
+        self.max_batch_size = max_batch_size
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pending: dict[Hashable, asyncio.Future] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load(self, key: Hashable) -> Any:
+        """
+        Load one key, batched with the other loads of this tick.
+
+        Args:
+            key: Key to load
+
+        Returns:
+            Result for the key, or None if the batch returned none
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Futures of another (closed) loop cannot be awaited here
+            self._loop = loop
+            self._pending = {}
+
+        future = self._pending.get(key)
+        if future is None:
+            if not self._pending:
+                loop.call_soon(self._dispatch)
+            future = loop.create_future()
+            self._pending[key] = future
+
+        # Shield the shared future: one cancelled caller must not cancel
+        # the load for the others
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: Iterable[Hashable]) -> list:
+        """
+        Load several keys in one batch.
+
+        Args:
+            keys: Keys to load
+
+        Returns:
+            Results in key order
+        """
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def _dispatch(self) -> None:
+        """Start the batch queries for the loads collected in this tick."""
+        pending, self._pending = self._pending, {}
+        keys = list(pending)
+        for start in range(0, len(keys), self.max_batch_size):
+            batch = {
+                key: pending[key] for key in keys[start : start + self.max_batch_size]
+            }
+            task = asyncio.ensure_future(self._run(batch))
+            # Keep a reference until done so the task is not garbage collected
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: dict[Hashable, asyncio.Future]) -> None:
+        """Run one batch query and resolve its futures."""
+        try:
+            results = await self.batch_load(list(batch))
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(results.get(key))
+
+
+def group_records(records: list, field: str, keys: Iterable[Hashable]) -> dict:
+    """
+    Group batch query records by a key field.
+
+    Args:
+        records: Records of a batch query
+        field: Field holding the key (e.g. "agent_id")
+        keys: Requested keys (each gets a list, empty if it has no records)
+
+    Returns:
+        {key: [records]}
+    """
+    grouped = {key: [] for key in keys}
+    for record in records:
+        group = grouped.get(record.get(field))
+        if group is not None:
+            group.append(record)
+    return grouped
@@ -16,6 +16,11 @@ from kailash.workflow.builder import WorkflowBuilder
 from studio.config import get_settings
 from studio.services.governance_service import GovernanceService
 from studio.services.lineage_service import LineageService
+from studio.services.pagination import keyset_page, keyset_params
+from studio.services.token_estimator import TokenEstimator
+
+# Flat per-invocation cost when an agent reports no usage and has no model pricing
+DEFAULT_INVOCATION_COST = 0.05
 
 
 class ExternalAgentService:
@@ -33,6 +38,7 @@ class ExternalAgentService:
         self.governance_service = governance_service or GovernanceService(
             runtime=self.runtime
         )
+        self.token_estimator = TokenEstimator()
 
         # Initialize encryption service
         settings = get_settings()
@@ -47,6 +53,19 @@ class ExternalAgentService:
             else encryption_key.encode()
         )
 
+    async def initialize(self) -> None:
+        """
+        Start governance components (Redis counters, write-behind workers,
+        approval expiry scheduler).
+
+        Called once by the service container when the app starts.
+        """
+        await self.governance_service.initialize()
+
+    async def close(self) -> None:
+        """Stop governance components, completing queued bookkeeping."""
+        await self.governance_service.close()
+
     def _normalize_response(self, data: dict | None) -> dict | None:
         """
         Normalize response data for API compatibility.
@@ -262,6 +281,73 @@ class ExternalAgentService:
             "usage_percentage": result.usage_percentage,
         }
 
+    def estimate_invocation_cost(self, agent: dict, request_data: dict) -> float:
+        """
+        Estimate the cost of an invocation before it is made.
+
+        Counts request tokens locally and prices them with the agent's model
+        (``config.model``). ``config.expected_output_tokens`` sets the expected
+        response size, defaulting to the request size. Agents without a model
+        use a flat per-invocation cost.
+
+        Args:
+            agent: ExternalAgent record
+            request_data: Request payload
+
+        Returns:
+            Estimated cost in USD
+        """
+        config = self._parse_config(agent)
+        model = config.get("model")
+        if not model:
+            return float(config.get("cost_per_invocation", DEFAULT_INVOCATION_COST))
+
+        input_tokens = self.token_estimator.count_payload(request_data, model)
+        output_tokens = int(config.get("expected_output_tokens", input_tokens))
+        return self.token_estimator.estimate_cost(model, input_tokens, output_tokens)
+
+    def calculate_actual_cost(
+        self, agent: dict, response_data: dict, estimated_cost: float
+    ) -> float:
+        """
+        Calculate the actual cost of an invocation from the agent's response.
+
+        Uses the ``usage`` block reported by the agent when present, otherwise
+        (including malformed payloads) the pre-invocation estimate.
+
+        Args:
+            agent: ExternalAgent record
+            response_data: Response payload
+            estimated_cost: Pre-invocation estimate
+
+        Returns:
+            Actual cost in USD
+        """
+        usage = None
+        if isinstance(response_data, dict):
+            metadata = response_data.get("metadata")
+            usage = response_data.get("usage") or (
+                metadata.get("usage") if isinstance(metadata, dict) else None
+            )
+        if not usage or not isinstance(usage, dict):
+            return estimated_cost
+
+        if "cost_usd" in usage:
+            return float(usage["cost_usd"])
+
+        model = self._parse_config(agent).get("model")
+        return self.token_estimator.usage_cost(model, usage)
+
+    def _parse_config(self, agent: dict) -> dict:
+        """Parse the agent's JSON config field."""
+        config = agent.get("config") or {}
+        if isinstance(config, str):
+            try:
+                config = json.loads(config)
+            except json.JSONDecodeError:
+                config = {}
+        return config if isinstance(config, dict) else {}
+
     # ===================
     # Invocation Logging
     # ===================
@@ -474,9 +560,10 @@ class ExternalAgentService:
         status: str | None = None,
         limit: int = 100,
         offset: int = 0,
+        cursor: str | None = None,
     ) -> dict:
         """
-        List external agents with filtering and pagination.
+        List external agents with filtering and pagination, newest first.
 
         Args:
             organization_id: Organization ID
@@ -484,10 +571,14 @@ class ExternalAgentService:
             platform: Optional platform filter
             status: Optional status filter
             limit: Page size
-            offset: Page offset
+            offset: Page offset (ignored with a cursor)
+            cursor: Cursor of the previous page (next_cursor)
 
         Returns:
-            Dictionary with agents, total, limit, offset
+            Dictionary with agents, total, limit, offset, next_cursor
+
+        Raises:
+            ValueError: If the cursor is malformed
         """
         # Build filter conditions
         filters = {"organization_id": organization_id}
@@ -502,11 +593,8 @@ class ExternalAgentService:
         workflow.add_node(
             "ExternalAgentListNode",
             "list",
-            {
-                "filter": filters,  # DataFlow expects 'filter' as a dict, not 'filters' as JSON
-                "limit": limit,
-                "offset": offset,
-            },
+            # DataFlow expects 'filter' as a dict, not 'filters' as JSON
+            keyset_params(filters, cursor, limit, offset),
         )
 
         results, _ = await self.runtime.execute_workflow_async(
@@ -518,6 +606,7 @@ class ExternalAgentService:
             "records", []
         )  # DataFlow ListNode returns "records", not "items"
         total = list_result.get("total", len(agents))
+        agents, next_cursor = keyset_page(agents, limit)
 
         # Remove encrypted credentials and normalize field names
         agents = [
@@ -532,6 +621,7 @@ class ExternalAgentService:
             "total": total,
             "limit": limit,
             "offset": offset,
+            "next_cursor": next_cursor,
         }
 
     async def update(self, agent_id: str, updates: dict) -> dict | None:
@@ -585,6 +675,10 @@ class ExternalAgentService:
 
         updated = results.get("update")
 
+        # Reload cached budget limits in every worker
+        if "budget_limit_monthly" in updates or "budget_limit_daily" in updates:
+            await self.governance_service.invalidate_budget(agent_id)
+
         # Remove encrypted credentials from response
         if updated and "encrypted_credentials" in updated:
             updated = updated.copy()
@@ -622,8 +716,11 @@ class ExternalAgentService:
         """
         Invoke an external agent with full lineage tracking.
 
-        Creates lineage record before invocation, executes the HTTP request,
-        and updates lineage with results.
+        Runs the governance pre-checks concurrently, creates lineage record
+        before invocation, executes the HTTP request, and updates lineage with
+        results. Cost and lineage bookkeeping is written behind by the
+        governance service's write-behind queue; the rate limit slot taken by
+        the pre-checks is given back if the invocation fails.
 
         Args:
             agent_id: External agent ID
@@ -650,29 +747,18 @@ class ExternalAgentService:
         if agent.get("status") == "deleted":
             raise ValueError(f"External agent {agent_id} is deleted")
 
-        # Estimate cost (simplified for now - can be enhanced with platform-specific pricing)
-        estimated_cost = 0.05  # $0.05 per invocation default
+        # Estimate cost from request tokens for the budget pre-check
+        estimated_cost = self.estimate_invocation_cost(agent, request_data)
 
-        # Check rate limit
-        rate_limit_ok, rate_limit_info = await self.check_rate_limit(
-            agent_id, user_id, organization_id
+        # Check (and take a rate limit slot) and budget concurrently
+        checks = await self.governance_service.run_pre_checks(
+            external_agent_id=agent_id,
+            organization_id=organization_id,
+            user_id=user_id,
+            estimated_cost=estimated_cost,
         )
-        if not rate_limit_ok:
-            error_msg = "Rate limit exceeded"
-            if rate_limit_info.get("retry_after_seconds"):
-                error_msg += (
-                    f" - retry after {rate_limit_info['retry_after_seconds']} seconds"
-                )
-            raise ValueError(error_msg)
-
-        # Check budget
-        budget_ok, budget_info = await self.check_budget(
-            agent_id, organization_id, estimated_cost
-        )
-        if not budget_ok:
-            raise ValueError(
-                f"Budget limit exceeded: {budget_info.get('reason', 'Unknown reason')}"
-            )
+        if not checks.allowed:
+            raise ValueError(checks.reason)
 
         # Create lineage record if external headers are provided
         lineage = None
@@ -696,6 +782,7 @@ class ExternalAgentService:
         trace_id = lineage["trace_id"] if lineage else str(uuid.uuid4())
 
         # Execute HTTP invocation
+        recorded = False
         try:
             # Make actual HTTP call to external agent
             async with httpx.AsyncClient() as client:
@@ -709,28 +796,26 @@ class ExternalAgentService:
 
                 response_data = response.json()
 
-                # Calculate actual cost (can be enhanced with platform-specific pricing)
-                actual_cost = estimated_cost
+                # Calculate actual cost from reported usage
+                actual_cost = self.calculate_actual_cost(
+                    agent, response_data, estimated_cost
+                )
 
-                # Record cost for budget tracking
-                await self.governance_service.record_invocation_cost(
+                # Record cost and invocation history (written behind)
+                await self.governance_service.record_invocation(
                     external_agent_id=agent_id,
                     organization_id=organization_id,
+                    user_id=user_id,
                     actual_cost=actual_cost,
                     execution_success=True,
                     metadata={"duration_ms": duration_ms},
                 )
+                recorded = True
 
-                # Record invocation for rate limiting
-                await self.governance_service.record_rate_limit_invocation(
-                    external_agent_id=agent_id,
-                    user_id=user_id,
-                    org_id=organization_id,
-                )
-
-                # Update lineage if created
+                # Update lineage if created (written behind)
                 if lineage:
-                    await self.lineage_service.update_lineage_result(
+                    await self.governance_service.write_behind.submit(
+                        self.lineage_service.update_lineage_result,
                         invocation_id=lineage["id"],
                         status="success",
                         response={
@@ -755,6 +840,8 @@ class ExternalAgentService:
                         "execution_time_ms": duration_ms,
                         "status": "success",
                         "trace_id": trace_id,
+                        "estimated_cost": estimated_cost,
+                        "actual_cost": actual_cost,
                         "invoked_at": invoked_at,
                         "completed_at": completed_at,
                     }
@@ -777,9 +864,19 @@ class ExternalAgentService:
             completed_at = end_time.isoformat()
             duration_ms = int((end_time - start_time).total_seconds() * 1000)
 
-            # Update lineage if created
+            # Failed invocations do not count against the rate limit
+            if not recorded:
+                await self.governance_service.release_rate_limit(
+                    checks.rate_limit,
+                    external_agent_id=agent_id,
+                    user_id=user_id,
+                    org_id=organization_id,
+                )
+
+            # Update lineage if created (written behind)
             if lineage:
-                await self.lineage_service.update_lineage_result(
+                await self.governance_service.write_behind.submit(
+                    self.lineage_service.update_lineage_result,
                     invocation_id=lineage["id"],
                     status="failure",
                     duration_ms=duration_ms,
@@ -805,6 +902,7 @@ class ExternalAgentService:
                     "status": "failed",
                     "error_message": str(e),
                     "trace_id": trace_id,
+                    "estimated_cost": estimated_cost,
                     "invoked_at": invoked_at,
                     "completed_at": completed_at,
                 }
@@ -26,10 +26,10 @@ class GatewayService:
     - Environment-based filtering
     """
 
-    def __init__(self):
+    def __init__(self, runtime=None):
         """Initialize the gateway service."""
         self.settings = get_settings()
-        self.runtime = AsyncLocalRuntime()
+        self.runtime = runtime or AsyncLocalRuntime()
         self._fernet = None
 
     @property
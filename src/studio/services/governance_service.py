@@ -6,24 +6,33 @@ into Kaizen Studio for external agent governance.
 
 This service is a thin integration layer that delegates to the production-ready
 governance components from studio_kaizen.trust.governance.
+
+run_pre_checks() runs the independent pre-invocation checks concurrently and
+stops at the first denial; record_invocation() hands post-invocation
+bookkeeping to a background write-behind queue.
 """
 
+import asyncio
 import logging
+from array import array
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any
 
 from kailash.runtime import AsyncLocalRuntime
-from kailash.workflow.builder import WorkflowBuilder
 
 from studio.config import get_settings, is_production
+from studio.services.write_behind import WriteBehindQueue
 
 # Try to import from studio_kaizen.trust.governance, fall back to stubs if not available
 try:
     from studio_kaizen.trust.governance import (
         # Budget
         BudgetCheckResult,
+        BudgetScope,
+        CachedBudgetStore,
+        DataFlowBudgetStore,
         ExternalAgentBudget,
         ExternalAgentBudgetEnforcer,
         # Rate limiting
@@ -39,12 +48,14 @@ try:
         PolicyEvaluationResult,
         # Approval
         ApprovalCheckResult,
+        ApprovalExpiryScheduler,
         ApprovalRequest,
         ApprovalStatus,
         ApprovalTriggerConfig,
         ApprovalWorkflowConfig,
         ExternalAgentApprovalManager,
         InMemoryApprovalStore,
+        InvocationHistoryIndex,
         TriggerContext,
     )
 
@@ -89,6 +100,7 @@ except ImportError:
         remaining: int = -1
         retry_after_seconds: int | None = None
         current_usage: dict = field(default_factory=dict)
+        acquired_at: float | None = None
 
     @dataclass
     class PolicyEvaluationResult:
@@ -122,10 +134,43 @@ except ImportError:
         requests_per_hour: int = 1000
         requests_per_day: int = 10000
 
+    @dataclass
+    class BudgetScope:
+        """Stub for budget scope."""
+
+        organization_id: str = ""
+        team_id: str | None = None
+        user_id: str | None = None
+        agent_id: str | None = None
+
+    class DataFlowBudgetStore:
+        """Stub for DataFlow budget store."""
+
+        def __init__(self, runtime=None, db=None):
+            pass
+
+    class CachedBudgetStore:
+        """Stub for cached budget store (default budget, no spend tracking)."""
+
+        def __init__(self, store=None, redis_url=None, ttl_seconds=60):
+            pass
+
+        async def initialize(self):
+            pass
+
+        async def close(self):
+            pass
+
+        async def get_budget(self, agent_id, scope) -> ExternalAgentBudget:
+            return ExternalAgentBudget(external_agent_id=agent_id)
+
+        async def invalidate(self, agent_id):
+            pass
+
     class ExternalAgentBudgetEnforcer:
         """Stub for budget enforcer."""
 
-        def __init__(self, runtime=None, db=None):
+        def __init__(self, runtime=None, db=None, store=None):
             pass
 
         async def check_budget(self, budget, cost) -> BudgetCheckResult:
@@ -136,13 +181,51 @@ except ImportError:
         async def record_usage(self, budget, cost, success, metadata=None):
             return budget
 
+    class _MinuteWindow:
+        """Ring buffer of 60 one-second invocation counts with a running total."""
+
+        __slots__ = ("counts", "head", "total")
+
+        def __init__(self):
+            self.counts = array("I", bytes(4 * 60))
+            self.head = 0
+            self.total = 0
+
+        def count(self, now: float) -> int:
+            """Advance to the second of now and return the window total."""
+            current = int(now)
+            if current > self.head:
+                if current - self.head >= 60:
+                    self.counts = array("I", bytes(4 * 60))
+                    self.total = 0
+                else:
+                    for second in range(self.head + 1, current + 1):
+                        self.total -= self.counts[second % 60]
+                        self.counts[second % 60] = 0
+                self.head = current
+            return self.total
+
+        def add(self, now: float) -> None:
+            """Count one invocation at now."""
+            self.count(now)
+            self.counts[self.head % 60] += 1
+            self.total += 1
+
+        def remove(self, at: float) -> None:
+            """Uncount one invocation counted at time at, if still in the window."""
+            second = int(at)
+            if self.head - 60 < second <= self.head and self.counts[second % 60]:
+                self.counts[second % 60] -= 1
+                self.total -= 1
+
     class ExternalAgentRateLimiter:
         """Stub for rate limiter that enforces limits for testing."""
 
         def __init__(self, redis_url=None, config=None):
             self.config = config or RateLimitConfig()
-            # Track invocations per key (agent_id:user_id:org_id)
-            self._invocations: dict[str, list[float]] = {}
+            # Minute window per key (agent_id:user_id:org_id), in order of
+            # last record so idle keys can be evicted from the front
+            self._windows: dict[str, _MinuteWindow] = {}
             import time
 
             self._time = time
@@ -151,7 +234,7 @@ except ImportError:
             pass
 
         async def close(self):
-            self._invocations.clear()
+            self._windows.clear()
 
         def _get_key(self, **kwargs) -> str:
             """Generate rate limit key from kwargs."""
@@ -160,23 +243,12 @@ except ImportError:
             org_id = kwargs.get("org_id", "")
             return f"{agent_id}:{user_id}:{org_id}"
 
-        def _clean_old_invocations(self, key: str, window_seconds: int) -> int:
-            """Remove old invocations outside the window and return current count."""
-            now = self._time.time()
-            cutoff = now - window_seconds
-            if key in self._invocations:
-                self._invocations[key] = [
-                    t for t in self._invocations[key] if t > cutoff
-                ]
-                return len(self._invocations[key])
-            return 0
-
         async def check_rate_limit(self, **kwargs) -> RateLimitCheckResult:
             """Check rate limit and enforce configured limits."""
-            key = self._get_key(**kwargs)
+            window = self._windows.get(self._get_key(**kwargs))
+            minute_count = window.count(self._time.time()) if window else 0
 
             # Check minute limit
-            minute_count = self._clean_old_invocations(key, 60)
             if minute_count >= self.config.requests_per_minute:
                 return RateLimitCheckResult(
                     allowed=False,
@@ -195,13 +267,37 @@ except ImportError:
                 current_usage={"minute": minute_count},
             )
 
-        async def record_invocation(self, **kwargs):
+        async def acquire(self, **kwargs) -> RateLimitCheckResult:
+            """Check the rate limit and record the invocation if allowed."""
+            now = self._time.time()
+            result = await self.check_rate_limit(**kwargs)
+            if result.allowed:
+                await self.record_invocation(now=now, **kwargs)
+                result.remaining -= 1
+                result.acquired_at = now
+            return result
+
+        async def release(self, acquired_at: float, **kwargs) -> None:
+            """Give back an invocation recorded by acquire()."""
+            window = self._windows.get(self._get_key(**kwargs))
+            if window:
+                window.remove(acquired_at)
+
+        async def record_invocation(self, now=None, **kwargs):
             """Record an invocation for rate limiting."""
             key = self._get_key(**kwargs)
-            now = self._time.time()
-            if key not in self._invocations:
-                self._invocations[key] = []
-            self._invocations[key].append(now)
+            if now is None:
+                now = self._time.time()
+            window = self._windows.pop(key, None) or _MinuteWindow()
+            window.add(now)
+            self._windows[key] = window
+
+            # Evict keys idle for a full minute (their window counts zero)
+            while self._windows:
+                oldest_key = next(iter(self._windows))
+                if self._windows[oldest_key].head > int(now) - 60:
+                    break
+                del self._windows[oldest_key]
 
     class ExternalAgentPolicyEngine:
         """Stub for policy engine that evaluates added policies."""
@@ -395,6 +491,8 @@ except ImportError:
         sensitive_data_patterns: list = field(default_factory=list)
         require_first_invocation: bool = False
         require_new_agent: bool = False
+        rate_trigger_count: int | None = None
+        rate_trigger_window_seconds: int = 3600
         require_production_approval: bool = False
         environments_requiring_approval: list = field(default_factory=list)
 
@@ -522,6 +620,33 @@ except ImportError:
             await self.store.save(request)
             return request
 
+    class ApprovalExpiryScheduler:
+        """Stub for approval expiry scheduler (stub requests never expire)."""
+
+        def __init__(self, manager, interval_seconds=None):
+            self.manager = manager
+
+        def start(self):
+            pass
+
+        async def stop(self):
+            pass
+
+    class InvocationHistoryIndex:
+        """Stub for invocation history (nothing is recorded)."""
+
+        def __init__(self, redis_url=None, window_seconds=3600):
+            self.redis_url = redis_url
+
+        async def initialize(self):
+            pass
+
+        async def close(self):
+            pass
+
+        async def record_invocation(self, agent_id, user_id, organization_id):
+            pass
+
 
 logger = logging.getLogger(__name__)
 
@@ -539,6 +664,49 @@ elif not APPROVAL_AVAILABLE:
     )
 
 
+@dataclass
+class GovernanceCheckResult:
+    """
+    Combined result of the pre-invocation governance checks.
+
+    Checks cancelled after another check denied the invocation have no
+    result (None).
+
+    Attributes:
+        allowed: Whether every check allowed the invocation
+        denied_by: Check that denied it ("rate_limit", "budget", "policy"
+            or "approval"), None if allowed
+        rate_limit: Rate limit check result
+        budget: Budget check result
+        policy: Policy evaluation result (if a policy context was given)
+        approval: Approval check result (if a payload was given)
+    """
+
+    allowed: bool = True
+    denied_by: str | None = None
+    rate_limit: RateLimitCheckResult | None = None
+    budget: BudgetCheckResult | None = None
+    policy: PolicyEvaluationResult | None = None
+    approval: ApprovalCheckResult | None = None
+
+    @property
+    def reason(self) -> str | None:
+        """Get the reason of the denial, None if allowed."""
+        if self.denied_by == "rate_limit":
+            reason = "Rate limit exceeded"
+            retry_after = self.rate_limit.retry_after_seconds
+            if retry_after:
+                reason += f" - retry after {retry_after} seconds"
+            return reason
+        if self.denied_by == "budget":
+            return f"Budget limit exceeded: {self.budget.reason or 'Unknown reason'}"
+        if self.denied_by == "policy":
+            return f"Policy denied: {self.policy.reason}"
+        if self.denied_by == "approval":
+            return f"Approval required: {self.approval.trigger_reason}"
+        return None
+
+
 class GovernanceService:
     """
     Governance service for external agent budget, rate limiting, policy enforcement,
@@ -613,17 +781,23 @@ class GovernanceService:
 
         # Get settings
         settings = get_settings()
+        self._redis_url = redis_url or getattr(
+            settings, "redis_url", "redis://localhost:6379/0"
+        )
 
-        # Initialize budget enforcer
+        # Initialize budget enforcer; limits are cached and spend is counted
+        # in Redis, shared by all workers
+        self.budget_store = CachedBudgetStore(
+            DataFlowBudgetStore(self.runtime, db),
+            redis_url=self._redis_url,
+        )
         self.budget_enforcer = ExternalAgentBudgetEnforcer(
             runtime=self.runtime,
             db=db,
+            store=self.budget_store,
         )
 
         # Initialize rate limiter (if Redis available)
-        self._redis_url = redis_url or getattr(
-            settings, "redis_url", "redis://localhost:6379/0"
-        )
         self._rate_limit_config = rate_limit_config or RateLimitConfig()
         self.rate_limiter: ExternalAgentRateLimiter | None = None
         self._rate_limiter_initialized = False
@@ -640,18 +814,28 @@ class GovernanceService:
         self._approval_workflow_config = approval_workflow_config or ApprovalWorkflowConfig()
         self.approval_manager: ExternalAgentApprovalManager | None = None
         self._approval_manager_initialized = False
+        self.expiry_scheduler: ApprovalExpiryScheduler | None = None
+
+        # First-seen markers and windowed counts for history-based triggers
+        self.invocation_history = InvocationHistoryIndex(
+            redis_url=self._redis_url,
+            window_seconds=self._approval_trigger_config.rate_trigger_window_seconds,
+        )
 
-        # Cache for agent budgets (avoid repeated DB lookups)
-        self._budget_cache: dict[str, ExternalAgentBudget] = {}
-        self._cache_ttl_seconds = 60
+        # Post-invocation bookkeeping runs in the background
+        self.write_behind = WriteBehindQueue("governance")
 
     async def initialize(self) -> None:
         """
         Initialize governance service components.
 
-        Initializes Redis connection for rate limiting and approval manager.
-        Gracefully degrades if components unavailable.
+        Initializes Redis connections for budget counters, rate limiting and
+        invocation history, and the approval manager. Gracefully degrades if
+        components unavailable.
         """
+        self.write_behind.start()
+        await self.budget_store.initialize()
+
         # Try to initialize rate limiter
         try:
             self.rate_limiter = ExternalAgentRateLimiter(
@@ -673,12 +857,18 @@ class GovernanceService:
 
         # Initialize approval manager
         try:
+            await self.invocation_history.initialize()
             self.approval_manager = ExternalAgentApprovalManager(
                 store=InMemoryApprovalStore(),
                 trigger_config=self._approval_trigger_config,
                 workflow_config=self._approval_workflow_config,
+                history_provider=self.invocation_history,
             )
             self._approval_manager_initialized = True
+
+            # Expire timed-out requests in the background
+            self.expiry_scheduler = ApprovalExpiryScheduler(self.approval_manager)
+            self.expiry_scheduler.start()
             logger.info("GovernanceService initialized with approval workflows")
         except Exception as e:
             logger.warning(
@@ -690,6 +880,13 @@ class GovernanceService:
 
     async def close(self) -> None:
         """Close governance service resources."""
+        # Complete queued bookkeeping while the rate limiter is still open
+        await self.write_behind.close()
+        if self.expiry_scheduler:
+            await self.expiry_scheduler.stop()
+            self.expiry_scheduler = None
+        await self.budget_store.close()
+        await self.invocation_history.close()
         if self.rate_limiter:
             await self.rate_limiter.close()
 
@@ -791,17 +988,14 @@ class GovernanceService:
             # Get or fetch budget for agent
             budget = await self._get_agent_budget(external_agent_id, organization_id)
 
-            # Record usage
-            updated_budget = await self.budget_enforcer.record_usage(
+            # Record usage (persisted and added to the spend counters)
+            await self.budget_enforcer.record_usage(
                 budget,
                 actual_cost,
                 execution_success,
                 metadata,
             )
 
-            # Update cache
-            self._budget_cache[external_agent_id] = updated_budget
-
             logger.info(
                 f"Recorded cost for {external_agent_id}: ${actual_cost:.4f}, "
                 f"success={execution_success}"
@@ -817,9 +1011,11 @@ class GovernanceService:
         organization_id: str,
     ) -> ExternalAgentBudget:
         """
-        Get or fetch budget configuration for external agent.
+        Get budget configuration and current spend for external agent.
 
-        Uses cache to avoid repeated database lookups.
+        Limits are cached by the budget store (reloaded after their TTL or an
+        invalidation) and spend comes from the shared Redis counters, so no
+        database read is needed in the steady state.
 
         Args:
             external_agent_id: External agent identifier
@@ -828,53 +1024,24 @@ class GovernanceService:
         Returns:
             ExternalAgentBudget configuration
         """
-        # Check cache
-        if external_agent_id in self._budget_cache:
-            return self._budget_cache[external_agent_id]
-
-        # Fetch from database using DataFlow
-        workflow = WorkflowBuilder()
-        workflow.add_node(
-            "ExternalAgentReadNode",
-            "read_agent",
-            {"id": external_agent_id},
-        )
-
-        results, _ = await self.runtime.execute_workflow_async(
-            workflow.build(),
-            inputs={},
-        )
-
-        agent = results.get("read_agent")
-        if not agent:
+        # Same (simplified) scope the enforcer records usage under, so
+        # counters are seeded from the agent's own usage records
+        scope = BudgetScope(organization_id=external_agent_id)
+        budget = await self.budget_store.get_budget(external_agent_id, scope)
+        if not budget:
             raise ValueError(f"External agent {external_agent_id} not found")
+        return budget
 
-        # Create budget object from agent configuration
-        # -1.0 means unlimited - use a very large value (10M) instead
-        monthly_limit = agent.get("budget_limit_monthly", 1000.0)
-        if monthly_limit < 0:
-            monthly_limit = 10_000_000.0  # 10M = effectively unlimited
-
-        daily_limit = agent.get("budget_limit_daily", -1.0)
-        if daily_limit < 0:
-            daily_limit = None  # None means no daily limit
-
-        budget = ExternalAgentBudget(
-            external_agent_id=external_agent_id,
-            monthly_budget_usd=monthly_limit,
-            monthly_spent_usd=0.0,  # TODO: Fetch from BudgetHistory
-            daily_budget_usd=daily_limit,
-            daily_spent_usd=0.0,  # TODO: Fetch from BudgetHistory
-            cost_per_execution=0.05,  # Default estimate
-            warning_threshold=0.80,
-            degradation_threshold=0.90,
-            enforcement_mode="hard",
-        )
+    async def invalidate_budget(self, external_agent_id: str) -> None:
+        """
+        Reload budget limits of an agent in every worker.
 
-        # Cache budget
-        self._budget_cache[external_agent_id] = budget
+        Call after the agent's budget limits were changed.
 
-        return budget
+        Args:
+            external_agent_id: External agent identifier
+        """
+        await self.budget_store.invalidate(external_agent_id)
 
     # ===================
     # Rate Limiting
@@ -890,6 +1057,9 @@ class GovernanceService:
         """
         Check if request is within rate limits.
 
+        Does not count the request; invocations take their slot with
+        acquire_rate_limit() (run_pre_checks() does).
+
         Args:
             external_agent_id: External agent identifier
             user_id: User identifier
@@ -901,18 +1071,61 @@ class GovernanceService:
 
         Examples:
             >>> result = await service.check_rate_limit("agent-001", "user-001")
-            >>> if result.allowed:
-            ...     # Proceed with invocation
-            ...     await invoke_agent()
-            ...     # Record invocation for rate limiting
-            ...     await service.record_rate_limit_invocation("agent-001", "user-001")
-            >>> else:
+            >>> if not result.allowed:
             ...     # Return 429 Too Many Requests
             ...     raise HTTPException(
             ...         429,
             ...         headers={"Retry-After": str(result.retry_after_seconds)}
             ...     )
         """
+        return await self._limit_rate(
+            "check_rate_limit", external_agent_id, user_id, team_id, org_id
+        )
+
+    async def acquire_rate_limit(
+        self,
+        external_agent_id: str,
+        user_id: str,
+        team_id: str | None = None,
+        org_id: str | None = None,
+    ) -> RateLimitCheckResult:
+        """
+        Check rate limits and count the invocation if allowed, atomically.
+
+        Concurrent invocations cannot both take the last free slot. Give the
+        slot back with release_rate_limit() if the invocation does not run
+        or fails.
+
+        Args:
+            external_agent_id: External agent identifier
+            user_id: User identifier
+            team_id: Optional team identifier
+            org_id: Optional organization identifier
+
+        Returns:
+            RateLimitCheckResult; acquired_at is set if the invocation was counted
+
+        Examples:
+            >>> result = await service.acquire_rate_limit("agent-001", "user-001")
+            >>> if result.allowed:
+            ...     try:
+            ...         await invoke_agent()
+            ...     except Exception:
+            ...         await service.release_rate_limit(result, "agent-001", "user-001")
+        """
+        return await self._limit_rate(
+            "acquire", external_agent_id, user_id, team_id, org_id
+        )
+
+    async def _limit_rate(
+        self,
+        method: str,
+        external_agent_id: str,
+        user_id: str,
+        team_id: str | None,
+        org_id: str | None,
+    ) -> RateLimitCheckResult:
+        """Call a rate limiter method with the service's failure handling."""
         # Graceful degradation if rate limiter not initialized
         if not self.rate_limiter or not self._rate_limiter_initialized:
             logger.warning(
@@ -927,7 +1140,7 @@ class GovernanceService:
 
         try:
             # Check rate limit
-            result = await self.rate_limiter.check_rate_limit(
+            result = await getattr(self.rate_limiter, method)(
                 agent_id=external_agent_id,
                 user_id=user_id,
                 team_id=team_id,
@@ -960,6 +1173,42 @@ class GovernanceService:
                     retry_after_seconds=None,
                 )
 
+    async def release_rate_limit(
+        self,
+        result: RateLimitCheckResult | None,
+        external_agent_id: str,
+        user_id: str,
+        team_id: str | None = None,
+        org_id: str | None = None,
+    ) -> None:
+        """
+        Give back the slot taken by acquire_rate_limit().
+
+        Does nothing if the result did not count an invocation.
+
+        Args:
+            result: Result of acquire_rate_limit()
+            external_agent_id: External agent identifier
+            user_id: User identifier
+            team_id: Optional team identifier
+            org_id: Optional organization identifier
+        """
+        if result is None or getattr(result, "acquired_at", None) is None:
+            return
+        if not self.rate_limiter or not self._rate_limiter_initialized:
+            return
+
+        try:
+            await self.rate_limiter.release(
+                result.acquired_at,
+                agent_id=external_agent_id,
+                user_id=user_id,
+                team_id=team_id,
+                org_id=org_id,
+            )
+        except Exception as e:
+            logger.error(f"Failed to release rate limit invocation: {e}")
+
     async def record_rate_limit_invocation(
         self,
         external_agent_id: str,
@@ -1287,6 +1536,169 @@ class GovernanceService:
             organization_id=organization_id,
         )
 
+    # ===================
+    # Invocation Pipeline
+    # ===================
+
+    async def run_pre_checks(
+        self,
+        external_agent_id: str,
+        organization_id: str,
+        user_id: str,
+        estimated_cost: float,
+        team_id: str | None = None,
+        policy_context: ExternalAgentPolicyContext | None = None,
+        payload: dict[str, Any] | None = None,
+        environment: str = "development",
+    ) -> GovernanceCheckResult:
+        """
+        Run the pre-invocation governance checks concurrently.
+
+        Rate limit and budget are always checked; policies are evaluated if a
+        policy context is given and approval triggers if a payload is given.
+        The checks are independent, so they run at the same time and the
+        invocation waits for the slowest instead of the sum. The first denial
+        cancels the checks still running.
+
+        The rate limit check acquires the invocation's slot atomically. If
+        another check denies, the slot is released again; if the invocation
+        itself fails, the caller releases it with release_rate_limit().
+
+        Args:
+            external_agent_id: External agent identifier
+            organization_id: Organization identifier
+            user_id: User identifier
+            estimated_cost: Estimated cost in USD
+            team_id: Optional team identifier
+            policy_context: Optional policy evaluation context
+            payload: Optional invocation payload for approval triggers
+            environment: Environment for approval triggers
+
+        Returns:
+            GovernanceCheckResult with the result of each finished check
+
+        Examples:
+            >>> checks = await service.run_pre_checks(
+            ...     "agent-001", "org-001", "user-001", estimated_cost=0.25
+            ... )
+            >>> if not checks.allowed:
+            ...     raise HTTPException(403, detail=checks.reason)
+        """
+        checks = {
+            "rate_limit": self.acquire_rate_limit(
+                external_agent_id=external_agent_id,
+                user_id=user_id,
+                team_id=team_id,
+                org_id=organization_id,
+            ),
+            "budget": self.check_budget(
+                external_agent_id=external_agent_id,
+                organization_id=organization_id,
+                estimated_cost=estimated_cost,
+                user_id=user_id,
+            ),
+        }
+        if policy_context is not None:
+            checks["policy"] = self.evaluate_policy(external_agent_id, policy_context)
+        if payload is not None:
+            checks["approval"] = self.check_approval_required(
+                external_agent_id=external_agent_id,
+                organization_id=organization_id,
+                user_id=user_id,
+                payload=payload,
+                estimated_cost=estimated_cost,
+                team_id=team_id,
+                environment=environment,
+            )
+
+        tasks = {asyncio.ensure_future(check): name for name, check in checks.items()}
+        result = GovernanceCheckResult()
+        try:
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    name = tasks[task]
+                    check_result = task.result()
+                    setattr(result, name, check_result)
+                    if result.allowed and self._denies(name, check_result):
+                        result.allowed = False
+                        result.denied_by = name
+                if not result.allowed:
+                    break
+        finally:
+            for task, name in tasks.items():
+                # A cancelled acquire may already have taken the slot
+                if name != "rate_limit" or result.allowed:
+                    task.cancel()
+
+        if not result.allowed:
+            logger.info(f"Pre-checks denied {external_agent_id}: {result.denied_by}")
+            if result.denied_by != "rate_limit":
+                # Give back the slot acquired for the denied invocation
+                rate_limit = next(t for t, n in tasks.items() if n == "rate_limit")
+                await self.release_rate_limit(
+                    await rate_limit,
+                    external_agent_id=external_agent_id,
+                    user_id=user_id,
+                    team_id=team_id,
+                    org_id=organization_id,
+                )
+        return result
+
+    @staticmethod
+    def _denies(check: str, result: Any) -> bool:
+        """Whether a pre-check result denies the invocation."""
+        if check == "policy":
+            return result.effect == PolicyEffect.DENY
+        if check == "approval":
+            return result.required
+        return not result.allowed
+
+    async def record_invocation(
+        self,
+        external_agent_id: str,
+        organization_id: str,
+        user_id: str,
+        actual_cost: float,
+        execution_success: bool,
+        team_id: str | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Queue the post-invocation bookkeeping of an invocation.
+
+        The cost and the invocation history of approval triggers are recorded
+        by the write-behind queue, so the caller does not wait for the writes.
+        close() completes the queued writes. The rate limit slot was already
+        taken by run_pre_checks().
+
+        Args:
+            external_agent_id: External agent identifier
+            organization_id: Organization identifier
+            user_id: User identifier
+            actual_cost: Actual execution cost in USD
+            execution_success: Whether execution succeeded
+            team_id: Optional team identifier
+            metadata: Optional execution metadata
+        """
+        await self.write_behind.submit(
+            self.record_invocation_cost,
+            external_agent_id=external_agent_id,
+            organization_id=organization_id,
+            actual_cost=actual_cost,
+            execution_success=execution_success,
+            metadata=metadata,
+        )
+        await self.write_behind.submit(
+            self.invocation_history.record_invocation,
+            agent_id=external_agent_id,
+            user_id=user_id,
+            organization_id=organization_id,
+        )
+
     # ===================
     # Governance Status
     # ===================
@@ -1398,5 +1810,6 @@ class GovernanceService:
 
 
 __all__ = [
+    "GovernanceCheckResult",
     "GovernanceService",
 ]
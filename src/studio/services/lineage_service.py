@@ -14,6 +14,7 @@ from kailash.workflow.builder import WorkflowBuilder
 
 # Import studio.models to ensure DataFlow models and nodes are registered
 import studio.models  # noqa: F401
+from studio.services.pagination import keyset_page, keyset_params
 
 
 class LineageService:
@@ -292,17 +293,22 @@ class LineageService:
         filters: dict | None = None,
         page: int = 1,
         limit: int = 100,
+        cursor: str | None = None,
     ) -> dict:
         """
-        List lineage records with filtering and pagination.
+        List lineage records with filtering and pagination, newest first.
 
         Args:
             filters: Filter conditions (external_user_id, organization_id, status, etc.)
-            page: Page number (1-indexed)
+            page: Page number (1-indexed, ignored with a cursor)
             limit: Page size
+            cursor: Cursor of the previous page (next_cursor)
 
         Returns:
-            Dictionary with lineages, total, page, limit
+            Dictionary with lineages, total, page, limit, next_cursor
+
+        Raises:
+            ValueError: If the cursor is malformed
         """
         offset = (page - 1) * limit
 
@@ -313,11 +319,8 @@ class LineageService:
         workflow.add_node(
             "InvocationLineageListNode",
             "list",
-            {
-                "filter": filter_conditions,  # DataFlow expects "filter" as dict
-                "limit": limit,
-                "offset": offset,
-            },
+            # DataFlow expects "filter" as dict
+            keyset_params(filter_conditions, cursor, limit, offset),
         )
 
         results, _ = await self.runtime.execute_workflow_async(
@@ -347,11 +350,14 @@ class LineageService:
                 else 0
             )
 
+        lineages, next_cursor = keyset_page(lineages, limit)
+
         return {
             "lineages": lineages,
             "total": total,
             "page": page,
             "limit": limit,
+            "next_cursor": next_cursor,
         }
 
     # ===================
@@ -6,10 +6,23 @@ Supports OpenAI, Anthropic, and Azure OpenAI.
 """
 
 import os
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
 
 import httpx
 
+from studio.services.request_coalescer import (
+    RequestCoalescer,
+    request_key,
+    should_coalesce,
+)
+
+# Shared across LLMService instances so concurrent handlers coalesce together
+_coalescer = RequestCoalescer()
+
+# Provider request timeout in seconds
+LLM_TIMEOUT_SECONDS = 120.0
+
 
 class LLMService:
     """
@@ -19,8 +32,15 @@ class LLMService:
     - OpenAI (gpt-4, gpt-4o, gpt-4-turbo, gpt-3.5-turbo)
     - Anthropic (claude-3-opus, claude-3-sonnet, claude-3-haiku)
     - Azure OpenAI
+
+    Identical concurrent requests can be coalesced into a single provider call
+    (see request_coalescer). Coalescing is opt-in per call and never applies to
+    sampled requests (temperature > 0) unless explicitly allowed.
     """
 
+    # Shared HTTP client profile used when built by the service container
+    HTTP_CLIENT = "llm"
+
     # Model to provider mapping
     PROVIDER_MAP = {
         # OpenAI models
@@ -57,12 +77,30 @@ class LLMService:
         "claude-opus-4.5": "claude-opus-4-5-20251101",
     }
 
-    def __init__(self):
-        """Initialize LLM service with API keys from environment."""
+    def __init__(self, http_client: httpx.AsyncClient | None = None):
+        """
+        Initialize LLM service with API keys from environment.
+
+        Args:
+            http_client: Optional shared HTTP client (pooled connections to
+                providers); a client per call is used otherwise
+        """
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
         self.anthropic_api_key = os.getenv("ANTHROPIC_API_KEY")
         self.azure_api_key = os.getenv("AZURE_OPENAI_API_KEY")
         self.azure_endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
+        self.coalescer = _coalescer
+        self.http_client = http_client
+
+    @asynccontextmanager
+    async def _client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Get the shared HTTP client, or a short-lived one if none is set."""
+        if self.http_client is not None:
+            yield self.http_client
+            return
+
+        async with httpx.AsyncClient(timeout=LLM_TIMEOUT_SECONDS) as client:
+            yield client
 
     def get_provider(self, model_id: str) -> str:
         """Get the provider for a given model ID."""
@@ -80,6 +118,8 @@ class LLMService:
         temperature: float = 0.7,
         max_tokens: int = 4096,
         conversation_history: list | None = None,
+        coalesce: bool = False,
+        coalesce_nondeterministic: bool = False,
     ) -> dict:
         """
         Execute a chat completion request.
@@ -91,10 +131,53 @@ class LLMService:
             temperature: Temperature setting (0.0-2.0)
             max_tokens: Maximum tokens in response
             conversation_history: Optional list of previous messages
+            coalesce: Share one provider call with identical in-flight requests
+            coalesce_nondeterministic: Also coalesce when temperature > 0
 
         Returns:
             Dict with 'content', 'model', 'usage', 'finish_reason'
+            (and 'coalesced' when the result was shared with another caller)
         """
+        if should_coalesce(temperature, coalesce, coalesce_nondeterministic):
+            key = self._request_key(
+                model_id,
+                system_prompt,
+                user_message,
+                temperature,
+                max_tokens,
+                conversation_history,
+            )
+            return await self.coalescer.run(
+                key,
+                lambda: self._chat_completion(
+                    model_id,
+                    system_prompt,
+                    user_message,
+                    temperature,
+                    max_tokens,
+                    conversation_history,
+                ),
+            )
+
+        return await self._chat_completion(
+            model_id,
+            system_prompt,
+            user_message,
+            temperature,
+            max_tokens,
+            conversation_history,
+        )
+
+    async def _chat_completion(
+        self,
+        model_id: str,
+        system_prompt: str,
+        user_message: str,
+        temperature: float,
+        max_tokens: int,
+        conversation_history: list | None,
+    ) -> dict:
+        """Dispatch a chat completion to the provider for the model."""
         provider = self.get_provider(model_id)
         model = self.normalize_model(model_id)
 
@@ -125,6 +208,9 @@ class LLMService:
         temperature: float = 0.7,
         max_tokens: int = 4096,
         conversation_history: list | None = None,
+        coalesce: bool = False,
+        coalesce_nondeterministic: bool = False,
+        usage: dict | None = None,
     ) -> AsyncGenerator[str, None]:
         """
         Execute a streaming chat completion request.
@@ -136,10 +222,70 @@ class LLMService:
             temperature: Temperature setting
             max_tokens: Maximum tokens
             conversation_history: Optional previous messages
+            coalesce: Multicast one upstream stream to identical in-flight requests
+            coalesce_nondeterministic: Also coalesce when temperature > 0
+            usage: Optional dict filled with the provider-reported token usage
+                ('prompt_tokens', 'completion_tokens', 'total_tokens') once the
+                stream completes; 'coalesced' is set when the stream was shared
 
         Yields:
             Chunks of the response content
         """
+        if should_coalesce(temperature, coalesce, coalesce_nondeterministic):
+            key = self._request_key(
+                model_id,
+                system_prompt,
+                user_message,
+                temperature,
+                max_tokens,
+                conversation_history,
+                stream=True,
+            )
+            if usage is not None and self.coalescer.is_streaming(key):
+                usage["coalesced"] = True
+            items = self.coalescer.stream(
+                key,
+                lambda: self._chat_completion_stream(
+                    model_id,
+                    system_prompt,
+                    user_message,
+                    temperature,
+                    max_tokens,
+                    conversation_history,
+                ),
+            )
+        else:
+            items = self._chat_completion_stream(
+                model_id,
+                system_prompt,
+                user_message,
+                temperature,
+                max_tokens,
+                conversation_history,
+            )
+
+        async for item in items:
+            if isinstance(item, dict):
+                # Usage report emitted by the provider stream after the content
+                if usage is not None:
+                    usage.update(item)
+                continue
+            yield item
+
+    async def _chat_completion_stream(
+        self,
+        model_id: str,
+        system_prompt: str,
+        user_message: str,
+        temperature: float,
+        max_tokens: int,
+        conversation_history: list | None,
+    ) -> AsyncGenerator[str | dict, None]:
+        """
+        Dispatch a streaming chat completion to the provider for the model.
+
+        Yields content chunks (str) followed by a single usage dict.
+        """
         provider = self.get_provider(model_id)
         model = self.normalize_model(model_id)
 
@@ -164,6 +310,27 @@ class LLMService:
             ):
                 yield chunk
 
+    def _request_key(
+        self,
+        model_id: str,
+        system_prompt: str,
+        user_message: str,
+        temperature: float,
+        max_tokens: int,
+        conversation_history: list | None,
+        stream: bool = False,
+    ) -> str:
+        """Build the coalescing key for a chat completion request."""
+        return request_key(
+            model=self.normalize_model(model_id),
+            system_prompt=system_prompt,
+            user_message=user_message,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            conversation_history=conversation_history or [],
+            stream=stream,
+        )
+
     async def _openai_chat(
         self,
         model: str,
@@ -184,7 +351,7 @@ class LLMService:
             messages.extend(conversation_history)
         messages.append({"role": "user", "content": user_message})
 
-        async with httpx.AsyncClient(timeout=120.0) as client:
+        async with self._client() as client:
             response = await client.post(
                 "https://api.openai.com/v1/chat/completions",
                 headers={
@@ -231,7 +398,7 @@ class LLMService:
                 messages.append({"role": role, "content": msg["content"]})
         messages.append({"role": "user", "content": user_message})
 
-        async with httpx.AsyncClient(timeout=120.0) as client:
+        async with self._client() as client:
             response = await client.post(
                 "https://api.anthropic.com/v1/messages",
                 headers={
@@ -278,7 +445,7 @@ class LLMService:
         temperature: float,
         max_tokens: int,
         conversation_history: list | None,
-    ) -> AsyncGenerator[str, None]:
+    ) -> AsyncGenerator[str | dict, None]:
         """Execute streaming OpenAI chat completion."""
         if not self.openai_api_key:
             raise ValueError("OPENAI_API_KEY not configured")
@@ -290,7 +457,7 @@ class LLMService:
             messages.extend(conversation_history)
         messages.append({"role": "user", "content": user_message})
 
-        async with httpx.AsyncClient(timeout=120.0) as client:
+        async with self._client() as client:
             async with client.stream(
                 "POST",
                 "https://api.openai.com/v1/chat/completions",
@@ -304,9 +471,11 @@ class LLMService:
                     "temperature": temperature,
                     "max_tokens": max_tokens if max_tokens > 0 else None,
                     "stream": True,
+                    "stream_options": {"include_usage": True},
                 },
             ) as response:
                 response.raise_for_status()
+                usage = {}
                 async for line in response.aiter_lines():
                     if line.startswith("data: "):
                         data = line[6:]
@@ -316,12 +485,23 @@ class LLMService:
                             import json
 
                             chunk = json.loads(data)
+                            # Final chunk carries usage and an empty choices list
+                            if chunk.get("usage"):
+                                usage = chunk["usage"]
+                            if not chunk.get("choices"):
+                                continue
                             delta = chunk["choices"][0].get("delta", {})
-                            if "content" in delta:
+                            if delta.get("content"):
                                 yield delta["content"]
                         except Exception:
                             continue
 
+                yield {
+                    "prompt_tokens": usage.get("prompt_tokens", 0),
+                    "completion_tokens": usage.get("completion_tokens", 0),
+                    "total_tokens": usage.get("total_tokens", 0),
+                }
+
     async def _anthropic_stream(
         self,
         model: str,
@@ -330,7 +510,7 @@ class LLMService:
         temperature: float,
         max_tokens: int,
         conversation_history: list | None,
-    ) -> AsyncGenerator[str, None]:
+    ) -> AsyncGenerator[str | dict, None]:
         """Execute streaming Anthropic chat completion."""
         if not self.anthropic_api_key:
             raise ValueError("ANTHROPIC_API_KEY not configured")
@@ -344,7 +524,7 @@ class LLMService:
                 messages.append({"role": role, "content": msg["content"]})
         messages.append({"role": "user", "content": user_message})
 
-        async with httpx.AsyncClient(timeout=120.0) as client:
+        async with self._client() as client:
             async with client.stream(
                 "POST",
                 "https://api.anthropic.com/v1/messages",
@@ -363,6 +543,8 @@ class LLMService:
                 },
             ) as response:
                 response.raise_for_status()
+                input_tokens = 0
+                output_tokens = 0
                 async for line in response.aiter_lines():
                     if line.startswith("data: "):
                         data = line[6:]
@@ -371,15 +553,30 @@ class LLMService:
 
                             event = json.loads(data)
                             event_type = event.get("type")
-                            if event_type == "content_block_delta":
+                            if event_type == "message_start":
+                                message_usage = event.get("message", {}).get("usage", {})
+                                input_tokens = message_usage.get("input_tokens", 0)
+                                output_tokens = message_usage.get("output_tokens", 0)
+                            elif event_type == "content_block_delta":
                                 delta = event.get("delta", {})
                                 if delta.get("type") == "text_delta":
                                     yield delta.get("text", "")
+                            elif event_type == "message_delta":
+                                # Cumulative output token count
+                                output_tokens = event.get("usage", {}).get(
+                                    "output_tokens", output_tokens
+                                )
                             elif event_type == "message_stop":
                                 break
                         except Exception:
                             continue
 
+                yield {
+                    "prompt_tokens": input_tokens,
+                    "completion_tokens": output_tokens,
+                    "total_tokens": input_tokens + output_tokens,
+                }
+
     def is_configured(self, model_id: str) -> bool:
         """Check if the required API key is configured for a model."""
         provider = self.get_provider(model_id)
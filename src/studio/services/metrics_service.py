@@ -11,6 +11,7 @@ from kailash.runtime import AsyncLocalRuntime
 from kailash.workflow.builder import WorkflowBuilder
 
 from studio.config import get_settings
+from studio.services.timestamps import parse_timestamp, time_range, utc_now
 
 
 class MetricsService:
@@ -42,22 +43,7 @@ class MetricsService:
         Returns:
             Parsed datetime object (always timezone-aware in UTC)
         """
-        if not date_str:
-            raise ValueError("Date string cannot be empty")
-
-        # Normalize the date string
-        normalized = date_str
-        if normalized.endswith("Z"):
-            normalized = normalized[:-1] + "+00:00"
-
-        try:
-            parsed = datetime.fromisoformat(normalized)
-            # Ensure the datetime is timezone-aware (convert naive to UTC)
-            if parsed.tzinfo is None:
-                parsed = parsed.replace(tzinfo=UTC)
-            return parsed
-        except ValueError as e:
-            raise ValueError(f"Invalid date format: {date_str}") from e
+        return parse_timestamp(date_str)
 
     async def record(self, metric: dict) -> dict:
         """
@@ -69,7 +55,7 @@ class MetricsService:
         Returns:
             Created metric data
         """
-        now = datetime.now(UTC).isoformat()
+        now = utc_now()
         metric_id = str(uuid.uuid4())
 
         metric_data = {
@@ -121,27 +107,16 @@ class MetricsService:
         Returns:
             Summary with avg latency, total tokens, error rate, cost
         """
-        # Get all metrics matching filters
+        # Get all metrics matching filters (date range applied in the database)
         metrics = await self.list(
             organization_id=organization_id,
             deployment_id=deployment_id,
             agent_id=agent_id,
+            start_date=start_date,
+            end_date=end_date,
             limit=10000,  # Get all for aggregation
         )
 
-        # Filter by date range if specified
-        if start_date:
-            start_dt = self._parse_iso_date(start_date)
-            metrics = [
-                m for m in metrics if self._parse_iso_date(m["created_at"]) >= start_dt
-            ]
-
-        if end_date:
-            end_dt = self._parse_iso_date(end_date)
-            metrics = [
-                m for m in metrics if self._parse_iso_date(m["created_at"]) <= end_dt
-            ]
-
         if not metrics:
             return {
                 "total_executions": 0,
@@ -199,18 +174,16 @@ class MetricsService:
             List of time-bucketed data points
         """
         # Get all metrics in range
-        metrics = await self.list(organization_id=organization_id, limit=10000)
+        metrics = await self.list(
+            organization_id=organization_id,
+            start_date=start_date,
+            end_date=end_date,
+            limit=10000,
+        )
 
         start_dt = self._parse_iso_date(start_date)
         end_dt = self._parse_iso_date(end_date)
 
-        # Filter by date range
-        metrics = [
-            m
-            for m in metrics
-            if start_dt <= self._parse_iso_date(m["created_at"]) <= end_dt
-        ]
-
         # Determine bucket size
         if interval == "hour":
             bucket_delta = timedelta(hours=1)
@@ -272,6 +245,8 @@ class MetricsService:
         deployment_id: str | None = None,
         agent_id: str | None = None,
         status: str | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
         limit: int = 100,
     ) -> list:
         """
@@ -282,6 +257,8 @@ class MetricsService:
             deployment_id: Optional deployment filter
             agent_id: Optional agent filter
             status: Optional status filter
+            start_date: Optional start of created_at range (ISO format)
+            end_date: Optional end of created_at range, inclusive (ISO format)
             limit: Maximum results
 
         Returns:
@@ -294,6 +271,10 @@ class MetricsService:
             filter_data["agent_id"] = agent_id
         if status:
             filter_data["status"] = status
+        if start_date or end_date:
+            filter_data["created_at"] = time_range(
+                "created_at", start_date, end_date, inclusive_end=True
+            )
 
         workflow = WorkflowBuilder()
         workflow.add_node(
@@ -370,14 +351,10 @@ class MetricsService:
         # Get top errors
         top_errors = await self.get_top_errors(organization_id=organization_id, limit=5)
 
-        # Get top agents by usage
-        all_metrics = await self.list(organization_id=organization_id, limit=10000)
-
-        # Filter to 24h
-        start_dt = self._parse_iso_date(start_24h)
-        recent_metrics = [
-            m for m in all_metrics if self._parse_iso_date(m["created_at"]) >= start_dt
-        ]
+        # Get top agents by usage in the last 24h
+        recent_metrics = await self.list(
+            organization_id=organization_id, start_date=start_24h, limit=10000
+        )
 
         # Group by agent
         agent_usage = {}
@@ -0,0 +1,165 @@
+"""
+Cursor Pagination
+
+Opaque keyset cursors for list queries ordered newest first.
+A cursor encodes the (created_at, id) key of the last record of a page; the
+next page filters on keys strictly below it instead of skipping rows with an
+offset, so each page costs the same regardless of depth (with the
+(organization_id, created_at) indexes) and pages stay stable under
+concurrent inserts.
+"""
+
+import base64
+import heapq
+import itertools
+import json
+from datetime import UTC, datetime
+
+from studio.services.timestamps import bind_timestamp, parse_timestamp
+
+# Newest first; id breaks created_at ties so the order is total
+KEYSET_ORDER = ["-created_at", "-id"]
+
+_EPOCH = datetime.fromtimestamp(0, UTC)
+
+
+def encode_cursor(record: dict) -> str:
+    """
+    Encode the cursor pointing after a record.
+
+    Args:
+        record: Record with created_at and id
+
+    Returns:
+        Opaque URL-safe cursor
+    """
+    created_at = record["created_at"]
+    if isinstance(created_at, datetime):
+        created_at = created_at.isoformat()
+
+    payload = json.dumps([created_at, record["id"]], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, str]:
+    """
+    Decode a cursor into its (created_at, id) key.
+
+    Args:
+        cursor: Cursor from encode_cursor()
+
+    Returns:
+        (created_at, id)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, record_id = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+    if not isinstance(created_at, str) or not isinstance(record_id, str):
+        raise ValueError("Invalid cursor")
+    return created_at, record_id
+
+
+def keyset_filter(filters: dict, cursor: str | None) -> dict:
+    """
+    Add the "after cursor" condition to a filter.
+
+    Args:
+        filters: Filter conditions
+        cursor: Cursor of the previous page, or None for the first page
+
+    Returns:
+        Filter for (created_at, id) < cursor key
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    if not cursor:
+        return filters
+
+    created_at, record_id = decode_cursor(cursor)
+    created_at = bind_timestamp("created_at", created_at)
+    return {
+        **filters,
+        "$or": [
+            {"created_at": {"$lt": created_at}},
+            {"created_at": created_at, "id": {"$lt": record_id}},
+        ],
+    }
+
+
+def keyset_params(
+    filters: dict, cursor: str | None, limit: int, offset: int = 0
+) -> dict:
+    """
+    Get ListNode parameters for one keyset page.
+
+    One extra record is fetched to tell whether another page follows. The
+    offset is only used without a cursor, for callers still paging by number.
+
+    Args:
+        filters: Filter conditions
+        cursor: Cursor of the previous page, or None for the first page
+        limit: Page size
+        offset: Legacy offset (ignored with a cursor)
+
+    Returns:
+        ListNode parameters (filter, order_by, limit[, offset])
+    """
+    params = {
+        "filter": keyset_filter(filters, cursor),
+        "order_by": KEYSET_ORDER,
+        "limit": limit + 1,
+    }
+    if offset and not cursor:
+        params["offset"] = offset
+    return params
+
+
+def keyset_page(records: list, limit: int) -> tuple[list, str | None]:
+    """
+    Trim a keyset result to the page and get the next cursor.
+
+    Args:
+        records: Records fetched with keyset_params()
+        limit: Page size
+
+    Returns:
+        (page records, next cursor or None on the last page)
+    """
+    if len(records) <= limit:
+        return records, None
+    page = records[:limit]
+    return page, encode_cursor(page[-1])
+
+
+def sort_key(record: dict) -> tuple[datetime, str]:
+    """Get the keyset sort key of a record (for merging sources)."""
+    created_at = record.get("created_at")
+    return (
+        parse_timestamp(created_at) if created_at else _EPOCH,
+        record.get("id", ""),
+    )
+
+
+def merge_pages(sources: list[list], limit: int) -> tuple[list, str | None]:
+    """
+    Merge keyset pages of several sources into one page.
+
+    Each source must have been fetched with the same cursor and
+    keyset_params(); the merged cursor is then valid for all of them.
+
+    Args:
+        sources: Records of each source, newest first
+        limit: Page size
+
+    Returns:
+        (page records, next cursor or None on the last page)
+    """
+    merged = heapq.merge(*sources, key=sort_key, reverse=True)
+    return keyset_page(list(itertools.islice(merged, limit + 1)), limit)
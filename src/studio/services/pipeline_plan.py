@@ -0,0 +1,301 @@
+"""
+Pipeline Plan
+
+Compiled execution plans for orchestration pipelines.
+A plan holds the validated topological order, predecessor lists and agent IDs
+of a pipeline graph. Plans are cached per (pipeline_id, updated_at) in process
+memory and in Redis, so repeated runs of an unchanged pipeline skip graph reads
+and validation. Plans only contain data versioned by the pipeline's
+updated_at; agent configs are not part of a plan and are read per execution.
+"""
+
+import heapq
+import json
+import logging
+import time
+from collections import OrderedDict
+
+import redis
+from redis import asyncio as aioredis
+
+from studio.config import get_redis_url
+
+logger = logging.getLogger(__name__)
+
+PLAN_CACHE_TTL_SECONDS = 300
+PLAN_CACHE_MAX_ENTRIES = 512
+# Redis socket timeout; slower calls are treated as cache misses
+PLAN_CACHE_SOCKET_TIMEOUT_SECONDS = 0.5
+
+
+def validate_graph(nodes: list, connections: list) -> dict:
+    """
+    Validate pipeline graph structure.
+
+    Args:
+        nodes: Node records
+        connections: Connection records
+
+    Returns:
+        Validation result with errors and warnings
+    """
+    errors = []
+    warnings = []
+
+    # Check for empty pipeline
+    if not nodes:
+        errors.append("Pipeline has no nodes")
+        return {"valid": False, "errors": errors, "warnings": warnings}
+
+    # Build node ID set
+    node_ids = {node["id"] for node in nodes}
+
+    # Check connections reference valid nodes
+    for conn in connections:
+        if conn["source_node_id"] not in node_ids:
+            errors.append(
+                f"Connection references invalid source node: {conn['source_node_id']}"
+            )
+        if conn["target_node_id"] not in node_ids:
+            errors.append(
+                f"Connection references invalid target node: {conn['target_node_id']}"
+            )
+
+    # Check for input/output nodes
+    has_input = any(n["node_type"] == "input" for n in nodes)
+    has_output = any(n["node_type"] == "output" for n in nodes)
+
+    if not has_input:
+        warnings.append("Pipeline has no input node")
+    if not has_output:
+        warnings.append("Pipeline has no output node")
+
+    # Check agent nodes have agent_id
+    for node in nodes:
+        if node["node_type"] == "agent" and not node.get("agent_id"):
+            errors.append(f"Agent node '{node['label']}' has no agent assigned")
+
+    # Check for cycles
+    if topological_order(nodes, connections) is None:
+        errors.append("Pipeline contains cycles")
+
+    return {
+        "valid": len(errors) == 0,
+        "errors": errors,
+        "warnings": warnings,
+    }
+
+
+def topological_order(nodes: list, connections: list) -> list[str] | None:
+    """
+    Order nodes so that every node comes after its predecessors.
+
+    Uses Kahn's algorithm; ties are broken by the original node order so that
+    independent nodes keep the order they were saved in.
+
+    Args:
+        nodes: Node records
+        connections: Connection records
+
+    Returns:
+        Node IDs in execution order, or None if the graph contains a cycle
+    """
+    position = {node["id"]: index for index, node in enumerate(nodes)}
+    in_degree = dict.fromkeys(position, 0)
+    successors = {node_id: [] for node_id in position}
+
+    for conn in connections:
+        source, target = conn["source_node_id"], conn["target_node_id"]
+        if source in position and target in position:
+            successors[source].append(target)
+            in_degree[target] += 1
+
+    ready = [position[n] for n, degree in in_degree.items() if degree == 0]
+    heapq.heapify(ready)
+    ids = [node["id"] for node in nodes]
+    order = []
+
+    while ready:
+        node_id = ids[heapq.heappop(ready)]
+        order.append(node_id)
+        for target in successors[node_id]:
+            in_degree[target] -= 1
+            if in_degree[target] == 0:
+                heapq.heappush(ready, position[target])
+
+    if len(order) < len(ids):
+        return None
+    return order
+
+
+def compile_plan(pipeline: dict, nodes: list, connections: list) -> dict:
+    """
+    Compile a pipeline graph into an execution plan.
+
+    The plan is a superset of the pipeline-with-graph shape (nodes,
+    connections, pattern), with nodes sorted in execution order.
+
+    Args:
+        pipeline: Pipeline record
+        nodes: Node records
+        connections: Connection records
+
+    Returns:
+        Execution plan
+    """
+    validation = validate_graph(nodes, connections)
+
+    predecessors = {node["id"]: [] for node in nodes}
+    for conn in connections:
+        if conn["target_node_id"] in predecessors:
+            predecessors[conn["target_node_id"]].append(conn["source_node_id"])
+
+    order = topological_order(nodes, connections) or [n["id"] for n in nodes]
+    nodes_by_id = {node["id"]: node for node in nodes}
+
+    return {
+        "pipeline_id": pipeline["id"],
+        "organization_id": pipeline.get("organization_id", ""),
+        "name": pipeline.get("name", ""),
+        "pattern": pipeline.get("pattern", "sequential"),
+        "updated_at": pipeline.get("updated_at", ""),
+        "nodes": [nodes_by_id[node_id] for node_id in order],
+        "connections": connections,
+        "order": order,
+        "predecessors": predecessors,
+        "agent_ids": list(
+            dict.fromkeys(
+                node["agent_id"]
+                for node in nodes
+                if node["node_type"] == "agent" and node.get("agent_id")
+            )
+        ),
+        **validation,
+    }
+
+
+class PipelinePlanCache:
+    """
+    Two-level cache of compiled pipeline plans.
+
+    The in-memory level holds the latest plan per pipeline; Redis holds plans
+    per (pipeline_id, updated_at) so that other workers can reuse them. A graph
+    edit bumps the pipeline's updated_at, so stale plans are never matched.
+    Redis is used through the asyncio client; failures and timeouts are logged
+    and treated as cache misses.
+
+    Examples:
+        >>> cache = PipelinePlanCache()
+        >>> plan = await cache.get(pipeline["id"], pipeline["updated_at"])
+        >>> if plan is None:
+        ...     await cache.set(compile_plan(pipeline, nodes, connections))
+    """
+
+    def __init__(
+        self,
+        redis_client=None,
+        ttl_seconds: int = PLAN_CACHE_TTL_SECONDS,
+        max_entries: int = PLAN_CACHE_MAX_ENTRIES,
+    ):
+        """
+        Initialize the plan cache.
+
+        Args:
+            redis_client: Optional asyncio Redis client (defaults to the app
+                Redis)
+            ttl_seconds: Plan lifetime in both cache levels
+            max_entries: Maximum plans kept in memory
+        """
+        self.redis_client = redis_client or aioredis.from_url(
+            get_redis_url(),
+            socket_timeout=PLAN_CACHE_SOCKET_TIMEOUT_SECONDS,
+            socket_connect_timeout=PLAN_CACHE_SOCKET_TIMEOUT_SECONDS,
+        )
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.key_prefix = "pipeline_plan:"
+        self._plans: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+
+    def _key(self, pipeline_id: str, updated_at: str) -> str:
+        """Get the Redis key for a pipeline version."""
+        return f"{self.key_prefix}{pipeline_id}:{updated_at}"
+
+    async def get(self, pipeline_id: str, updated_at: str) -> dict | None:
+        """
+        Get the cached plan for a pipeline version.
+
+        Args:
+            pipeline_id: Pipeline ID
+            updated_at: Pipeline updated_at timestamp (the version)
+
+        Returns:
+            Cached plan, or None on a miss
+        """
+        entry = self._plans.get(pipeline_id)
+        if entry is not None:
+            expires_at, plan = entry
+            if plan["updated_at"] == updated_at and expires_at > time.monotonic():
+                self._plans.move_to_end(pipeline_id)
+                return plan
+            self._plans.pop(pipeline_id, None)
+
+        try:
+            raw = await self.redis_client.get(self._key(pipeline_id, updated_at))
+        except redis.RedisError as e:
+            logger.warning(f"Failed to read cached plan for {pipeline_id}: {e}")
+            return None
+
+        if not raw:
+            return None
+
+        plan = json.loads(raw)
+        self._remember(plan)
+        return plan
+
+    async def set(self, plan: dict) -> None:
+        """
+        Cache a compiled plan.
+
+        Args:
+            plan: Plan from compile_plan
+        """
+        self._remember(plan)
+
+        try:
+            await self.redis_client.setex(
+                self._key(plan["pipeline_id"], plan["updated_at"]),
+                self.ttl_seconds,
+                json.dumps(plan, default=str),
+            )
+        except redis.RedisError as e:
+            logger.warning(f"Failed to cache plan for {plan['pipeline_id']}: {e}")
+
+    def invalidate(self, pipeline_id: str) -> None:
+        """
+        Drop the in-memory plan of a pipeline.
+
+        Other workers pick up edits through the bumped updated_at.
+
+        Args:
+            pipeline_id: Pipeline ID
+        """
+        self._plans.pop(pipeline_id, None)
+
+    def _remember(self, plan: dict) -> None:
+        """Store a plan in memory, evicting the least recently used one."""
+        pipeline_id = plan["pipeline_id"]
+        self._plans[pipeline_id] = (time.monotonic() + self.ttl_seconds, plan)
+        self._plans.move_to_end(pipeline_id)
+        while len(self._plans) > self.max_entries:
+            self._plans.popitem(last=False)
+
+
+_plan_cache: PipelinePlanCache | None = None
+
+
+def get_plan_cache() -> PipelinePlanCache:
+    """Get the process-wide pipeline plan cache."""
+    global _plan_cache
+    if _plan_cache is None:
+        _plan_cache = PipelinePlanCache()
+    return _plan_cache
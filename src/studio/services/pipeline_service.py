@@ -4,6 +4,7 @@ Pipeline Service
 CRUD and graph operations for orchestration pipelines using DataFlow nodes.
 """
 
+import asyncio
 import json
 import uuid
 from datetime import UTC, datetime
@@ -11,6 +12,14 @@ from datetime import UTC, datetime
 from kailash.runtime import AsyncLocalRuntime
 from kailash.workflow.builder import WorkflowBuilder
 
+from studio.services.cascade import (
+    CASCADE_TIMEOUT_SECONDS,
+    delete_where,
+    execute_cascade,
+)
+from studio.services.pagination import keyset_page, keyset_params
+from studio.services.pipeline_plan import compile_plan, get_plan_cache, validate_graph
+
 # Orchestration patterns configuration
 ORCHESTRATION_PATTERNS = {
     "sequential": "Agents execute in sequence, output passes to next",
@@ -21,6 +30,89 @@ ORCHESTRATION_PATTERNS = {
 }
 
 
+# Fields compared when diffing a saved graph against the stored one
+NODE_DIFF_FIELDS = (
+    "node_type",
+    "agent_id",
+    "label",
+    "position_x",
+    "position_y",
+    "config",
+)
+CONNECTION_DIFF_FIELDS = (
+    "source_node_id",
+    "target_node_id",
+    "source_handle",
+    "target_handle",
+    "condition",
+)
+
+
+def _json_field(value) -> str:
+    """Serialize a dict config/condition to a JSON string (DataFlow stores str)."""
+    if isinstance(value, dict):
+        return json.dumps(value)
+    return value or ""
+
+
+def _same_value(stored, new) -> bool:
+    """Compare a stored field with a new value, tolerating int/float coercion."""
+    if isinstance(new, float) and isinstance(stored, int | float):
+        return float(stored) == new
+    return stored == new
+
+
+def _node_record(pipeline_id: str, node: dict, now: str) -> dict:
+    """Build a full PipelineNode record from node data."""
+    return {
+        "id": node.get("id") or str(uuid.uuid4()),
+        "pipeline_id": pipeline_id,
+        "node_type": node.get("node_type") or "agent",
+        "agent_id": node.get("agent_id") or "",
+        "label": node.get("label") or "",
+        "position_x": float(node.get("position_x") or 0.0),
+        "position_y": float(node.get("position_y") or 0.0),
+        "config": _json_field(node.get("config")),
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+def _connection_record(pipeline_id: str, connection: dict, now: str) -> dict:
+    """Build a full PipelineConnection record from connection data."""
+    return {
+        "id": connection.get("id") or str(uuid.uuid4()),
+        "pipeline_id": pipeline_id,
+        "source_node_id": connection["source_node_id"],
+        "target_node_id": connection["target_node_id"],
+        "source_handle": connection.get("source_handle") or "output",
+        "target_handle": connection.get("target_handle") or "input",
+        "condition": _json_field(connection.get("condition")),
+        "created_at": now,
+    }
+
+
+def _assign_own_ids(records: list, existing: list) -> dict:
+    """
+    Give records whose ID is not among the stored records a new ID.
+
+    Args:
+        records: Normalized records (changed in place)
+        existing: Stored records of the same pipeline
+
+    Returns:
+        Map of replaced ID to new ID
+    """
+    existing_ids = {record["id"] for record in existing}
+    id_map = {}
+    for record in records:
+        if record["id"] not in existing_ids:
+            new_id = str(uuid.uuid4())
+            id_map[record["id"]] = new_id
+            record["id"] = new_id
+    return id_map
+
+
 class PipelineService:
     """
     Pipeline service for managing orchestration pipelines, nodes, and connections.
@@ -31,6 +123,7 @@ class PipelineService:
     def __init__(self):
         """Initialize the pipeline service."""
         self.runtime = AsyncLocalRuntime()
+        self.plan_cache = get_plan_cache()
 
     # ===================
     # Pipeline CRUD
@@ -153,6 +246,7 @@ class PipelineService:
         results, _ = await self.runtime.execute_workflow_async(
             workflow.build(), inputs={}
         )
+        self.plan_cache.invalidate(pipeline_id)
 
         return await self.get(pipeline_id)
 
@@ -171,7 +265,8 @@ class PipelineService:
 
     async def hard_delete(self, pipeline_id: str) -> bool:
         """
-        Permanently delete a pipeline and all its nodes/connections.
+        Permanently delete a pipeline and all its nodes/connections in one
+        transaction.
 
         Args:
             pipeline_id: Pipeline ID
@@ -179,29 +274,15 @@ class PipelineService:
         Returns:
             True if deleted successfully
         """
-        # Delete all connections first
-        connections = await self.list_connections(pipeline_id)
-        for conn in connections:
-            await self.remove_connection(conn["id"])
-
-        # Delete all nodes
-        nodes = await self.list_nodes(pipeline_id)
-        for node in nodes:
-            await self.remove_node(node["id"])
-
-        # Delete pipeline
-        workflow = WorkflowBuilder()
-        workflow.add_node(
-            "PipelineDeleteNode",
-            "delete",
-            {
-                "id": pipeline_id,
-            },
-        )
-
-        results, _ = await self.runtime.execute_workflow_async(
-            workflow.build(), inputs={}
+        await execute_cascade(
+            self.runtime,
+            [
+                delete_where("PipelineConnection", pipeline_id=pipeline_id),
+                delete_where("PipelineNode", pipeline_id=pipeline_id),
+                delete_where("Pipeline", id=pipeline_id),
+            ],
         )
+        self.plan_cache.invalidate(pipeline_id)
 
         return True
 
@@ -212,19 +293,24 @@ class PipelineService:
         filters: dict | None = None,
         limit: int = 50,
         offset: int = 0,
+        cursor: str | None = None,
     ) -> dict:
         """
-        List pipelines with optional filters.
+        List pipelines with optional filters, newest first.
 
         Args:
             organization_id: Organization ID
             workspace_id: Optional workspace ID filter
             filters: Optional additional filter conditions
             limit: Maximum records to return
-            offset: Number of records to skip
+            offset: Number of records to skip (ignored with a cursor)
+            cursor: Cursor of the previous page (next_cursor)
 
         Returns:
-            Dict with records and total count
+            Dict with records, total count and next_cursor
+
+        Raises:
+            ValueError: If the cursor is malformed
         """
         workflow = WorkflowBuilder()
 
@@ -238,11 +324,7 @@ class PipelineService:
         workflow.add_node(
             "PipelineListNode",
             "list",
-            {
-                "filter": combined_filters,
-                "limit": limit,
-                "offset": offset,
-            },
+            keyset_params(combined_filters, cursor, limit, offset),
         )
 
         results, _ = await self.runtime.execute_workflow_async(
@@ -250,9 +332,11 @@ class PipelineService:
         )
 
         list_result = results.get("list", {})
+        records, next_cursor = keyset_page(list_result.get("records", []), limit)
         return {
-            "records": list_result.get("records", []),
+            "records": records,
             "total": list_result.get("count", list_result.get("total", 0)),
+            "next_cursor": next_cursor,
         }
 
     # ===================
@@ -281,6 +365,58 @@ class PipelineService:
 
         return pipeline
 
+    async def get_plan(self, pipeline_id: str) -> dict | None:
+        """
+        Get the compiled execution plan of a pipeline.
+
+        Plans are cached per (pipeline_id, updated_at), so an unchanged
+        pipeline costs a single pipeline read; the graph is only loaded and
+        validated when the pipeline has been edited. Plans hold agent IDs
+        only; agent configs are read per execution.
+
+        Args:
+            pipeline_id: Pipeline ID
+
+        Returns:
+            Execution plan (see compile_plan), or None if not found
+        """
+        pipeline = await self.get(pipeline_id)
+        if not pipeline:
+            return None
+
+        plan = await self.plan_cache.get(pipeline_id, pipeline.get("updated_at", ""))
+        if plan is not None:
+            return plan
+
+        nodes, connections = await asyncio.gather(
+            self.list_nodes(pipeline_id), self.list_connections(pipeline_id)
+        )
+
+        plan = compile_plan(pipeline, nodes, connections)
+        await self.plan_cache.set(plan)
+        return plan
+
+    def _add_touch(self, workflow: WorkflowBuilder, pipeline_id: str) -> None:
+        """
+        Add a pipeline timestamp update to a workflow.
+
+        Bumping updated_at changes the pipeline version that execution
+        plans are cached under.
+
+        Args:
+            workflow: Workflow performing a graph edit
+            pipeline_id: Pipeline ID
+        """
+        workflow.add_node(
+            "PipelineUpdateNode",
+            "touch",
+            {
+                "filter": {"id": pipeline_id},
+                "fields": {},
+            },
+        )
+        self.plan_cache.invalidate(pipeline_id)
+
     async def save_graph(
         self,
         pipeline_id: str,
@@ -290,6 +426,10 @@ class PipelineService:
         """
         Save complete graph (replaces existing nodes and connections).
 
+        The new graph is diffed against the stored one and only added, changed
+        and removed nodes/connections are written, using DataFlow bulk nodes in
+        a single workflow. The saved graph is returned without a re-read.
+
         Args:
             pipeline_id: Pipeline ID
             nodes: List of node data
@@ -298,27 +438,224 @@ class PipelineService:
         Returns:
             Updated pipeline with graph
         """
-        # Delete existing connections and nodes
-        existing_connections = await self.list_connections(pipeline_id)
-        for conn in existing_connections:
-            await self.remove_connection(conn["id"])
+        pipeline = await self.get_with_graph(pipeline_id)
+        if not pipeline:
+            raise ValueError(f"Pipeline {pipeline_id} not found")
 
-        existing_nodes = await self.list_nodes(pipeline_id)
-        for node in existing_nodes:
-            await self.remove_node(node["id"])
+        now = datetime.now(UTC).isoformat()
+        diff = self.diff_graph(
+            pipeline_id,
+            pipeline["nodes"],
+            pipeline["connections"],
+            nodes,
+            connections,
+            now,
+        )
 
-        # Create new nodes
-        for node_data in nodes:
-            await self.add_node(pipeline_id, node_data)
+        if diff["changed"]:
+            steps = []
+            if diff["removed_connection_ids"]:
+                steps.append(
+                    (
+                        "PipelineConnectionBulkDeleteNode",
+                        "remove_connections",
+                        {
+                            "filter": {"id": {"$in": diff["removed_connection_ids"]}},
+                            "confirmed": True,
+                        },
+                    )
+                )
+            if diff["removed_node_ids"]:
+                steps.append(
+                    (
+                        "PipelineNodeBulkDeleteNode",
+                        "remove_nodes",
+                        {
+                            "filter": {"id": {"$in": diff["removed_node_ids"]}},
+                            "confirmed": True,
+                        },
+                    )
+                )
+            if diff["upsert_nodes"]:
+                steps.append(
+                    (
+                        "PipelineNodeBulkUpsertNode",
+                        "upsert_nodes",
+                        {
+                            "data": diff["upsert_nodes"],
+                            "conflict_resolution": "update",
+                        },
+                    )
+                )
+            if diff["upsert_connections"]:
+                steps.append(
+                    (
+                        "PipelineConnectionBulkUpsertNode",
+                        "upsert_connections",
+                        {
+                            "data": diff["upsert_connections"],
+                            "conflict_resolution": "update",
+                        },
+                    )
+                )
 
-        # Create new connections
-        for conn_data in connections:
-            await self.add_connection(pipeline_id, conn_data)
+            # Run all writes in order inside one transaction, like a cascade:
+            # connections go before nodes on delete and after them on upsert
+            workflow = WorkflowBuilder()
+            workflow.add_node(
+                "TransactionScopeNode",
+                "tx",
+                {"timeout": CASCADE_TIMEOUT_SECONDS, "rollback_on_error": True},
+            )
+            previous = "tx"
+            for node_type, node_id, params in steps:
+                workflow.add_node(node_type, node_id, params)
+                workflow.add_connection(previous, "result", node_id, "input")
+                previous = node_id
 
-        # Update pipeline timestamp
-        await self.update(pipeline_id, {})
+            # Update pipeline timestamp in the same transaction
+            self._add_touch(workflow, pipeline_id)
+            workflow.add_connection(previous, "result", "touch", "input")
 
-        return await self.get_with_graph(pipeline_id)
+            workflow.add_node("TransactionCommitNode", "commit", {})
+            workflow.add_connection("touch", "result", "commit", "input")
+
+            results, _ = await self.runtime.execute_workflow_async(
+                workflow.build(), inputs={}
+            )
+            self.plan_cache.invalidate(pipeline_id)
+
+            touched = results.get("touch")
+            if isinstance(touched, dict) and touched.get("updated_at"):
+                pipeline["updated_at"] = touched["updated_at"]
+
+        pipeline["nodes"] = diff["nodes"]
+        pipeline["connections"] = diff["connections"]
+
+        return pipeline
+
+    def diff_graph(
+        self,
+        pipeline_id: str,
+        existing_nodes: list,
+        existing_connections: list,
+        nodes: list,
+        connections: list,
+        now: str | None = None,
+    ) -> dict:
+        """
+        Compute the changes needed to turn the stored graph into a new graph.
+
+        Nodes and connections are matched by ID; items without an ID, or with
+        an ID not in the stored graph, are new and get a new ID. Unchanged
+        records keep their stored timestamps.
+
+        Args:
+            pipeline_id: Pipeline ID
+            existing_nodes: Stored node records
+            existing_connections: Stored connection records
+            nodes: New node data
+            connections: New connection data
+            now: Timestamp for created/updated records (defaults to now)
+
+        Returns:
+            Dict with the records to upsert, the IDs to remove, the resulting
+            graph (nodes, connections) and whether anything changed
+        """
+        now = now or datetime.now(UTC).isoformat()
+
+        # Only IDs of this pipeline's stored graph are kept; any other ID gets
+        # a new one so an upsert can never overwrite a record of another
+        # pipeline. Connection endpoints follow the renamed nodes.
+        node_records = [_node_record(pipeline_id, node, now) for node in nodes]
+        node_id_map = _assign_own_ids(node_records, existing_nodes)
+        connection_records = []
+        for conn in connections:
+            record = _connection_record(pipeline_id, conn, now)
+            for endpoint in ("source_node_id", "target_node_id"):
+                record[endpoint] = node_id_map.get(record[endpoint], record[endpoint])
+            connection_records.append(record)
+        _assign_own_ids(connection_records, existing_connections)
+
+        upsert_nodes, result_nodes = self._diff_records(
+            existing_nodes,
+            node_records,
+            NODE_DIFF_FIELDS,
+            now,
+            touch_updated_at=True,
+        )
+        upsert_connections, result_connections = self._diff_records(
+            existing_connections,
+            connection_records,
+            CONNECTION_DIFF_FIELDS,
+            now,
+        )
+
+        node_ids = {node["id"] for node in result_nodes}
+        connection_ids = {conn["id"] for conn in result_connections}
+        removed_node_ids = [n["id"] for n in existing_nodes if n["id"] not in node_ids]
+        removed_connection_ids = [
+            c["id"] for c in existing_connections if c["id"] not in connection_ids
+        ]
+
+        return {
+            "upsert_nodes": upsert_nodes,
+            "upsert_connections": upsert_connections,
+            "removed_node_ids": removed_node_ids,
+            "removed_connection_ids": removed_connection_ids,
+            "nodes": result_nodes,
+            "connections": result_connections,
+            "changed": bool(
+                upsert_nodes
+                or upsert_connections
+                or removed_node_ids
+                or removed_connection_ids
+            ),
+        }
+
+    def _diff_records(
+        self,
+        existing: list,
+        incoming: list,
+        fields: tuple,
+        now: str,
+        touch_updated_at: bool = False,
+    ) -> tuple[list, list]:
+        """
+        Split incoming records into those to write and the resulting record list.
+
+        Args:
+            existing: Stored records
+            incoming: New records (already normalized)
+            fields: Fields compared to detect a change
+            now: Timestamp for updated records
+            touch_updated_at: Whether the model has an updated_at field
+
+        Returns:
+            Tuple of (records to upsert, resulting records in input order)
+        """
+        existing_by_id = {record["id"]: record for record in existing}
+        upserts = []
+        result = []
+
+        for record in incoming:
+            stored = existing_by_id.get(record["id"])
+            if stored is None:
+                upserts.append(record)
+                result.append(record)
+                continue
+
+            if all(_same_value(stored.get(f), record[f]) for f in fields):
+                result.append(stored)
+                continue
+
+            record["created_at"] = stored.get("created_at", record["created_at"])
+            if touch_updated_at:
+                record["updated_at"] = now
+            upserts.append(record)
+            result.append(record)
+
+        return upserts, result
 
     # ===================
     # Node Operations
@@ -359,6 +696,7 @@ class PipelineService:
                 "updated_at": now,
             },
         )
+        self._add_touch(workflow, pipeline_id)
 
         results, _ = await self.runtime.execute_workflow_async(
             workflow.build(), inputs={}
@@ -367,13 +705,16 @@ class PipelineService:
         # DataFlow Create nodes return the created record directly
         return results.get("create", {})
 
-    async def update_node(self, node_id: str, data: dict) -> dict | None:
+    async def update_node(
+        self, node_id: str, data: dict, pipeline_id: str | None = None
+    ) -> dict | None:
         """
         Update a pipeline node.
 
         Args:
             node_id: Node ID
             data: Fields to update
+            pipeline_id: Pipeline ID (looked up from the node if omitted)
 
         Returns:
             Updated node data
@@ -393,6 +734,8 @@ class PipelineService:
                 "fields": data,
             },
         )
+        if pipeline_id:
+            self._add_touch(workflow, pipeline_id)
 
         results, _ = await self.runtime.execute_workflow_async(
             workflow.build(), inputs={}
@@ -410,18 +753,30 @@ class PipelineService:
         results2, _ = await self.runtime.execute_workflow_async(
             workflow2.build(), inputs={}
         )
-        return results2.get("read")
+        node = results2.get("read")
+
+        if not pipeline_id and node:
+            touch = WorkflowBuilder()
+            self._add_touch(touch, node["pipeline_id"])
+            await self.runtime.execute_workflow_async(touch.build(), inputs={})
 
-    async def remove_node(self, node_id: str) -> bool:
+        return node
+
+    async def remove_node(self, node_id: str, pipeline_id: str | None = None) -> bool:
         """
         Remove a node from a pipeline.
 
         Args:
             node_id: Node ID
+            pipeline_id: Pipeline ID (looked up from the node if omitted)
 
         Returns:
             True if deleted
         """
+        if not pipeline_id:
+            node = await self.get_node(node_id)
+            pipeline_id = node.get("pipeline_id") if node else None
+
         workflow = WorkflowBuilder()
         workflow.add_node(
             "PipelineNodeDeleteNode",
@@ -430,6 +785,8 @@ class PipelineService:
                 "id": node_id,
             },
         )
+        if pipeline_id:
+            self._add_touch(workflow, pipeline_id)
 
         results, _ = await self.runtime.execute_workflow_async(
             workflow.build(), inputs={}
@@ -527,6 +884,7 @@ class PipelineService:
                 "created_at": now,
             },
         )
+        self._add_touch(workflow, pipeline_id)
 
         results, _ = await self.runtime.execute_workflow_async(
             workflow.build(), inputs={}
@@ -535,16 +893,23 @@ class PipelineService:
         # DataFlow Create nodes return the created record directly
         return results.get("create", {})
 
-    async def remove_connection(self, connection_id: str) -> bool:
+    async def remove_connection(
+        self, connection_id: str, pipeline_id: str | None = None
+    ) -> bool:
         """
         Remove a connection.
 
         Args:
             connection_id: Connection ID
+            pipeline_id: Pipeline ID (looked up from the connection if omitted)
 
         Returns:
             True if deleted
         """
+        if not pipeline_id:
+            connection = await self.get_connection(connection_id)
+            pipeline_id = connection.get("pipeline_id") if connection else None
+
         workflow = WorkflowBuilder()
         workflow.add_node(
             "PipelineConnectionDeleteNode",
@@ -553,6 +918,8 @@ class PipelineService:
                 "id": connection_id,
             },
         )
+        if pipeline_id:
+            self._add_touch(workflow, pipeline_id)
 
         results, _ = await self.runtime.execute_workflow_async(
             workflow.build(), inputs={}
@@ -631,80 +998,9 @@ class PipelineService:
         if not pipeline:
             return {"valid": False, "errors": ["Pipeline not found"]}
 
-        errors = []
-        warnings = []
-        nodes = pipeline.get("nodes", [])
-        connections = pipeline.get("connections", [])
-
-        # Check for empty pipeline
-        if not nodes:
-            errors.append("Pipeline has no nodes")
-            return {"valid": False, "errors": errors, "warnings": warnings}
-
-        # Build node ID set
-        node_ids = {node["id"] for node in nodes}
-
-        # Check connections reference valid nodes
-        for conn in connections:
-            if conn["source_node_id"] not in node_ids:
-                errors.append(
-                    f"Connection references invalid source node: {conn['source_node_id']}"
-                )
-            if conn["target_node_id"] not in node_ids:
-                errors.append(
-                    f"Connection references invalid target node: {conn['target_node_id']}"
-                )
-
-        # Check for input/output nodes
-        has_input = any(n["node_type"] == "input" for n in nodes)
-        has_output = any(n["node_type"] == "output" for n in nodes)
-
-        if not has_input:
-            warnings.append("Pipeline has no input node")
-        if not has_output:
-            warnings.append("Pipeline has no output node")
-
-        # Check agent nodes have agent_id
-        for node in nodes:
-            if node["node_type"] == "agent" and not node.get("agent_id"):
-                errors.append(f"Agent node '{node['label']}' has no agent assigned")
-
-        # Check for cycles (simple detection)
-        # Build adjacency list
-        adjacency = {node["id"]: [] for node in nodes}
-        for conn in connections:
-            if conn["source_node_id"] in adjacency:
-                adjacency[conn["source_node_id"]].append(conn["target_node_id"])
-
-        # DFS for cycle detection
-        visited = set()
-        rec_stack = set()
-
-        def has_cycle(node_id):
-            visited.add(node_id)
-            rec_stack.add(node_id)
-
-            for neighbor in adjacency.get(node_id, []):
-                if neighbor not in visited:
-                    if has_cycle(neighbor):
-                        return True
-                elif neighbor in rec_stack:
-                    return True
-
-            rec_stack.discard(node_id)
-            return False
-
-        for node in nodes:
-            if node["id"] not in visited:
-                if has_cycle(node["id"]):
-                    errors.append("Pipeline contains cycles")
-                    break
-
-        return {
-            "valid": len(errors) == 0,
-            "errors": errors,
-            "warnings": warnings,
-        }
+        return validate_graph(
+            pipeline.get("nodes", []), pipeline.get("connections", [])
+        )
 
     async def build_workflow(self, pipeline_id: str) -> WorkflowBuilder:
         """
@@ -720,18 +1016,17 @@ class PipelineService:
             This is a basic implementation. Full workflow generation
             would require agent execution nodes from Kaizen framework.
         """
-        pipeline = await self.get_with_graph(pipeline_id)
-        if not pipeline:
+        plan = await self.get_plan(pipeline_id)
+        if not plan:
             raise ValueError(f"Pipeline {pipeline_id} not found")
 
-        # Validate first
-        validation = await self.validate(pipeline_id)
-        if not validation["valid"]:
-            raise ValueError(f"Invalid pipeline: {validation['errors']}")
+        # Plans are validated when compiled
+        if not plan["valid"]:
+            raise ValueError(f"Invalid pipeline: {plan['errors']}")
 
         workflow = WorkflowBuilder()
-        nodes = pipeline.get("nodes", [])
-        connections = pipeline.get("connections", [])
+        nodes = plan["nodes"]
+        connections = plan["connections"]
 
         # Create workflow nodes
         # Note: This is a placeholder - actual agent execution would use
@@ -0,0 +1,279 @@
+"""
+Query Cache
+
+Read-through Redis cache for single-node DataFlow reads (Read/List/Count).
+
+Every model has a version counter in Redis that each write node of the model
+(Create/Update/Delete/Upsert/Bulk*) increments after it ran. Cache keys
+contain the version current when the read started, so a write makes all
+earlier entries of its model unreachable at once; they simply expire. A read
+that races a write can only store its result under the old version, which no
+later read looks up.
+
+The counters live in Redis rather than in process or event-loop state, so
+invalidation is the same for all workers (DataFlow's own cache stays disabled
+in studio.models for that reason). Redis is used through the asyncio client
+with short socket timeouts, so a slow Redis never blocks the event loop and
+degrades to cache misses.
+
+Only models whose writes all go through execute_node() (or call
+bump_model_version()) may be listed in QUERY_CACHE_TTL_SECONDS; models
+without an entry, or with a TTL of 0, are never cached.
+"""
+
+import hashlib
+import json
+import logging
+import re
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+
+import redis
+from redis import asyncio as aioredis
+
+from studio.config import get_redis_url, get_settings
+
+logger = logging.getLogger(__name__)
+
+# Cache lifetime by model; a missing entry or 0 opts the model out
+QUERY_CACHE_TTL_SECONDS = {
+    "Agent": 300,
+    "AgentContext": 300,
+    "AgentTool": 300,
+    "AgentVersion": 300,
+}
+
+# Redis socket timeout; slower calls are treated as cache misses
+QUERY_CACHE_SOCKET_TIMEOUT_SECONDS = 0.5
+
+READ_OPERATIONS = frozenset({"Read", "List", "Count"})
+WRITE_OPERATIONS = frozenset(
+    {
+        "Create",
+        "Update",
+        "Delete",
+        "Upsert",
+        "BulkCreate",
+        "BulkUpdate",
+        "BulkDelete",
+        "BulkUpsert",
+    }
+)
+
+_NODE_TYPE_PATTERN = re.compile(
+    r"^(?P<model>\w+?)(?P<operation>Bulk(?:Create|Update|Delete|Upsert)"
+    r"|Create|Read|Update|Delete|List|Count|Upsert)Node$"
+)
+
+
+def parse_node_type(node_type: str) -> tuple[str, str] | None:
+    """
+    Split a DataFlow node type into model and operation.
+
+    Args:
+        node_type: DataFlow node type (e.g. "AgentBulkDeleteNode")
+
+    Returns:
+        (model, operation), e.g. ("Agent", "BulkDelete"), or None if the node
+        is not a generated CRUD node
+    """
+    match = _NODE_TYPE_PATTERN.match(node_type)
+    if match is None:
+        return None
+    return match["model"], match["operation"]
+
+
+def _encode(value):
+    """JSON-encode values DataFlow returns that JSON has no type for."""
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, date):
+        return {"__date__": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"__decimal__": str(value)}
+    if isinstance(value, UUID):
+        return {"__uuid__": str(value)}
+    raise TypeError(f"Cannot cache value of type {type(value).__name__}")
+
+
+def _decode(obj: dict):
+    """Restore values encoded by _encode()."""
+    if len(obj) == 1:
+        if "__datetime__" in obj:
+            return datetime.fromisoformat(obj["__datetime__"])
+        if "__date__" in obj:
+            return date.fromisoformat(obj["__date__"])
+        if "__decimal__" in obj:
+            return Decimal(obj["__decimal__"])
+        if "__uuid__" in obj:
+            return UUID(obj["__uuid__"])
+    return obj
+
+
+def dumps(value) -> str:
+    """Serialize a node result, keeping datetime/Decimal/UUID types."""
+    return json.dumps(value, default=_encode, sort_keys=True, separators=(",", ":"))
+
+
+def loads(raw: str | bytes):
+    """Deserialize a node result stored by dumps()."""
+    return json.loads(raw, object_hook=_decode)
+
+
+class QueryCache:
+    """
+    Versioned read-through cache of DataFlow node results.
+
+    Uses the asyncio Redis client. Redis failures and timeouts are logged and
+    treated as cache misses; results are then read from the database.
+
+    Examples:
+        >>> cache = QueryCache()
+        >>> version = await cache.get_version("Agent")
+        >>> result = await cache.get("Agent", version, "AgentReadNode", params)
+        >>> if result is None:
+        ...     result = await read_agent(params)
+        ...     await cache.set("Agent", version, "AgentReadNode", params, result)
+        >>> await cache.bump_version("Agent")  # after every write
+    """
+
+    def __init__(self, redis_client=None, ttl_seconds: dict[str, int] | None = None):
+        """
+        Initialize the query cache.
+
+        Args:
+            redis_client: Optional asyncio Redis client (defaults to the app
+                Redis)
+            ttl_seconds: Cache lifetime by model (defaults to
+                QUERY_CACHE_TTL_SECONDS)
+        """
+        self.redis_client = redis_client or aioredis.from_url(
+            get_redis_url(),
+            socket_timeout=QUERY_CACHE_SOCKET_TIMEOUT_SECONDS,
+            socket_connect_timeout=QUERY_CACHE_SOCKET_TIMEOUT_SECONDS,
+        )
+        self.ttl_seconds = (
+            QUERY_CACHE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        )
+        self.key_prefix = "dataflow:"
+
+    def is_cached(self, model: str) -> bool:
+        """Check whether reads of a model are cached."""
+        return self.ttl_seconds.get(model, 0) > 0
+
+    def _version_key(self, model: str) -> str:
+        """Get the Redis key of a model's version counter."""
+        return f"{self.key_prefix}version:{model}"
+
+    def _key(self, model: str, version: int, node_type: str, params: dict) -> str:
+        """Get the Redis key of a read at a model version."""
+        digest = hashlib.sha256(dumps(params).encode()).hexdigest()
+        return f"{self.key_prefix}cache:{model}:v{version}:{node_type}:{digest}"
+
+    async def get_version(self, model: str) -> int | None:
+        """
+        Get the current version of a model.
+
+        Args:
+            model: DataFlow model name
+
+        Returns:
+            Version (0 before the first write), or None if Redis is unavailable
+        """
+        try:
+            raw = await self.redis_client.get(self._version_key(model))
+        except redis.RedisError as e:
+            logger.warning(f"Failed to read cache version of {model}: {e}")
+            return None
+        return int(raw) if raw else 0
+
+    async def bump_version(self, model: str) -> None:
+        """
+        Invalidate all cached reads of a model.
+
+        Call after every write of a cached model that does not go through
+        execute_node().
+
+        Args:
+            model: DataFlow model name
+        """
+        if not self.is_cached(model):
+            return
+
+        try:
+            await self.redis_client.incr(self._version_key(model))
+        except redis.RedisError as e:
+            logger.warning(f"Failed to invalidate cached reads of {model}: {e}")
+
+    async def get(self, model: str, version: int, node_type: str, params: dict):
+        """
+        Get a cached node result.
+
+        Args:
+            model: DataFlow model name
+            version: Model version from get_version()
+            node_type: DataFlow node type
+            params: Node parameters
+
+        Returns:
+            Node result, or None on a miss
+        """
+        try:
+            raw = await self.redis_client.get(
+                self._key(model, version, node_type, params)
+            )
+        except (redis.RedisError, TypeError) as e:
+            logger.warning(f"Failed to read cached {node_type} result: {e}")
+            return None
+
+        if not raw:
+            return None
+        return loads(raw)
+
+    async def set(
+        self, model: str, version: int, node_type: str, params: dict, result
+    ) -> None:
+        """
+        Cache a node result under the version read before executing the node.
+
+        Args:
+            model: DataFlow model name
+            version: Model version from get_version()
+            node_type: DataFlow node type
+            params: Node parameters
+            result: Node result
+        """
+        try:
+            await self.redis_client.setex(
+                self._key(model, version, node_type, params),
+                self.ttl_seconds[model],
+                dumps(result),
+            )
+        except (redis.RedisError, TypeError) as e:
+            logger.warning(f"Failed to cache {node_type} result: {e}")
+
+
+_query_cache: QueryCache | None = None
+
+
+def get_query_cache() -> QueryCache | None:
+    """Get the process-wide query cache, or None if caching is disabled."""
+    global _query_cache
+    if not get_settings().query_cache_enabled:
+        return None
+    if _query_cache is None:
+        _query_cache = QueryCache()
+    return _query_cache
+
+
+async def bump_model_version(model: str) -> None:
+    """
+    Invalidate all cached reads of a model (no-op if caching is disabled).
+
+    Args:
+        model: DataFlow model name
+    """
+    cache = get_query_cache()
+    if cache is not None:
+        await cache.bump_version(model)
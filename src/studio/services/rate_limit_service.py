@@ -23,9 +23,9 @@ class RateLimitService:
     Redis provides atomic operations and automatic key expiration.
     """
 
-    def __init__(self):
+    def __init__(self, redis_client=None):
         """Initialize the rate limit service with Redis connection."""
-        self.redis_client = redis.from_url(get_redis_url())
+        self.redis_client = redis_client or redis.from_url(get_redis_url())
         self.window_size_seconds = 60  # 1 minute window
         self.key_prefix = "ratelimit:"
 
@@ -0,0 +1,166 @@
+"""
+Read Repository
+
+Direct parameterized-SQL reads for hot single-table lookups.
+Each query returns the same row dicts as the generated DataFlow node it
+replaces, but runs as one prepared statement on an asyncpg pool instead of
+building and executing a workflow. Services opt in per call and fall back to
+the workflow path when the direct path is unavailable.
+"""
+
+import asyncio
+import logging
+import os
+
+import asyncpg
+
+from studio.config import get_database_url, get_settings
+
+logger = logging.getLogger(__name__)
+
+# Hot queries by name. Table names follow DataFlow's defaults for the models
+# (User -> users, APIKey -> api_keys, ...). asyncpg prepares each statement
+# once per connection and reuses it from its statement cache.
+HOT_QUERIES = {
+    # UserReadNode {"id": user_id}
+    "user_by_id": "SELECT * FROM users WHERE id = $1",
+    # AgentReadNode {"id": agent_id}
+    "agent_by_id": "SELECT * FROM agents WHERE id = $1",
+    # APIKeyListNode {"filter": {"key_prefix": prefix}, "limit": 1}
+    "api_key_by_prefix": "SELECT * FROM api_keys WHERE key_prefix = $1 LIMIT 1",
+    # PolicyAssignmentListNode {"filter": {"principal_type": ..., "principal_id": ...}}
+    "policy_assignments_for_principal": (
+        "SELECT * FROM policy_assignments "
+        "WHERE principal_type = $1 AND principal_id = $2"
+    ),
+}
+
+
+def get_direct_database_url() -> str:
+    """
+    Get the database URL used by DataFlow, in a form asyncpg accepts.
+
+    Returns:
+        PostgreSQL connection URL
+    """
+    if os.getenv("ENVIRONMENT") == "testing":
+        url = get_database_url(test=True)
+    else:
+        url = os.getenv("DATABASE_URL", get_settings().database_url)
+
+    # Strip SQLAlchemy-style driver suffixes (postgresql+asyncpg://)
+    scheme, sep, rest = url.partition("://")
+    return f"{scheme.split('+')[0]}{sep}{rest}"
+
+
+class ReadRepository:
+    """
+    Prepared-statement reads on a shared asyncpg pool.
+
+    The pool is opened on first use and sized by direct_read_pool_size;
+    its connections come on top of each worker's DataFlow pool. Errors are raised to the caller, which falls back to the
+    workflow path; on a non-PostgreSQL database the repository disables
+    itself (enabled=False).
+
+    Examples:
+        >>> reads = ReadRepository()
+        >>> user = await reads.get_user("user-123")
+        >>> await reads.close()
+    """
+
+    def __init__(self, database_url: str | None = None, max_size: int | None = None):
+        """
+        Initialize the repository.
+
+        Args:
+            database_url: PostgreSQL URL (defaults to the DataFlow database)
+            max_size: Maximum pool connections (defaults to direct_read_pool_size)
+        """
+        self.database_url = database_url
+        self.max_size = max_size or get_settings().direct_read_pool_size
+        self.enabled = True
+        self._pool: asyncpg.Pool | None = None
+        self._lock = asyncio.Lock()
+
+    async def _get_pool(self) -> asyncpg.Pool:
+        """Get the connection pool, opening it on first use."""
+        if self._pool is not None:
+            return self._pool
+
+        async with self._lock:
+            if self._pool is None:
+                url = self.database_url or get_direct_database_url()
+                if not url.startswith(("postgresql://", "postgres://")):
+                    self.enabled = False
+                    raise RuntimeError("Direct reads require a PostgreSQL database")
+                self._pool = await asyncpg.create_pool(
+                    url, min_size=1, max_size=self.max_size
+                )
+        return self._pool
+
+    async def fetch_one(self, query: str, *args) -> dict | None:
+        """
+        Run a hot query and return its first row.
+
+        Args:
+            query: Name in HOT_QUERIES
+            *args: Query parameters
+
+        Returns:
+            Row dict, or None if no row matched
+        """
+        pool = await self._get_pool()
+        row = await pool.fetchrow(HOT_QUERIES[query], *args)
+        return dict(row) if row is not None else None
+
+    async def fetch_all(self, query: str, *args) -> list[dict]:
+        """
+        Run a hot query and return all rows.
+
+        Args:
+            query: Name in HOT_QUERIES
+            *args: Query parameters
+
+        Returns:
+            Row dicts
+        """
+        pool = await self._get_pool()
+        rows = await pool.fetch(HOT_QUERIES[query], *args)
+        return [dict(row) for row in rows]
+
+    async def get_user(self, user_id: str) -> dict | None:
+        """Read a user row (UserReadNode shape)."""
+        return await self.fetch_one("user_by_id", user_id)
+
+    async def get_agent(self, agent_id: str) -> dict | None:
+        """Read an agent row (AgentReadNode shape)."""
+        return await self.fetch_one("agent_by_id", agent_id)
+
+    async def find_api_key(self, key_prefix: str) -> dict | None:
+        """Find an API key row by prefix (APIKeyListNode record shape)."""
+        return await self.fetch_one("api_key_by_prefix", key_prefix)
+
+    async def list_policy_assignments(
+        self, principal_type: str, principal_id: str
+    ) -> list[dict]:
+        """List a principal's policy assignments (PolicyAssignmentListNode records)."""
+        return await self.fetch_all(
+            "policy_assignments_for_principal", principal_type, principal_id
+        )
+
+    async def close(self) -> None:
+        """Close the connection pool."""
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
+
+_read_repository: ReadRepository | None = None
+
+
+def get_read_repository() -> ReadRepository:
+    """Get the process-wide read repository."""
+    global _read_repository
+    if _read_repository is None:
+        _read_repository = ReadRepository()
+    return _read_repository
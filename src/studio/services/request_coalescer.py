@@ -0,0 +1,220 @@
+"""
+Request Coalescer
+
+Singleflight layer for concurrent identical LLM calls.
+Callers that issue the same request while one is in flight share a single
+upstream call (or a single upstream stream) instead of each hitting the provider.
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+def request_key(**params) -> str:
+    """
+    Build a canonical hash for a request.
+
+    Keys are sorted and serialized compactly so that equivalent requests
+    produce the same key regardless of argument order.
+
+    Args:
+        **params: Request parameters (model, prompts, sampling settings, ...)
+
+    Returns:
+        Hex SHA-256 digest of the canonical request
+    """
+    canonical = json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def should_coalesce(
+    temperature: float,
+    enabled: bool = True,
+    allow_nondeterministic: bool = False,
+) -> bool:
+    """
+    Decide whether a request may share a result with other callers.
+
+    Sampling with temperature > 0 gives each caller a different answer,
+    so those calls are only coalesced when explicitly allowed.
+
+    Args:
+        temperature: Sampling temperature of the request
+        enabled: Whether coalescing is enabled for the agent
+        allow_nondeterministic: Allow coalescing when temperature > 0
+
+    Returns:
+        True if the request can be coalesced
+    """
+    if not enabled:
+        return False
+    return temperature <= 0 or allow_nondeterministic
+
+
+class _StreamBroadcast:
+    """
+    Multicasts chunks from one upstream stream to many subscribers.
+
+    Chunks are buffered so that subscribers joining mid-stream replay
+    everything produced so far before receiving live chunks.
+    """
+
+    def __init__(self):
+        self.chunks: list[str] = []
+        self.done = False
+        self.error: BaseException | None = None
+        self.subscribers = 0
+        self.task: asyncio.Task | None = None
+        self._changed = asyncio.Condition()
+
+    async def pump(self, upstream: AsyncIterator[str]) -> None:
+        """Read the upstream stream and publish every chunk."""
+        try:
+            async for chunk in upstream:
+                async with self._changed:
+                    self.chunks.append(chunk)
+                    self._changed.notify_all()
+        except BaseException as e:
+            # Propagated to subscribers once they drain the buffered chunks
+            self.error = e
+        finally:
+            async with self._changed:
+                self.done = True
+                self._changed.notify_all()
+
+    async def subscribe(self) -> AsyncGenerator[str, None]:
+        """Yield all chunks of the stream, starting from the first."""
+        index = 0
+        while True:
+            async with self._changed:
+                await self._changed.wait_for(
+                    lambda: index < len(self.chunks) or self.done
+                )
+                pending = self.chunks[index:]
+                finished = self.done
+            for chunk in pending:
+                yield chunk
+            index += len(pending)
+            if finished and index >= len(self.chunks):
+                break
+
+        if self.error is not None and not isinstance(
+            self.error, asyncio.CancelledError
+        ):
+            raise self.error
+
+
+class RequestCoalescer:
+    """
+    Singleflight coordinator keyed by canonical request hash.
+
+    Examples:
+        >>> coalescer = RequestCoalescer()
+        >>> key = request_key(model="gpt-4o", prompt="hello", temperature=0)
+        >>> result = await coalescer.run(key, lambda: call_provider())
+    """
+
+    def __init__(self):
+        """Initialize the coalescer with empty in-flight tables."""
+        self._calls: dict[str, asyncio.Future] = {}
+        self._streams: dict[str, _StreamBroadcast] = {}
+        self.coalesced_count = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct upstream calls and streams currently running."""
+        return len(self._calls) + len(self._streams)
+
+    def is_streaming(self, key: str) -> bool:
+        """Check whether an upstream stream for the key is already in flight."""
+        return key in self._streams
+
+    async def run(self, key: str, factory: Callable[[], Awaitable[dict]]) -> dict:
+        """
+        Execute a call, sharing the result with concurrent identical calls.
+
+        The first caller for a key starts the upstream call; later callers
+        await the same future. Each caller receives its own copy of the result
+        so that mutations do not leak between callers. Followers get
+        ``coalesced=True`` in their result.
+
+        Args:
+            key: Canonical request key (see request_key)
+            factory: Zero-argument coroutine factory performing the upstream call
+
+        Returns:
+            Result of the upstream call
+        """
+        future = self._calls.get(key)
+        follower = future is not None
+
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            self._calls[key] = future
+
+            def _release(_future, key=key, future=future):
+                if self._calls.get(key) is future:
+                    self._calls.pop(key, None)
+
+            future.add_done_callback(_release)
+        else:
+            self.coalesced_count += 1
+            logger.debug(f"Coalesced LLM request {key[:12]}")
+
+        # Shield so a cancelled caller does not cancel the call for the others
+        result = await asyncio.shield(future)
+
+        result = copy.deepcopy(result)
+        if follower and isinstance(result, dict):
+            result["coalesced"] = True
+        return result
+
+    async def stream(
+        self,
+        key: str,
+        factory: Callable[[], AsyncIterator[str]],
+    ) -> AsyncGenerator[str, None]:
+        """
+        Stream a response, multicasting one upstream stream to all subscribers.
+
+        The upstream stream is cancelled once every subscriber has gone away.
+
+        Args:
+            key: Canonical request key (see request_key)
+            factory: Zero-argument callable returning the upstream async iterator
+
+        Yields:
+            Chunks of the response content
+        """
+        broadcast = self._streams.get(key)
+        if broadcast is None:
+            broadcast = _StreamBroadcast()
+            self._streams[key] = broadcast
+            broadcast.task = asyncio.ensure_future(broadcast.pump(factory()))
+
+            def _release(_task, key=key, broadcast=broadcast):
+                if self._streams.get(key) is broadcast:
+                    self._streams.pop(key, None)
+
+            broadcast.task.add_done_callback(_release)
+        else:
+            self.coalesced_count += 1
+            logger.debug(f"Coalesced LLM stream {key[:12]}")
+
+        broadcast.subscribers += 1
+        try:
+            async for chunk in broadcast.subscribe():
+                yield chunk
+        finally:
+            broadcast.subscribers -= 1
+            if broadcast.subscribers == 0 and not broadcast.done:
+                broadcast.task.cancel()
+                # Stop new subscribers from joining a stream being torn down
+                if self._streams.get(key) is broadcast:
+                    self._streams.pop(key, None)
@@ -29,10 +29,10 @@ class SSOService:
     - Secret encryption with Fernet
     """
 
-    def __init__(self):
+    def __init__(self, runtime=None):
         """Initialize the SSO service."""
         self.settings = get_settings()
-        self.runtime = AsyncLocalRuntime()
+        self.runtime = runtime or AsyncLocalRuntime()
         self._fernet = None
 
     @property
@@ -0,0 +1,180 @@
+"""
+Stream Framer
+
+Server-Sent Events framing for token streams.
+Provider deltas (often 1-3 characters) are coalesced into frames by byte budget
+or time window, the constant event envelope is encoded once per stream, and a
+bounded queue between the provider and the client propagates backpressure:
+a slow client stops the stream from being read instead of buffering it.
+"""
+
+import asyncio
+import json
+from collections.abc import AsyncGenerator, AsyncIterator
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# Flush a frame once it holds this many bytes of content...
+DEFAULT_FRAME_BYTES = 256
+
+# ...or once its first delta has waited this long
+DEFAULT_FRAME_DELAY_SECONDS = 0.03
+
+# Deltas buffered between provider and client before the provider is paused
+DEFAULT_QUEUE_SIZE = 64
+
+
+def dumps(obj) -> bytes:
+    """
+    Serialize an object to compact JSON bytes.
+
+    Uses orjson when installed, the standard library otherwise.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str)
+    return json.dumps(obj, separators=(",", ":"), default=str).encode()
+
+
+def encode_event(event: str, data: dict) -> bytes:
+    """
+    Encode a Server-Sent Event.
+
+    Args:
+        event: Event name
+        data: Event payload
+
+    Returns:
+        Encoded SSE event
+    """
+    return b"event: " + event.encode() + b"\ndata: " + dumps(data) + b"\n\n"
+
+
+class _EndOfStream:
+    """Queue sentinel carrying the upstream error, if any."""
+
+    def __init__(self, error: BaseException | None = None):
+        self.error = error
+
+
+class StreamFramer:
+    """
+    Coalesces streamed content deltas into SSE "content" frames.
+
+    Examples:
+        >>> framer = StreamFramer(thread_id)
+        >>> async for frame in framer.frames(llm_service.chat_completion_stream(...)):
+        ...     yield frame
+    """
+
+    def __init__(
+        self,
+        thread_id: str,
+        max_bytes: int = DEFAULT_FRAME_BYTES,
+        max_delay: float = DEFAULT_FRAME_DELAY_SECONDS,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+    ):
+        """
+        Initialize the framer.
+
+        Args:
+            thread_id: Conversation thread ID included in every frame
+            max_bytes: Content bytes that trigger a flush
+            max_delay: Seconds a delta may wait before it is flushed
+            queue_size: Maximum deltas buffered ahead of the client
+        """
+        self.max_bytes = max_bytes
+        self.max_delay = max_delay
+        self.queue_size = queue_size
+
+        # The envelope is constant for the stream; only content is encoded per frame
+        self._prefix = (
+            b'event: content\ndata: {"type":"content","thread_id":'
+            + dumps(thread_id)
+            + b',"content":'
+        )
+        self._suffix = b"}\n\n"
+
+    def encode(self, content: str) -> bytes:
+        """
+        Encode one content frame.
+
+        Args:
+            content: Frame content
+
+        Returns:
+            Encoded SSE event
+        """
+        return self._prefix + dumps(content) + self._suffix
+
+    async def _pump(self, chunks: AsyncIterator[str], queue: asyncio.Queue) -> None:
+        """Read upstream deltas into the bounded queue."""
+        try:
+            async for chunk in chunks:
+                # Blocks while the client is behind, pausing the upstream read
+                await queue.put(chunk)
+        except Exception as e:
+            await queue.put(_EndOfStream(e))
+        else:
+            await queue.put(_EndOfStream())
+
+    async def frames(self, chunks: AsyncIterator[str]) -> AsyncGenerator[bytes, None]:
+        """
+        Frame a stream of content deltas.
+
+        Args:
+            chunks: Upstream content deltas
+
+        Yields:
+            Encoded SSE content events
+
+        Raises:
+            Exception: Any error raised by the upstream stream, after the
+                content received before it has been flushed
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        pump = asyncio.ensure_future(self._pump(chunks, queue))
+
+        buffer: list[str] = []
+        size = 0
+        deadline = 0.0
+
+        try:
+            while True:
+                timeout = max(0.0, deadline - loop.time()) if buffer else None
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout)
+                except TimeoutError:
+                    yield self.encode("".join(buffer))
+                    buffer, size = [], 0
+                    continue
+
+                if isinstance(item, _EndOfStream):
+                    if buffer:
+                        yield self.encode("".join(buffer))
+                    if item.error is not None:
+                        raise item.error
+                    return
+
+                if not buffer:
+                    deadline = loop.time() + self.max_delay
+                buffer.append(item)
+                size += len(item.encode())
+
+                if size >= self.max_bytes:
+                    yield self.encode("".join(buffer))
+                    buffer, size = [], 0
+        finally:
+            pump.cancel()
@@ -4,12 +4,16 @@ Team Service
 CRUD operations for teams and team memberships using DataFlow nodes.
 """
 
+import asyncio
 import uuid
 from datetime import UTC, datetime
 
 from kailash.runtime import AsyncLocalRuntime
 from kailash.workflow.builder import WorkflowBuilder
 
+from studio.services.cascade import delete_where, execute_cascade
+from studio.services.dataloader import DataLoader, group_records
+
 
 class TeamService:
     """
@@ -21,6 +25,8 @@ class TeamService:
     def __init__(self, runtime=None):
         """Initialize the team service."""
         self.runtime = runtime or AsyncLocalRuntime()
+        # Batch member queries of concurrent requests (see get_team_with_members)
+        self.member_loader = DataLoader(self.list_members_many)
 
     async def create_team(
         self,
@@ -107,17 +113,34 @@ class TeamService:
         Returns:
             Team data with members list, None if team not found
         """
-        team = await self.get_team(team_id)
+        # Members don't depend on the team record; query both concurrently
+        team, memberships = await asyncio.gather(
+            self.get_team(team_id), self.member_loader.load(team_id)
+        )
         if not team:
             return None
 
-        # Get team members
+        team["members"] = memberships
+
+        return team
+
+    async def list_members_many(self, team_ids: list[str]) -> dict[str, list]:
+        """
+        List the memberships of several teams in a single query.
+
+        Args:
+            team_ids: Team IDs
+
+        Returns:
+            Dict mapping each team ID to its membership records
+        """
         workflow = WorkflowBuilder()
         workflow.add_node(
             "TeamMembershipListNode",
             "members",
             {
-                "filter": {"team_id": team_id},
+                "filter": {"team_id": {"$in": team_ids}},
+                "limit": 1000 * len(team_ids),
                 "enable_cache": False,  # Bypass cache to avoid stale data
             },
         )
@@ -126,10 +149,8 @@ class TeamService:
             workflow.build(), inputs={}
         )
 
-        memberships = results.get("members", {}).get("records", [])
-        team["members"] = memberships
-
-        return team
+        records = results.get("members", {}).get("records", [])
+        return group_records(records, "team_id", team_ids)
 
     async def update_team(self, team_id: str, data: dict) -> dict | None:
         """
@@ -162,7 +183,7 @@ class TeamService:
 
     async def delete_team(self, team_id: str) -> bool:
         """
-        Delete a team and all its memberships.
+        Delete a team and all its memberships in one transaction.
 
         Args:
             team_id: Team ID
@@ -170,49 +191,12 @@ class TeamService:
         Returns:
             True if deleted successfully
         """
-        # Delete all memberships first
-        workflow = WorkflowBuilder()
-        workflow.add_node(
-            "TeamMembershipListNode",
-            "find_members",
-            {
-                "filter": {"team_id": team_id},
-                "enable_cache": False,  # Bypass cache to avoid stale data
-            },
-        )
-
-        results, _ = await self.runtime.execute_workflow_async(
-            workflow.build(), inputs={}
-        )
-
-        memberships = results.get("find_members", {}).get("records", [])
-
-        # Delete each membership
-        for membership in memberships:
-            delete_workflow = WorkflowBuilder()
-            delete_workflow.add_node(
-                "TeamMembershipDeleteNode",
-                "delete_member",
-                {
-                    "id": membership["id"],
-                },
-            )
-            await self.runtime.execute_workflow_async(
-                delete_workflow.build(), inputs={}
-            )
-
-        # Delete the team
-        delete_team_workflow = WorkflowBuilder()
-        delete_team_workflow.add_node(
-            "TeamDeleteNode",
-            "delete",
-            {
-                "id": team_id,
-            },
-        )
-
-        await self.runtime.execute_workflow_async(
-            delete_team_workflow.build(), inputs={}
+        await execute_cascade(
+            self.runtime,
+            [
+                delete_where("TeamMembership", team_id=team_id),
+                delete_where("Team", id=team_id),
+            ],
         )
 
         return True
@@ -13,7 +13,9 @@ from kailash.runtime import AsyncLocalRuntime
 from kailash.workflow.builder import WorkflowBuilder
 
 from studio.services.agent_service import AgentService
+from studio.services.pagination import keyset_page, keyset_params
 from studio.services.pipeline_service import PipelineService
+from studio.services.token_estimator import TokenEstimator, normalize_usage
 
 
 class TestService:
@@ -28,6 +30,7 @@ class TestService:
         self.runtime = AsyncLocalRuntime()
         self.agent_service = AgentService()
         self.pipeline_service = PipelineService()
+        self.token_estimator = TokenEstimator()
 
     # ===================
     # Agent Testing
@@ -197,24 +200,66 @@ class TestService:
             # Extract output and token usage
             output = result.get("output", "")
 
-            # Calculate token usage (rough estimate)
-            input_tokens = len(json.dumps(input_data))
-            output_tokens = len(output)
-
             return {
                 "response": output,
                 "output": output,  # Include both for compatibility
-                "_token_usage": {
-                    "input": input_tokens,
-                    "output": output_tokens,
-                    "total": input_tokens + output_tokens,
-                },
+                "_token_usage": self._token_usage(
+                    config.model,
+                    result.get("usage"),
+                    agent.get("system_prompt", ""),
+                    agent_input,
+                    output,
+                ),
             }
 
         except Exception as e:
             # Return error details
             raise RuntimeError(f"Agent execution failed: {str(e)}") from e
 
+    def _token_usage(
+        self,
+        model: str,
+        usage: dict | None,
+        system_prompt: str,
+        agent_input: str,
+        output: str,
+    ) -> dict:
+        """
+        Build the token usage block for an agent execution.
+
+        Uses the provider-reported usage when the agent surfaces it and falls
+        back to local tokenizer counts otherwise.
+
+        Args:
+            model: Model identifier
+            usage: Provider usage block, if reported
+            system_prompt: Agent system prompt
+            agent_input: Input sent to the agent
+            output: Agent output
+
+        Returns:
+            Dict with 'input', 'output', 'total', 'cost_usd' and 'source'
+        """
+        if usage:
+            token_usage = normalize_usage(usage)
+            token_usage["source"] = "provider"
+        else:
+            input_tokens = self.token_estimator.count_messages(
+                model, system_prompt=system_prompt, user_message=agent_input
+            )
+            output_tokens = self.token_estimator.count(output, model)
+            token_usage = {
+                "input": input_tokens,
+                "output": output_tokens,
+                "total": input_tokens + output_tokens,
+                "source": "estimate",
+            }
+
+        token_usage["cost_usd"] = self.token_estimator.estimate_cost(
+            model, token_usage["input"], token_usage["output"]
+        )
+        return token_usage
+
     # ===================
     # Pipeline Testing
     # ===================
@@ -238,15 +283,14 @@ class TestService:
         Returns:
             Test execution result
         """
-        # Get pipeline with graph
-        pipeline = await self.pipeline_service.get_with_graph(pipeline_id)
+        # Get compiled execution plan (cached per pipeline version)
+        pipeline = await self.pipeline_service.get_plan(pipeline_id)
         if not pipeline:
             raise ValueError(f"Pipeline {pipeline_id} not found")
 
-        # Validate pipeline
-        validation = await self.pipeline_service.validate(pipeline_id)
-        if not validation["valid"]:
-            raise ValueError(f"Invalid pipeline: {validation['errors']}")
+        # Plans are validated when compiled
+        if not pipeline["valid"]:
+            raise ValueError(f"Invalid pipeline: {pipeline['errors']}")
 
         options = options or {}
         now = datetime.now(UTC).isoformat()
@@ -319,7 +363,7 @@ class TestService:
         Execute a pipeline by building and executing a Kailash workflow.
 
         Args:
-            pipeline: Pipeline with graph (nodes and connections)
+            pipeline: Execution plan or pipeline with graph (nodes and connections)
             input_data: Input data
             options: Execution options
 
@@ -330,9 +374,8 @@ class TestService:
 
         from kaizen.signatures import InputField, OutputField, Signature
 
-        # Get nodes and connections
+        # Get nodes (compiled plans list them in execution order)
         nodes = pipeline.get("nodes", [])
-        connections = pipeline.get("connections", [])
 
         if not nodes:
             return {
@@ -359,47 +402,22 @@ class TestService:
             temperature: float = 0.7
             max_tokens: int = 1000
 
-        # Process each node and add to workflow
-        node_outputs = {}
-
-        # Find input nodes (nodes with no incoming connections)
-        incoming_map = {}
-        for conn in connections:
-            target = conn["target_node_id"]
-            if target not in incoming_map:
-                incoming_map[target] = []
-            incoming_map[target].append(conn["source_node_id"])
-
-        # Get input nodes (nodes with node_type='input' or no incoming connections)
-        input_nodes = [
-            n for n in nodes if n["node_type"] == "input" or n["id"] not in incoming_map
-        ]
-
-        # Get output nodes (nodes with node_type='output' or no outgoing connections)
-        outgoing_map = {}
-        for conn in connections:
-            source = conn["source_node_id"]
-            if source not in outgoing_map:
-                outgoing_map[source] = []
-            outgoing_map[source].append(conn["target_node_id"])
-
-        output_nodes = [
-            n
-            for n in nodes
-            if n["node_type"] == "output" or n["id"] not in outgoing_map
-        ]
-
-        # Execute nodes in topological order
-        # For simplicity, we'll execute sequentially based on connections
-        # In a real implementation, you'd want proper topological sorting
+        # Snapshot agent configs once per execution in one batched query, so
+        # every run sees current agent settings and an agent edited mid-run
+        # does not change this run. Compiled plans list the referenced agents.
+        agent_ids = pipeline.get("agent_ids")
+        if agent_ids is None:
+            agent_ids = [n.get("agent_id") for n in nodes if n["node_type"] == "agent"]
+        agents = await self.agent_service.get_many(agent_ids)
 
         executed_nodes = set()
-        total_input_tokens = len(json.dumps(input_data))
+        total_input_tokens = 0
         total_output_tokens = 0
+        total_cost_usd = 0.0
 
         async def execute_node(node: dict, node_input: dict) -> dict:
             """Execute a single pipeline node."""
-            nonlocal total_output_tokens
+            nonlocal total_input_tokens, total_output_tokens, total_cost_usd
 
             node_type = node["node_type"]
             node_id = node["id"]
@@ -418,17 +436,18 @@ class TestService:
                 if not agent_id:
                     return {"output": "No agent configured for this node"}
 
-                # Get agent configuration
-                agent = await self.agent_service.get(agent_id)
+                # Get agent configuration from the execution snapshot
+                agent = agents.get(agent_id)
                 if not agent:
                     return {"output": f"Agent {agent_id} not found"}
 
                 # Use shared execution method for consistency and testability
                 result = await self._execute_agent(agent, node_input, options)
                 output = result.get("output", "")
-                total_output_tokens += result.get("_token_usage", {}).get(
-                    "output", len(output)
-                )
+                token_usage = result.get("_token_usage", {})
+                total_input_tokens += token_usage.get("input", 0)
+                total_output_tokens += token_usage.get("output", 0)
+                total_cost_usd += token_usage.get("cost_usd", 0.0)
 
                 return {"output": output}
 
@@ -492,6 +511,7 @@ class TestService:
                 "input": total_input_tokens,
                 "output": total_output_tokens,
                 "total": total_input_tokens + total_output_tokens,
+                "cost_usd": total_cost_usd,
             },
         }
 
@@ -686,19 +706,24 @@ class TestService:
         pipeline_id: str | None = None,
         limit: int = 20,
         offset: int = 0,
+        cursor: str | None = None,
     ) -> dict:
         """
-        List test executions with optional filters.
+        List test executions with optional filters, most recent first.
 
         Args:
             organization_id: Organization ID
             agent_id: Optional agent ID filter
             pipeline_id: Optional pipeline ID filter
             limit: Maximum records to return
-            offset: Number of records to skip
+            offset: Number of records to skip (ignored with a cursor)
+            cursor: Cursor of the previous page (next_cursor)
 
         Returns:
-            Dict with records and total count
+            Dict with records, total count and next_cursor
+
+        Raises:
+            ValueError: If the cursor is malformed
         """
         workflow = WorkflowBuilder()
 
@@ -713,9 +738,7 @@ class TestService:
             "TestExecutionListNode",
             "list",
             {
-                "filter": filters,
-                "limit": limit,
-                "offset": offset,
+                **keyset_params(filters, cursor, limit, offset),
                 "skip_cache": True,  # Ensure fresh data after deletions
             },
         )
@@ -725,16 +748,14 @@ class TestService:
         )
 
         list_result = results.get("list", {})
-        records = list_result.get("records", [])
-
-        # Sort by created_at descending (most recent first)
-        records = sorted(records, key=lambda x: x.get("created_at", ""), reverse=True)
+        records, next_cursor = keyset_page(list_result.get("records", []), limit)
 
         return {
             "records": records,
             "total": list_result.get(
                 "count", 0
             ),  # DataFlow returns 'count', not 'total'
+            "next_cursor": next_cursor,
         }
 
     async def get_execution(self, execution_id: str) -> dict | None:
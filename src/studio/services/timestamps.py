@@ -0,0 +1,132 @@
+"""
+Timestamps
+
+Canonical timestamp handling and database-side time windows.
+
+DataFlow stores its managed created_at/updated_at columns as naive UTC
+TIMESTAMP; other timestamp fields (recorded_at, started_at, ...) are ISO-8601
+text. Text stored in the canonical UTC form produced by format_timestamp()
+sorts chronologically, so range filters ($gte/$lt) built by time_range() run
+in the database and use the model indexes for both kinds of column instead of
+filtering fetched rows in Python.
+
+Migration path to native timestamptz columns:
+1. Run scripts/backfill_timestamps.py to rewrite legacy text values (naive,
+   "Z" or non-UTC offsets) into the canonical form.
+2. Run it again with --convert to alter TIMESTAMP_COLUMNS to timestamptz,
+   deploy the models with datetime annotations for them and set
+   NATIVE_TIMESTAMPS=true; time_range() then binds aware datetimes.
+"""
+
+from datetime import UTC, datetime
+
+from studio.config import get_settings
+
+# Columns managed by DataFlow as naive UTC TIMESTAMP
+MANAGED_TIMESTAMP_COLUMNS = ("created_at", "updated_at")
+
+# Timestamp columns filtered by date windows, by model
+TIMESTAMP_COLUMNS = {
+    "AuditLog": ("created_at",),
+    "ExecutionMetric": ("created_at",),
+    "InvocationLineage": ("created_at",),
+    "Run": ("started_at", "created_at"),
+    "UsageRecord": ("recorded_at", "created_at"),
+}
+
+
+def parse_timestamp(value: str | datetime) -> datetime:
+    """
+    Parse an ISO-8601 timestamp into a timezone-aware UTC datetime.
+
+    Handles the 'Z' suffix and offsets; naive values are taken as UTC.
+
+    Args:
+        value: ISO-8601 string or datetime
+
+    Returns:
+        UTC datetime
+
+    Raises:
+        ValueError: If the value is empty or not ISO-8601
+    """
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        if not value:
+            raise ValueError("Date string cannot be empty")
+        normalized = value[:-1] + "+00:00" if value.endswith("Z") else value
+        try:
+            parsed = datetime.fromisoformat(normalized)
+        except ValueError as e:
+            raise ValueError(f"Invalid date format: {value}") from e
+
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=UTC)
+    return parsed.astimezone(UTC)
+
+
+def format_timestamp(value: str | datetime) -> str:
+    """
+    Format a timestamp in the canonical UTC form.
+
+    Always includes microseconds and the +00:00 offset, so canonical strings
+    sort chronologically (2026-01-01T00:00:00.000000+00:00).
+
+    Args:
+        value: ISO-8601 string or datetime
+
+    Returns:
+        Canonical timestamp string
+    """
+    return parse_timestamp(value).isoformat(timespec="microseconds")
+
+
+def utc_now() -> str:
+    """Get the current time as a canonical timestamp string."""
+    return format_timestamp(datetime.now(UTC))
+
+
+def bind_timestamp(column: str, value: str | datetime) -> str | datetime:
+    """
+    Convert a timestamp into the filter value for a column's storage type.
+
+    Args:
+        column: Filtered column
+        value: ISO-8601 string or datetime
+
+    Returns:
+        Aware datetime (timestamptz), naive UTC datetime (DataFlow-managed
+        TIMESTAMP) or canonical string (text)
+    """
+    if get_settings().native_timestamps:
+        return parse_timestamp(value)
+    if column in MANAGED_TIMESTAMP_COLUMNS:
+        return parse_timestamp(value).replace(tzinfo=None)
+    return format_timestamp(value)
+
+
+def time_range(
+    column: str,
+    start: str | datetime | None = None,
+    end: str | datetime | None = None,
+    inclusive_end: bool = False,
+) -> dict:
+    """
+    Build a DataFlow filter for a time window on a timestamp column.
+
+    Args:
+        column: Filtered column (decides how bounds are bound)
+        start: Window start (inclusive), if any
+        end: Window end (exclusive unless inclusive_end), if any
+        inclusive_end: Use $lte instead of $lt for the end
+
+    Returns:
+        Filter operators, e.g. {"$gte": ..., "$lt": ...}
+    """
+    window = {}
+    if start is not None:
+        window["$gte"] = bind_timestamp(column, start)
+    if end is not None:
+        window["$lte" if inclusive_end else "$lt"] = bind_timestamp(column, end)
+    return window
@@ -0,0 +1,245 @@
+"""
+Token Estimator
+
+Local token counting and cost estimation for budget pre-checks.
+Uses tiktoken when installed (tokenizers are cached per encoding) and falls
+back to a character-based heuristic otherwise. Provider-reported usage blocks
+are normalized here so executions, metrics, and billing share one shape.
+"""
+
+import json
+import logging
+import math
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+try:
+    import tiktoken
+
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    tiktoken = None
+    TIKTOKEN_AVAILABLE = False
+
+# Average characters per token for English text (fallback heuristic)
+CHARS_PER_TOKEN = 4
+
+# Per-message overhead of the chat format (role markers, separators)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+# USD per 1M tokens: (input, output)
+MODEL_PRICING = {
+    "gpt-4": (30.00, 60.00),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4-turbo": (10.00, 30.00),
+    "gpt-4-turbo-preview": (10.00, 30.00),
+    "gpt-3.5-turbo": (0.50, 1.50),
+    "gpt-3.5-turbo-16k": (3.00, 4.00),
+    "claude-3-opus-20240229": (15.00, 75.00),
+    "claude-3-sonnet-20240229": (3.00, 15.00),
+    "claude-3-haiku-20240307": (0.25, 1.25),
+    "claude-3-5-sonnet-20241022": (3.00, 15.00),
+    "claude-3-5-haiku-20241022": (0.80, 4.00),
+    "claude-opus-4-5-20251101": (5.00, 25.00),
+}
+
+# Matches the billing "token" price ($0.002 per 1K tokens)
+DEFAULT_PRICING = (2.00, 2.00)
+
+# Models with a dedicated tiktoken encoding; everything else uses cl100k_base
+ENCODING_BY_MODEL_PREFIX = {
+    "gpt-4o": "o200k_base",
+    "gpt-4": "cl100k_base",
+    "gpt-3.5": "cl100k_base",
+}
+DEFAULT_ENCODING = "cl100k_base"
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(name: str):
+    """Load a tiktoken encoding once per process."""
+    return tiktoken.get_encoding(name)
+
+
+def empty_usage() -> dict:
+    """Return a zero token usage block."""
+    return {"input": 0, "output": 0, "total": 0}
+
+
+def normalize_usage(usage: dict | None) -> dict:
+    """
+    Normalize a provider usage block to {"input", "output", "total"}.
+
+    Accepts OpenAI (prompt_tokens/completion_tokens), Anthropic
+    (input_tokens/output_tokens) and already-normalized shapes.
+
+    Args:
+        usage: Provider usage block
+
+    Returns:
+        Normalized usage dict
+    """
+    if not usage:
+        return empty_usage()
+
+    input_tokens = int(
+        usage.get("input", usage.get("prompt_tokens", usage.get("input_tokens", 0)))
+        or 0
+    )
+    output_tokens = int(
+        usage.get(
+            "output", usage.get("completion_tokens", usage.get("output_tokens", 0))
+        )
+        or 0
+    )
+    total = int(usage.get("total", usage.get("total_tokens", 0)) or 0)
+
+    return {
+        "input": input_tokens,
+        "output": output_tokens,
+        "total": total or input_tokens + output_tokens,
+    }
+
+
+class TokenEstimator:
+    """
+    Local token counter and cost estimator.
+
+    Counts are exact when tiktoken is installed and the model uses an OpenAI
+    encoding; otherwise they are approximations suitable for budget pre-checks.
+
+    Examples:
+        >>> estimator = TokenEstimator()
+        >>> tokens = estimator.count("Hello world", model="gpt-4o")
+        >>> cost = estimator.estimate_cost("gpt-4o", input_tokens=tokens, output_tokens=500)
+    """
+
+    def _encoding_for(self, model: str | None):
+        """Get the cached tokenizer for a model, or None to use the heuristic."""
+        if not TIKTOKEN_AVAILABLE:
+            return None
+
+        name = DEFAULT_ENCODING
+        for prefix, encoding in ENCODING_BY_MODEL_PREFIX.items():
+            if model and model.startswith(prefix):
+                name = encoding
+                break
+
+        try:
+            return _get_encoding(name)
+        except Exception as e:
+            logger.warning(f"Failed to load tokenizer {name}: {e}")
+            return None
+
+    def count(self, text: str, model: str | None = None) -> int:
+        """
+        Count tokens in a text.
+
+        Args:
+            text: Text to count
+            model: Optional model identifier to select the tokenizer
+
+        Returns:
+            Number of tokens
+        """
+        if not text:
+            return 0
+
+        encoding = self._encoding_for(model)
+        if encoding is None:
+            return math.ceil(len(text) / CHARS_PER_TOKEN)
+        return len(encoding.encode(text, disallowed_special=()))
+
+    def count_batch(self, texts: list[str], model: str | None = None) -> list[int]:
+        """
+        Count tokens for many texts in one tokenizer pass.
+
+        Args:
+            texts: Texts to count
+            model: Optional model identifier to select the tokenizer
+
+        Returns:
+            Token count per text, in input order
+        """
+        encoding = self._encoding_for(model)
+        if encoding is None:
+            return [math.ceil(len(t) / CHARS_PER_TOKEN) if t else 0 for t in texts]
+        encoded = encoding.encode_batch(texts, disallowed_special=())
+        return [len(tokens) for tokens in encoded]
+
+    def count_messages(
+        self,
+        model: str | None,
+        system_prompt: str = "",
+        user_message: str = "",
+        conversation_history: list | None = None,
+    ) -> int:
+        """
+        Count prompt tokens for a chat completion request.
+
+        Args:
+            model: Model identifier
+            system_prompt: System prompt
+            user_message: User message
+            conversation_history: Optional previous messages
+
+        Returns:
+            Estimated prompt tokens including per-message overhead
+        """
+        texts = [system_prompt or ""]
+        texts.extend(str(m.get("content", "")) for m in conversation_history or [])
+        texts.append(user_message or "")
+
+        counts = self.count_batch(texts, model)
+        return sum(counts) + MESSAGE_OVERHEAD_TOKENS * len(texts)
+
+    def count_payload(self, payload, model: str | None = None) -> int:
+        """
+        Count tokens of an arbitrary JSON-serializable payload.
+
+        Args:
+            payload: Payload (str or JSON-serializable object)
+            model: Optional model identifier
+
+        Returns:
+            Number of tokens
+        """
+        if not isinstance(payload, str):
+            payload = json.dumps(payload, default=str)
+        return self.count(payload, model)
+
+    def estimate_cost(
+        self,
+        model: str | None,
+        input_tokens: int,
+        output_tokens: int = 0,
+    ) -> float:
+        """
+        Estimate the USD cost of a call.
+
+        Args:
+            model: Model identifier (unknown models use the default token price)
+            input_tokens: Prompt tokens
+            output_tokens: Completion tokens
+
+        Returns:
+            Cost in USD
+        """
+        input_price, output_price = MODEL_PRICING.get(model or "", DEFAULT_PRICING)
+        return (input_tokens * input_price + output_tokens * output_price) / 1_000_000
+
+    def usage_cost(self, model: str | None, usage: dict | None) -> float:
+        """
+        Compute the USD cost of a provider usage block.
+
+        Args:
+            model: Model identifier
+            usage: Provider usage block (any supported shape)
+
+        Returns:
+            Cost in USD
+        """
+        normalized = normalize_usage(usage)
+        return self.estimate_cost(model, normalized["input"], normalized["output"])
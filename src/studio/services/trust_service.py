@@ -15,6 +15,7 @@ from kailash.workflow.builder import WorkflowBuilder
 
 # Import models to register DataFlow nodes
 import studio.models  # noqa: F401
+from studio.services.cascade import execute_cascade, update_where
 
 
 class HumanOrigin:
@@ -606,18 +607,9 @@ class TrustService:
         downstream_ids = [a["agent_id"] for a in affected]
         revoked_ids.extend(downstream_ids)
 
-        # Revoke the main agent's chain
-        await self._revoke_chain(agent_id, reason, initiated_by, now)
-
-        # Revoke all delegations from this agent
-        await self._revoke_delegations_from_agent(agent_id, reason, initiated_by, now)
-
-        # Revoke all downstream agents' chains and delegations
-        for downstream_id in downstream_ids:
-            await self._revoke_chain(downstream_id, reason, initiated_by, now)
-            await self._revoke_delegations_from_agent(
-                downstream_id, reason, initiated_by, now
-            )
+        # Revoke the chains and delegations of the agent and all downstream
+        # agents in one transaction
+        await self._revoke_agents(revoked_ids, reason, initiated_by, now)
 
         # Record audit
         await self._record_audit(
@@ -697,87 +689,34 @@ class TrustService:
             "completed_at": now.isoformat(),
         }
 
-    async def _revoke_chain(
-        self, agent_id: str, reason: str, revoked_by: str, now: datetime
+    async def _revoke_agents(
+        self, agent_ids: list[str], reason: str, revoked_by: str, now: datetime
     ) -> None:
-        """Revoke a specific trust chain."""
-        # Find the chain
-        workflow = WorkflowBuilder()
-        workflow.add_node(
-            "TrustChainListNode",
-            "find",
-            {"filter": {"agent_id": agent_id}, "limit": 1},
-        )
-
-        results, _ = await self.runtime.execute_workflow_async(
-            workflow.build(), inputs={}
-        )
-
-        find_result = results.get("find", {})
-        chains = find_result.get("records", []) if isinstance(find_result, dict) else []
-        if not chains:
-            return
-
-        chain = chains[0]
-        chain_id = chain.get("id")
-
-        # Update chain to revoked status
-        workflow = WorkflowBuilder()
-        workflow.add_node(
-            "TrustChainUpdateNode",
-            "update",
-            {
-                "filter": {"id": chain_id},
-                "fields": {
-                    "status": "revoked",
-                    "revoked_at": now.isoformat(),
-                    "revoked_by": revoked_by,
-                    "revocation_reason": reason,
-                    # DataFlow auto-manages updated_at - DO NOT set manually (DF-104)
-                },
-            },
-        )
-
-        await self.runtime.execute_workflow_async(workflow.build(), inputs={})
-
-    async def _revoke_delegations_from_agent(
-        self, agent_id: str, reason: str, revoked_by: str, now: datetime
-    ) -> None:
-        """Revoke all delegations where agent is delegator."""
-        workflow = WorkflowBuilder()
-        workflow.add_node(
-            "TrustDelegationListNode",
-            "find",
-            {"filter": {"delegator_id": agent_id, "status": "active"}, "limit": 1000},
-        )
+        """Revoke the trust chains and active outgoing delegations of agents."""
+        revocation = {
+            "status": "revoked",
+            "revoked_at": now.isoformat(),
+            "revoked_by": revoked_by,
+            "revocation_reason": reason,
+            # DataFlow auto-manages updated_at - DO NOT set manually (DF-104)
+        }
 
-        results, _ = await self.runtime.execute_workflow_async(
-            workflow.build(), inputs={}
+        await execute_cascade(
+            self.runtime,
+            [
+                update_where(
+                    "TrustChain",
+                    {"agent_id": {"$in": agent_ids}, "status": {"$ne": "revoked"}},
+                    revocation,
+                ),
+                update_where(
+                    "TrustDelegation",
+                    {"delegator_id": {"$in": agent_ids}, "status": "active"},
+                    revocation,
+                ),
+            ],
         )
 
-        find_result = results.get("find", {})
-        delegations = find_result.get("records", []) if isinstance(find_result, dict) else []
-
-        for delegation in delegations:
-            delegation_id = delegation.get("id")
-            workflow = WorkflowBuilder()
-            workflow.add_node(
-                "TrustDelegationUpdateNode",
-                "update",
-                {
-                    "filter": {"id": delegation_id},
-                    "fields": {
-                        "status": "revoked",
-                        "revoked_at": now.isoformat(),
-                        "revoked_by": revoked_by,
-                        "revocation_reason": reason,
-                        # DataFlow auto-manages updated_at - DO NOT set manually (DF-104)
-                    },
-                },
-            )
-
-            await self.runtime.execute_workflow_async(workflow.build(), inputs={})
-
     # ===================
     # Audit Operations
     # ===================
@@ -8,9 +8,10 @@ import uuid
 from datetime import UTC, datetime
 
 from kailash.runtime import AsyncLocalRuntime
-from kailash.workflow.builder import WorkflowBuilder
 from passlib.context import CryptContext
 
+from studio.services.workflow_templates import execute_node
+
 # Password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -62,8 +63,8 @@ class UserService:
         user_id = str(uuid.uuid4())
         password_hash = self.hash_password(password)
 
-        workflow = WorkflowBuilder()
-        workflow.add_node(
+        results = await execute_node(
+            self.runtime,
             "UserCreateNode",
             "create",
             {
@@ -79,10 +80,6 @@ class UserService:
             },
         )
 
-        results, _ = await self.runtime.execute_workflow_async(
-            workflow.build(), inputs={}
-        )
-
         # Check for errors in workflow result
         result = results.get("create")
         if result is None:
@@ -122,18 +119,14 @@ class UserService:
         Returns:
             User data if found (without password_hash), None otherwise
         """
-        workflow = WorkflowBuilder()
-        workflow.add_node(
-            "UserReadNode",
-            "read",
-            {
-                "id": user_id,
-            },
-        )
-
         try:
-            results, _ = await self.runtime.execute_workflow_async(
-                workflow.build(), inputs={}
+            results = await execute_node(
+                self.runtime,
+                "UserReadNode",
+                "read",
+                {
+                    "id": user_id,
+                },
             )
 
             user = results.get("read")
@@ -154,8 +147,8 @@ class UserService:
         Returns:
             User data if found (without password_hash), None otherwise
         """
-        workflow = WorkflowBuilder()
-        workflow.add_node(
+        results = await execute_node(
+            self.runtime,
             "UserListNode",
             "find",
             {
@@ -165,10 +158,6 @@ class UserService:
             },
         )
 
-        results, _ = await self.runtime.execute_workflow_async(
-            workflow.build(), inputs={}
-        )
-
         users = results.get("find", {}).get("records", [])
         if not users:
             return None
@@ -194,8 +183,8 @@ class UserService:
         if "password" in data:
             data["password_hash"] = self.hash_password(data.pop("password"))
 
-        workflow = WorkflowBuilder()
-        workflow.add_node(
+        results = await execute_node(
+            self.runtime,
             "UserUpdateNode",
             "update",
             {
@@ -204,10 +193,6 @@ class UserService:
             },
         )
 
-        results, _ = await self.runtime.execute_workflow_async(
-            workflow.build(), inputs={}
-        )
-
         return await self.get_user(user_id)
 
     async def delete_user(self, user_id: str) -> bool:
@@ -220,8 +205,8 @@ class UserService:
         Returns:
             True if deleted successfully
         """
-        workflow = WorkflowBuilder()
-        workflow.add_node(
+        results = await execute_node(
+            self.runtime,
             "UserUpdateNode",
             "delete",
             {
@@ -232,10 +217,6 @@ class UserService:
             },
         )
 
-        results, _ = await self.runtime.execute_workflow_async(
-            workflow.build(), inputs={}
-        )
-
         return True
 
     async def list_users(
@@ -257,14 +238,13 @@ class UserService:
         Returns:
             Dict with records and total count
         """
-        workflow = WorkflowBuilder()
-
         # Combine organization filter with additional filters
         combined_filters = {"organization_id": organization_id}
         if filters:
             combined_filters.update(filters)
 
-        workflow.add_node(
+        results = await execute_node(
+            self.runtime,
             "UserListNode",
             "list",
             {
@@ -275,10 +255,6 @@ class UserService:
             },
         )
 
-        results, _ = await self.runtime.execute_workflow_async(
-            workflow.build(), inputs={}
-        )
-
         list_result = results.get("list", {})
         records = list_result.get("records", [])
 
@@ -0,0 +1,168 @@
+"""
+Workflow Templates
+
+Pre-built single-node workflows for DataFlow CRUD operations.
+Each (node_type, node_id, parameter shape) workflow is built and validated
+once; calls bind their actual parameters through the runtime's node-scoped
+inputs, which take precedence over node config. Template configs hold typed
+placeholders only, never caller data.
+
+Reads of cached models are served from the versioned query cache and writes
+invalidate it (see studio.services.query_cache).
+"""
+
+from collections import OrderedDict
+
+from kailash.workflow.builder import WorkflowBuilder
+
+from studio.services.query_cache import (
+    WRITE_OPERATIONS,
+    get_query_cache,
+    parse_node_type,
+)
+
+TEMPLATE_CACHE_MAX_ENTRIES = 1024
+
+
+def _placeholder(value):
+    """Get a same-typed stand-in for a parameter value."""
+    if isinstance(value, dict):
+        return {key: _placeholder(item) for key, item in value.items()}
+    if isinstance(value, bool | int | float | str | list | tuple):
+        return type(value)()
+    return value
+
+
+def parameter_shape(value) -> object:
+    """
+    Get the shape of a parameter value: nested keys and leaf types.
+
+    Args:
+        value: Node parameters (or a nested value)
+
+    Returns:
+        Hashable shape
+    """
+    if isinstance(value, dict):
+        return tuple(
+            (key, parameter_shape(item)) for key, item in sorted(value.items())
+        )
+    return type(value).__name__
+
+
+class WorkflowTemplateCache:
+    """
+    LRU cache of built single-node workflows.
+
+    Examples:
+        >>> templates = WorkflowTemplateCache()
+        >>> workflow = templates.get("AgentReadNode", "read", {"id": agent_id})
+        >>> await runtime.execute_workflow_async(workflow, inputs={"read": {"id": agent_id}})
+    """
+
+    def __init__(self, max_entries: int = TEMPLATE_CACHE_MAX_ENTRIES):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum templates kept
+        """
+        self.max_entries = max_entries
+        self._templates: OrderedDict[tuple, object] = OrderedDict()
+
+    def get(self, node_type: str, node_id: str, params: dict):
+        """
+        Get the built workflow for a node call, building it on first use.
+
+        Args:
+            node_type: DataFlow node type (e.g. "AgentReadNode")
+            node_id: Node ID (the key of the node's result)
+            params: Call parameters (only their shape is used)
+
+        Returns:
+            Built workflow
+        """
+        key = (node_type, node_id, parameter_shape(params))
+
+        workflow = self._templates.get(key)
+        if workflow is not None:
+            self._templates.move_to_end(key)
+            return workflow
+
+        builder = WorkflowBuilder()
+        builder.add_node(node_type, node_id, _placeholder(params))
+        workflow = builder.build()
+
+        self._templates[key] = workflow
+        while len(self._templates) > self.max_entries:
+            self._templates.popitem(last=False)
+        return workflow
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+
+_template_cache: WorkflowTemplateCache | None = None
+
+
+def get_template_cache() -> WorkflowTemplateCache:
+    """Get the process-wide workflow template cache."""
+    global _template_cache
+    if _template_cache is None:
+        _template_cache = WorkflowTemplateCache()
+    return _template_cache
+
+
+async def execute_node(runtime, node_type: str, node_id: str, params: dict) -> dict:
+    """
+    Execute a single DataFlow node through a cached workflow template.
+
+    Equivalent to building a one-node workflow with params as node config and
+    executing it, without rebuilding the workflow on every call. Reads of
+    cached models are answered from the query cache when possible; writes
+    bump the model's cache version once the node ran.
+
+    Args:
+        runtime: AsyncLocalRuntime
+        node_type: DataFlow node type (e.g. "AgentReadNode")
+        node_id: Node ID
+        params: Node parameters
+
+    Returns:
+        Workflow results keyed by node ID
+    """
+    cache = get_query_cache()
+    parsed = parse_node_type(node_type)
+    if cache is None or parsed is None or not cache.is_cached(parsed[0]):
+        return await _run_node(runtime, node_type, node_id, params)
+
+    model, operation = parsed
+    if operation in WRITE_OPERATIONS:
+        try:
+            return await _run_node(runtime, node_type, node_id, params)
+        finally:
+            # Also after failures: a write may have been applied partially
+            await cache.bump_version(model)
+
+    version = await cache.get_version(model)
+    if version is None:
+        return await _run_node(runtime, node_type, node_id, params)
+
+    cached = await cache.get(model, version, node_type, params)
+    if cached is not None:
+        return {node_id: cached}
+
+    results = await _run_node(runtime, node_type, node_id, params)
+    result = results.get(node_id)
+    if result is not None and not (isinstance(result, dict) and "error" in result):
+        await cache.set(model, version, node_type, params, result)
+    return results
+
+
+async def _run_node(runtime, node_type: str, node_id: str, params: dict) -> dict:
+    """Execute a single node through its workflow template."""
+    workflow = get_template_cache().get(node_type, node_id, params)
+    results, _ = await runtime.execute_workflow_async(
+        workflow, inputs={node_id: params}
+    )
+    return results
@@ -0,0 +1,139 @@
+"""
+Write-Behind Queue
+
+Background execution of bookkeeping writes that a request does not need to
+wait for (cost records, rate limit records, lineage results). Writes are
+queued and run by a few worker tasks; the caller returns as soon as the write
+is queued. Failed writes are logged, not raised, since the request they belong
+to has already been answered.
+
+If the queue is full, or not started in the running event loop, a write runs
+inline instead, so writes are delayed under load but never dropped.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+WRITE_BEHIND_MAX_SIZE = 10_000
+WRITE_BEHIND_WORKERS = 4
+
+WriteFn = Callable[..., Awaitable[Any]]
+
+
+class WriteBehindQueue:
+    """
+    Runs queued async writes in background worker tasks.
+
+    Examples:
+        >>> queue = WriteBehindQueue("governance")
+        >>> queue.start()
+        >>> await queue.submit(service.record_invocation_cost, "agent-1", ...)
+        >>> await queue.close()  # waits for queued writes
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_size: int = WRITE_BEHIND_MAX_SIZE,
+        workers: int = WRITE_BEHIND_WORKERS,
+    ):
+        """
+        Initialize the (not yet started) queue.
+
+        Args:
+            name: Name used in log messages
+            max_size: Maximum queued writes before writes run inline
+            workers: Number of worker tasks
+        """
+        self.name = name
+        self.max_size = max_size
+        self.workers = workers
+        self._queue: asyncio.Queue | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._tasks: list[asyncio.Task] = []
+
+    @property
+    def running(self) -> bool:
+        """Whether the workers are running in the current event loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return bool(self._tasks) and loop is self._loop
+
+    @property
+    def pending(self) -> int:
+        """Number of queued writes not yet picked up by a worker."""
+        return self._queue.qsize() if self._queue else 0
+
+    def start(self) -> None:
+        """Start the workers in the running event loop."""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._tasks = [
+            asyncio.create_task(self._work(), name=f"{self.name}-write-behind-{i}")
+            for i in range(self.workers)
+        ]
+
+    async def submit(self, write: WriteFn, *args: Any, **kwargs: Any) -> None:
+        """
+        Queue a write, or run it inline if the queue is full or not running.
+
+        Args:
+            write: Async function performing the write
+            *args: Positional arguments of the write
+            **kwargs: Keyword arguments of the write
+        """
+        if self.running:
+            try:
+                self._queue.put_nowait((write, args, kwargs))
+                return
+            except asyncio.QueueFull:
+                logger.warning(
+                    f"Write-behind queue {self.name} is full, writing inline"
+                )
+
+        await self._run(write, args, kwargs)
+
+    async def flush(self) -> None:
+        """Wait until all queued writes are completed."""
+        if self.running:
+            await self._queue.join()
+
+    async def close(self) -> None:
+        """Complete the queued writes and stop the workers."""
+        if not self.running:
+            # Workers of another (closed) loop cannot be awaited here
+            self._tasks = []
+            return
+
+        await self.flush()
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _work(self) -> None:
+        """Run queued writes until cancelled."""
+        while True:
+            write, args, kwargs = await self._queue.get()
+            try:
+                await self._run(write, args, kwargs)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, write: WriteFn, args: tuple, kwargs: dict) -> None:
+        """Run one write, logging failures."""
+        try:
+            await write(*args, **kwargs)
+        except Exception as e:
+            name = getattr(write, "__qualname__", repr(write))
+            logger.error(
+                f"Write-behind {self.name} write {name} failed: {e}", exc_info=True
+            )
@@ -76,6 +76,7 @@ from studio_kaizen.trust.governance.config import (
 # Storage
 from studio_kaizen.trust.governance.store import (
     BudgetStore,
+    CachedBudgetStore,
     DataFlowBudgetStore,
     InMemoryBudgetStore,
     ApprovalStore,
@@ -89,6 +90,7 @@ from studio_kaizen.trust.governance.triggers import (
     TriggerContext,
     TriggerResult,
     InMemoryHistoryProvider,
+    InvocationHistoryIndex,
 )
 
 # Enforcers and Managers
@@ -96,6 +98,7 @@ from studio_kaizen.trust.governance.budget_enforcer import ExternalAgentBudgetEn
 from studio_kaizen.trust.governance.rate_limiter import ExternalAgentRateLimiter
 from studio_kaizen.trust.governance.policy_engine import ExternalAgentPolicyEngine
 from studio_kaizen.trust.governance.approval_manager import (
+    ApprovalExpiryScheduler,
     ExternalAgentApprovalManager,
     ApprovalNotFoundError,
     UnauthorizedApproverError,
@@ -109,6 +112,7 @@ from studio_kaizen.trust.governance.notifications import (
     ApprovalNotificationService,
     ApproverInfo,
     EmailNotificationAdapter,
+    NotificationDispatcher,
     SlackNotificationAdapter,
     TeamsNotificationAdapter,
     WebhookNotificationAdapter,
@@ -146,6 +150,7 @@ __all__ = [
     "BudgetStore",
     "InMemoryBudgetStore",
     "DataFlowBudgetStore",
+    "CachedBudgetStore",
     # Storage - Approval
     "ApprovalStore",
     "InMemoryApprovalStore",
@@ -155,11 +160,13 @@ __all__ = [
     "TriggerContext",
     "TriggerResult",
     "InMemoryHistoryProvider",
+    "InvocationHistoryIndex",
     # Enforcers and Managers
     "ExternalAgentBudgetEnforcer",
     "ExternalAgentRateLimiter",
     "ExternalAgentPolicyEngine",
     "ExternalAgentApprovalManager",
+    "ApprovalExpiryScheduler",
     # Approval Errors
     "ApprovalNotFoundError",
     "UnauthorizedApproverError",
@@ -170,6 +177,7 @@ __all__ = [
     "ApprovalNotificationService",
     "ApproverInfo",
     "EmailNotificationAdapter",
+    "NotificationDispatcher",
     "SlackNotificationAdapter",
     "TeamsNotificationAdapter",
     "WebhookNotificationAdapter",
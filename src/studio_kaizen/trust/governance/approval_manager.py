@@ -10,8 +10,13 @@ Features:
 - Timeout and expiration handling
 - Full audit trail
 - Notification integration
+
+Expired requests are processed by ApprovalExpiryScheduler, a background
+task that reads due requests from the store's get_expired() query in
+batches, updates each batch at once and notifies requestors concurrently.
 """
 
+import asyncio
 import logging
 import uuid
 from datetime import datetime
@@ -28,7 +33,7 @@ from studio_kaizen.trust.governance.store import (
 from studio_kaizen.trust.governance.triggers import (
     ApprovalTriggerEvaluator,
     TriggerContext,
-    InMemoryHistoryProvider,
+    InvocationHistoryIndex,
 )
 from studio_kaizen.trust.governance.types import (
     ApprovalCheckResult,
@@ -155,7 +160,9 @@ class ExternalAgentApprovalManager:
         self.workflow_config = workflow_config or ApprovalWorkflowConfig()
         self.notification_service = notification_service
         self.store = store or InMemoryApprovalStore()
-        self.history_provider = history_provider or InMemoryHistoryProvider()
+        self.history_provider = history_provider or InvocationHistoryIndex(
+            window_seconds=self.trigger_config.rate_trigger_window_seconds
+        )
 
         # Initialize trigger evaluator
         self.trigger_evaluator = ApprovalTriggerEvaluator(
@@ -221,12 +228,14 @@ class ExternalAgentApprovalManager:
                 window_seconds=self.trigger_config.rate_trigger_window_seconds
             )
 
-        # Check first invocation
-        is_first_invocation = await self.history_provider.is_first_invocation(
-            agent_id=agent_id,
-            user_id=user_id,
-            organization_id=organization_id
-        )
+        # Check first invocation (only looked up if it can trigger)
+        is_first_invocation = False
+        if self.trigger_config.require_first_invocation:
+            is_first_invocation = await self.history_provider.is_first_invocation(
+                agent_id=agent_id,
+                user_id=user_id,
+                organization_id=organization_id
+            )
 
         # Build trigger context
         context = TriggerContext(
@@ -563,11 +572,20 @@ class ExternalAgentApprovalManager:
         """
         return await self.store.get(request_id)
 
-    async def process_expired_requests(self) -> list[ApprovalRequest]:
+    async def process_expired_requests(
+        self,
+        batch_size: int | None = None
+    ) -> list[ApprovalRequest]:
         """
         Process all expired approval requests.
 
-        Called by a scheduler to handle request timeouts.
+        Called by ApprovalExpiryScheduler to handle request timeouts.
+        Due requests are read from the store in batches (earliest expiry
+        first); each batch is saved with one store update and its
+        requestors are notified concurrently.
+
+        Args:
+            batch_size: Requests per batch (default: workflow config)
 
         Returns:
             List of processed expired requests
@@ -578,48 +596,69 @@ class ExternalAgentApprovalManager:
             >>> for req in expired:
             ...     print(f"Expired: {req.id}")
         """
-        expired_requests = await self.store.get_expired()
-        processed = []
-
-        for request in expired_requests:
-            if self.workflow_config.auto_reject_on_timeout:
-                request.status = ApprovalStatus.EXPIRED
-                request.rejections.append(ApprovalDecision(
-                    approver_id="system",
-                    decision="reject",
-                    reason="Request expired due to timeout",
-                    timestamp=datetime.utcnow()
-                ))
-            elif self.workflow_config.auto_approve_on_timeout:
-                # Dangerous - but supported for specific use cases
-                request.status = ApprovalStatus.APPROVED
-                request.approvals.append(ApprovalDecision(
-                    approver_id="system",
-                    decision="approve",
-                    reason="Auto-approved due to timeout",
-                    timestamp=datetime.utcnow()
-                ))
-            else:
-                request.status = ApprovalStatus.EXPIRED
+        batch_size = batch_size or self.workflow_config.expiry_batch_size
+        processed: list[ApprovalRequest] = []
+        processed_ids: set[str] = set()
+
+        while True:
+            due = await self.store.get_expired(limit=batch_size)
+            batch = [request for request in due if request.id not in processed_ids]
+            if not batch:
+                # Nothing due, or the store did not take the last updates
+                break
 
-            await self.store.save(request)
-            processed.append(request)
+            for request in batch:
+                self._apply_timeout(request)
+            await self.store.update_many(batch)
+
+            processed.extend(batch)
+            processed_ids.update(request.id for request in batch)
+            logger.info(f"Processed {len(batch)} expired requests")
 
-            # Notify requestor
+            # Notify requestors
             if self.notification_service and self.workflow_config.notify_on_expiration:
-                try:
-                    await self.notification_service.notify_requestor(
-                        request=request,
-                        decision="expired",
-                        reason="Request timed out"
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to notify about expiration: {e}")
+                await asyncio.gather(
+                    *(self._notify_expired(request) for request in batch)
+                )
 
-            logger.info(f"Processed expired request {request.id}")
+            if len(due) < batch_size:
+                break
 
         return processed
 
+    def _apply_timeout(self, request: ApprovalRequest) -> None:
+        """Apply the configured timeout decision to an expired request."""
+        if self.workflow_config.auto_reject_on_timeout:
+            request.status = ApprovalStatus.EXPIRED
+            request.rejections.append(ApprovalDecision(
+                approver_id="system",
+                decision="reject",
+                reason="Request expired due to timeout",
+                timestamp=datetime.utcnow()
+            ))
+        elif self.workflow_config.auto_approve_on_timeout:
+            # Dangerous - but supported for specific use cases
+            request.status = ApprovalStatus.APPROVED
+            request.approvals.append(ApprovalDecision(
+                approver_id="system",
+                decision="approve",
+                reason="Auto-approved due to timeout",
+                timestamp=datetime.utcnow()
+            ))
+        else:
+            request.status = ApprovalStatus.EXPIRED
+
+    async def _notify_expired(self, request: ApprovalRequest) -> None:
+        """Notify the requestor about an expired request."""
+        try:
+            await self.notification_service.notify_requestor(
+                request=request,
+                decision="expired",
+                reason="Request timed out"
+            )
+        except Exception as e:
+            logger.warning(f"Failed to notify about expiration: {e}")
+
     async def escalate(
         self,
         request_id: str,
@@ -757,7 +796,80 @@ class ExternalAgentApprovalManager:
         return " | ".join(parts)
 
 
+class ApprovalExpiryScheduler:
+    """
+    Background task that processes expired approval requests.
+
+    Every check interval it runs process_expired_requests(), which only
+    reads due requests from the store's get_expired() (the in-memory
+    store's expiry heap, or a database filter on status and expires_at),
+    so a check does not load every pending request.
+
+    Examples:
+        >>> scheduler = ApprovalExpiryScheduler(manager)
+        >>> scheduler.start()
+        >>> ...
+        >>> await scheduler.stop()
+    """
+
+    def __init__(
+        self,
+        manager: ExternalAgentApprovalManager,
+        interval_seconds: float | None = None
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            manager: Approval manager whose expired requests are processed
+            interval_seconds: Seconds between checks (default: workflow config)
+        """
+        self.manager = manager
+        self.interval_seconds = (
+            interval_seconds
+            if interval_seconds is not None
+            else manager.workflow_config.expiry_check_interval.total_seconds()
+        )
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        """Check whether the background task is running."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the background task (no-op if already running)."""
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background task and wait for it to finish."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def run_once(self) -> list[ApprovalRequest]:
+        """Process the requests that are due now."""
+        return await self.manager.process_expired_requests()
+
+    async def _run(self) -> None:
+        """Check for expired requests until cancelled."""
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                # Keep the scheduler alive; the requests stay due
+                logger.error(f"Failed to process expired approval requests: {e}")
+            await asyncio.sleep(self.interval_seconds)
+
+
 __all__ = [
+    "ApprovalExpiryScheduler",
     "ExternalAgentApprovalManager",
     "ApprovalNotFoundError",
     "UnauthorizedApproverError",
@@ -291,6 +291,8 @@ class ApprovalWorkflowConfig:
     reminder_interval: timedelta = field(default_factory=lambda: timedelta(hours=4))
     auto_reject_on_timeout: bool = False
     auto_approve_on_timeout: bool = False  # Dangerous - use with extreme caution
+    expiry_check_interval: timedelta = field(default_factory=lambda: timedelta(minutes=1))
+    expiry_batch_size: int = 100  # Expired requests processed per store query
 
     # Approvers
     approver_roles: list[str] = field(default_factory=lambda: ["admin"])
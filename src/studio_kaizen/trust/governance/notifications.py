@@ -8,6 +8,11 @@ notifications through various channels:
 - Microsoft Teams
 - Webhook (generic)
 
+Approval requests are fanned out concurrently by NotificationDispatcher:
+every approver is notified at once (bounded by a semaphore), approvers that
+share a Slack/Teams webhook get one message, and webhook adapters reuse one
+pooled HTTP session instead of opening a connection per message.
+
 Examples:
     >>> service = ApprovalNotificationService()
     >>> service.register_adapter("email", EmailNotificationAdapter(smtp_config))
@@ -15,15 +20,25 @@ Examples:
     >>> await service.notify_approvers(request, roles=["admin"], users=[])
 """
 
+import asyncio
 import json
 import logging
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Protocol
 
 logger = logging.getLogger(__name__)
 
+# Messages sent at once per notify_approvers() call
+NOTIFICATION_MAX_CONCURRENCY = 20
+
+# Open connections per adapter session, and timeout per message
+NOTIFICATION_POOL_SIZE = 20
+NOTIFICATION_TIMEOUT_SECONDS = 10.0
+
 
 @dataclass
 class ApproverInfo:
@@ -49,7 +64,17 @@ class ApproverResolver(Protocol):
 
 
 class NotificationAdapter(ABC):
-    """Base class for notification adapters."""
+    """
+    Base class for notification adapters.
+
+    Adapters whose messages all reach the same destination (e.g. a Slack
+    channel webhook) set batches_approvers and override
+    send_approval_request_batch(), so a request is posted once for all of
+    its approvers on that channel. By default a batch sends one message per
+    approver, concurrently.
+    """
+
+    batches_approvers: bool = False
 
     @abstractmethod
     async def send_approval_request(
@@ -71,6 +96,38 @@ class NotificationAdapter(ABC):
         """
         ...
 
+    async def send_approval_request_batch(
+        self,
+        request: Any,
+        approvers: list[ApproverInfo],
+        approval_url: str | None = None
+    ) -> bool:
+        """
+        Send one approval request notification addressed to several approvers.
+
+        The default sends send_approval_request() to each approver
+        concurrently; batching adapters override it with a single message.
+
+        Args:
+            request: The ApprovalRequest object
+            approvers: Approvers reached by the message
+            approval_url: Optional URL for approving/rejecting
+
+        Returns:
+            True if the notification was sent successfully to every approver
+        """
+        results = await asyncio.gather(
+            *(
+                self.send_approval_request(request, approver, approval_url)
+                for approver in approvers
+            )
+        )
+        return all(results)
+
+    async def close(self) -> None:
+        """Release connections held by the adapter (none by default)."""
+        return None
+
     @abstractmethod
     async def send_decision_notification(
         self,
@@ -94,6 +151,45 @@ class NotificationAdapter(ABC):
         ...
 
 
+def _approver_names(approvers: list[ApproverInfo]) -> str:
+    """Format approvers for a shared channel message."""
+    return ", ".join(approver.name or approver.user_id for approver in approvers)
+
+
+class _PooledSession:
+    """
+    aiohttp session shared by all messages of a webhook adapter.
+
+    Created lazily on first use; a session is bound to its event loop, so
+    a new one is created if the adapter is used from another loop.
+    """
+
+    def __init__(self, pool_size: int = NOTIFICATION_POOL_SIZE):
+        """Initialize the (not yet opened) session."""
+        self.pool_size = pool_size
+        self._session = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    async def get(self):
+        """Get the open session, creating it if needed."""
+        import aiohttp
+
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                timeout=aiohttp.ClientTimeout(total=NOTIFICATION_TIMEOUT_SECONDS)
+            )
+            self._loop = loop
+        return self._session
+
+    async def close(self) -> None:
+        """Close the session."""
+        session, self._session = self._session, None
+        if session is not None and not session.closed:
+            await session.close()
+
+
 class EmailNotificationAdapter(NotificationAdapter):
     """
     Email notification adapter.
@@ -232,7 +328,6 @@ This is an automated message from Kaizen Studio.
         body: str
     ) -> None:
         """Send email using SMTP."""
-        import smtplib
         from email.mime.text import MIMEText
         from email.mime.multipart import MIMEMultipart
 
@@ -242,6 +337,13 @@ This is an automated message from Kaizen Studio.
         msg["Subject"] = subject
         msg.attach(MIMEText(body, "plain"))
 
+        # smtplib blocks, so deliver in a thread to let other sends proceed
+        await asyncio.to_thread(self._deliver, msg)
+
+    def _deliver(self, msg: Any) -> None:
+        """Deliver a message to the SMTP server."""
+        import smtplib
+
         with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
             if self.use_tls:
                 server.starttls()
@@ -261,6 +363,8 @@ class SlackNotificationAdapter(NotificationAdapter):
         ... )
     """
 
+    batches_approvers = True
+
     def __init__(
         self,
         webhook_url: str,
@@ -271,6 +375,7 @@ class SlackNotificationAdapter(NotificationAdapter):
         self.webhook_url = webhook_url
         self.channel = channel
         self.base_url = base_url
+        self._session = _PooledSession()
 
     async def send_approval_request(
         self,
@@ -279,6 +384,15 @@ class SlackNotificationAdapter(NotificationAdapter):
         approval_url: str | None = None
     ) -> bool:
         """Send approval request to Slack."""
+        return await self.send_approval_request_batch(request, [approver], approval_url)
+
+    async def send_approval_request_batch(
+        self,
+        request: Any,
+        approvers: list[ApproverInfo],
+        approval_url: str | None = None
+    ) -> bool:
+        """Send one approval request to Slack for all approvers."""
         approval_link = approval_url or f"{self.base_url}/approvals/{request.id}"
 
         payload = {
@@ -297,7 +411,8 @@ class SlackNotificationAdapter(NotificationAdapter):
                         {"type": "mrkdwn", "text": f"*Agent:*\n{request.external_agent_id}"},
                         {"type": "mrkdwn", "text": f"*Requested By:*\n{request.requested_by_user_id}"},
                         {"type": "mrkdwn", "text": f"*Estimated Cost:*\n${request.estimated_cost or 0:.2f}"},
-                        {"type": "mrkdwn", "text": f"*Expires:*\n{request.expires_at.strftime('%Y-%m-%d %H:%M') if request.expires_at else 'N/A'}"}
+                        {"type": "mrkdwn", "text": f"*Expires:*\n{request.expires_at.strftime('%Y-%m-%d %H:%M') if request.expires_at else 'N/A'}"},
+                        {"type": "mrkdwn", "text": f"*Approvers:*\n{_approver_names(approvers)}"}
                     ]
                 },
                 {
@@ -369,20 +484,22 @@ class SlackNotificationAdapter(NotificationAdapter):
 
     async def _post_webhook(self, payload: dict[str, Any]) -> bool:
         """Post to Slack webhook."""
-        import aiohttp
-
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                self.webhook_url,
-                json=payload,
-                headers={"Content-Type": "application/json"}
-            ) as response:
-                if response.status == 200:
-                    return True
-                else:
-                    text = await response.text()
-                    logger.error(f"Slack webhook error: {response.status} - {text}")
-                    return False
+        session = await self._session.get()
+        async with session.post(
+            self.webhook_url,
+            json=payload,
+            headers={"Content-Type": "application/json"}
+        ) as response:
+            if response.status == 200:
+                return True
+            else:
+                text = await response.text()
+                logger.error(f"Slack webhook error: {response.status} - {text}")
+                return False
+
+    async def close(self) -> None:
+        """Close the pooled webhook session."""
+        await self._session.close()
 
 
 class TeamsNotificationAdapter(NotificationAdapter):
@@ -395,6 +512,8 @@ class TeamsNotificationAdapter(NotificationAdapter):
         ... )
     """
 
+    batches_approvers = True
+
     def __init__(
         self,
         webhook_url: str,
@@ -403,6 +522,7 @@ class TeamsNotificationAdapter(NotificationAdapter):
         """Initialize Teams adapter."""
         self.webhook_url = webhook_url
         self.base_url = base_url
+        self._session = _PooledSession()
 
     async def send_approval_request(
         self,
@@ -411,6 +531,15 @@ class TeamsNotificationAdapter(NotificationAdapter):
         approval_url: str | None = None
     ) -> bool:
         """Send approval request to Teams."""
+        return await self.send_approval_request_batch(request, [approver], approval_url)
+
+    async def send_approval_request_batch(
+        self,
+        request: Any,
+        approvers: list[ApproverInfo],
+        approval_url: str | None = None
+    ) -> bool:
+        """Send one approval request to Teams for all approvers."""
         approval_link = approval_url or f"{self.base_url}/approvals/{request.id}"
 
         payload = {
@@ -426,7 +555,8 @@ class TeamsNotificationAdapter(NotificationAdapter):
                         {"name": "Requested By", "value": request.requested_by_user_id},
                         {"name": "Estimated Cost", "value": f"${request.estimated_cost or 0:.2f}"},
                         {"name": "Reason", "value": request.trigger_reason},
-                        {"name": "Expires", "value": request.expires_at.strftime("%Y-%m-%d %H:%M") if request.expires_at else "N/A"}
+                        {"name": "Expires", "value": request.expires_at.strftime("%Y-%m-%d %H:%M") if request.expires_at else "N/A"},
+                        {"name": "Approvers", "value": _approver_names(approvers)}
                     ],
                     "markdown": True
                 }
@@ -479,20 +609,22 @@ class TeamsNotificationAdapter(NotificationAdapter):
 
     async def _post_webhook(self, payload: dict[str, Any]) -> bool:
         """Post to Teams webhook."""
-        import aiohttp
-
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                self.webhook_url,
-                json=payload,
-                headers={"Content-Type": "application/json"}
-            ) as response:
-                if response.status == 200:
-                    return True
-                else:
-                    text = await response.text()
-                    logger.error(f"Teams webhook error: {response.status} - {text}")
-                    return False
+        session = await self._session.get()
+        async with session.post(
+            self.webhook_url,
+            json=payload,
+            headers={"Content-Type": "application/json"}
+        ) as response:
+            if response.status == 200:
+                return True
+            else:
+                text = await response.text()
+                logger.error(f"Teams webhook error: {response.status} - {text}")
+                return False
+
+    async def close(self) -> None:
+        """Close the pooled webhook session."""
+        await self._session.close()
 
 
 class WebhookNotificationAdapter(NotificationAdapter):
@@ -518,6 +650,7 @@ class WebhookNotificationAdapter(NotificationAdapter):
         self.webhook_url = webhook_url
         self.secret = secret
         self.headers = headers or {}
+        self._session = _PooledSession()
 
     async def send_approval_request(
         self,
@@ -570,7 +703,6 @@ class WebhookNotificationAdapter(NotificationAdapter):
 
     async def _post_webhook(self, payload: dict[str, Any]) -> bool:
         """Post to webhook endpoint."""
-        import aiohttp
         import hashlib
         import hmac
 
@@ -587,17 +719,21 @@ class WebhookNotificationAdapter(NotificationAdapter):
             headers["X-Webhook-Signature"] = f"sha256={signature}"
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.webhook_url,
-                    json=payload,
-                    headers=headers
-                ) as response:
-                    return response.status < 400
+            session = await self._session.get()
+            async with session.post(
+                self.webhook_url,
+                json=payload,
+                headers=headers
+            ) as response:
+                return response.status < 400
         except Exception as e:
             logger.error(f"Webhook error: {e}")
             return False
 
+    async def close(self) -> None:
+        """Close the pooled webhook session."""
+        await self._session.close()
+
 
 class SimpleApproverResolver:
     """
@@ -634,11 +770,170 @@ class SimpleApproverResolver:
         return approvers
 
 
+@dataclass
+class ChannelLatency:
+    """Delivery latency statistics of a notification channel."""
+
+    messages: int = 0
+    failures: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    last_seconds: float = 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        """Get the mean latency per message."""
+        return self.total_seconds / self.messages if self.messages else 0.0
+
+    def record(self, seconds: float, success: bool) -> None:
+        """Record one sent (or failed) message."""
+        self.messages += 1
+        if not success:
+            self.failures += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.last_seconds = seconds
+
+
+class NotificationDispatcher:
+    """
+    Concurrent fan-out of approval request notifications.
+
+    Approvers are grouped by the first of their channels that has an
+    adapter, and all messages are sent at once, at most max_concurrency at a
+    time. Adapters that batch approvers send one message per group instead
+    of one per approver. Approvers whose message failed are retried on their
+    next channel in a following round, so each approver is still notified on
+    the first channel that succeeds.
+
+    Examples:
+        >>> dispatcher = NotificationDispatcher(adapters, max_concurrency=10)
+        >>> results = await dispatcher.dispatch(request, approvers, approval_url)
+        >>> dispatcher.latency["slack"].mean_seconds
+    """
+
+    def __init__(
+        self,
+        adapters: dict[str, NotificationAdapter],
+        max_concurrency: int = NOTIFICATION_MAX_CONCURRENCY
+    ):
+        """
+        Initialize dispatcher.
+
+        Args:
+            adapters: Notification adapters by channel (shared, not copied)
+            max_concurrency: Maximum messages in flight per dispatch
+        """
+        self.adapters = adapters
+        self.max_concurrency = max_concurrency
+        self.latency: dict[str, ChannelLatency] = {}
+
+    async def dispatch(
+        self,
+        request: Any,
+        approvers: list[ApproverInfo],
+        approval_url: str | None = None
+    ) -> dict[str, bool]:
+        """
+        Send an approval request to all approvers.
+
+        Args:
+            request: ApprovalRequest to notify about
+            approvers: Approvers to notify
+            approval_url: Optional URL for approving/rejecting
+
+        Returns:
+            Dict mapping approver IDs to success status
+        """
+        results = {approver.user_id: False for approver in approvers}
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        # Approvers still to notify, with the channels they have left to try
+        pending: list[tuple[ApproverInfo, Iterator[str]]] = [
+            (approver, iter(approver.notification_channels)) for approver in approvers
+        ]
+
+        while pending:
+            groups: dict[str, list[tuple[ApproverInfo, Iterator[str]]]] = {}
+            for approver, channels in pending:
+                channel = next((c for c in channels if c in self.adapters), None)
+                if channel is not None:
+                    groups.setdefault(channel, []).append((approver, channels))
+
+            sends = []
+            for channel, members in groups.items():
+                if self.adapters[channel].batches_approvers:
+                    sends.append((channel, members))
+                else:
+                    sends.extend((channel, [member]) for member in members)
+
+            outcomes = await asyncio.gather(*(
+                self._send(
+                    semaphore,
+                    channel,
+                    request,
+                    [approver for approver, _ in members],
+                    approval_url
+                )
+                for channel, members in sends
+            ))
+
+            pending = []
+            for (_, members), success in zip(sends, outcomes, strict=True):
+                for approver, channels in members:
+                    if success:
+                        results[approver.user_id] = True
+                    else:
+                        pending.append((approver, channels))
+
+        return results
+
+    async def _send(
+        self,
+        semaphore: asyncio.Semaphore,
+        channel: str,
+        request: Any,
+        approvers: list[ApproverInfo],
+        approval_url: str | None
+    ) -> bool:
+        """Send one message and record its latency."""
+        adapter = self.adapters[channel]
+
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                if len(approvers) == 1:
+                    success = await adapter.send_approval_request(
+                        request=request,
+                        approver=approvers[0],
+                        approval_url=approval_url
+                    )
+                else:
+                    success = await adapter.send_approval_request_batch(
+                        request=request,
+                        approvers=approvers,
+                        approval_url=approval_url
+                    )
+            except Exception as e:
+                logger.error(f"Failed to send {channel} notification: {e}")
+                success = False
+            elapsed = time.perf_counter() - start
+
+        self.latency.setdefault(channel, ChannelLatency()).record(elapsed, bool(success))
+        logger.debug(
+            f"Sent {channel} notification for {len(approvers)} approver(s) "
+            f"in {elapsed * 1000:.1f}ms"
+        )
+        return bool(success)
+
+
 class ApprovalNotificationService:
     """
     Multi-channel notification service for approvals.
 
-    Coordinates sending notifications across multiple channels.
+    Coordinates sending notifications across multiple channels. Approval
+    requests are fanned out concurrently by a NotificationDispatcher, whose
+    per-channel latency statistics are available as dispatcher.latency.
 
     Examples:
         >>> service = ApprovalNotificationService()
@@ -655,12 +950,14 @@ class ApprovalNotificationService:
     def __init__(
         self,
         approver_resolver: ApproverResolver | None = None,
-        base_url: str = "https://studio.example.com"
+        base_url: str = "https://studio.example.com",
+        max_concurrency: int = NOTIFICATION_MAX_CONCURRENCY
     ):
         """Initialize notification service."""
         self.adapters: dict[str, NotificationAdapter] = {}
         self.approver_resolver = approver_resolver or SimpleApproverResolver()
         self.base_url = base_url
+        self.dispatcher = NotificationDispatcher(self.adapters, max_concurrency)
 
     def register_adapter(self, channel: str, adapter: NotificationAdapter) -> None:
         """Register a notification adapter for a channel."""
@@ -683,8 +980,6 @@ class ApprovalNotificationService:
         Returns:
             Dict mapping approver IDs to success status
         """
-        results: dict[str, bool] = {}
-
         # Resolve approvers
         approvers = await self.approver_resolver.resolve_approvers(
             roles=approver_roles,
@@ -694,26 +989,7 @@ class ApprovalNotificationService:
 
         approval_url = f"{self.base_url}/approvals/{request.id}"
 
-        for approver in approvers:
-            success = False
-
-            for channel in approver.notification_channels:
-                adapter = self.adapters.get(channel)
-                if adapter:
-                    try:
-                        if await adapter.send_approval_request(
-                            request=request,
-                            approver=approver,
-                            approval_url=approval_url
-                        ):
-                            success = True
-                            break  # Stop after first successful notification
-                    except Exception as e:
-                        logger.error(f"Failed to send {channel} notification: {e}")
-
-            results[approver.user_id] = success
-
-        return results
+        return await self.dispatcher.dispatch(request, approvers, approval_url)
 
     async def notify_requestor(
         self,
@@ -754,6 +1030,10 @@ class ApprovalNotificationService:
 
         return False
 
+    async def close(self) -> None:
+        """Close the connections of all adapters."""
+        await asyncio.gather(*(adapter.close() for adapter in self.adapters.values()))
+
 
 __all__ = [
     "ApproverInfo",
@@ -764,5 +1044,7 @@ __all__ = [
     "TeamsNotificationAdapter",
     "WebhookNotificationAdapter",
     "SimpleApproverResolver",
+    "ChannelLatency",
+    "NotificationDispatcher",
     "ApprovalNotificationService",
 ]
@@ -7,10 +7,23 @@ Evaluates policies based on:
 - Resource attributes (agent, workspace)
 - Environment attributes (production, staging)
 - Context attributes (time, IP, etc.)
+
+Policies are compiled when added: conditions become predicates with
+pre-parsed time windows, role/team sets and CIDR prefix tables, and
+policies are kept sorted by priority in buckets by the environment (or
+team) they require. An evaluation only visits the buckets of the
+principal's environment and team plus the unconstrained policies.
 """
 
+import heapq
+import ipaddress
 import logging
+from bisect import insort
+from collections.abc import Callable
 from datetime import datetime
+from functools import lru_cache
+from itertools import count
+from operator import attrgetter
 from typing import Any
 
 from studio_kaizen.trust.governance.types import (
@@ -24,6 +37,63 @@ from studio_kaizen.trust.governance.types import (
 
 logger = logging.getLogger(__name__)
 
+ConditionPredicate = Callable[[ExternalAgentPolicyContext], bool]
+
+
+class _PrefixTable:
+    """
+    CIDR ranges compiled for constant-time membership tests.
+
+    A flattened prefix trie: networks are stored as (version, prefix length)
+    -> set of network prefixes, so a lookup probes one set per distinct
+    prefix length instead of parsing and testing every range.
+    """
+
+    __slots__ = ("_prefixes",)
+
+    def __init__(self, networks: list[ipaddress.IPv4Network | ipaddress.IPv6Network]):
+        self._prefixes: dict[tuple[int, int], set[int]] = {}
+        for network in networks:
+            shift = network.max_prefixlen - network.prefixlen
+            self._prefixes.setdefault((network.version, shift), set()).add(
+                int(network.network_address) >> shift
+            )
+
+    def __contains__(self, ip: ipaddress.IPv4Address | ipaddress.IPv6Address) -> bool:
+        value = int(ip)
+        return any(
+            value >> shift in prefixes
+            for (version, shift), prefixes in self._prefixes.items()
+            if version == ip.version
+        )
+
+
+class _CompiledPolicy:
+    """A policy with its compiled condition predicates, sort order and buckets."""
+
+    __slots__ = ("policy", "order", "predicates", "index", "keys")
+
+    def __init__(
+        self,
+        policy: ExternalAgentPolicy,
+        sequence: int,
+        predicates: list[ConditionPredicate],
+    ):
+        self.policy = policy
+        # Higher priority first, then insertion order
+        self.order = (-policy.priority, sequence)
+        self.predicates = predicates
+        # Bucket index (by environment or team; None = unindexed) and keys
+        self.index: dict[str, list[_CompiledPolicy]] | None = None
+        self.keys: frozenset[str] = frozenset()
+
+    def matches(self, context: ExternalAgentPolicyContext) -> bool:
+        """Check all conditions (AND logic); no conditions always match."""
+        return all(predicate(context) for predicate in self.predicates)
+
+
+_policy_order = attrgetter("order")
+
 
 class ExternalAgentPolicyEngine:
     """
@@ -82,6 +152,13 @@ class ExternalAgentPolicyEngine:
         # Policy storage
         self.policies: dict[str, ExternalAgentPolicy] = {}
 
+        # Compiled policies, sorted by priority within each bucket
+        self._compiled: dict[str, _CompiledPolicy] = {}
+        self._by_environment: dict[str, list[_CompiledPolicy]] = {}
+        self._by_team: dict[str, list[_CompiledPolicy]] = {}
+        self._unindexed: list[_CompiledPolicy] = []
+        self._sequence = count()
+
     async def evaluate_policies(
         self,
         context: ExternalAgentPolicyContext,
@@ -122,18 +199,12 @@ class ExternalAgentPolicyEngine:
             allow_policies: list[str] = []
             deny_policies: list[str] = []
 
-            # Sort by priority (higher first)
-            sorted_policies = sorted(
-                self.policies.values(),
-                key=lambda p: p.priority,
-                reverse=True,
-            )
-
-            for policy in sorted_policies:
+            for compiled in self._candidates(context):
+                policy = compiled.policy
                 if not policy.enabled:
                     continue
 
-                if self._policy_matches(policy, context):
+                if compiled.matches(context):
                     matched_policies.append(policy.policy_id)
 
                     if policy.effect == PolicyEffect.DENY:
@@ -161,7 +232,7 @@ class ExternalAgentPolicyEngine:
             )
             result.evaluation_time_ms = (time.time() - start_time) * 1000
 
-            logger.info(
+            logger.debug(
                 f"Policy evaluation: effect={result.effect.value}, "
                 f"matched={len(matched_policies)}, "
                 f"reason={result.reason}"
@@ -199,198 +270,225 @@ class ExternalAgentPolicyEngine:
             matched_policies=[],
         )
 
-    def _policy_matches(
-        self,
-        policy: ExternalAgentPolicy,
-        context: ExternalAgentPolicyContext,
-    ) -> bool:
+    def _candidates(self, context: ExternalAgentPolicyContext):
         """
-        Check if policy conditions match the context.
+        Get the policies that can match the context, by priority.
 
-        All conditions must match (AND logic).
+        Policies requiring an environment or team are only in the bucket of
+        that value, so the others are never visited.
 
         Args:
-            policy: Policy to evaluate
             context: Request context
 
         Returns:
-            True if all conditions match
+            Iterator of compiled policies (higher priority first)
         """
-        if not policy.conditions:
-            # No conditions = always match
-            return True
-
-        for condition in policy.conditions:
-            if not self._condition_matches(condition, context):
-                return False
-
-        return True
+        principal = context.principal
+        buckets = [self._unindexed]
+        environment = getattr(principal, "environment", None)
+        if environment and environment in self._by_environment:
+            buckets.append(self._by_environment[environment])
+        team_id = getattr(principal, "team_id", None)
+        if team_id and team_id in self._by_team:
+            buckets.append(self._by_team[team_id])
+
+        if len(buckets) == 1:
+            return iter(self._unindexed)
+        return heapq.merge(*buckets, key=_policy_order)
+
+    def _compile_policy(self, policy: ExternalAgentPolicy) -> _CompiledPolicy:
+        """Compile the conditions of a policy into predicates."""
+        return _CompiledPolicy(
+            policy,
+            next(self._sequence),
+            [self._compile_condition(condition) for condition in policy.conditions],
+        )
 
-    def _condition_matches(
-        self,
-        condition: PolicyCondition,
-        context: ExternalAgentPolicyContext,
-    ) -> bool:
+    def _compile_condition(self, condition: PolicyCondition) -> ConditionPredicate:
         """
-        Check if a single condition matches the context.
+        Compile a single condition into a predicate on the context.
 
         Args:
-            condition: Condition to evaluate
-            context: Request context
+            condition: Condition to compile
 
         Returns:
-            True if condition matches
+            Predicate returning True if the condition matches
         """
         condition_type = condition.type.lower()
 
         if condition_type == "environment":
-            return self._match_environment(condition, context)
+            return self._compile_environment(condition)
         elif condition_type == "time":
-            return self._match_time(condition, context)
+            return self._compile_time(condition)
         elif condition_type == "ip":
-            return self._match_ip(condition, context)
+            return self._compile_ip(condition)
         elif condition_type == "role":
-            return self._match_role(condition, context)
+            return self._compile_role(condition)
         elif condition_type == "team":
-            return self._match_team(condition, context)
+            return self._compile_team(condition)
         elif condition_type == "custom":
-            return self._match_custom(condition, context)
+            return self._compile_custom(condition)
         else:
             logger.warning(f"Unknown condition type: {condition_type}")
-            return False
+            return _never
 
-    def _match_environment(
-        self,
-        condition: PolicyCondition,
-        context: ExternalAgentPolicyContext,
-    ) -> bool:
-        """Match environment condition."""
+    def _compile_environment(self, condition: PolicyCondition) -> ConditionPredicate:
+        """Compile environment condition."""
         if not condition.environments:
-            return True
-        principal = context.principal
-        env = getattr(principal, "environment", None)
-        return env in condition.environments if env else False
+            return _always
+        environments = frozenset(condition.environments)
 
-    def _match_time(
-        self,
-        condition: PolicyCondition,
-        context: ExternalAgentPolicyContext,
-    ) -> bool:
-        """Match time-based condition."""
+        def match(context: ExternalAgentPolicyContext) -> bool:
+            env = getattr(context.principal, "environment", None)
+            return env in environments if env else False
+
+        return match
+
+    def _compile_time(self, condition: PolicyCondition) -> ConditionPredicate:
+        """Compile time-based condition (time of day and day of week)."""
         if not condition.time_range:
-            return True
+            return _always
 
         time_range = condition.time_range
-        now = context.timestamp or datetime.utcnow()
+        minutes: tuple[int, int] | None = None
 
-        # Check time of day
+        # Parse time of day once
         start_time = time_range.get("start")
         end_time = time_range.get("end")
-
         if start_time and end_time:
             try:
                 start_hour, start_min = map(int, start_time.split(":"))
                 end_hour, end_min = map(int, end_time.split(":"))
-
-                current_minutes = now.hour * 60 + now.minute
-                start_minutes = start_hour * 60 + start_min
-                end_minutes = end_hour * 60 + end_min
-
-                if not (start_minutes <= current_minutes <= end_minutes):
-                    return False
+                minutes = (start_hour * 60 + start_min, end_hour * 60 + end_min)
             except (ValueError, AttributeError):
                 logger.warning(f"Invalid time format in condition: {time_range}")
 
-        # Check day of week (0=Monday, 6=Sunday)
-        allowed_days = time_range.get("days", [])
-        if allowed_days and now.weekday() not in allowed_days:
-            return False
+        # Day of week (0=Monday, 6=Sunday)
+        allowed_days = frozenset(time_range.get("days", []))
 
-        return True
+        def match(context: ExternalAgentPolicyContext) -> bool:
+            now = context.timestamp or datetime.utcnow()
+            if minutes is not None:
+                current_minutes = now.hour * 60 + now.minute
+                if not (minutes[0] <= current_minutes <= minutes[1]):
+                    return False
+            return not allowed_days or now.weekday() in allowed_days
 
-    def _match_ip(
-        self,
-        condition: PolicyCondition,
-        context: ExternalAgentPolicyContext,
-    ) -> bool:
-        """Match IP address condition."""
-        if not condition.ip_ranges:
-            return True
+        return match
 
-        principal = context.principal
-        ip = getattr(principal, "ip_address", None)
-        if not ip:
-            return False
+    def _compile_ip(self, condition: PolicyCondition) -> ConditionPredicate:
+        """Compile IP address condition (single IPs and CIDR ranges)."""
+        if not condition.ip_ranges:
+            return _always
 
-        # Check against each allowed range
+        addresses = set()
+        networks = []
         for ip_range in condition.ip_ranges:
-            if self._ip_in_range(ip, ip_range):
-                return True
-
-        return False
-
-    def _ip_in_range(self, ip: str, ip_range: str) -> bool:
-        """Check if IP is in range (supports CIDR notation)."""
-        import ipaddress
-
-        try:
-            ip_addr = ipaddress.ip_address(ip)
-
             if "/" in ip_range:
                 # CIDR notation
-                network = ipaddress.ip_network(ip_range, strict=False)
-                return ip_addr in network
+                try:
+                    networks.append(ipaddress.ip_network(ip_range, strict=False))
+                except ValueError:
+                    logger.warning(f"Invalid IP range in condition: {ip_range}")
             else:
                 # Single IP
-                return ip == ip_range
+                addresses.add(ip_range)
+        prefixes = _PrefixTable(networks)
 
-        except ValueError:
-            return False
+        def match(context: ExternalAgentPolicyContext) -> bool:
+            ip = getattr(context.principal, "ip_address", None)
+            if not ip:
+                return False
+            ip_addr = _parse_ip(ip)
+            if ip_addr is None:
+                return False
+            return ip in addresses or ip_addr in prefixes
 
-    def _match_role(
-        self,
-        condition: PolicyCondition,
-        context: ExternalAgentPolicyContext,
-    ) -> bool:
-        """Match role condition."""
+        return match
+
+    def _compile_role(self, condition: PolicyCondition) -> ConditionPredicate:
+        """Compile role condition."""
         if not condition.roles:
-            return True
+            return _always
+        roles = frozenset(condition.roles)
 
-        principal = context.principal
-        user_roles = getattr(principal, "roles", [])
+        def match(context: ExternalAgentPolicyContext) -> bool:
+            # Any user role in allowed roles
+            user_roles = getattr(context.principal, "roles", [])
+            return not roles.isdisjoint(user_roles)
 
-        # Check if any user role is in allowed roles
-        return bool(set(user_roles) & set(condition.roles))
+        return match
 
-    def _match_team(
-        self,
-        condition: PolicyCondition,
-        context: ExternalAgentPolicyContext,
-    ) -> bool:
-        """Match team condition."""
+    def _compile_team(self, condition: PolicyCondition) -> ConditionPredicate:
+        """Compile team condition."""
         if not condition.teams:
-            return True
+            return _always
+        teams = frozenset(condition.teams)
 
-        principal = context.principal
-        team_id = getattr(principal, "team_id", None)
+        def match(context: ExternalAgentPolicyContext) -> bool:
+            team_id = getattr(context.principal, "team_id", None)
+            return team_id in teams if team_id else False
 
-        return team_id in condition.teams if team_id else False
+        return match
 
-    def _match_custom(
-        self,
-        condition: PolicyCondition,
-        context: ExternalAgentPolicyContext,
-    ) -> bool:
-        """Match custom condition using context attributes."""
+    def _compile_custom(self, condition: PolicyCondition) -> ConditionPredicate:
+        """Compile custom condition on context attributes."""
         if not condition.custom:
-            return True
+            return _always
+        expected_items = tuple(condition.custom.items())
 
-        for key, expected in condition.custom.items():
-            actual = context.attributes.get(key)
-            if actual != expected:
-                return False
+        def match(context: ExternalAgentPolicyContext) -> bool:
+            attributes = context.attributes
+            return all(
+                attributes.get(key) == expected for key, expected in expected_items
+            )
+
+        return match
+
+    def _index_keys(
+        self, policy: ExternalAgentPolicy
+    ) -> tuple[dict[str, list[_CompiledPolicy]] | None, frozenset[str]]:
+        """
+        Get the bucket index and keys of a policy.
 
-        return True
+        A policy goes into the environment buckets if it requires one of a
+        set of environments, else into the team buckets if it requires one
+        of a set of teams, else it is unindexed.
+        """
+        for condition_type, values, index in (
+            ("environment", "environments", self._by_environment),
+            ("team", "teams", self._by_team),
+        ):
+            required: frozenset | None = None
+            for condition in policy.conditions:
+                allowed = getattr(condition, values)
+                if condition.type.lower() == condition_type and allowed:
+                    # All conditions must match: intersect their values
+                    allowed = frozenset(allowed)
+                    required = allowed if required is None else required & allowed
+            if required is not None:
+                return index, required
+        return None, frozenset()
+
+    def _index(self, compiled: _CompiledPolicy) -> None:
+        """Add a compiled policy to its buckets."""
+        compiled.index, compiled.keys = self._index_keys(compiled.policy)
+        if compiled.index is None:
+            insort(self._unindexed, compiled, key=_policy_order)
+            return
+        for key in compiled.keys:
+            insort(compiled.index.setdefault(key, []), compiled, key=_policy_order)
+
+    def _unindex(self, compiled: _CompiledPolicy) -> None:
+        """Remove a compiled policy from its buckets."""
+        if compiled.index is None:
+            self._unindexed.remove(compiled)
+            return
+        for key in compiled.keys:
+            bucket = compiled.index[key]
+            bucket.remove(compiled)
+            if not bucket:
+                del compiled.index[key]
 
     def _resolve_conflicts(
         self,
@@ -453,6 +551,11 @@ class ExternalAgentPolicyEngine:
         Args:
             policy: Policy to add
         """
+        if policy.policy_id in self._compiled:
+            self._unindex(self._compiled.pop(policy.policy_id))
+        compiled = self._compile_policy(policy)
+        self._index(compiled)
+        self._compiled[policy.policy_id] = compiled
         self.policies[policy.policy_id] = policy
         logger.info(f"Added policy: {policy.policy_id} ({policy.name})")
 
@@ -468,6 +571,7 @@ class ExternalAgentPolicyEngine:
         """
         if policy_id in self.policies:
             del self.policies[policy_id]
+            self._unindex(self._compiled.pop(policy_id))
             logger.info(f"Removed policy: {policy_id}")
             return True
         return False
@@ -483,9 +587,32 @@ class ExternalAgentPolicyEngine:
     def clear_policies(self) -> None:
         """Remove all policies."""
         self.policies.clear()
+        self._compiled.clear()
+        self._by_environment.clear()
+        self._by_team.clear()
+        self._unindexed.clear()
         logger.info("Cleared all policies")
 
 
+@lru_cache(maxsize=1024)
+def _parse_ip(ip: str) -> ipaddress.IPv4Address | ipaddress.IPv6Address | None:
+    """Parse an IP address once for all IP conditions (None if invalid)."""
+    try:
+        return ipaddress.ip_address(ip)
+    except ValueError:
+        return None
+
+
+def _always(context: ExternalAgentPolicyContext) -> bool:
+    """Predicate of conditions without constraints."""
+    return True
+
+
+def _never(context: ExternalAgentPolicyContext) -> bool:
+    """Predicate of conditions that can never match."""
+    return False
+
+
 __all__ = [
     "ExternalAgentPolicyEngine",
 ]
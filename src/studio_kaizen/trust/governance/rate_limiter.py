@@ -4,17 +4,212 @@ External Agent Rate Limiter
 Production-ready rate limiting for external agent invocations.
 Supports Redis-backed distributed rate limiting with fallback
 to in-memory for testing.
+
+The Redis backend keeps one hash per key with fixed-size sub-window
+counters (60 x 1s, 60 x 1min and 24 x 1h buckets, stored as
+"<bucket index>:<count>" in ring slots), so memory per key is constant
+regardless of call volume. A Lua script checks all three windows and
+records the invocation in a single atomic round-trip.
+
+The in-memory backend uses the same bucket layout as ring buffers of
+counts with running totals, so checks and records are amortized O(1) and
+keys idle for a full day are evicted.
 """
 
 import logging
+import math
 import time
-from collections import defaultdict
+from array import array
+from collections import OrderedDict
 from typing import Any
 
 from studio_kaizen.trust.governance.types import RateLimitCheckResult, RateLimitConfig
 
 logger = logging.getLogger(__name__)
 
+# Sliding windows (usage name, RateLimitConfig field), in script order
+RATE_LIMIT_WINDOWS = (
+    ("minute", "requests_per_minute"),
+    ("hour", "requests_per_hour"),
+    ("day", "requests_per_day"),
+)
+
+# Buckets of each window (bucket seconds, bucket count):
+# minute = 60 x 1s, hour = 60 x 1min, day = 24 x 1h
+RATE_LIMIT_BUCKETS = ((1, 60), (60, 60), (3600, 24))
+
+# Bucket hash lifetime: the day window plus one bucket
+RATE_LIMIT_KEY_TTL_SECONDS = 86400 + 3600
+
+# Script modes
+_MODE_CHECK = 0
+_MODE_ACQUIRE = 1
+_MODE_RECORD = 2
+_MODE_RELEASE = 3
+
+# KEYS[1]: bucket hash
+# ARGV[1]: now (seconds; the acquire time to release); ARGV[2..4]: minute/hour/day
+# limits
+# ARGV[5]: mode (0 = check, 1 = check and record if allowed, 2 = record,
+#          3 = release an invocation recorded at ARGV[1])
+# ARGV[6]: hash TTL in seconds
+# Returns {exceeded window (0 = none), minute, hour, day counts, retry after}
+RATE_LIMIT_SCRIPT = """
+local now = tonumber(ARGV[1])
+local mode = tonumber(ARGV[5])
+local windows = {
+  {'s', 1, 60, tonumber(ARGV[2])},
+  {'m', 60, 60, tonumber(ARGV[3])},
+  {'h', 3600, 24, tonumber(ARGV[4])},
+}
+
+if mode == 3 then
+  for w, window in ipairs(windows) do
+    local prefix, size, n = window[1], window[2], window[3]
+    local index = math.floor(now / size)
+    local field = prefix .. (index % n)
+    local value = redis.call('HGET', KEYS[1], field)
+    if value then
+      local stored_index, stored = string.match(value, '^(%d+):(%d+)$')
+      if tonumber(stored_index) == index and tonumber(stored) > 0 then
+        redis.call('HSET', KEYS[1], field,
+          string.format('%d:%d', index, tonumber(stored) - 1))
+      end
+    end
+  end
+  return {0, 0, 0, 0, 0}
+end
+
+local counts = {0, 0, 0}
+local exceeded = 0
+local retry_after = 0
+
+for w, window in ipairs(windows) do
+  local prefix, size, n, limit = window[1], window[2], window[3], window[4]
+  local current = math.floor(now / size)
+  local fields = {}
+  for i = 0, n - 1 do
+    fields[i + 1] = prefix .. i
+  end
+  local values = redis.call('HMGET', KEYS[1], unpack(fields))
+  local oldest = current
+  for i = 1, n do
+    if values[i] then
+      local index, count = string.match(values[i], '^(%d+):(%d+)$')
+      index = tonumber(index)
+      if index and index > current - n and index <= current then
+        counts[w] = counts[w] + tonumber(count)
+        if index < oldest then
+          oldest = index
+        end
+      end
+    end
+  end
+  if exceeded == 0 and mode ~= 2 and counts[w] >= limit then
+    exceeded = w
+    retry_after = math.ceil((oldest + n) * size - now)
+  end
+end
+
+if mode == 2 or (mode == 1 and exceeded == 0) then
+  for w, window in ipairs(windows) do
+    local prefix, size, n = window[1], window[2], window[3]
+    local current = math.floor(now / size)
+    local field = prefix .. (current % n)
+    local count = 0
+    local value = redis.call('HGET', KEYS[1], field)
+    if value then
+      local index, stored = string.match(value, '^(%d+):(%d+)$')
+      if tonumber(index) == current then
+        count = tonumber(stored)
+      end
+    end
+    redis.call('HSET', KEYS[1], field, string.format('%d:%d', current, count + 1))
+    counts[w] = counts[w] + 1
+  end
+  redis.call('EXPIRE', KEYS[1], tonumber(ARGV[6]))
+end
+
+return {exceeded, counts[1], counts[2], counts[3], retry_after}
+"""
+
+
+class _SlidingWindow:
+    """
+    Ring buffer of per-bucket counts for one sliding window.
+
+    The window covers the current bucket and the buckets before it, up to
+    the ring size. A running total makes counting O(1); buckets leaving the
+    window are cleared as time advances, at most one pass over the ring.
+    """
+
+    __slots__ = ("bucket_seconds", "counts", "head", "total")
+
+    def __init__(self, bucket_seconds: int, buckets: int):
+        self.bucket_seconds = bucket_seconds
+        self.counts = array("I", bytes(4 * buckets))
+        self.head = 0
+        self.total = 0
+
+    def _advance(self, now: float) -> None:
+        """Move the window to the bucket of now, clearing expired buckets."""
+        current = int(now // self.bucket_seconds)
+        if current <= self.head:
+            # Same bucket (or clock went back): keep counting in the head
+            return
+
+        size = len(self.counts)
+        if current - self.head >= size:
+            self.counts = array("I", bytes(4 * size))
+            self.total = 0
+        else:
+            for index in range(self.head + 1, current + 1):
+                slot = index % size
+                self.total -= self.counts[slot]
+                self.counts[slot] = 0
+        self.head = current
+
+    def count(self, now: float) -> int:
+        """Get the number of invocations in the window ending at now."""
+        self._advance(now)
+        return self.total
+
+    def add(self, now: float) -> None:
+        """Count one invocation at now."""
+        self._advance(now)
+        self.counts[self.head % len(self.counts)] += 1
+        self.total += 1
+
+    def remove(self, at: float) -> None:
+        """Uncount one invocation counted at time at, if still in the window."""
+        index = int(at // self.bucket_seconds)
+        size = len(self.counts)
+        if self.head - size < index <= self.head and self.counts[index % size]:
+            self.counts[index % size] -= 1
+            self.total -= 1
+
+    def retry_after(self, now: float) -> int:
+        """Get seconds until the oldest counted bucket leaves the window."""
+        self._advance(now)
+        size = len(self.counts)
+        for index in range(self.head - size + 1, self.head + 1):
+            if self.counts[index % size]:
+                return max(1, math.ceil((index + size) * self.bucket_seconds - now))
+        return 1
+
+
+class _RateCounters:
+    """Sliding windows (minute, hour, day) of one rate limit key."""
+
+    __slots__ = ("windows", "last_recorded")
+
+    def __init__(self):
+        self.windows = tuple(
+            _SlidingWindow(bucket_seconds, buckets)
+            for bucket_seconds, buckets in RATE_LIMIT_BUCKETS
+        )
+        self.last_recorded = 0.0
+
 
 class ExternalAgentRateLimiter:
     """
@@ -31,14 +226,15 @@ class ExternalAgentRateLimiter:
         ... )
         >>> await limiter.initialize()
         >>>
-        >>> # Check rate limit
-        >>> result = await limiter.check_rate_limit(
-        ...     agent_id="agent-001",
-        ...     user_id="user-001"
-        ... )
+        >>> # Take a slot, and give it back if the request fails
+        >>> result = await limiter.acquire(agent_id="agent-001", user_id="user-001")
         >>> if result.allowed:
-        ...     await execute_request()
-        ...     await limiter.record_invocation(agent_id="agent-001", user_id="user-001")
+        ...     try:
+        ...         await execute_request()
+        ...     except Exception:
+        ...         await limiter.release(
+        ...             result.acquired_at, agent_id="agent-001", user_id="user-001"
+        ...         )
 
         >>> # In-memory (testing)
         >>> limiter = ExternalAgentRateLimiter()  # No redis_url = in-memory
@@ -59,10 +255,12 @@ class ExternalAgentRateLimiter:
         self.redis_url = redis_url
         self.config = config or RateLimitConfig()
         self._redis: Any = None
+        self._script: Any = None
         self._initialized = False
 
-        # In-memory storage (used when Redis not available)
-        self._invocations: dict[str, list[float]] = defaultdict(list)
+        # In-memory storage (used when Redis not available), ordered by
+        # last record so idle keys can be evicted from the front
+        self._counters: OrderedDict[str, _RateCounters] = OrderedDict()
 
     async def initialize(self) -> None:
         """
@@ -76,6 +274,7 @@ class ExternalAgentRateLimiter:
 
                 self._redis = redis.from_url(self.redis_url)
                 await self._redis.ping()
+                self._script = self._redis.register_script(RATE_LIMIT_SCRIPT)
                 self._initialized = True
                 logger.info(f"Rate limiter initialized with Redis: {self.redis_url}")
             except Exception as e:
@@ -84,6 +283,7 @@ class ExternalAgentRateLimiter:
                     "Using in-memory rate limiting."
                 )
                 self._redis = None
+                self._script = None
                 self._initialized = True
         else:
             self._initialized = True
@@ -94,7 +294,8 @@ class ExternalAgentRateLimiter:
         if self._redis:
             await self._redis.close()
             self._redis = None
-        self._invocations.clear()
+            self._script = None
+        self._counters.clear()
         self._initialized = False
 
     def _get_key(self, **kwargs) -> str:
@@ -141,156 +342,176 @@ class ExternalAgentRateLimiter:
 
     async def _check_memory_rate_limit(self, **kwargs) -> RateLimitCheckResult:
         """Check rate limit using in-memory storage."""
-        key = self._get_key(**kwargs)
+        counters = self._counters.get(self._get_key(**kwargs))
         now = time.time()
 
-        # Clean old invocations and count for each window
-        minute_count = self._clean_and_count(key, 60, now)
-        hour_count = self._clean_and_count(key, 3600, now)
-        day_count = self._clean_and_count(key, 86400, now)
-
+        if counters is None:
+            counts = (0, 0, 0)
+        else:
+            counts = tuple(window.count(now) for window in counters.windows)
         current_usage = {
-            "minute": minute_count,
-            "hour": hour_count,
-            "day": day_count,
+            name: count
+            for (name, _), count in zip(RATE_LIMIT_WINDOWS, counts, strict=True)
         }
 
-        # Check minute limit
-        if minute_count >= self.config.requests_per_minute:
-            return RateLimitCheckResult(
-                allowed=False,
-                limit_exceeded="requests_per_minute",
-                remaining=0,
-                retry_after_seconds=60 - int(now % 60),
-                current_usage=current_usage,
-            )
+        # Check minute, hour and day limits in order
+        for index, ((_, limit_field), count) in enumerate(
+            zip(RATE_LIMIT_WINDOWS, counts, strict=True)
+        ):
+            if count >= getattr(self.config, limit_field):
+                # A limit of 0 is exceeded before anything was recorded
+                if counters is None:
+                    retry_after = 1
+                else:
+                    retry_after = counters.windows[index].retry_after(now)
+                return RateLimitCheckResult(
+                    allowed=False,
+                    limit_exceeded=limit_field,
+                    remaining=0,
+                    retry_after_seconds=retry_after,
+                    current_usage=current_usage,
+                )
 
-        # Check hour limit
-        if hour_count >= self.config.requests_per_hour:
+        # All limits OK
+        remaining = min(
+            getattr(self.config, limit_field) - count
+            for (_, limit_field), count in zip(RATE_LIMIT_WINDOWS, counts, strict=True)
+        )
+
+        return RateLimitCheckResult(
+            allowed=True,
+            limit_exceeded=None,
+            remaining=remaining,
+            retry_after_seconds=None,
+            current_usage=current_usage,
+        )
+
+    async def _check_redis_rate_limit(self, **kwargs) -> RateLimitCheckResult:
+        """Check rate limit using Redis backend."""
+        try:
+            return await self._run_script(_MODE_CHECK, time.time(), **kwargs)
+        except Exception as e:
+            logger.error(f"Redis rate limit check failed: {e}")
+            # Fail open on Redis errors (allow request)
             return RateLimitCheckResult(
-                allowed=False,
-                limit_exceeded="requests_per_hour",
-                remaining=0,
-                retry_after_seconds=3600 - int(now % 3600),
-                current_usage=current_usage,
+                allowed=True,
+                limit_exceeded=None,
+                remaining=-1,
+                retry_after_seconds=None,
+                current_usage={},
             )
 
-        # Check day limit
-        if day_count >= self.config.requests_per_day:
+    async def _run_script(
+        self, mode: int, now: float, **kwargs
+    ) -> RateLimitCheckResult:
+        """Run the bucket script for a key and build the check result."""
+        exceeded, minute, hour, day, retry_after = await self._script(
+            keys=[f"{self._get_key(**kwargs)}:buckets"],
+            args=[
+                now,
+                self.config.requests_per_minute,
+                self.config.requests_per_hour,
+                self.config.requests_per_day,
+                mode,
+                RATE_LIMIT_KEY_TTL_SECONDS,
+            ],
+        )
+        counts = (int(minute), int(hour), int(day))
+        current_usage = {
+            name: count
+            for (name, _), count in zip(RATE_LIMIT_WINDOWS, counts, strict=True)
+        }
+
+        if exceeded:
+            _, limit_field = RATE_LIMIT_WINDOWS[int(exceeded) - 1]
             return RateLimitCheckResult(
                 allowed=False,
-                limit_exceeded="requests_per_day",
+                limit_exceeded=limit_field,
                 remaining=0,
-                retry_after_seconds=86400 - int(now % 86400),
+                retry_after_seconds=max(1, int(retry_after)),
                 current_usage=current_usage,
             )
 
-        # All limits OK
         remaining = min(
-            self.config.requests_per_minute - minute_count,
-            self.config.requests_per_hour - hour_count,
-            self.config.requests_per_day - day_count,
+            getattr(self.config, limit_field) - count
+            for (_, limit_field), count in zip(RATE_LIMIT_WINDOWS, counts, strict=True)
         )
-
         return RateLimitCheckResult(
             allowed=True,
             limit_exceeded=None,
-            remaining=remaining,
+            remaining=max(0, remaining),
             retry_after_seconds=None,
             current_usage=current_usage,
         )
 
-    def _clean_and_count(self, key: str, window_seconds: int, now: float) -> int:
-        """Clean old invocations outside window and return count."""
-        cutoff = now - window_seconds
-        self._invocations[key] = [
-            t for t in self._invocations[key] if t > cutoff
-        ]
-        return len(self._invocations[key])
-
-    async def _check_redis_rate_limit(self, **kwargs) -> RateLimitCheckResult:
-        """Check rate limit using Redis backend."""
-        key = self._get_key(**kwargs)
-        now = time.time()
-
-        # Use Redis ZRANGEBYSCORE to count invocations in each window
-        try:
-            pipe = self._redis.pipeline()
-
-            # Count for each window
-            minute_key = f"{key}:minute"
-            hour_key = f"{key}:hour"
-            day_key = f"{key}:day"
-
-            minute_cutoff = now - 60
-            hour_cutoff = now - 3600
-            day_cutoff = now - 86400
+    async def acquire(self, **kwargs) -> RateLimitCheckResult:
+        """
+        Check rate limits and record the invocation if allowed, atomically.
 
-            pipe.zcount(minute_key, minute_cutoff, now)
-            pipe.zcount(hour_key, hour_cutoff, now)
-            pipe.zcount(day_key, day_cutoff, now)
+        Unlike check_rate_limit() followed by record_invocation(), concurrent
+        callers cannot both pass the last free slot. With Redis this is a
+        single script round-trip.
 
-            results = await pipe.execute()
-            minute_count, hour_count, day_count = results
+        Args:
+            agent_id: External agent ID
+            user_id: User ID
+            team_id: Optional team ID
+            org_id: Optional organization ID
 
-            current_usage = {
-                "minute": minute_count,
-                "hour": hour_count,
-                "day": day_count,
-            }
+        Returns:
+            RateLimitCheckResult; the invocation was recorded at acquired_at
+            if allowed
 
-            # Check limits
-            if minute_count >= self.config.requests_per_minute:
-                return RateLimitCheckResult(
-                    allowed=False,
-                    limit_exceeded="requests_per_minute",
-                    remaining=0,
-                    retry_after_seconds=60,
-                    current_usage=current_usage,
-                )
+        Examples:
+            >>> result = await limiter.acquire(agent_id="agent-001", user_id="user-001")
+            >>> if not result.allowed:
+            ...     raise HTTPException(429)
+        """
+        now = time.time()
+        if self._redis:
+            try:
+                result = await self._run_script(_MODE_ACQUIRE, now, **kwargs)
+            except Exception as e:
+                logger.error(f"Redis rate limit acquire failed: {e}")
+                # Fail open on Redis errors (allow request)
+                return RateLimitCheckResult(allowed=True, remaining=-1)
+        else:
+            result = await self._check_memory_rate_limit(**kwargs)
+            if result.allowed:
+                await self._record_memory_invocation(now=now, **kwargs)
+                result.remaining = max(0, result.remaining - 1)
 
-            if hour_count >= self.config.requests_per_hour:
-                return RateLimitCheckResult(
-                    allowed=False,
-                    limit_exceeded="requests_per_hour",
-                    remaining=0,
-                    retry_after_seconds=3600,
-                    current_usage=current_usage,
-                )
+        if result.allowed:
+            result.acquired_at = now
+        return result
 
-            if day_count >= self.config.requests_per_day:
-                return RateLimitCheckResult(
-                    allowed=False,
-                    limit_exceeded="requests_per_day",
-                    remaining=0,
-                    retry_after_seconds=86400,
-                    current_usage=current_usage,
-                )
+    async def release(self, acquired_at: float, **kwargs) -> None:
+        """
+        Give back an invocation recorded by acquire().
 
-            remaining = min(
-                self.config.requests_per_minute - minute_count,
-                self.config.requests_per_hour - hour_count,
-                self.config.requests_per_day - day_count,
-            )
+        Call when the acquired invocation did not run (another check denied
+        it) or failed, so it does not count against the limits. Releasing
+        after the invocation's bucket left a window only affects the windows
+        still counting it.
 
-            return RateLimitCheckResult(
-                allowed=True,
-                limit_exceeded=None,
-                remaining=remaining,
-                retry_after_seconds=None,
-                current_usage=current_usage,
-            )
+        Args:
+            acquired_at: acquired_at of the acquire() result
+            agent_id: External agent ID
+            user_id: User ID
+            team_id: Optional team ID
+            org_id: Optional organization ID
+        """
+        if self._redis:
+            try:
+                await self._run_script(_MODE_RELEASE, acquired_at, **kwargs)
+            except Exception as e:
+                logger.error(f"Failed to release invocation in Redis: {e}")
+            return
 
-        except Exception as e:
-            logger.error(f"Redis rate limit check failed: {e}")
-            # Fail open on Redis errors (allow request)
-            return RateLimitCheckResult(
-                allowed=True,
-                limit_exceeded=None,
-                remaining=-1,
-                retry_after_seconds=None,
-                current_usage={},
-            )
+        counters = self._counters.get(self._get_key(**kwargs))
+        if counters is not None:
+            for window in counters.windows:
+                window.remove(acquired_at)
 
     async def record_invocation(self, **kwargs) -> None:
         """
@@ -309,46 +530,35 @@ class ExternalAgentRateLimiter:
         else:
             await self._record_memory_invocation(**kwargs)
 
-    async def _record_memory_invocation(self, **kwargs) -> None:
-        """Record invocation in memory."""
+    async def _record_memory_invocation(
+        self, now: float | None = None, **kwargs
+    ) -> None:
+        """Record invocation in memory (at now, default the current time)."""
         key = self._get_key(**kwargs)
-        now = time.time()
-        self._invocations[key].append(now)
+        if now is None:
+            now = time.time()
+
+        counters = self._counters.get(key)
+        if counters is None:
+            counters = self._counters[key] = _RateCounters()
+        else:
+            self._counters.move_to_end(key)
+        for window in counters.windows:
+            window.add(now)
+        counters.last_recorded = now
+
+        # Evict keys idle for the key TTL: their windows all count zero
+        idle_before = now - RATE_LIMIT_KEY_TTL_SECONDS
+        while self._counters:
+            oldest_key, oldest = next(iter(self._counters.items()))
+            if oldest.last_recorded > idle_before:
+                break
+            del self._counters[oldest_key]
 
     async def _record_redis_invocation(self, **kwargs) -> None:
         """Record invocation in Redis."""
-        key = self._get_key(**kwargs)
-        now = time.time()
-
         try:
-            pipe = self._redis.pipeline()
-
-            # Add to all window sorted sets
-            minute_key = f"{key}:minute"
-            hour_key = f"{key}:hour"
-            day_key = f"{key}:day"
-
-            # ZADD with timestamp as score
-            pipe.zadd(minute_key, {str(now): now})
-            pipe.zadd(hour_key, {str(now): now})
-            pipe.zadd(day_key, {str(now): now})
-
-            # Set expiry to clean up old keys
-            pipe.expire(minute_key, 120)  # 2 minutes
-            pipe.expire(hour_key, 7200)  # 2 hours
-            pipe.expire(day_key, 172800)  # 2 days
-
-            # Clean old entries
-            minute_cutoff = now - 60
-            hour_cutoff = now - 3600
-            day_cutoff = now - 86400
-
-            pipe.zremrangebyscore(minute_key, 0, minute_cutoff)
-            pipe.zremrangebyscore(hour_key, 0, hour_cutoff)
-            pipe.zremrangebyscore(day_key, 0, day_cutoff)
-
-            await pipe.execute()
-
+            await self._run_script(_MODE_RECORD, time.time(), **kwargs)
         except Exception as e:
             logger.error(f"Failed to record invocation in Redis: {e}")
             # Don't fail the request if recording fails
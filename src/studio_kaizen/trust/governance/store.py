@@ -6,6 +6,7 @@ Provides storage backends for governance features:
 Budget Storage:
 - InMemoryBudgetStore: For testing and development
 - DataFlowBudgetStore: Production storage using DataFlow
+- CachedBudgetStore: Limit cache and Redis spend counters over another store
 
 Approval Storage:
 - InMemoryApprovalStore: For testing and development
@@ -14,11 +15,15 @@ Approval Storage:
 All stores implement their respective protocols.
 """
 
+import heapq
 import json
 import logging
+import time
+import uuid
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from datetime import datetime, timedelta
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime, timedelta
 from typing import Any, Protocol
 
 from studio_kaizen.trust.governance.types import (
@@ -31,6 +36,80 @@ from studio_kaizen.trust.governance.types import (
 
 logger = logging.getLogger(__name__)
 
+# Expired requests returned by get_expired() when no limit is given
+DEFAULT_EXPIRED_LIMIT = 1000
+
+# Lifetime of budget limits cached by CachedBudgetStore
+BUDGET_LIMITS_TTL_SECONDS = 60
+
+# Spend counter lifetimes: a month/day plus slack for clock skew
+BUDGET_MONTH_KEY_TTL_SECONDS = 32 * 86400
+BUDGET_DAY_KEY_TTL_SECONDS = 2 * 86400
+
+# Lifetime of a seed claim (and its zeroed counters) if the seeder never completes
+BUDGET_SEED_CLAIM_TTL_SECONDS = 30
+
+# Counter script modes
+_COUNTERS_READ = 0
+_COUNTERS_CLAIM = 1
+_COUNTERS_ADD = 2
+_COUNTERS_SEED = 3
+
+# KEYS[1]: month hash (cost, count); KEYS[2]: day cost; KEYS[3]: limits version
+# KEYS[4]: seed claim hash (token, month, day: 1 if that counter is being seeded)
+# ARGV[1]: mode (0 = read, 1 = claim missing counters, 2 = add to existing
+#          counters, 3 = add the seed to claimed counters)
+# ARGV[2]: cost; ARGV[3]: invocations; ARGV[4]: day cost (seed only)
+# ARGV[5], ARGV[6]: month and day counter TTL in seconds
+# ARGV[7]: claim token; ARGV[8]: claim TTL in seconds
+# Returns {month cost, month count, day cost, version, claim token}, nil where
+# missing
+BUDGET_COUNTERS_SCRIPT = """
+local mode = tonumber(ARGV[1])
+if mode == 1 then
+  if redis.call('EXISTS', KEYS[4]) == 0 then
+    local month_new = redis.call('EXISTS', KEYS[1]) == 0
+    local day_new = redis.call('EXISTS', KEYS[2]) == 0
+    if month_new or day_new then
+      redis.call('HSET', KEYS[4], 'token', ARGV[7],
+        'month', month_new and 1 or 0, 'day', day_new and 1 or 0)
+      redis.call('EXPIRE', KEYS[4], tonumber(ARGV[8]))
+      if month_new then
+        redis.call('HSET', KEYS[1], 'cost', 0, 'count', 0)
+        redis.call('EXPIRE', KEYS[1], tonumber(ARGV[8]))
+      end
+      if day_new then
+        redis.call('SET', KEYS[2], 0, 'EX', tonumber(ARGV[8]))
+      end
+    end
+  end
+elseif mode == 2 then
+  if redis.call('EXISTS', KEYS[1]) == 1 then
+    redis.call('HINCRBYFLOAT', KEYS[1], 'cost', ARGV[2])
+    redis.call('HINCRBY', KEYS[1], 'count', ARGV[3])
+  end
+  if redis.call('EXISTS', KEYS[2]) == 1 then
+    redis.call('INCRBYFLOAT', KEYS[2], ARGV[2])
+  end
+elseif mode == 3 then
+  if redis.call('HGET', KEYS[4], 'token') == ARGV[7] then
+    if redis.call('HGET', KEYS[4], 'month') == '1' then
+      redis.call('HINCRBYFLOAT', KEYS[1], 'cost', ARGV[2])
+      redis.call('HINCRBY', KEYS[1], 'count', ARGV[3])
+      redis.call('EXPIRE', KEYS[1], tonumber(ARGV[5]))
+    end
+    if redis.call('HGET', KEYS[4], 'day') == '1' then
+      redis.call('INCRBYFLOAT', KEYS[2], ARGV[4])
+      redis.call('EXPIRE', KEYS[2], tonumber(ARGV[6]))
+    end
+    redis.call('DEL', KEYS[4])
+  end
+end
+local month = redis.call('HMGET', KEYS[1], 'cost', 'count')
+return {month[1], month[2], redis.call('GET', KEYS[2]), redis.call('GET', KEYS[3]),
+  redis.call('HGET', KEYS[4], 'token')}
+"""
+
 
 class BudgetStore(Protocol):
     """
@@ -265,12 +344,14 @@ class DataFlowBudgetStore:
         from datetime import UTC
 
         from kailash.workflow.builder import WorkflowBuilder
+        from studio.services.timestamps import time_range
 
         now = datetime.now(UTC)
         month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
         day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
 
-        # Query usage records for this agent in current month
+        # Query usage records for this agent in current month. The month window
+        # is applied in the database, bound for recorded_at's storage type.
         workflow = WorkflowBuilder()
         workflow.add_node(
             "UsageRecordListNode",
@@ -279,6 +360,7 @@ class DataFlowBudgetStore:
                 "filter": {
                     "external_agent_id": agent_id,
                     "organization_id": scope.organization_id,
+                    "recorded_at": time_range("recorded_at", month_start),
                 },
                 "limit": 10000,  # Get all records for aggregation
             }
@@ -296,21 +378,17 @@ class DataFlowBudgetStore:
             daily_cost = 0.0
             monthly_invocations = 0
 
+            # Records are already limited to this month; the day window is
+            # bound like the month window, so it compares with recorded_at
+            day_window = time_range("recorded_at", day_start)
             for record in records:
-                record_time_str = record.get("recorded_at", "")
-                if record_time_str:
-                    try:
-                        record_time = datetime.fromisoformat(record_time_str.replace("Z", "+00:00"))
-                        cost = record.get("cost", 0.0)
+                cost = record.get("cost", 0.0)
+                monthly_cost += cost
+                monthly_invocations += 1
 
-                        if record_time >= month_start:
-                            monthly_cost += cost
-                            monthly_invocations += 1
-
-                            if record_time >= day_start:
-                                daily_cost += cost
-                    except (ValueError, TypeError):
-                        continue
+                recorded_at = record.get("recorded_at")
+                if recorded_at and recorded_at >= day_window["$gte"]:
+                    daily_cost += cost
 
             return {
                 "monthly_cost": monthly_cost,
@@ -354,10 +432,12 @@ class DataFlowBudgetStore:
     async def record_usage(self, record: BudgetUsageRecord) -> None:
         """Record usage to UsageRecord model."""
         import uuid
+        from datetime import UTC
 
         from kailash.workflow.builder import WorkflowBuilder
 
-        now = datetime.utcnow().isoformat()
+        # Canonical UTC form (sorts chronologically for range filters)
+        now = datetime.now(UTC).isoformat(timespec="microseconds")
 
         workflow = WorkflowBuilder()
         workflow.add_node(
@@ -412,6 +492,418 @@ class DataFlowBudgetStore:
         pass  # Period resets are handled by timestamp filtering
 
 
+@dataclass
+class _CachedLimits:
+    """Budget limits of an agent cached by CachedBudgetStore."""
+
+    budget: ExternalAgentBudget
+    version: str | None
+    expires_at: float
+
+
+@dataclass
+class _SpendCounters:
+    """In-process spend of an agent in the current month and day."""
+
+    month: str
+    day: str
+    month_cost: float
+    month_count: int
+    day_cost: float
+    seeding: str | None = None
+
+
+class CachedBudgetStore:
+    """
+    Budget store that caches limits and tracks spend in counters.
+
+    Wraps another budget store (usually DataFlowBudgetStore), which stays
+    the source of truth. Budget limits read from it are cached per process
+    for ttl_seconds. Spend of the current month and day is kept in Redis
+    counters that record_usage() increments atomically, so get_budget() is
+    one Redis round-trip instead of reading the agent and aggregating its
+    usage records, and all workers see the same spend.
+
+    Counters of a new period are seeded from the wrapped store on first
+    read. The seeding worker first claims the missing counters by creating
+    them at zero, so increments recorded while it reads the wrapped store
+    are kept, and then adds the totals it read. Increments arriving before
+    the claim are skipped, since the read includes their (persisted) usage
+    records; a record persisted before the read but counted after the claim
+    is counted twice, which errs on the side of blocking. update_budget() and
+    invalidate() bump a per-agent version in Redis, which makes every worker
+    reload the limits on its next read.
+
+    Without Redis the counters are kept in process, which is only correct
+    for a single worker. Redis errors fall back to the wrapped store.
+
+    Examples:
+        >>> store = CachedBudgetStore(
+        ...     DataFlowBudgetStore(runtime),
+        ...     redis_url="redis://localhost:6379/0"
+        ... )
+        >>> await store.initialize()
+        >>> budget = await store.get_budget("agent-001", scope)
+        >>> await store.record_usage(record)  # increments the spend counters
+    """
+
+    def __init__(
+        self,
+        store: BudgetStore,
+        redis_url: str | None = None,
+        ttl_seconds: float = BUDGET_LIMITS_TTL_SECONDS
+    ):
+        """
+        Initialize cached budget store.
+
+        Args:
+            store: Budget store to read limits and seed usage from
+            redis_url: Redis connection URL (optional, counts in process if not provided)
+            ttl_seconds: Lifetime of cached budget limits
+        """
+        self.store = store
+        self.redis_url = redis_url
+        self.ttl_seconds = ttl_seconds
+        self._redis: Any = None
+        self._script: Any = None
+        self._limits: dict[str, _CachedLimits] = {}
+        self._counters: dict[str, _SpendCounters] = {}
+
+    async def initialize(self) -> None:
+        """
+        Initialize Redis connection if configured.
+
+        Falls back to in-process counters if Redis unavailable.
+        """
+        if not self.redis_url:
+            return
+
+        try:
+            import redis.asyncio as redis
+
+            self._redis = redis.from_url(self.redis_url)
+            await self._redis.ping()
+            self._script = self._redis.register_script(BUDGET_COUNTERS_SCRIPT)
+            logger.info(f"Budget counters initialized with Redis: {self.redis_url}")
+        except Exception as e:
+            logger.warning(
+                f"Failed to connect to Redis: {e}. "
+                "Using in-process budget counters (single worker only)."
+            )
+            self._redis = None
+            self._script = None
+
+    async def close(self) -> None:
+        """Close Redis connection and clear cached data."""
+        if self._redis:
+            await self._redis.close()
+            self._redis = None
+            self._script = None
+        self._limits.clear()
+        self._counters.clear()
+
+    def _version_key(self, agent_id: str) -> str:
+        """Get the key of an agent's limits version."""
+        return f"budget:{agent_id}:version"
+
+    def _keys(self, agent_id: str, month: str, day: str) -> list[str]:
+        """Get the month, day, version and seed claim keys of an agent."""
+        return [
+            f"budget:{agent_id}:month:{month}",
+            f"budget:{agent_id}:day:{day}",
+            self._version_key(agent_id),
+            f"budget:{agent_id}:seed",
+        ]
+
+    @staticmethod
+    def _periods() -> tuple[str, str]:
+        """Get the current (UTC) month and day."""
+        now = datetime.now(UTC)
+        return now.strftime("%Y-%m"), now.strftime("%Y-%m-%d")
+
+    async def _run_script(
+        self,
+        agent_id: str,
+        month: str,
+        day: str,
+        mode: int,
+        cost: float = 0.0,
+        invocations: int = 0,
+        day_cost: float = 0.0,
+        token: str = ""
+    ) -> tuple[tuple[float, int, float] | None, str | None, str | None]:
+        """
+        Run the counter script.
+
+        Returns (spend or None if unseeded or being seeded, version, claim token).
+        """
+        month_cost, month_count, day_spent, version, claim = await self._script(
+            keys=self._keys(agent_id, month, day),
+            args=[
+                mode,
+                float(cost),
+                invocations,
+                float(day_cost),
+                BUDGET_MONTH_KEY_TTL_SECONDS,
+                BUDGET_DAY_KEY_TTL_SECONDS,
+                token,
+                BUDGET_SEED_CLAIM_TTL_SECONDS,
+            ],
+        )
+        if version is not None:
+            version = version.decode() if isinstance(version, bytes) else str(version)
+        if claim is not None:
+            claim = claim.decode() if isinstance(claim, bytes) else str(claim)
+        if (
+            month_cost is None
+            or month_count is None
+            or day_spent is None
+            or claim is not None
+        ):
+            return None, version, claim
+        return (float(month_cost), int(month_count), float(day_spent)), version, claim
+
+    async def get_budget(
+        self,
+        agent_id: str,
+        scope: BudgetScope
+    ) -> ExternalAgentBudget | None:
+        """Get budget for an agent with cached limits and counted spend."""
+        month, day = self._periods()
+
+        try:
+            if self._redis:
+                spend, version, _ = await self._run_script(
+                    agent_id, month, day, _COUNTERS_READ
+                )
+            else:
+                spend, version = self._memory_spend(agent_id, month, day), None
+        except Exception as e:
+            logger.error(f"Failed to read budget counters: {e}")
+            return await self.store.get_budget(agent_id, scope)
+
+        # Claim before reading the wrapped store, so usage recorded while
+        # reading is counted on top of the seed
+        claim = None
+        if spend is None:
+            claim = await self._claim(agent_id, month, day)
+
+        cached = self._limits.get(agent_id)
+        loaded = None
+        if (
+            cached is None
+            or cached.version != version
+            or cached.expires_at <= time.monotonic()
+        ):
+            loaded = await self.store.get_budget(agent_id, scope)
+            if loaded is None:
+                self._limits.pop(agent_id, None)
+                self._drop_claim(agent_id, claim)
+                return None
+            cached = _CachedLimits(loaded, version, time.monotonic() + self.ttl_seconds)
+            self._limits[agent_id] = cached
+
+        if spend is None:
+            if loaded is None:
+                loaded = await self.store.get_budget(agent_id, scope)
+                if loaded is None:
+                    self._drop_claim(agent_id, claim)
+                    return None
+            spend = await self._seed(agent_id, month, day, loaded, claim)
+
+        month_cost, month_count, day_cost = spend
+        return replace(
+            cached.budget,
+            monthly_spent_usd=month_cost,
+            monthly_execution_count=month_count,
+            daily_spent_usd=day_cost,
+        )
+
+    async def _claim(self, agent_id: str, month: str, day: str) -> str | None:
+        """
+        Claim the missing counters of an agent for seeding.
+
+        Creates them at zero, so record_usage() counts into them while the
+        wrapped store is read. Returns the claim token, or None if another
+        worker (or task) claimed them first or the counters already exist.
+        """
+        token = uuid.uuid4().hex
+        if not self._redis:
+            counters = self._counters.get(agent_id)
+            if counters and counters.month == month and counters.day == day:
+                return None
+            self._counters[agent_id] = _SpendCounters(
+                month=month,
+                day=day,
+                month_cost=0.0,
+                month_count=0,
+                day_cost=0.0,
+                seeding=token,
+            )
+            return token
+
+        try:
+            _, _, claim = await self._run_script(
+                agent_id, month, day, _COUNTERS_CLAIM, token=token
+            )
+        except Exception as e:
+            logger.error(f"Failed to claim budget counters: {e}")
+            return None
+        return token if claim == token else None
+
+    def _drop_claim(self, agent_id: str, claim: str | None) -> None:
+        """Drop an unseeded in-process claim (Redis claims expire)."""
+        counters = self._counters.get(agent_id)
+        if claim is not None and counters is not None and counters.seeding == claim:
+            del self._counters[agent_id]
+
+    async def _seed(
+        self,
+        agent_id: str,
+        month: str,
+        day: str,
+        budget: ExternalAgentBudget,
+        claim: str | None
+    ) -> tuple[float, int, float]:
+        """Add a loaded budget's spend to claimed counters and return the spend."""
+        if not self._redis:
+            counters = self._counters.get(agent_id)
+            if claim is None or counters is None or counters.seeding != claim:
+                return (
+                    budget.monthly_spent_usd,
+                    budget.monthly_execution_count,
+                    budget.daily_spent_usd,
+                )
+            counters.month_cost += budget.monthly_spent_usd
+            counters.month_count += budget.monthly_execution_count
+            counters.day_cost += budget.daily_spent_usd
+            counters.seeding = None
+            return counters.month_cost, counters.month_count, counters.day_cost
+
+        spend = None
+        if claim is not None:
+            try:
+                # Counters are only seeded while the claim is still ours
+                spend, _, _ = await self._run_script(
+                    agent_id,
+                    month,
+                    day,
+                    _COUNTERS_SEED,
+                    cost=budget.monthly_spent_usd,
+                    invocations=budget.monthly_execution_count,
+                    day_cost=budget.daily_spent_usd,
+                    token=claim,
+                )
+            except Exception as e:
+                logger.error(f"Failed to seed budget counters: {e}")
+
+        if spend is None:
+            return (
+                budget.monthly_spent_usd,
+                budget.monthly_execution_count,
+                budget.daily_spent_usd,
+            )
+        return spend
+
+    def _memory_spend(
+        self,
+        agent_id: str,
+        month: str,
+        day: str
+    ) -> tuple[float, int, float] | None:
+        """Get in-process spend of the current period, None if unseeded."""
+        counters = self._counters.get(agent_id)
+        if (
+            counters is None
+            or counters.month != month
+            or counters.day != day
+            or counters.seeding is not None
+        ):
+            return None
+        return counters.month_cost, counters.month_count, counters.day_cost
+
+    async def update_budget(
+        self,
+        agent_id: str,
+        scope: BudgetScope,
+        budget: ExternalAgentBudget
+    ) -> ExternalAgentBudget:
+        """Update budget limits and invalidate them in every worker."""
+        updated = await self.store.update_budget(agent_id, scope, budget)
+        await self.invalidate(agent_id)
+        return updated
+
+    async def invalidate(self, agent_id: str) -> None:
+        """
+        Make every worker reload the budget limits of an agent.
+
+        Call after changing an agent's limits without update_budget().
+
+        Args:
+            agent_id: External agent ID
+        """
+        self._limits.pop(agent_id, None)
+        if self._redis:
+            try:
+                await self._redis.incr(self._version_key(agent_id))
+            except Exception as e:
+                logger.error(f"Failed to invalidate budget limits of {agent_id}: {e}")
+
+    async def record_usage(self, record: BudgetUsageRecord) -> None:
+        """Persist a usage event and add it to the spend counters."""
+        await self.store.record_usage(record)
+
+        month, day = self._periods()
+        if not self._redis:
+            counters = self._counters.get(record.agent_id)
+            if counters and counters.month == month and counters.day == day:
+                counters.month_cost += record.cost
+                counters.month_count += 1
+                counters.day_cost += record.cost
+            return
+
+        try:
+            await self._run_script(
+                record.agent_id,
+                month,
+                day,
+                _COUNTERS_ADD,
+                cost=record.cost,
+                invocations=1,
+            )
+        except Exception as e:
+            logger.error(f"Failed to count budget usage: {e}")
+
+    async def get_period_usage(
+        self,
+        agent_id: str,
+        scope: BudgetScope,
+        period_start: datetime,
+        period_end: datetime
+    ) -> dict[str, float]:
+        """Get aggregated usage for a period."""
+        return await self.store.get_period_usage(
+            agent_id, scope, period_start, period_end
+        )
+
+    async def reset_period_usage(
+        self,
+        agent_id: str,
+        scope: BudgetScope
+    ) -> None:
+        """Reset usage counters for a new period (reseeded on next read)."""
+        await self.store.reset_period_usage(agent_id, scope)
+
+        self._counters.pop(agent_id, None)
+        if self._redis:
+            month, day = self._periods()
+            try:
+                month_key, day_key, _, seed_key = self._keys(agent_id, month, day)
+                await self._redis.delete(month_key, day_key, seed_key)
+            except Exception as e:
+                logger.error(f"Failed to reset budget counters of {agent_id}: {e}")
+
+
 # ===================
 # Approval Storage
 # ===================
@@ -448,8 +940,12 @@ class ApprovalStore(Protocol):
         """Get pending requests for a specific agent."""
         ...
 
-    async def get_expired(self) -> list[ApprovalRequest]:
-        """Get all expired but not yet processed requests."""
+    async def get_expired(self, limit: int | None = None) -> list[ApprovalRequest]:
+        """Get expired but not yet processed requests, earliest expiry first."""
+        ...
+
+    async def update_many(self, requests: list[ApprovalRequest]) -> None:
+        """Save status and decisions of existing requests in one batch."""
         ...
 
     async def delete(self, request_id: str) -> bool:
@@ -478,11 +974,28 @@ class InMemoryApprovalStore:
         """Initialize empty storage."""
         self._requests: dict[str, ApprovalRequest] = {}
 
+        # Expiry index: min-heap of (expires_at, request ID) of pending
+        # requests; entries of decided, re-scheduled or deleted requests are
+        # dropped lazily when they reach the top
+        self._expiry_heap: list[tuple[datetime, str]] = []
+        self._scheduled: dict[str, datetime] = {}
+
     async def save(self, request: ApprovalRequest) -> ApprovalRequest:
         """Save an approval request."""
         self._requests[request.id] = request
+        if request.status == ApprovalStatus.PENDING and request.expires_at:
+            if self._scheduled.get(request.id) != request.expires_at:
+                self._scheduled[request.id] = request.expires_at
+                heapq.heappush(self._expiry_heap, (request.expires_at, request.id))
+        else:
+            self._scheduled.pop(request.id, None)
         return request
 
+    async def update_many(self, requests: list[ApprovalRequest]) -> None:
+        """Save status and decisions of existing requests in one batch."""
+        for request in requests:
+            await self.save(request)
+
     async def get(self, request_id: str) -> ApprovalRequest | None:
         """Get an approval request by ID."""
         return self._requests.get(request_id)
@@ -519,27 +1032,54 @@ class InMemoryApprovalStore:
             result.append(request)
         return result
 
-    async def get_expired(self) -> list[ApprovalRequest]:
-        """Get all expired but not yet processed requests."""
+    async def get_expired(self, limit: int | None = None) -> list[ApprovalRequest]:
+        """
+        Get expired but not yet processed requests, earliest expiry first.
+
+        Only the due entries of the expiry index are visited, not all pending
+        requests.
+
+        Args:
+            limit: Maximum number of requests (default: DEFAULT_EXPIRED_LIMIT)
+        """
+        limit = limit or DEFAULT_EXPIRED_LIMIT
         now = datetime.utcnow()
-        result = []
-        for request in self._requests.values():
-            if request.status != ApprovalStatus.PENDING:
+        result: list[ApprovalRequest] = []
+
+        while self._expiry_heap and self._expiry_heap[0][0] < now and len(result) < limit:
+            expires_at, request_id = heapq.heappop(self._expiry_heap)
+            if self._scheduled.get(request_id) != expires_at:
+                # Re-scheduled or already dropped
+                continue
+            request = self._requests.get(request_id)
+            if (
+                request is None
+                or request.status != ApprovalStatus.PENDING
+                or request.expires_at != expires_at
+            ):
+                # Changed without save()
+                del self._scheduled[request_id]
                 continue
-            if request.expires_at and request.expires_at < now:
-                result.append(request)
+            result.append(request)
+
+        # Still pending until processed and saved: keep them scheduled
+        for request in result:
+            heapq.heappush(self._expiry_heap, (request.expires_at, request.id))
         return result
 
     async def delete(self, request_id: str) -> bool:
         """Delete an approval request."""
         if request_id in self._requests:
             del self._requests[request_id]
+            self._scheduled.pop(request_id, None)
             return True
         return False
 
     async def clear(self) -> None:
         """Clear all stored data (for testing)."""
         self._requests.clear()
+        self._expiry_heap.clear()
+        self._scheduled.clear()
 
 
 class DataFlowApprovalStore:
@@ -547,7 +1087,11 @@ class DataFlowApprovalStore:
     Production approval store using DataFlow for persistence.
 
     Uses DataFlow nodes to persist approval requests to the database.
-    Requires ApprovalRequest DataFlow model.
+    Requires an ApprovalRequest DataFlow model, which this package does not
+    define. get_expired() filters on status and expires_at and sorts by
+    expires_at in the database; no index is declared for this, so the
+    application defining the model should add one on (status, expires_at)
+    for the query not to scan the table.
 
     Examples:
         >>> from kailash.runtime import AsyncLocalRuntime
@@ -573,26 +1117,8 @@ class DataFlowApprovalStore:
 
         # Serialize complex fields
         invocation_context_json = json.dumps(request.invocation_context)
-        approvals_json = json.dumps([
-            {
-                "approver_id": d.approver_id,
-                "decision": d.decision,
-                "reason": d.reason,
-                "timestamp": d.timestamp.isoformat() if d.timestamp else None,
-                "metadata": d.metadata
-            }
-            for d in request.approvals
-        ])
-        rejections_json = json.dumps([
-            {
-                "approver_id": d.approver_id,
-                "decision": d.decision,
-                "reason": d.reason,
-                "timestamp": d.timestamp.isoformat() if d.timestamp else None,
-                "metadata": d.metadata
-            }
-            for d in request.rejections
-        ])
+        approvals_json = self._decisions_json(request.approvals)
+        rejections_json = self._decisions_json(request.rejections)
 
         # Check if request exists (upsert logic)
         existing = await self.get(request.id)
@@ -604,15 +1130,7 @@ class DataFlowApprovalStore:
             workflow.add_node(
                 "ApprovalRequestUpdateNode",
                 "update_request",
-                {
-                    "filter": {"id": request.id},
-                    "fields": {
-                        "status": request.status.value,
-                        "approvals": approvals_json,
-                        "rejections": rejections_json,
-                        "required_approvals": request.required_approvals,
-                    }
-                }
+                self._update_params(request)
             )
         else:
             # Create new
@@ -745,15 +1263,31 @@ class DataFlowApprovalStore:
             logger.warning(f"Failed to get pending requests for agent: {e}")
             return []
 
-    async def get_expired(self) -> list[ApprovalRequest]:
-        """Get all expired but not yet processed requests."""
+    async def get_expired(self, limit: int | None = None) -> list[ApprovalRequest]:
+        """
+        Get expired but not yet processed requests, earliest expiry first.
+
+        The expiry filter runs in the database, so only due requests are
+        returned regardless of how many are pending (see the class docstring
+        on indexing).
+
+        Args:
+            limit: Maximum number of requests (default: DEFAULT_EXPIRED_LIMIT)
+        """
         from kailash.workflow.builder import WorkflowBuilder
 
         workflow = WorkflowBuilder()
         workflow.add_node(
             "ApprovalRequestListNode",
             "list_requests",
-            {"filter": {"status": "pending"}, "limit": 1000}
+            {
+                "filter": {
+                    "status": "pending",
+                    "expires_at": {"$lt": datetime.utcnow().isoformat()},
+                },
+                "order_by": ["expires_at"],
+                "limit": limit or DEFAULT_EXPIRED_LIMIT,
+            }
         )
 
         try:
@@ -763,20 +1297,43 @@ class DataFlowApprovalStore:
             )
 
             records = results.get("list_requests", {}).get("records", [])
-            now = datetime.utcnow()
-
-            expired = []
-            for record in records:
-                request = self._record_to_request(record)
-                if request.expires_at and request.expires_at < now:
-                    expired.append(request)
-
-            return expired
+            return [self._record_to_request(r) for r in records]
 
         except Exception as e:
             logger.warning(f"Failed to get expired requests: {e}")
             return []
 
+    async def update_many(self, requests: list[ApprovalRequest]) -> None:
+        """
+        Save status and decisions of existing requests in one batch.
+
+        All updates run in a single workflow execution.
+
+        Args:
+            requests: Requests to update (must exist)
+        """
+        from kailash.workflow.builder import WorkflowBuilder
+
+        if not requests:
+            return
+
+        workflow = WorkflowBuilder()
+        for i, request in enumerate(requests):
+            workflow.add_node(
+                "ApprovalRequestUpdateNode",
+                f"update_request_{i}",
+                self._update_params(request)
+            )
+
+        try:
+            await self.runtime.execute_workflow_async(
+                workflow.build(),
+                inputs={}
+            )
+        except Exception as e:
+            logger.error(f"Failed to update approval requests: {e}")
+            raise
+
     async def delete(self, request_id: str) -> bool:
         """Delete an approval request."""
         from kailash.workflow.builder import WorkflowBuilder
@@ -798,6 +1355,32 @@ class DataFlowApprovalStore:
             logger.warning(f"Failed to delete approval request: {e}")
             return False
 
+    def _update_params(self, request: ApprovalRequest) -> dict[str, Any]:
+        """Get the update node parameters for status and decisions."""
+        return {
+            "filter": {"id": request.id},
+            "fields": {
+                "status": request.status.value,
+                "approvals": self._decisions_json(request.approvals),
+                "rejections": self._decisions_json(request.rejections),
+                "required_approvals": request.required_approvals,
+            }
+        }
+
+    @staticmethod
+    def _decisions_json(decisions: list) -> str:
+        """Serialize approval decisions."""
+        return json.dumps([
+            {
+                "approver_id": d.approver_id,
+                "decision": d.decision,
+                "reason": d.reason,
+                "timestamp": d.timestamp.isoformat() if d.timestamp else None,
+                "metadata": d.metadata
+            }
+            for d in decisions
+        ])
+
     def _record_to_request(self, record: dict[str, Any]) -> ApprovalRequest:
         """Convert database record to ApprovalRequest."""
         from studio_kaizen.trust.governance.types import ApprovalDecision
@@ -884,6 +1467,7 @@ __all__ = [
     "BudgetStore",
     "InMemoryBudgetStore",
     "DataFlowBudgetStore",
+    "CachedBudgetStore",
     # Approval stores
     "ApprovalStore",
     "InMemoryApprovalStore",
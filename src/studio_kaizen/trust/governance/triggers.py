@@ -7,16 +7,99 @@ Provides logic for evaluating approval triggers including:
 - Rate-based triggers
 - Context triggers (first invocation, new agent)
 - Sensitive data detection
+
+Payload and sensitive data patterns are combined into one regex alternation
+with a named group per pattern and matched against the string leaves of the
+payload (keys, strings and scalar values), so a payload is scanned once for
+all patterns without building a JSON string of it.
+
+InvocationHistoryIndex answers the history-based triggers (first invocation,
+invocations in window) from per-agent first-seen markers and fixed-size
+bucket counters instead of scanning recorded invocations, so lookups and
+memory per agent are constant.
 """
 
 import json
+import logging
+import math
 import re
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Protocol
 
 from .config import ApprovalTriggerConfig
 
+logger = logging.getLogger(__name__)
+
+# Built-in common sensitive patterns (data type -> regex)
+BUILTIN_SENSITIVE_PATTERNS = {
+    "SSN": r"\b\d{3}-\d{2}-\d{4}\b",
+    "Credit Card": r"\b\d{4}[- ]?\d{4}[- ]?\d{4}[- ]?\d{4}\b",
+    "API Key": r"(?i)(api[_-]?key|apikey|secret[_-]?key)\s*[=:]\s*['\"]?[\w\-]{20,}",
+    "Password": r"(?i)(password|passwd|pwd)\s*[=:]\s*['\"]?[^\s'\"]{8,}",
+}
+
+# Leading global inline flags, e.g. "(?i)"; not allowed inside an alternation
+_GLOBAL_FLAGS = re.compile(r"^\(\?([aiLmsux]+)\)")
+
+# Numbered backreferences would point at the wrong group once combined
+_NUMBERED_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?\(\d")
+
+# Maximum compiled alternations (pattern subsets) kept per scanner
+PAYLOAD_SCANNER_MAX_COMBINED = 64
+
+# Counter buckets per history window, and maximum agents/users kept in memory
+INVOCATION_HISTORY_BUCKETS = 60
+INVOCATION_HISTORY_MAX_KEYS = 10_000
+
+# Script modes
+_HISTORY_COUNT = 0
+_HISTORY_RECORD = 1
+
+# KEYS[1]: first-seen marker; KEYS[2..]: counter hashes
+# ARGV[1]: current bucket index; ARGV[2]: buckets to count; ARGV[3]: ring size
+# ARGV[4]: mode (0 = count, 1 = record); ARGV[5]: hash TTL; ARGV[6]: now
+# Counter hashes hold ring slots "s<index % size>" = "<index>:<count>".
+# Returns {seen before this call (0/1), count of each hash in the window}
+INVOCATION_HISTORY_SCRIPT = """
+local current = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local size = tonumber(ARGV[3])
+local record = tonumber(ARGV[4]) == 1
+local result = {redis.call('EXISTS', KEYS[1])}
+if record and result[1] == 0 then
+  redis.call('SET', KEYS[1], ARGV[6])
+end
+for k = 2, #KEYS do
+  if record then
+    local slot = 's' .. (current % size)
+    local count = 0
+    local value = redis.call('HGET', KEYS[k], slot)
+    if value then
+      local index, n = string.match(value, '^(%d+):(%d+)$')
+      if tonumber(index) == current then
+        count = tonumber(n)
+      end
+    end
+    redis.call('HSET', KEYS[k], slot, current .. ':' .. (count + 1))
+    redis.call('EXPIRE', KEYS[k], tonumber(ARGV[5]))
+  end
+  local total = 0
+  for _, value in ipairs(redis.call('HVALS', KEYS[k])) do
+    local index, n = string.match(value, '^(%d+):(%d+)$')
+    index = tonumber(index)
+    if index and index > current - window and index <= current then
+      total = total + tonumber(n)
+    end
+  end
+  result[k] = total
+end
+return result
+"""
+
 
 @dataclass
 class TriggerContext:
@@ -90,6 +173,207 @@ class InvocationHistoryProvider(Protocol):
         ...
 
 
+class PayloadScanner:
+    """
+    Matches many regex patterns against a payload in a single pass.
+
+    The patterns are compiled into one alternation of named groups. A search
+    finds the leftmost match of any pattern; the matched pattern is dropped
+    and the search resumes at the same position with the remaining ones, so
+    each string is scanned once plus once per matching pattern. Patterns
+    that cannot be combined (numbered backreferences) are searched
+    separately. Alternations of the remaining patterns are compiled on demand
+    and kept in a bounded LRU cache.
+
+    Examples:
+        >>> scanner = PayloadScanner({"delete": "delete.*", "admin": ".*admin.*"})
+        >>> scanner.scan({"action": "delete_user"})
+        ['delete']
+        >>> scanner.matches_any({"note": "hello"})
+        False
+    """
+
+    def __init__(
+        self,
+        patterns: dict[str, str],
+        flags: dict[str, int] | None = None,
+        max_combined: int = PAYLOAD_SCANNER_MAX_COMBINED
+    ):
+        """
+        Compile the patterns.
+
+        Args:
+            patterns: Pattern name -> regex (invalid regexes are skipped)
+            flags: Optional pattern name -> re flags (e.g. re.IGNORECASE)
+            max_combined: Maximum cached alternations of pattern subsets
+        """
+        flags = flags or {}
+        self.max_combined = max(1, max_combined)
+        self._names: list[str] = []
+        self._groups: dict[str, str] = {}
+        self._separate: dict[str, re.Pattern] = {}
+        self._combinable: dict[str, str] = {}
+
+        for name, pattern in patterns.items():
+            try:
+                compiled = re.compile(pattern, flags.get(name, 0))
+            except re.error:
+                # Invalid pattern - skip it
+                continue
+            self._names.append(name)
+            if _NUMBERED_BACKREFERENCE.search(pattern):
+                self._separate[name] = compiled
+            else:
+                self._groups[name] = f"g{len(self._groups)}"
+                self._combinable[name] = _scoped(pattern, flags.get(name, 0))
+
+        self._pattern_names = {group: name for name, group in self._groups.items()}
+        self._combined: OrderedDict[frozenset[str], re.Pattern] = OrderedDict()
+        try:
+            self._combine(frozenset(self._combinable))
+        except re.error:
+            # Conflicting group names etc.: search every pattern on its own
+            for name in self._combinable:
+                self._separate[name] = re.compile(patterns[name], flags.get(name, 0))
+            self._combinable.clear()
+            self._combined.clear()
+
+    @property
+    def names(self) -> list[str]:
+        """Get the names of the valid patterns, in configuration order."""
+        return list(self._names)
+
+    def scan(self, payload: Any, first_only: bool = False) -> list[str]:
+        """
+        Get the patterns matching anywhere in the payload.
+
+        Args:
+            payload: Payload (dicts, lists and scalars; keys are scanned too)
+            first_only: Stop at the first matching pattern
+
+        Returns:
+            Names of the matching patterns, in configuration order
+        """
+        return self.scan_texts(_payload_strings(payload), first_only)
+
+    def matches_any(self, payload: Any) -> bool:
+        """Check whether any pattern matches (stops at the first match)."""
+        return bool(self.scan(payload, first_only=True))
+
+    def scan_texts(self, texts: Iterable[str], first_only: bool = False) -> list[str]:
+        """
+        Get the patterns matching any of the texts.
+
+        Args:
+            texts: Strings to scan
+            first_only: Stop at the first matching pattern
+
+        Returns:
+            Names of the matching patterns, in configuration order
+        """
+        remaining = frozenset(self._combinable)
+        separate = dict(self._separate)
+        matched: set[str] = set()
+
+        for text in texts:
+            position = 0
+            while remaining:
+                match = self._combine(remaining).search(text, position)
+                if match is None:
+                    break
+                name = self._pattern_names[match.lastgroup]
+                matched.add(name)
+                if first_only:
+                    return [name]
+                remaining = remaining - {name}
+                position = match.start()
+
+            for name, pattern in list(separate.items()):
+                if pattern.search(text):
+                    matched.add(name)
+                    if first_only:
+                        return [name]
+                    del separate[name]
+
+            if not remaining and not separate:
+                break
+
+        return [name for name in self._names if name in matched]
+
+    def _combine(self, names: frozenset[str]) -> re.Pattern:
+        """Get the (cached) alternation of the given patterns."""
+        combined = self._combined.get(names)
+        if combined is not None:
+            self._combined.move_to_end(names)
+            return combined
+
+        combined = re.compile(
+            "|".join(
+                f"(?P<{self._groups[name]}>{self._combinable[name]})"
+                for name in self._names
+                if name in names
+            )
+        )
+        self._combined[names] = combined
+        while len(self._combined) > self.max_combined:
+            self._combined.popitem(last=False)
+        return combined
+
+
+def _scoped(pattern: str, flags: int) -> str:
+    """
+    Rewrite a pattern so its flags only apply inside its own group.
+
+    Leading global inline flags ("(?i)...") and compile flags become a
+    scoped flag group ("(?i:...)").
+    """
+    inline = ""
+    match = _GLOBAL_FLAGS.match(pattern)
+    if match:
+        inline = match.group(1)
+        pattern = pattern[match.end():]
+    for flag, letter in (
+        (re.IGNORECASE, "i"),
+        (re.MULTILINE, "m"),
+        (re.DOTALL, "s"),
+        (re.VERBOSE, "x"),
+    ):
+        if flags & flag and letter not in inline:
+            inline += letter
+    return f"(?{inline}:{pattern})" if inline else f"(?:{pattern})"
+
+
+def _payload_strings(payload: Any) -> Iterator[str]:
+    """
+    Iterate over the string leaves of a payload.
+
+    Yields dict keys, strings and scalars as they would appear in the
+    payload's JSON, walking nested dicts and lists iteratively.
+    """
+    stack = [payload]
+    seen: set[int] = set()
+    while stack:
+        value = stack.pop()
+        if isinstance(value, str):
+            yield value
+        elif isinstance(value, dict):
+            if id(value) in seen:
+                continue
+            seen.add(id(value))
+            for key, item in value.items():
+                yield key if isinstance(key, str) else json.dumps(key, default=str)
+                stack.append(item)
+        elif isinstance(value, (list, tuple)):
+            if id(value) in seen:
+                continue
+            seen.add(id(value))
+            stack.extend(reversed(value))
+        elif value is None or isinstance(value, (bool, int, float)):
+            yield json.dumps(value)
+        else:
+            yield str(value)
+
+
 class ApprovalTriggerEvaluator:
     """
     Evaluates approval triggers for external agent invocations.
@@ -121,22 +405,26 @@ class ApprovalTriggerEvaluator:
         self.config = config
         self.history_provider = history_provider
 
-        # Compile regex patterns once
-        self._payload_patterns: list[re.Pattern] = []
-        self._sensitive_patterns: list[re.Pattern] = []
-
-        for pattern in config.payload_patterns:
-            try:
-                self._payload_patterns.append(re.compile(pattern, re.IGNORECASE))
-            except re.error:
-                # Invalid pattern - skip it but log
-                pass
-
-        for pattern in config.sensitive_data_patterns:
-            try:
-                self._sensitive_patterns.append(re.compile(pattern))
-            except re.error:
-                pass
+        # Compile all payload, sensitive and built-in patterns into one scanner
+        patterns: dict[str, str] = {}
+        flags: dict[str, int] = {}
+        for i, pattern in enumerate(config.payload_patterns):
+            patterns[f"payload_{i}"] = pattern
+            flags[f"payload_{i}"] = re.IGNORECASE
+        for i, pattern in enumerate(config.sensitive_data_patterns):
+            patterns[f"sensitive_{i}"] = pattern
+        for data_type, pattern in BUILTIN_SENSITIVE_PATTERNS.items():
+            patterns[f"builtin:{data_type}"] = pattern
+        self._scanner = PayloadScanner(patterns, flags)
+
+        # Pattern name -> reported pattern / data type
+        self._labels: dict[str, str] = {}
+        for i, pattern in enumerate(config.payload_patterns):
+            self._labels[f"payload_{i}"] = pattern
+        for i, pattern in enumerate(config.sensitive_data_patterns):
+            self._labels[f"sensitive_{i}"] = self._sensitive_data_type(i, pattern)
+        for data_type in BUILTIN_SENSITIVE_PATTERNS:
+            self._labels[f"builtin:{data_type}"] = data_type
 
     async def evaluate(self, context: TriggerContext) -> TriggerResult:
         """
@@ -208,16 +496,16 @@ class ApprovalTriggerEvaluator:
             reasons.append(f"Environment '{context.environment}' requires approval")
             details["environment"] = context.environment
 
-        # Check payload patterns
-        payload_str = self._serialize_payload(context.payload)
-        matched_patterns = self._check_payload_patterns(payload_str)
+        # Check payload and sensitive data patterns (one scan of the payload)
+        matched_names = self._scanner.scan(context.payload)
+        matched_patterns = self._check_payload_patterns(matched_names)
         if matched_patterns:
             triggers_matched.append("payload_pattern")
             reasons.append(f"Payload contains restricted patterns: {', '.join(matched_patterns)}")
             details["payload_patterns"] = matched_patterns
 
         # Check sensitive data patterns
-        sensitive_matches = self._check_sensitive_data(payload_str)
+        sensitive_matches = self._check_sensitive_data(matched_names)
         if sensitive_matches:
             triggers_matched.append("sensitive_data")
             reasons.append(f"Sensitive data detected: {', '.join(sensitive_matches)}")
@@ -248,54 +536,49 @@ class ApprovalTriggerEvaluator:
             details=details
         )
 
-    def _serialize_payload(self, payload: dict[str, Any]) -> str:
-        """Convert payload to string for pattern matching."""
-        try:
-            return json.dumps(payload, default=str)
-        except (TypeError, ValueError):
-            return str(payload)
-
-    def _check_payload_patterns(self, payload_str: str) -> list[str]:
-        """Check payload against configured patterns."""
-        matched = []
-        for pattern in self._payload_patterns:
-            if pattern.search(payload_str):
-                matched.append(pattern.pattern)
-        return matched
-
-    def _check_sensitive_data(self, payload_str: str) -> list[str]:
-        """Check for sensitive data patterns."""
-        detected_types = []
-
-        # Check configured patterns
-        for i, pattern in enumerate(self._sensitive_patterns):
-            if pattern.search(payload_str):
-                # Try to categorize the pattern
-                pattern_str = pattern.pattern
-                if "\\d{3}-\\d{2}-\\d{4}" in pattern_str:
-                    detected_types.append("SSN")
-                elif "\\d{16}" in pattern_str or "\\d{4}[- ]?\\d{4}[- ]?\\d{4}[- ]?\\d{4}" in pattern_str:
-                    detected_types.append("Credit Card")
-                elif "@" in pattern_str and "\\." in pattern_str:
-                    detected_types.append("Email Pattern")
-                else:
-                    detected_types.append(f"Pattern_{i}")
-
-        # Built-in common sensitive patterns
-        builtin_patterns = {
-            "SSN": r"\b\d{3}-\d{2}-\d{4}\b",
-            "Credit Card": r"\b\d{4}[- ]?\d{4}[- ]?\d{4}[- ]?\d{4}\b",
-            "API Key": r"(?i)(api[_-]?key|apikey|secret[_-]?key)\s*[=:]\s*['\"]?[\w\-]{20,}",
-            "Password": r"(?i)(password|passwd|pwd)\s*[=:]\s*['\"]?[^\s'\"]{8,}",
-        }
-
-        for data_type, pattern in builtin_patterns.items():
-            if data_type not in detected_types:
-                if re.search(pattern, payload_str):
-                    detected_types.append(data_type)
+    def has_restricted_content(self, payload: dict[str, Any]) -> bool:
+        """
+        Check whether a payload matches any payload or sensitive data pattern.
 
+        Stops scanning at the first match.
+
+        Args:
+            payload: Invocation payload
+
+        Returns:
+            True if any pattern (including the built-in ones) matches
+        """
+        return self._scanner.matches_any(payload)
+
+    def _check_payload_patterns(self, matched_names: list[str]) -> list[str]:
+        """Get the configured payload patterns among the matched patterns."""
+        return [
+            self._labels[name] for name in matched_names if name.startswith("payload_")
+        ]
+
+    def _check_sensitive_data(self, matched_names: list[str]) -> list[str]:
+        """Get the sensitive data types among the matched patterns."""
+        # Configured patterns first, then built-ins not already detected
+        detected_types = [
+            self._labels[name] for name in matched_names if name.startswith("sensitive_")
+        ]
+        for name in matched_names:
+            data_type = self._labels[name]
+            if name.startswith("builtin:") and data_type not in detected_types:
+                detected_types.append(data_type)
         return detected_types
 
+    @staticmethod
+    def _sensitive_data_type(index: int, pattern: str) -> str:
+        """Try to categorize a configured sensitive data pattern."""
+        if "\\d{3}-\\d{2}-\\d{4}" in pattern:
+            return "SSN"
+        elif "\\d{16}" in pattern or "\\d{4}[- ]?\\d{4}[- ]?\\d{4}[- ]?\\d{4}" in pattern:
+            return "Credit Card"
+        elif "@" in pattern and "\\." in pattern:
+            return "Email Pattern"
+        return f"Pattern_{index}"
+
 
 class InMemoryHistoryProvider:
     """
@@ -361,10 +644,237 @@ class InMemoryHistoryProvider:
         return key not in self._first_invocation_cache
 
 
+class InvocationHistoryIndex:
+    """
+    Compact invocation history for approval triggers.
+
+    Implements InvocationHistoryProvider with a first-seen marker per agent
+    and invocation counters in a ring of fixed-size buckets per agent and
+    per agent/user, so answering a trigger check never scans invocations
+    and memory per agent does not grow with its invocations.
+
+    With Redis, markers and counters are shared by all workers and survive
+    restarts; one script records an invocation or counts the window in a
+    single round-trip. An in-memory front remembers agents already seen,
+    so is_first_invocation() needs no round-trip once an agent is known.
+    Redis errors fall back to the in-memory front.
+
+    Without Redis the counters are kept in memory as well. At most max_keys
+    agents and agent/users are kept (least recently used first evicted);
+    an evicted agent counts as not yet invoked, which errs on the side of
+    requiring approval.
+
+    Counts are exact to one bucket (window_seconds / buckets); windows
+    longer than window_seconds are counted up to window_seconds.
+
+    Examples:
+        >>> history = InvocationHistoryIndex(
+        ...     redis_url="redis://localhost:6379/0",
+        ...     window_seconds=3600
+        ... )
+        >>> await history.initialize()
+        >>> await history.record_invocation("agent-001", "user-001", "org-001")
+        >>> await history.is_first_invocation("agent-001", "user-001", "org-001")
+        False
+    """
+
+    def __init__(
+        self,
+        redis_url: str | None = None,
+        window_seconds: int = 3600,
+        buckets: int = INVOCATION_HISTORY_BUCKETS,
+        max_keys: int = INVOCATION_HISTORY_MAX_KEYS
+    ):
+        """
+        Initialize the history index.
+
+        Args:
+            redis_url: Redis connection URL (optional, uses memory if not provided)
+            window_seconds: Longest window counted (the rate trigger window)
+            buckets: Counter buckets per window
+            max_keys: Maximum agents and agent/users kept in memory
+        """
+        self.redis_url = redis_url
+        self.buckets = buckets
+        self.bucket_seconds = max(1, math.ceil(window_seconds / buckets))
+        self.max_keys = max_keys
+        self._redis: Any = None
+        self._script: Any = None
+
+        # In-memory front: known agents, and counters when running without Redis
+        self._seen: OrderedDict[str, None] = OrderedDict()
+        self._counters: OrderedDict[str, dict[int, int]] = OrderedDict()
+
+    async def initialize(self) -> None:
+        """
+        Initialize Redis connection if configured.
+
+        Falls back to in-memory history if Redis unavailable.
+        """
+        if not self.redis_url:
+            return
+
+        try:
+            import redis.asyncio as redis
+
+            self._redis = redis.from_url(self.redis_url)
+            await self._redis.ping()
+            self._script = self._redis.register_script(INVOCATION_HISTORY_SCRIPT)
+            logger.info(f"Invocation history initialized with Redis: {self.redis_url}")
+        except Exception as e:
+            logger.warning(
+                f"Failed to connect to Redis: {e}. "
+                "Using in-memory invocation history."
+            )
+            self._redis = None
+            self._script = None
+
+    async def close(self) -> None:
+        """Close Redis connection and clear in-memory history."""
+        if self._redis:
+            await self._redis.close()
+            self._redis = None
+            self._script = None
+        self._seen.clear()
+        self._counters.clear()
+
+    @staticmethod
+    def _agent_key(agent_id: str, organization_id: str) -> str:
+        """Get the key of an agent."""
+        return f"{organization_id}:{agent_id}"
+
+    def _counter_key(self, agent_key: str, user_id: str | None) -> str:
+        """Get the counter key of an agent (all users if user_id is None)."""
+        return f"{agent_key}:user:{user_id or '*'}"
+
+    def _window(self, window_seconds: int) -> int:
+        """Get the number of buckets covering a window."""
+        return min(self.buckets, max(1, math.ceil(window_seconds / self.bucket_seconds)))
+
+    def _remember(self, cache: OrderedDict, key: str, value: Any) -> None:
+        """Store a front entry, evicting the least recently used."""
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > self.max_keys:
+            cache.popitem(last=False)
+
+    async def _run_script(
+        self,
+        agent_key: str,
+        counter_keys: list[str],
+        window: int,
+        mode: int
+    ) -> list[int]:
+        """Run the history script; returns {seen, count per counter key}."""
+        now = time.time()
+        result = await self._script(
+            keys=[f"approval_history:{agent_key}:seen"]
+            + [f"approval_history:{key}" for key in counter_keys],
+            args=[
+                int(now // self.bucket_seconds),
+                window,
+                self.buckets,
+                mode,
+                self.bucket_seconds * (self.buckets + 1),
+                int(now),
+            ],
+        )
+        return [int(value) for value in result]
+
+    async def record_invocation(
+        self,
+        agent_id: str,
+        user_id: str | None,
+        organization_id: str
+    ) -> None:
+        """Record an invocation."""
+        agent_key = self._agent_key(agent_id, organization_id)
+        counter_keys = [self._counter_key(agent_key, None)]
+        if user_id:
+            counter_keys.append(self._counter_key(agent_key, user_id))
+
+        self._remember(self._seen, agent_key, None)
+        if self._redis:
+            try:
+                await self._run_script(
+                    agent_key, counter_keys, self.buckets, _HISTORY_RECORD
+                )
+                return
+            except Exception as e:
+                logger.error(f"Failed to record invocation history: {e}")
+
+        current = int(time.time() // self.bucket_seconds)
+        for key in counter_keys:
+            counts = self._counters.get(key, {})
+            counts = {
+                index: count for index, count in counts.items()
+                if index > current - self.buckets
+            }
+            counts[current] = counts.get(current, 0) + 1
+            self._remember(self._counters, key, counts)
+
+    async def get_invocation_count(
+        self,
+        agent_id: str,
+        user_id: str | None,
+        organization_id: str,
+        window_seconds: int
+    ) -> int:
+        """Get count of invocations in time window."""
+        agent_key = self._agent_key(agent_id, organization_id)
+        counter_key = self._counter_key(agent_key, user_id)
+        window = self._window(window_seconds)
+
+        if self._redis:
+            try:
+                seen, count = await self._run_script(
+                    agent_key, [counter_key], window, _HISTORY_COUNT
+                )
+                if seen:
+                    self._remember(self._seen, agent_key, None)
+                return count
+            except Exception as e:
+                logger.error(f"Failed to read invocation history: {e}")
+
+        counts = self._counters.get(counter_key)
+        if not counts:
+            return 0
+        current = int(time.time() // self.bucket_seconds)
+        return sum(
+            count for index, count in counts.items()
+            if current - window < index <= current
+        )
+
+    async def is_first_invocation(
+        self,
+        agent_id: str,
+        user_id: str | None,
+        organization_id: str
+    ) -> bool:
+        """Check if this is the first invocation."""
+        agent_key = self._agent_key(agent_id, organization_id)
+        if agent_key in self._seen:
+            self._seen.move_to_end(agent_key)
+            return False
+
+        if self._redis:
+            try:
+                seen, = await self._run_script(agent_key, [], 1, _HISTORY_COUNT)
+                if seen:
+                    self._remember(self._seen, agent_key, None)
+                    return False
+            except Exception as e:
+                logger.error(f"Failed to read invocation history: {e}")
+
+        return True
+
+
 __all__ = [
+    "PayloadScanner",
     "TriggerContext",
     "TriggerResult",
     "InvocationHistoryProvider",
     "ApprovalTriggerEvaluator",
     "InMemoryHistoryProvider",
+    "InvocationHistoryIndex",
 ]
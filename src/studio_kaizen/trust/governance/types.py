@@ -211,6 +211,7 @@ class RateLimitCheckResult:
     remaining: int = -1  # Remaining requests in current window
     retry_after_seconds: int | None = None  # When to retry
     current_usage: dict[str, int] = field(default_factory=dict)  # Usage by window
+    acquired_at: float | None = None  # When acquire() recorded the invocation
 
 
 # ===================
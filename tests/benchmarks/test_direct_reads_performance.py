@@ -0,0 +1,220 @@
+"""
+Direct Read Performance Benchmarks
+
+Compares workflow-based DataFlow reads with the direct prepared-statement
+reads of ReadRepository for each hot query:
+- UserReadNode vs user_by_id
+- AgentReadNode vs agent_by_id
+- APIKeyListNode (by prefix) vs api_key_by_prefix
+- PolicyAssignmentListNode (by principal) vs policy_assignments_for_principal
+
+Each pair must return the same rows; the direct path must be faster.
+
+Uses real PostgreSQL - NO MOCKING.
+"""
+
+import statistics
+import time
+import uuid
+
+import pytest
+from kailash.runtime import AsyncLocalRuntime
+from kailash.workflow.builder import WorkflowBuilder
+
+ITERATIONS = 50
+
+
+async def _measure(read, iterations: int = ITERATIONS) -> tuple[list[float], object]:
+    """Run a read repeatedly and return its latencies and last result."""
+    # Warm up (pool connections, prepared statements, node registry)
+    result = await read()
+
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        result = await read()
+        latencies.append(time.perf_counter() - start)
+
+    return latencies, result
+
+
+def _report(name: str, workflow: list[float], direct: list[float]) -> tuple:
+    """Print a comparison and return (workflow median, direct median)."""
+    workflow_median = statistics.median(workflow)
+    direct_median = statistics.median(direct)
+
+    print(f"\n--- {name} ({ITERATIONS} reads) ---")
+    print(f"Workflow median: {workflow_median * 1000:.2f}ms")
+    print(f"Direct median:   {direct_median * 1000:.2f}ms")
+    print(f"Speedup:         {workflow_median / direct_median:.1f}x")
+
+    return workflow_median, direct_median
+
+
+@pytest.mark.integration  # Tier 2: Real infrastructure
+@pytest.mark.timeout(120)
+@pytest.mark.asyncio
+class TestDirectReadPerformance:
+    """
+    Performance benchmarks for direct reads of hot queries.
+
+    Intent: Verify the direct path returns the generated nodes' row shapes
+    and removes the workflow build/execute overhead from each lookup.
+
+    Target: direct median below workflow median for every query.
+    """
+
+    async def _workflow_read(self, runtime, node: str, params: dict):
+        workflow = WorkflowBuilder()
+        workflow.add_node(node, "read", params)
+        results, _ = await runtime.execute_workflow_async(workflow.build(), inputs={})
+        return results.get("read")
+
+    async def test_user_by_id(self, test_db, hot_records, read_repository):
+        """UserReadNode vs direct user_by_id."""
+        runtime = AsyncLocalRuntime()
+        user_id = hot_records["user"]["id"]
+
+        workflow, expected = await _measure(
+            lambda: self._workflow_read(runtime, "UserReadNode", {"id": user_id})
+        )
+        direct, actual = await _measure(lambda: read_repository.get_user(user_id))
+
+        assert actual == expected
+        workflow_median, direct_median = _report("User by ID", workflow, direct)
+        assert direct_median < workflow_median
+
+    async def test_agent_by_id(self, test_db, hot_records, read_repository):
+        """AgentReadNode vs direct agent_by_id."""
+        runtime = AsyncLocalRuntime()
+        agent_id = hot_records["agent"]["id"]
+
+        workflow, expected = await _measure(
+            lambda: self._workflow_read(runtime, "AgentReadNode", {"id": agent_id})
+        )
+        direct, actual = await _measure(lambda: read_repository.get_agent(agent_id))
+
+        assert actual == expected
+        workflow_median, direct_median = _report("Agent by ID", workflow, direct)
+        assert direct_median < workflow_median
+
+    async def test_api_key_by_prefix(self, test_db, hot_records, read_repository):
+        """APIKeyListNode (by prefix) vs direct api_key_by_prefix."""
+        runtime = AsyncLocalRuntime()
+        key_prefix = hot_records["api_key"]["key_prefix"]
+
+        async def workflow_read():
+            result = await self._workflow_read(
+                runtime,
+                "APIKeyListNode",
+                {"filter": {"key_prefix": key_prefix}, "limit": 1},
+            )
+            return result["records"][0]
+
+        workflow, expected = await _measure(workflow_read)
+        direct, actual = await _measure(
+            lambda: read_repository.find_api_key(key_prefix)
+        )
+
+        assert actual == expected
+        workflow_median, direct_median = _report("API key by prefix", workflow, direct)
+        assert direct_median < workflow_median
+
+    async def test_policy_assignments_for_principal(
+        self, test_db, hot_records, read_repository
+    ):
+        """PolicyAssignmentListNode (by principal) vs direct read."""
+        runtime = AsyncLocalRuntime()
+        user_id = hot_records["user"]["id"]
+
+        async def workflow_read():
+            result = await self._workflow_read(
+                runtime,
+                "PolicyAssignmentListNode",
+                {
+                    "filter": {"principal_type": "user", "principal_id": user_id},
+                    "enable_cache": False,
+                },
+            )
+            return result["records"]
+
+        workflow, expected = await _measure(workflow_read)
+        direct, actual = await _measure(
+            lambda: read_repository.list_policy_assignments("user", user_id)
+        )
+
+        assert sorted(actual, key=lambda a: a["id"]) == sorted(
+            expected, key=lambda a: a["id"]
+        )
+        workflow_median, direct_median = _report(
+            "Policy assignments by principal", workflow, direct
+        )
+        assert direct_median < workflow_median
+
+
+# ===================
+# Fixtures
+# ===================
+
+
+@pytest.fixture
+async def read_repository():
+    """Direct-read repository on the test database."""
+    from studio.services.read_repository import ReadRepository
+
+    repository = ReadRepository(max_size=2)
+    yield repository
+    await repository.close()
+
+
+@pytest.fixture
+async def hot_records(test_db, authenticated_owner_client):
+    """
+    Create one record for each hot query.
+
+    Uses services directly (workflow path) so the rows are written exactly
+    as the application writes them.
+    """
+    from studio.services.abac_service import ABACService
+    from studio.services.agent_service import AgentService
+    from studio.services.api_key_service import APIKeyService
+    from studio.services.workspace_service import WorkspaceService
+
+    client, user, org = authenticated_owner_client
+
+    workspace = await WorkspaceService().create_workspace(
+        name=f"Direct Reads Workspace {uuid.uuid4().hex[:6]}",
+        organization_id=org["id"],
+        environment_type="development",
+    )
+
+    agent = await AgentService().create(
+        organization_id=org["id"],
+        workspace_id=workspace["id"],
+        name="Direct Reads Agent",
+        agent_type="chat",
+        model_id="gpt-4o-mini",
+        created_by=user["id"],
+    )
+
+    api_key, _ = await APIKeyService().create(
+        org_id=org["id"],
+        name="Direct Reads Key",
+        scopes=["agents:read"],
+        rate_limit=1000,
+        user_id=user["id"],
+    )
+
+    abac_service = ABACService()
+    policy = await abac_service.create_policy(
+        organization_id=org["id"],
+        name="Direct Reads Policy",
+        resource_type="agent",
+        action="read",
+        effect="allow",
+        conditions={},
+        created_by=user["id"],
+    )
+    await abac_service.assign_policy(policy["id"], "user", user["id"])
+
+    return {"user": user, "agent": agent, "api_key": api_key}
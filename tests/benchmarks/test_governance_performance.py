@@ -0,0 +1,672 @@
+"""
+Governance Performance Benchmarks
+
+Micro benchmarks of each governance component and a macro benchmark of the
+combined pre-invocation checks, under synthetic multi-tenant load:
+- ExternalAgentRateLimiter.acquire (in-memory and fakeredis)
+- ExternalAgentBudgetEnforcer.check_budget / record_usage (InMemoryBudgetStore)
+- CachedBudgetStore.get_budget (fakeredis counters)
+- ExternalAgentPolicyEngine.evaluate_policies
+- ApprovalTriggerEvaluator.evaluate
+- ABACService.evaluate (assigned policies served from memory)
+- All pre-invocation checks of an invocation gathered, many invocations
+  in flight
+
+Tenants, agents, users and policies are generated deterministically at the
+scale selected with GOVERNANCE_BENCH_SCALE ("small" by default, or
+"large"); tenant traffic is skewed so a few tenants are hot. Every
+benchmark reports p50/p99 latency, throughput and allocations (tracemalloc
+peak and retained bytes per operation, measured in a separate pass).
+
+Results are written as JSON to GOVERNANCE_BENCH_RESULTS if set. Retained
+bytes per operation, which do not depend on the machine, are compared
+against the committed governance_baseline.json (entries of the same
+scale); a benchmark more than GOVERNANCE_BENCH_TOLERANCE times its baseline
+fails. Latencies depend on the machine, so they are reported but not
+compared. GOVERNANCE_BENCH_UPDATE_BASELINE=1 rewrites the baseline from the
+current run instead.
+
+The benchmarks are marked "benchmark" and deselected by default; run them
+with "pytest -m benchmark tests/benchmarks/test_governance_performance.py".
+No infrastructure is needed; Redis benchmarks are skipped without fakeredis.
+"""
+
+import asyncio
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from studio_kaizen.trust.governance.budget_enforcer import ExternalAgentBudgetEnforcer
+from studio_kaizen.trust.governance.config import ApprovalTriggerConfig
+from studio_kaizen.trust.governance.policy_engine import ExternalAgentPolicyEngine
+from studio_kaizen.trust.governance.rate_limiter import ExternalAgentRateLimiter
+from studio_kaizen.trust.governance.store import CachedBudgetStore, InMemoryBudgetStore
+from studio_kaizen.trust.governance.triggers import (
+    ApprovalTriggerEvaluator,
+    TriggerContext,
+)
+from studio_kaizen.trust.governance.types import (
+    BudgetScope,
+    ExternalAgentBudget,
+    ExternalAgentPolicy,
+    ExternalAgentPolicyContext,
+    ExternalAgentPrincipal,
+    PolicyCondition,
+    PolicyEffect,
+    RateLimitConfig,
+)
+
+
+@dataclass(frozen=True)
+class BenchScale:
+    """Size of the synthetic load."""
+
+    tenants: int
+    agents_per_tenant: int
+    users_per_tenant: int
+    policies_per_tenant: int
+    operations: int
+
+
+SCALES = {
+    "small": BenchScale(
+        tenants=10,
+        agents_per_tenant=10,
+        users_per_tenant=20,
+        policies_per_tenant=20,
+        operations=2000,
+    ),
+    "large": BenchScale(
+        tenants=200,
+        agents_per_tenant=25,
+        users_per_tenant=100,
+        policies_per_tenant=50,
+        operations=20000,
+    ),
+}
+
+SCALE_NAME = os.environ.get("GOVERNANCE_BENCH_SCALE", "small")
+SCALE = SCALES[SCALE_NAME]
+CONCURRENCY = int(os.environ.get("GOVERNANCE_BENCH_CONCURRENCY", "50"))
+TOLERANCE = float(os.environ.get("GOVERNANCE_BENCH_TOLERANCE", "2.0"))
+UPDATE_BASELINE = os.environ.get("GOVERNANCE_BENCH_UPDATE_BASELINE") == "1"
+BASELINE_PATH = Path(__file__).with_name("governance_baseline.json")
+
+# Metrics compared with the baseline (machine independent), and the
+# differences below which they are noise, whatever the ratio to the baseline
+NOISE_FLOORS = {"retained_bytes_per_op": 256.0}
+
+USERS_PER_TEAM = 5
+SEED = 7
+
+# Monday noon, inside the time window of every generated policy
+NOW = datetime(2026, 1, 5, 12, 0)
+
+
+# ===================
+# Synthetic Load
+# ===================
+
+
+@dataclass(frozen=True)
+class Invocation:
+    """One synthetic external agent invocation."""
+
+    org_id: str
+    team_id: str
+    agent_id: str
+    user_id: str
+    cost: float
+    payload: dict
+
+
+def _team(org_id: str, user_index: int) -> str:
+    """Get the team of a tenant's user."""
+    return f"{org_id}-team-{user_index // USERS_PER_TEAM}"
+
+
+def synthetic_invocations(scale: BenchScale = SCALE) -> list[Invocation]:
+    """
+    Generate invocations across tenants, agents and users.
+
+    Tenant traffic follows a 1/rank distribution; about 1% of payloads
+    contain sensitive data.
+    """
+    rng = random.Random(SEED)
+    weights = [1 / (rank + 1) for rank in range(scale.tenants)]
+    invocations = []
+    for i in range(scale.operations):
+        tenant = rng.choices(range(scale.tenants), weights)[0]
+        org_id = f"org-{tenant}"
+        user = rng.randrange(scale.users_per_tenant)
+        body = f"Summarize quarterly report {i} for the finance team"
+        if rng.random() < 0.01:
+            body += " (customer ssn 123-45-6789)"
+        invocations.append(
+            Invocation(
+                org_id=org_id,
+                team_id=_team(org_id, user),
+                agent_id=f"{org_id}-agent-{rng.randrange(scale.agents_per_tenant)}",
+                user_id=f"{org_id}-user-{user}",
+                cost=round(rng.uniform(0.01, 2.0), 4),
+                payload={
+                    "action": "process",
+                    "documents": [{"title": f"Report {i}", "body": body}],
+                    "options": {"language": "en", "max_tokens": 1024},
+                },
+            )
+        )
+    return invocations
+
+
+def synthetic_policies(scale: BenchScale = SCALE) -> list[ExternalAgentPolicy]:
+    """Generate team-scoped policies for every tenant plus a few global ones."""
+    policies = []
+    teams_per_tenant = max(1, scale.users_per_tenant // USERS_PER_TEAM)
+    for tenant in range(scale.tenants):
+        org_id = f"org-{tenant}"
+        for i in range(scale.policies_per_tenant):
+            policies.append(
+                ExternalAgentPolicy(
+                    policy_id=f"{org_id}-pol-{i}",
+                    name=f"{org_id} policy {i}",
+                    effect=PolicyEffect.DENY if i % 7 == 6 else PolicyEffect.ALLOW,
+                    priority=i % 10,
+                    conditions=[
+                        PolicyCondition(
+                            type="team",
+                            teams=[
+                                _team(org_id, (i % teams_per_tenant) * USERS_PER_TEAM)
+                            ],
+                        ),
+                        PolicyCondition(
+                            type="ip",
+                            ip_ranges=[f"10.{tenant % 256}.0.0/16", "192.168.0.0/24"],
+                        ),
+                        PolicyCondition(
+                            type="time",
+                            time_range={
+                                "start": "06:00",
+                                "end": "22:00",
+                                "days": [0, 1, 2, 3, 4],
+                            },
+                        ),
+                        PolicyCondition(type="role", roles=["operator", "admin"]),
+                    ],
+                )
+            )
+    for i in range(3):
+        policies.append(
+            ExternalAgentPolicy(
+                policy_id=f"global-{i}",
+                name=f"Global {i}",
+                effect=PolicyEffect.ALLOW,
+                conditions=[PolicyCondition(type="role", roles=["admin"])],
+            )
+        )
+    return policies
+
+
+def synthetic_abac_policies(scale: BenchScale = SCALE) -> dict[str, list[dict]]:
+    """Generate the ABAC policies assigned to each user, by user ID."""
+    by_user = {}
+    for tenant in range(scale.tenants):
+        org_id = f"org-{tenant}"
+        tenant_policies = [
+            {
+                "id": f"{org_id}-abac-{i}",
+                "resource_type": ("agent", "deployment", "*")[i % 3],
+                "action": ("invoke", "read", "*")[i % 3],
+                "effect": "deny" if i % 9 == 8 else "allow",
+                "priority": scale.policies_per_tenant - i,
+                "status": "active",
+                "conditions": {
+                    "all": [
+                        {"field": "resource.status", "op": "eq", "value": "active"},
+                        {
+                            "field": "resource.tier",
+                            "op": "in",
+                            "value": ["standard", "premium"],
+                        },
+                        {"field": "context.time.hour", "op": "gte", "value": 0},
+                    ]
+                },
+            }
+            for i in range(scale.policies_per_tenant)
+        ]
+        for user in range(scale.users_per_tenant):
+            by_user[f"{org_id}-user-{user}"] = tenant_policies
+    return by_user
+
+
+def policy_context(invocation: Invocation) -> ExternalAgentPolicyContext:
+    """Create the policy evaluation context of an invocation."""
+    return ExternalAgentPolicyContext(
+        principal=ExternalAgentPrincipal(
+            external_agent_id=invocation.agent_id,
+            provider="custom",
+            environment="production",
+            org_id=invocation.org_id,
+            user_id=invocation.user_id,
+            team_id=invocation.team_id,
+            roles=["operator"],
+            ip_address="192.168.0.10",
+        ),
+        action="invoke",
+        resource=invocation.agent_id,
+        timestamp=NOW,
+    )
+
+
+def trigger_context(invocation: Invocation) -> TriggerContext:
+    """Create the approval trigger context of an invocation."""
+    return TriggerContext(
+        agent_id=invocation.agent_id,
+        user_id=invocation.user_id,
+        organization_id=invocation.org_id,
+        payload=invocation.payload,
+        estimated_cost=invocation.cost,
+        environment="production",
+    )
+
+
+def agent_budgets(invocations: list[Invocation]) -> dict[str, ExternalAgentBudget]:
+    """Create a budget for every invoked agent."""
+    return {
+        inv.agent_id: ExternalAgentBudget(
+            external_agent_id=inv.agent_id,
+            monthly_budget_usd=1_000_000.0,
+            daily_budget_usd=100_000.0,
+        )
+        for inv in invocations
+    }
+
+
+def unlimited_rate_limits() -> RateLimitConfig:
+    """Rate limits no synthetic load reaches (every call is recorded)."""
+    return RateLimitConfig(
+        requests_per_minute=10**9,
+        requests_per_hour=10**9,
+        requests_per_day=10**9,
+    )
+
+
+async def connect_fakeredis(component) -> None:
+    """Initialize a Redis-backed component against an in-process fakeredis."""
+    pytest.importorskip("lupa")
+    fakeredis = pytest.importorskip("fakeredis")
+
+    client = fakeredis.aioredis.FakeRedis(server=fakeredis.FakeServer())
+    with patch("redis.asyncio.from_url", return_value=client):
+        await component.initialize()
+
+
+# ===================
+# Measurement
+# ===================
+
+
+@dataclass
+class BenchResult:
+    """Machine-readable result of one benchmark."""
+
+    name: str
+    operations: int
+    p50_us: float
+    p99_us: float
+    throughput_ops_s: float
+    alloc_peak_kib: float
+    retained_bytes_per_op: float
+
+
+RESULTS: dict[str, BenchResult] = {}
+
+Operation = Callable[[int], Awaitable[object]]
+
+
+async def _timed(operation: Operation, i: int, latencies: list[float]) -> None:
+    """Run one operation and append its latency."""
+    start = time.perf_counter()
+    await operation(i)
+    latencies.append(time.perf_counter() - start)
+
+
+async def measure(
+    name: str,
+    operation: Operation,
+    operations: int = SCALE.operations,
+    concurrency: int = 1,
+) -> BenchResult:
+    """
+    Benchmark an operation called with 0..operations-1.
+
+    With concurrency > 1, operations run in gathered batches of that size
+    and latencies include waiting for the event loop.
+    """
+    # Warm up (caches, lazily created state)
+    for i in range(min(100, operations)):
+        await operation(i)
+
+    latencies: list[float] = []
+    start = time.perf_counter()
+    for batch in range(0, operations, concurrency):
+        await asyncio.gather(
+            *(
+                _timed(operation, i, latencies)
+                for i in range(batch, min(batch + concurrency, operations))
+            )
+        )
+    elapsed = time.perf_counter() - start
+
+    # Allocations in a separate pass, since tracing slows every allocation
+    traced = max(1, operations // 10)
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    for i in range(traced):
+        await operation(i)
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return BenchResult(
+        name=name,
+        operations=operations,
+        p50_us=round(statistics.median(latencies) * 1_000_000, 2),
+        p99_us=round(statistics.quantiles(latencies, n=100)[98] * 1_000_000, 2),
+        throughput_ops_s=round(operations / elapsed, 1),
+        alloc_peak_kib=round((peak - before) / 1024, 1),
+        retained_bytes_per_op=round(max(0, after - before) / traced, 1),
+    )
+
+
+def baseline() -> dict:
+    """Get the stored baseline, {"scales": {scale: {name: result}}}."""
+    if not BASELINE_PATH.exists():
+        return {"scales": {}}
+    return json.loads(BASELINE_PATH.read_text())
+
+
+def regressions(result: BenchResult) -> list[str]:
+    """Compare a result with its baseline; returns the regressed metrics."""
+    previous = baseline()["scales"].get(SCALE_NAME, {}).get(result.name)
+    if UPDATE_BASELINE or not previous:
+        return []
+
+    regressed = []
+    for metric, floor in NOISE_FLOORS.items():
+        current, expected = getattr(result, metric), previous[metric]
+        if current > expected * TOLERANCE and current - expected > floor:
+            regressed.append(
+                f"{result.name} {metric} {current:.1f} > {TOLERANCE}x baseline {expected:.1f}"
+            )
+    return regressed
+
+
+def report(result: BenchResult) -> None:
+    """Print and keep a result, failing on a regression against the baseline."""
+    RESULTS[result.name] = result
+    print(f"\n--- {result.name} ({SCALE_NAME}, {result.operations} ops) ---")
+    print(f"p50:        {result.p50_us:.1f}us")
+    print(f"p99:        {result.p99_us:.1f}us")
+    print(f"Throughput: {result.throughput_ops_s:,.0f} ops/s")
+    print(f"Alloc peak: {result.alloc_peak_kib:.1f}KiB")
+    print(f"Retained:   {result.retained_bytes_per_op:.0f}B/op")
+
+    regressed = regressions(result)
+    assert not regressed, "Performance regression: " + "; ".join(regressed)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def bench_results():
+    """Write the results (and the baseline if requested) after the benchmarks."""
+    yield
+    if not RESULTS:
+        return
+
+    results = {name: asdict(result) for name, result in sorted(RESULTS.items())}
+    path = os.environ.get("GOVERNANCE_BENCH_RESULTS")
+    if path:
+        Path(path).write_text(
+            json.dumps(
+                {
+                    "scale": SCALE_NAME,
+                    "parameters": asdict(SCALE),
+                    "concurrency": CONCURRENCY,
+                    "python": platform.python_version(),
+                    "results": results,
+                },
+                indent=2,
+            )
+            + "\n"
+        )
+
+    if UPDATE_BASELINE:
+        stored = baseline()
+        stored["scales"].setdefault(SCALE_NAME, {}).update(
+            {
+                name: {metric: result[metric] for metric in NOISE_FLOORS}
+                for name, result in results.items()
+            }
+        )
+        BASELINE_PATH.write_text(json.dumps(stored, indent=2, sort_keys=True) + "\n")
+
+
+# ===================
+# Benchmarks
+# ===================
+
+
+@pytest.fixture(scope="module")
+def invocations() -> list[Invocation]:
+    """Synthetic invocations of the selected scale."""
+    return synthetic_invocations()
+
+
+@pytest.mark.benchmark
+@pytest.mark.timeout(300)
+@pytest.mark.asyncio
+class TestGovernanceMicroBenchmarks:
+    """
+    Per-component benchmarks under synthetic multi-tenant load.
+
+    Targets: see governance_baseline.json (p50 within TOLERANCE x baseline).
+    """
+
+    async def test_rate_limiter_memory(self, invocations):
+        """Benchmark in-memory acquire across tenants, agents and users."""
+        limiter = ExternalAgentRateLimiter(config=unlimited_rate_limits())
+        await limiter.initialize()
+
+        async def acquire(i):
+            inv = invocations[i]
+            return await limiter.acquire(
+                agent_id=inv.agent_id,
+                user_id=inv.user_id,
+                team_id=inv.team_id,
+                org_id=inv.org_id,
+            )
+
+        report(await measure("rate_limiter_memory", acquire))
+        assert (await acquire(0)).allowed is True
+        await limiter.close()
+
+    async def test_rate_limiter_redis(self, invocations):
+        """Benchmark the Lua bucket script through fakeredis."""
+        limiter = ExternalAgentRateLimiter(
+            redis_url="redis://fake", config=unlimited_rate_limits()
+        )
+        await connect_fakeredis(limiter)
+
+        async def acquire(i):
+            inv = invocations[i]
+            return await limiter.acquire(
+                agent_id=inv.agent_id,
+                user_id=inv.user_id,
+                team_id=inv.team_id,
+                org_id=inv.org_id,
+            )
+
+        report(await measure("rate_limiter_redis", acquire))
+        assert (await acquire(0)).allowed is True
+        await limiter.close()
+
+    async def test_budget_check(self, invocations):
+        """Benchmark the pre-invocation budget check."""
+        enforcer = ExternalAgentBudgetEnforcer(store=InMemoryBudgetStore())
+        budgets = agent_budgets(invocations)
+
+        async def check(i):
+            inv = invocations[i]
+            return await enforcer.check_budget(budgets[inv.agent_id], inv.cost)
+
+        report(await measure("budget_check", check))
+        assert (await check(0)).allowed is True
+
+    async def test_budget_record_usage(self, invocations):
+        """Benchmark recording usage into the in-memory store."""
+        enforcer = ExternalAgentBudgetEnforcer(store=InMemoryBudgetStore())
+        budgets = agent_budgets(invocations)
+
+        async def record(i):
+            inv = invocations[i]
+            return await enforcer.record_usage(budgets[inv.agent_id], inv.cost, True)
+
+        report(await measure("budget_record_usage", record))
+
+    async def test_budget_cached_read_redis(self, invocations):
+        """Benchmark budget reads from cached limits and Redis counters."""
+        backing = InMemoryBudgetStore()
+        for agent_id, budget in agent_budgets(invocations).items():
+            await backing.update_budget(
+                agent_id, BudgetScope(organization_id=agent_id), budget
+            )
+        store = CachedBudgetStore(backing, redis_url="redis://fake")
+        await connect_fakeredis(store)
+
+        async def read(i):
+            agent_id = invocations[i].agent_id
+            return await store.get_budget(
+                agent_id, BudgetScope(organization_id=agent_id)
+            )
+
+        report(await measure("budget_cached_read_redis", read))
+        assert (await read(0)) is not None
+        await store.close()
+
+    async def test_policy_engine(self, invocations):
+        """Benchmark policy evaluation with every tenant's policies loaded."""
+        engine = ExternalAgentPolicyEngine()
+        for policy in synthetic_policies():
+            engine.add_policy(policy)
+        contexts = [policy_context(inv) for inv in invocations]
+
+        async def evaluate(i):
+            return await engine.evaluate_policies(contexts[i])
+
+        report(await measure("policy_engine", evaluate))
+
+    async def test_approval_triggers(self, invocations):
+        """Benchmark approval trigger evaluation including payload scanning."""
+        evaluator = ApprovalTriggerEvaluator(
+            ApprovalTriggerConfig(
+                cost_threshold=1.5,
+                payload_patterns=["drop table", "rm -rf", r"delete\s+from"],
+                sensitive_data_patterns=[
+                    r"\b\d{3}-\d{2}-\d{4}\b",
+                    r"\b[\w.]+@[\w.]+\.\w+\b",
+                ],
+            )
+        )
+        contexts = [trigger_context(inv) for inv in invocations]
+
+        async def evaluate(i):
+            return await evaluator.evaluate(contexts[i])
+
+        report(await measure("approval_triggers", evaluate))
+
+    async def test_abac_evaluate(self, invocations):
+        """Benchmark ABAC evaluation with assigned policies served from memory."""
+        from studio.services.abac_service import ABACService
+
+        policies_by_user = synthetic_abac_policies()
+
+        async def get_user_policies(user_id, direct=False):
+            return policies_by_user[user_id]
+
+        service = ABACService(runtime=object(), reads=object())
+        service.get_user_policies = get_user_policies
+        resource = {"status": "active", "tier": "premium"}
+
+        async def evaluate(i):
+            return await service.evaluate(
+                invocations[i].user_id, "agent", "invoke", resource=resource
+            )
+
+        report(await measure("abac_evaluate", evaluate))
+
+
+@pytest.mark.benchmark
+@pytest.mark.timeout(300)
+@pytest.mark.asyncio
+class TestGovernanceMacroBenchmark:
+    """Benchmark of all pre-invocation checks with many invocations in flight."""
+
+    async def test_pre_invocation_checks(self, invocations):
+        """
+        Benchmark rate limit, budget, policy and trigger checks per invocation.
+
+        The checks of an invocation are gathered (as GovernanceService
+        does), and CONCURRENCY invocations are in flight at a time.
+        """
+        limiter = ExternalAgentRateLimiter(config=unlimited_rate_limits())
+        await limiter.initialize()
+        backing = InMemoryBudgetStore()
+        for agent_id, budget in agent_budgets(invocations).items():
+            await backing.update_budget(
+                agent_id, BudgetScope(organization_id=agent_id), budget
+            )
+        store = CachedBudgetStore(backing)
+        enforcer = ExternalAgentBudgetEnforcer(store=store)
+        engine = ExternalAgentPolicyEngine()
+        for policy in synthetic_policies():
+            engine.add_policy(policy)
+        evaluator = ApprovalTriggerEvaluator(ApprovalTriggerConfig(cost_threshold=1.5))
+        policy_contexts = [policy_context(inv) for inv in invocations]
+        trigger_contexts = [trigger_context(inv) for inv in invocations]
+
+        async def check_budget(inv):
+            budget = await store.get_budget(
+                inv.agent_id, BudgetScope(organization_id=inv.agent_id)
+            )
+            return await enforcer.check_budget(budget, inv.cost)
+
+        async def pre_checks(i):
+            inv = invocations[i]
+            return await asyncio.gather(
+                limiter.acquire(
+                    agent_id=inv.agent_id,
+                    user_id=inv.user_id,
+                    team_id=inv.team_id,
+                    org_id=inv.org_id,
+                ),
+                check_budget(inv),
+                engine.evaluate_policies(policy_contexts[i]),
+                evaluator.evaluate(trigger_contexts[i]),
+            )
+
+        report(
+            await measure("pre_invocation_checks", pre_checks, concurrency=CONCURRENCY)
+        )
+        await limiter.close()
@@ -0,0 +1,185 @@
+"""
+Policy Engine Performance Benchmarks
+
+Measures ExternalAgentPolicyEngine.evaluate_policies() as the number of
+policies grows:
+- 50 vs 5000 team-scoped policies (evaluation should stay near-constant)
+- CIDR, time window and role conditions on every policy
+- add_policy/remove_policy cost at 5000 policies
+
+Only the relative scaling check runs by default; the absolute latency
+targets are marked "benchmark" and run with -m benchmark. The engine is
+in-memory, so no infrastructure is needed.
+"""
+
+import statistics
+import time
+from datetime import datetime
+
+import pytest
+
+from studio_kaizen.trust.governance.policy_engine import ExternalAgentPolicyEngine
+from studio_kaizen.trust.governance.types import (
+    ExternalAgentPolicy,
+    ExternalAgentPolicyContext,
+    ExternalAgentPrincipal,
+    PolicyCondition,
+    PolicyEffect,
+)
+
+ITERATIONS = 2000
+POLICIES_PER_TEAM = 5
+
+
+def _engine(policy_count: int) -> ExternalAgentPolicyEngine:
+    """Create an engine with team-scoped policies plus a few global ones."""
+    engine = ExternalAgentPolicyEngine()
+    for i in range(policy_count):
+        engine.add_policy(
+            ExternalAgentPolicy(
+                policy_id=f"pol-{i}",
+                name=f"Policy {i}",
+                effect=PolicyEffect.DENY if i % 7 == 0 else PolicyEffect.ALLOW,
+                priority=i % 10,
+                conditions=[
+                    PolicyCondition(type="team", teams=[f"team-{i // POLICIES_PER_TEAM}"]),
+                    PolicyCondition(
+                        type="ip",
+                        ip_ranges=[f"10.{i % 256}.0.0/16", "192.168.0.0/24", "2001:db8::/32"],
+                    ),
+                    PolicyCondition(
+                        type="time",
+                        time_range={"start": "00:00", "end": "23:59", "days": [0, 1, 2, 3, 4]},
+                    ),
+                    PolicyCondition(type="role", roles=["operator", "admin"]),
+                ],
+            )
+        )
+    for i in range(3):
+        engine.add_policy(
+            ExternalAgentPolicy(
+                policy_id=f"global-{i}",
+                name=f"Global {i}",
+                effect=PolicyEffect.ALLOW,
+                conditions=[PolicyCondition(type="role", roles=["admin"])],
+            )
+        )
+    return engine
+
+
+def _context(team_id: str) -> ExternalAgentPolicyContext:
+    """Create an evaluation context for a team member."""
+    return ExternalAgentPolicyContext(
+        principal=ExternalAgentPrincipal(
+            external_agent_id="agent-001",
+            provider="custom",
+            environment="production",
+            org_id="org-001",
+            team_id=team_id,
+            roles=["operator"],
+            ip_address="192.168.0.10",
+        ),
+        action="invoke",
+        resource="agent-001",
+        timestamp=datetime(2026, 1, 5, 12, 0),  # Monday noon
+    )
+
+
+async def _measure(engine: ExternalAgentPolicyEngine, team_count: int) -> list[float]:
+    """Evaluate contexts of all teams in turn and return latencies."""
+    contexts = [_context(f"team-{i}") for i in range(team_count)]
+
+    # Warm up
+    await engine.evaluate_policies(contexts[0])
+
+    latencies = []
+    for i in range(ITERATIONS):
+        start = time.perf_counter()
+        result = await engine.evaluate_policies(contexts[i % team_count])
+        latencies.append(time.perf_counter() - start)
+
+    assert result.matched_policies, "Team policies should match"
+    return latencies
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(60)
+@pytest.mark.asyncio
+class TestPolicyEngineScaling:
+    """
+    Scaling of indexed policy evaluation (relative, machine-independent).
+
+    Target: p50 latency at 5000 policies within 3x of 50 policies
+    """
+
+    async def test_evaluation_scales_with_matching_policies_only(self):
+        """
+        Intent: Verify evaluation cost does not grow with unrelated policies.
+
+        Each team owns POLICIES_PER_TEAM policies, so an evaluation visits the
+        same number of policies at 50 and at 5000 policies in total.
+        """
+        small = await _measure(_engine(50), 50 // POLICIES_PER_TEAM)
+        large = await _measure(_engine(5000), 5000 // POLICIES_PER_TEAM)
+
+        small_median = statistics.median(small)
+        large_median = statistics.median(large)
+        large_p95 = statistics.quantiles(large, n=20)[18]
+
+        print("\n--- Policy Evaluation ---")
+        print(f"50 policies median:   {small_median * 1_000_000:.1f}us")
+        print(f"5000 policies median: {large_median * 1_000_000:.1f}us")
+        print(f"5000 policies p95:    {large_p95 * 1_000_000:.1f}us")
+
+        assert large_median < small_median * 3, "Evaluation should be near-constant"
+
+
+@pytest.mark.benchmark
+@pytest.mark.timeout(60)
+@pytest.mark.asyncio
+class TestPolicyEngineLatencyTargets:
+    """
+    Absolute latency targets (machine-dependent, run with -m benchmark).
+
+    Targets:
+    - p50 evaluation latency at 5000 policies: <1ms
+    - p50 add + remove of one policy at 5000 policies: <1ms
+    """
+
+    async def test_evaluation_latency_at_scale(self):
+        """
+        Intent: Verify evaluation at 5000 policies stays below 1ms (p50).
+        """
+        large = await _measure(_engine(5000), 5000 // POLICIES_PER_TEAM)
+
+        large_median = statistics.median(large)
+        print(f"\n5000 policies median: {large_median * 1_000_000:.1f}us")
+
+        assert large_median < 0.001, f"Median {large_median * 1000:.3f}ms exceeds 1ms"
+
+    async def test_policy_updates_at_scale(self):
+        """
+        Intent: Verify keeping the index sorted stays cheap at 5000 policies.
+
+        Target: add + remove of one policy <1ms (p50).
+        """
+        engine = _engine(5000)
+        policy = ExternalAgentPolicy(
+            policy_id="pol-new",
+            name="New Policy",
+            effect=PolicyEffect.ALLOW,
+            priority=5,
+            conditions=[PolicyCondition(type="team", teams=["team-1"])],
+        )
+
+        latencies = []
+        for _ in range(200):
+            start = time.perf_counter()
+            engine.add_policy(policy)
+            engine.remove_policy(policy.policy_id)
+            latencies.append(time.perf_counter() - start)
+
+        median_latency = statistics.median(latencies)
+        print(f"\nAdd + remove median: {median_latency * 1_000_000:.1f}us")
+
+        assert median_latency < 0.001
@@ -15,6 +15,9 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../src"))
 # Set testing environment - MUST be first!
 os.environ["ENVIRONMENT"] = "testing"
 
+# Fixtures write models directly; keep reads uncached so tests see them
+os.environ["QUERY_CACHE_ENABLED"] = "false"
+
 # Import config to get test database URL
 from studio.config import get_database_url  # noqa: E402
 
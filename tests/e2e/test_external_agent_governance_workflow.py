@@ -35,8 +35,6 @@ class TestExternalAgentGovernanceWorkflow:
                    governance-status shows remaining_budget=0
         """
         # Arrange
-        from studio_kaizen.trust.governance import ExternalAgentBudget
-
         runtime = AsyncLocalRuntime()
         governance_service = GovernanceService(runtime=runtime)
         await governance_service.initialize()
@@ -59,14 +57,6 @@ class TestExternalAgentGovernanceWorkflow:
                 budget_limit_monthly=50.0,  # $50/month limit
             )
 
-            # Initialize budget with 0 spent
-            budget = ExternalAgentBudget(
-                external_agent_id=agent["id"],
-                monthly_budget_usd=50.0,
-                monthly_spent_usd=0.0,
-            )
-            governance_service._budget_cache[agent["id"]] = budget
-
             # Act - Make 10 invocations at $5 each
             successful_invocations = 0
             for i in range(10):
@@ -91,8 +81,10 @@ class TestExternalAgentGovernanceWorkflow:
                 successful_invocations == 10
             ), f"Expected 10 successful invocations, got {successful_invocations}"
 
-            # Get current budget from cache
-            current_budget = governance_service._budget_cache[agent["id"]]
+            # Get current budget (cached limits, counted spend)
+            current_budget = await governance_service._get_agent_budget(
+                agent["id"], test_organization["id"]
+            )
             assert (
                 current_budget.monthly_spent_usd == 50.0
             ), "Budget should be fully spent"
@@ -55,6 +55,23 @@ async def test_external_agent_with_budget(authenticated_owner_client):
     return {"agent": agent, "user": user, "org": org}
 
 
+async def set_budget_state(governance_service, budget, organization_id):
+    """Store a budget's limits and record its monthly spend as real usage."""
+    from studio_kaizen.trust.governance import BudgetScope
+
+    await governance_service.budget_store.update_budget(
+        budget.external_agent_id,
+        BudgetScope(organization_id=organization_id),
+        budget,
+    )
+    await governance_service.record_invocation_cost(
+        external_agent_id=budget.external_agent_id,
+        organization_id=organization_id,
+        actual_cost=budget.monthly_spent_usd,
+        execution_success=True,
+    )
+
+
 @pytest.mark.integration
 class TestExternalAgentGovernanceBudget:
     """Test budget enforcement with real PostgreSQL."""
@@ -72,7 +89,7 @@ class TestExternalAgentGovernanceBudget:
         agent = test_external_agent_with_budget["agent"]
         org = test_external_agent_with_budget["org"]
 
-        # Simulate 95% budget usage by updating budget state in cache
+        # Simulate 95% budget usage with a real usage record
         from kaizen.trust.governance import ExternalAgentBudget
 
         budget = ExternalAgentBudget(
@@ -80,7 +97,7 @@ class TestExternalAgentGovernanceBudget:
             monthly_budget_usd=100.0,
             monthly_spent_usd=95.0,  # 95% used
         )
-        governance_service._budget_cache[agent["id"]] = budget
+        await set_budget_state(governance_service, budget, org["id"])
 
         # Act - Check budget with $10 cost (would exceed budget)
         result = await governance_service.check_budget(
@@ -116,7 +133,7 @@ class TestExternalAgentGovernanceBudget:
             monthly_budget_usd=100.0,
             monthly_spent_usd=50.0,  # 50% used
         )
-        governance_service._budget_cache[agent["id"]] = budget
+        await set_budget_state(governance_service, budget, org["id"])
 
         # Act - Check budget with $10 cost (within budget)
         result = await governance_service.check_budget(
@@ -271,7 +288,7 @@ class TestExternalAgentGovernanceStatus:
             monthly_spent_usd=60.0,
             monthly_execution_count=50,
         )
-        governance_service._budget_cache[agent["id"]] = budget
+        await set_budget_state(governance_service, budget, org["id"])
 
         # Act
         status = await governance_service.get_governance_status(
@@ -233,6 +233,40 @@ class TestWorkUnitsFiltering:
         assert data["page"] == 1
         assert data["pageSize"] == 2
 
+    @pytest.mark.asyncio
+    async def test_search_matches_past_first_page(self, authenticated_client):
+        """Should keep paging when the search match is not on the first page."""
+        client, user = authenticated_client
+
+        # The match is the oldest unit, behind two newer non-matching ones
+        for name in ("Needle Unit", "Other Unit 1", "Other Unit 2"):
+            await client.post(
+                "/api/v1/work-units",
+                json={"name": name, "type": "atomic"},
+            )
+
+        response = await client.get("/api/v1/work-units?search=needle&pageSize=1")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["items"] == []
+        assert data["hasMore"] is True
+
+        found = []
+        while data["nextCursor"]:
+            response = await client.get(
+                "/api/v1/work-units",
+                params={
+                    "search": "needle",
+                    "pageSize": 1,
+                    "cursor": data["nextCursor"],
+                },
+            )
+            assert response.status_code == 200
+            data = response.json()
+            found.extend(item["name"] for item in data["items"])
+
+        assert found == ["Needle Unit"]
+
 
 @pytest.mark.integration
 @pytest.mark.timeout(10)
@@ -0,0 +1,83 @@
+"""
+Tier 2: Workflow Template Integration Tests
+
+Tests that cached single-node workflow templates bind each call's parameters
+through the runtime's node-scoped inputs against real DataFlow nodes.
+NO MOCKING - uses actual PostgreSQL, DataFlow nodes, and AsyncLocalRuntime.
+"""
+
+import pytest
+from kailash.runtime import AsyncLocalRuntime
+from studio.services.workflow_templates import _run_node
+
+
+@pytest.mark.integration
+@pytest.mark.timeout(5)
+class TestTemplateParameterBinding:
+    """Test that template calls run with their own parameters."""
+
+    @pytest.mark.asyncio
+    async def test_create_and_read_bind_call_values(
+        self, test_db, organization_factory
+    ):
+        """Two calls of one template should write and read their own records."""
+        runtime = AsyncLocalRuntime()
+        first = organization_factory()
+        second = organization_factory()
+
+        await _run_node(runtime, "OrganizationCreateNode", "create", first)
+        created = await _run_node(runtime, "OrganizationCreateNode", "create", second)
+        read = await _run_node(
+            runtime, "OrganizationReadNode", "read", {"id": second["id"]}
+        )
+
+        # The template config only holds empty placeholders ("" ids and names)
+        assert created["create"]["id"] == second["id"]
+        assert read["read"]["id"] == second["id"]
+        assert read["read"]["name"] == second["name"]
+        assert read["read"]["slug"] == second["slug"]
+
+    @pytest.mark.asyncio
+    async def test_update_binds_filter(self, test_db, organization_factory):
+        """An update should only touch the record matched by the call's filter."""
+        runtime = AsyncLocalRuntime()
+        target = organization_factory()
+        other = organization_factory()
+        for org in (target, other):
+            await _run_node(runtime, "OrganizationCreateNode", "create", org)
+
+        await _run_node(
+            runtime,
+            "OrganizationUpdateNode",
+            "update",
+            {"filter": {"id": target["id"]}, "fields": {"name": "Renamed Org"}},
+        )
+        updated = await _run_node(
+            runtime, "OrganizationReadNode", "read", {"id": target["id"]}
+        )
+        untouched = await _run_node(
+            runtime, "OrganizationReadNode", "read", {"id": other["id"]}
+        )
+
+        assert updated["read"]["name"] == "Renamed Org"
+        assert untouched["read"]["name"] == other["name"]
+
+    @pytest.mark.asyncio
+    async def test_list_binds_filter(self, test_db, organization_factory):
+        """A list call should apply its filter, not the template's placeholder."""
+        runtime = AsyncLocalRuntime()
+        orgs = [organization_factory() for _ in range(2)]
+        for org in orgs:
+            await _run_node(runtime, "OrganizationCreateNode", "create", org)
+
+        listed = {}
+        for org in orgs:
+            results = await _run_node(
+                runtime,
+                "OrganizationListNode",
+                "list",
+                {"filter": {"id": org["id"]}, "limit": 10, "offset": 0},
+            )
+            listed[org["id"]] = [r["id"] for r in results["list"]["records"]]
+
+        assert listed == {org["id"]: [org["id"]] for org in orgs}
@@ -4,8 +4,10 @@ Tier 1 Unit Tests: Approval Manager
 Tests approval workflow management without any infrastructure dependencies.
 """
 
+import asyncio
 import pytest
 from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
 
 from studio_kaizen.trust.governance.types import (
     ApprovalStatus,
@@ -18,6 +20,7 @@ from studio_kaizen.trust.governance.config import (
 )
 from studio_kaizen.trust.governance.store import InMemoryApprovalStore
 from studio_kaizen.trust.governance.approval_manager import (
+    ApprovalExpiryScheduler,
     ExternalAgentApprovalManager,
     ApprovalNotFoundError,
     UnauthorizedApproverError,
@@ -90,6 +93,37 @@ class TestExternalAgentApprovalManager:
         assert result.required is True
         assert "cost_threshold" in result.triggers_matched
 
+    @pytest.mark.asyncio
+    async def test_history_only_read_for_history_triggers(self):
+        """Test history lookups are skipped unless a trigger needs them."""
+        history = AsyncMock()
+        history.is_first_invocation.return_value = True
+        manager = ExternalAgentApprovalManager(
+            trigger_config=ApprovalTriggerConfig(cost_threshold=100.0),
+            history_provider=history,
+        )
+
+        result = await manager.check_approval_required(
+            agent_id="agent-001",
+            payload={},
+            user_id="user-001",
+            organization_id="org-001",
+        )
+
+        assert result.required is False
+        history.is_first_invocation.assert_not_awaited()
+        history.get_invocation_count.assert_not_awaited()
+
+        manager.trigger_config.require_first_invocation = True
+        result = await manager.check_approval_required(
+            agent_id="agent-001",
+            payload={},
+            user_id="user-001",
+            organization_id="org-001",
+        )
+
+        assert result.triggers_matched == ["first_invocation"]
+
     @pytest.mark.asyncio
     async def test_create_approval_request(self, manager):
         """Test creating an approval request."""
@@ -408,6 +442,74 @@ class TestExternalAgentApprovalManager:
             )
 
 
+class TestApprovalExpiry:
+    """Tests for batched expiry processing and the expiry scheduler."""
+
+    async def _save_requests(self, store, count, expires_in):
+        """Save pending requests expiring after the given delta."""
+        for i in range(count):
+            await store.save(ApprovalRequest(
+                id=f"req-{expires_in.total_seconds():.0f}-{i}",
+                external_agent_id="agent-001",
+                organization_id="org-001",
+                requested_by_user_id=f"user-{i}",
+                trigger_reason="Policy",
+                expires_at=datetime.utcnow() + expires_in,
+            ))
+
+    @pytest.mark.asyncio
+    async def test_all_due_requests_processed_in_batches(self):
+        """Test that due requests beyond one batch are all processed."""
+        store = InMemoryApprovalStore()
+        notifications = AsyncMock()
+        manager = ExternalAgentApprovalManager(
+            store=store,
+            workflow_config=ApprovalWorkflowConfig(auto_reject_on_timeout=True),
+            notification_service=notifications,
+        )
+        await self._save_requests(store, 25, timedelta(hours=-1))
+        await self._save_requests(store, 5, timedelta(hours=1))
+        store.update_many = AsyncMock(wraps=store.update_many)
+
+        expired = await manager.process_expired_requests(batch_size=10)
+
+        assert len(expired) == 25
+        assert all(r.status == ApprovalStatus.EXPIRED for r in expired)
+        assert all(r.rejections[-1].approver_id == "system" for r in expired)
+        assert [len(call.args[0]) for call in store.update_many.await_args_list] == [10, 10, 5]
+        assert notifications.notify_requestor.await_count == 25
+        assert await store.get_expired() == []
+
+    @pytest.mark.asyncio
+    async def test_notification_failures_do_not_stop_processing(self):
+        """Test that a failing notification does not affect the batch."""
+        store = InMemoryApprovalStore()
+        notifications = AsyncMock()
+        notifications.notify_requestor.side_effect = [RuntimeError("smtp down"), None, None]
+        manager = ExternalAgentApprovalManager(store=store, notification_service=notifications)
+        await self._save_requests(store, 3, timedelta(hours=-1))
+
+        expired = await manager.process_expired_requests()
+
+        assert len(expired) == 3
+
+    @pytest.mark.asyncio
+    async def test_scheduler_processes_in_background(self):
+        """Test that the scheduler runs until stopped."""
+        store = InMemoryApprovalStore()
+        manager = ExternalAgentApprovalManager(store=store)
+        await self._save_requests(store, 3, timedelta(hours=-1))
+        scheduler = ApprovalExpiryScheduler(manager, interval_seconds=0.01)
+
+        scheduler.start()
+        assert scheduler.running
+        await asyncio.sleep(0.05)
+        await scheduler.stop()
+
+        assert not scheduler.running
+        assert await store.get_expired() == []
+
+
 class TestApprovalErrors:
     """Tests for approval error classes."""
 
@@ -427,6 +427,53 @@ class TestInMemoryApprovalStore:
         assert len(expired) == 1
         assert expired[0].id == "req-001"
 
+    @pytest.mark.asyncio
+    async def test_get_expired_earliest_first_with_limit(self, store):
+        """Test that expired requests come from the expiry index in order."""
+        now = datetime.utcnow()
+        for i, hours in enumerate([3, 1, 2, -1]):
+            await store.save(ApprovalRequest(
+                id=f"req-{i}",
+                external_agent_id="agent-001",
+                organization_id="org-001",
+                requested_by_user_id="user-001",
+                trigger_reason="Policy",
+                expires_at=now - timedelta(hours=hours),
+            ))
+
+        expired = await store.get_expired(limit=2)
+        assert [r.id for r in expired] == ["req-0", "req-2"]
+
+        # Not processed yet: returned again
+        expired = await store.get_expired()
+        assert [r.id for r in expired] == ["req-0", "req-2", "req-1"]
+
+    @pytest.mark.asyncio
+    async def test_get_expired_skips_decided_and_rescheduled(self, store):
+        """Test that decided, re-scheduled and deleted requests are not returned."""
+        now = datetime.utcnow()
+        requests = [
+            ApprovalRequest(
+                id=f"req-{i}",
+                external_agent_id="agent-001",
+                organization_id="org-001",
+                requested_by_user_id="user-001",
+                trigger_reason="Policy",
+                expires_at=now - timedelta(hours=1),
+            )
+            for i in range(4)
+        ]
+        for request in requests:
+            await store.save(request)
+
+        requests[0].status = ApprovalStatus.EXPIRED
+        requests[1].expires_at = now + timedelta(hours=1)
+        await store.update_many(requests[:2])
+        await store.delete("req-2")
+
+        expired = await store.get_expired()
+        assert [r.id for r in expired] == ["req-3"]
+
     @pytest.mark.asyncio
     async def test_delete(self, store, sample_request):
         """Test deleting a request."""
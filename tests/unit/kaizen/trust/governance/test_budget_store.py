@@ -0,0 +1,269 @@
+"""
+Tier 1 Unit Tests: Cached Budget Store
+
+Tests CachedBudgetStore limit caching and spend counters without
+infrastructure. Redis behaviour uses fakeredis (with Lua support).
+"""
+
+import pytest
+from dataclasses import replace
+from unittest.mock import AsyncMock, patch
+
+from studio_kaizen.trust.governance.store import (
+    CachedBudgetStore,
+    InMemoryBudgetStore,
+)
+from studio_kaizen.trust.governance.types import (
+    BudgetScope,
+    BudgetUsageRecord,
+    ExternalAgentBudget,
+)
+
+SCOPE = BudgetScope(organization_id="org-001")
+
+
+class CountingBudgetStore(InMemoryBudgetStore):
+    """In-memory store that counts reads and reports recorded spend."""
+
+    def __init__(self):
+        super().__init__()
+        self.reads = 0
+
+    async def get_budget(self, agent_id, scope):
+        """Get budget with spend aggregated from recorded usage."""
+        self.reads += 1
+        budget = await super().get_budget(agent_id, scope)
+        if budget is None:
+            return None
+        usage = self._period_usage[self._make_key(agent_id, scope)]
+        return replace(
+            budget,
+            monthly_spent_usd=usage["cost"],
+            daily_spent_usd=usage["cost"],
+            monthly_execution_count=usage["invocations"]
+        )
+
+
+def _record_during_first_read(backing_store, recorder, cost: float):
+    """Make the first read of the wrapped store record usage after reading."""
+    read = backing_store.get_budget
+
+    async def read_then_record(agent_id, scope):
+        budget = await read(agent_id, scope)
+        if backing_store.reads == 1:
+            await recorder.record_usage(_record(cost))
+        return budget
+
+    backing_store.get_budget = read_then_record
+
+
+def _record(cost: float, agent_id: str = "agent-001") -> BudgetUsageRecord:
+    """Create a usage record."""
+    return BudgetUsageRecord(
+        invocation_id=f"inv-{cost}",
+        agent_id=agent_id,
+        scope=SCOPE,
+        cost=cost
+    )
+
+
+@pytest.fixture
+async def backing_store():
+    """Create the wrapped store with one agent."""
+    store = CountingBudgetStore()
+    await store.update_budget(
+        "agent-001",
+        SCOPE,
+        ExternalAgentBudget(external_agent_id="agent-001", monthly_budget_usd=100.0)
+    )
+    return store
+
+
+class TestCachedBudgetStoreInProcess:
+    """Tests for CachedBudgetStore without Redis."""
+
+    @pytest.fixture
+    async def store(self, backing_store):
+        """Create cached store with in-process counters."""
+        store = CachedBudgetStore(backing_store)
+        await store.initialize()
+        yield store
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_limits_cached_within_ttl(self, store, backing_store):
+        """Test repeated reads do not reach the wrapped store."""
+        for _ in range(5):
+            budget = await store.get_budget("agent-001", SCOPE)
+
+        assert budget.monthly_budget_usd == 100.0
+        assert backing_store.reads == 1
+
+    @pytest.mark.asyncio
+    async def test_limits_reloaded_after_ttl(self, backing_store):
+        """Test limits are reloaded once the TTL expired."""
+        store = CachedBudgetStore(backing_store, ttl_seconds=0)
+
+        await store.get_budget("agent-001", SCOPE)
+        await store.get_budget("agent-001", SCOPE)
+
+        assert backing_store.reads == 2
+
+    @pytest.mark.asyncio
+    async def test_record_usage_counts_spend(self, store, backing_store):
+        """Test recorded usage is persisted and counted without reloading."""
+        await store.get_budget("agent-001", SCOPE)
+
+        await store.record_usage(_record(10.0))
+        await store.record_usage(_record(5.0))
+        budget = await store.get_budget("agent-001", SCOPE)
+
+        assert budget.monthly_spent_usd == 15.0
+        assert budget.daily_spent_usd == 15.0
+        assert budget.monthly_execution_count == 2
+        assert len(backing_store._usage_records) == 2
+        assert backing_store.reads == 1
+
+    @pytest.mark.asyncio
+    async def test_update_budget_reloads_limits(self, store, backing_store):
+        """Test update_budget writes through and drops the cached limits."""
+        await store.get_budget("agent-001", SCOPE)
+
+        await store.update_budget(
+            "agent-001",
+            SCOPE,
+            ExternalAgentBudget(external_agent_id="agent-001", monthly_budget_usd=200.0)
+        )
+        budget = await store.get_budget("agent-001", SCOPE)
+
+        assert budget.monthly_budget_usd == 200.0
+        assert backing_store.reads == 2
+
+    @pytest.mark.asyncio
+    async def test_usage_during_seed_counted(self, store, backing_store):
+        """Test usage recorded while the counters are seeded is not lost."""
+        await backing_store.record_usage(_record(7.0))
+        _record_during_first_read(backing_store, store, 30.0)
+
+        seeded = await store.get_budget("agent-001", SCOPE)
+        budget = await store.get_budget("agent-001", SCOPE)
+
+        assert seeded.monthly_spent_usd == 37.0
+        assert budget.monthly_spent_usd == 37.0
+        assert budget.monthly_execution_count == 2
+
+    @pytest.mark.asyncio
+    async def test_unknown_agent(self, store):
+        """Test unknown agents have no budget."""
+        assert await store.get_budget("agent-999", SCOPE) is None
+
+
+class TestCachedBudgetStoreRedis:
+    """Tests for CachedBudgetStore workers sharing Redis counters."""
+
+    @pytest.fixture
+    async def workers(self, backing_store):
+        """Create two cached stores sharing one fakeredis server."""
+        pytest.importorskip("lupa")
+        fakeredis = pytest.importorskip("fakeredis")
+
+        server = fakeredis.FakeServer()
+        stores = []
+        for _ in range(2):
+            store = CachedBudgetStore(backing_store, redis_url="redis://fake")
+            with patch(
+                "redis.asyncio.from_url",
+                return_value=fakeredis.aioredis.FakeRedis(server=server)
+            ):
+                await store.initialize()
+            stores.append(store)
+        yield stores
+        for store in stores:
+            await store.close()
+
+    @pytest.mark.asyncio
+    async def test_workers_share_spend(self, workers, backing_store):
+        """Test usage recorded by one worker is seen by the other."""
+        first, second = workers
+        await first.get_budget("agent-001", SCOPE)
+
+        await second.record_usage(_record(30.0))
+        await first.record_usage(_record(20.0))
+        budget = await first.get_budget("agent-001", SCOPE)
+
+        assert budget.monthly_spent_usd == 50.0
+        assert budget.monthly_execution_count == 2
+        assert backing_store.reads == 1
+
+    @pytest.mark.asyncio
+    async def test_usage_before_seed_counted_once(self, workers):
+        """Test usage recorded before the counters exist is not added twice."""
+        first, second = workers
+
+        await second.record_usage(_record(30.0))
+        budget = await first.get_budget("agent-001", SCOPE)
+        await second.record_usage(_record(5.0))
+        budget_after = await second.get_budget("agent-001", SCOPE)
+
+        assert budget.monthly_spent_usd == 30.0
+        assert budget_after.monthly_spent_usd == 35.0
+
+    @pytest.mark.asyncio
+    async def test_usage_during_seed_counted(self, workers, backing_store):
+        """Test usage recorded by another worker during a seed is not lost."""
+        first, second = workers
+        await backing_store.record_usage(_record(7.0))
+        _record_during_first_read(backing_store, second, 30.0)
+
+        seeded = await first.get_budget("agent-001", SCOPE)
+        budget = await second.get_budget("agent-001", SCOPE)
+
+        assert seeded.monthly_spent_usd == 37.0
+        assert budget.monthly_spent_usd == 37.0
+        assert budget.daily_spent_usd == 37.0
+        assert budget.monthly_execution_count == 2
+
+    @pytest.mark.asyncio
+    async def test_reads_during_seed_use_store(self, workers, backing_store):
+        """Test a worker reading while another seeds gets the stored spend."""
+        first, second = workers
+        await backing_store.record_usage(_record(7.0))
+        read = backing_store.get_budget
+        during = []
+
+        async def read_during_seed(agent_id, scope):
+            budget = await read(agent_id, scope)
+            if backing_store.reads == 1:
+                during.append(await second.get_budget(agent_id, scope))
+            return budget
+
+        backing_store.get_budget = read_during_seed
+        await first.get_budget("agent-001", SCOPE)
+
+        assert during[0].monthly_spent_usd == 7.0
+
+    @pytest.mark.asyncio
+    async def test_update_budget_invalidates_other_workers(self, workers, backing_store):
+        """Test a limit change in one worker is seen by the other."""
+        first, second = workers
+        await first.get_budget("agent-001", SCOPE)
+
+        await second.update_budget(
+            "agent-001",
+            SCOPE,
+            ExternalAgentBudget(external_agent_id="agent-001", monthly_budget_usd=200.0)
+        )
+        budget = await first.get_budget("agent-001", SCOPE)
+
+        assert budget.monthly_budget_usd == 200.0
+
+    @pytest.mark.asyncio
+    async def test_redis_error_falls_back_to_store(self, workers, backing_store):
+        """Test Redis failures read the budget from the wrapped store."""
+        first, _ = workers
+        await backing_store.record_usage(_record(7.0))
+        first._script = AsyncMock(side_effect=ConnectionError("redis down"))
+
+        budget = await first.get_budget("agent-001", SCOPE)
+
+        assert budget.monthly_spent_usd == 7.0
@@ -4,6 +4,8 @@ Tier 1 Unit Tests: Approval Notifications
 Tests notification adapters without any infrastructure dependencies.
 """
 
+import asyncio
+
 import pytest
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, patch
@@ -16,6 +18,8 @@ from studio_kaizen.trust.governance.notifications import (
     ApproverInfo,
     ApprovalNotificationService,
     EmailNotificationAdapter,
+    NotificationAdapter,
+    NotificationDispatcher,
     SlackNotificationAdapter,
     TeamsNotificationAdapter,
     WebhookNotificationAdapter,
@@ -392,3 +396,150 @@ class TestApprovalNotificationService:
             )
             assert "admin-001" in results
             assert results["admin-001"] is False
+
+
+class RecordingAdapter(NotificationAdapter):
+    """Adapter that records sends and takes a fixed time per message."""
+
+    def __init__(self, delay: float = 0.0, succeed: bool = True):
+        self.delay = delay
+        self.succeed = succeed
+        self.sent: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def send_approval_request(self, request, approver, approval_url=None):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        self.sent.append(approver.user_id)
+        return self.succeed
+
+    async def send_decision_notification(self, request, recipient, decision, reason):
+        return self.succeed
+
+
+class TestNotificationDispatcher:
+    """Tests for concurrent notification fan-out."""
+
+    @pytest.fixture
+    def sample_request(self):
+        """Create a sample approval request."""
+        return ApprovalRequest(
+            id="req-001",
+            external_agent_id="agent-001",
+            organization_id="org-001",
+            requested_by_user_id="user-001",
+            trigger_reason="Cost exceeds threshold",
+            payload_summary="Execute financial transaction",
+            created_at=datetime.utcnow(),
+            expires_at=datetime.utcnow() + timedelta(hours=24),
+        )
+
+    def _approvers(self, count, channels=("email",)):
+        return [
+            ApproverInfo(user_id=f"admin-{i}", notification_channels=list(channels))
+            for i in range(count)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_approvers_are_notified_concurrently(self, sample_request):
+        """Test that sends overlap instead of running one after another."""
+        adapter = RecordingAdapter(delay=0.05)
+        dispatcher = NotificationDispatcher({"email": adapter})
+
+        start = asyncio.get_running_loop().time()
+        results = await dispatcher.dispatch(sample_request, self._approvers(10))
+        elapsed = asyncio.get_running_loop().time() - start
+
+        assert all(results.values())
+        assert len(adapter.sent) == 10
+        assert elapsed < 0.25
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, sample_request):
+        """Test that at most max_concurrency messages are in flight."""
+        adapter = RecordingAdapter(delay=0.01)
+        dispatcher = NotificationDispatcher({"email": adapter}, max_concurrency=3)
+
+        await dispatcher.dispatch(sample_request, self._approvers(10))
+
+        assert adapter.max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_approvers_fall_back_to_next_channel(self, sample_request):
+        """Test that only approvers whose first channel failed try the next one."""
+        email = RecordingAdapter(succeed=False)
+        webhook = RecordingAdapter()
+        dispatcher = NotificationDispatcher({"email": email, "webhook": webhook})
+        approvers = [
+            ApproverInfo(user_id="admin-001", notification_channels=["email", "webhook"]),
+            ApproverInfo(user_id="admin-002", notification_channels=["webhook", "email"]),
+            ApproverInfo(user_id="admin-003", notification_channels=["email"]),
+        ]
+
+        results = await dispatcher.dispatch(sample_request, approvers)
+
+        assert results == {"admin-001": True, "admin-002": True, "admin-003": False}
+        assert sorted(email.sent) == ["admin-001", "admin-003"]
+        assert sorted(webhook.sent) == ["admin-001", "admin-002"]
+
+    @pytest.mark.asyncio
+    async def test_shared_webhook_gets_one_message(self, sample_request):
+        """Test that approvers on the same Slack webhook are batched."""
+        adapter = SlackNotificationAdapter(webhook_url="https://hooks.slack.com/services/test")
+        dispatcher = NotificationDispatcher({"slack": adapter})
+        approvers = self._approvers(5, channels=["slack"])
+
+        with patch.object(adapter, "_post_webhook", new_callable=AsyncMock, return_value=True) as mock_post:
+            results = await dispatcher.dispatch(sample_request, approvers)
+
+        assert all(results.values())
+        mock_post.assert_awaited_once()
+        fields = mock_post.await_args.args[0]["blocks"][1]["fields"]
+        assert "admin-0, admin-1, admin-2, admin-3, admin-4" in fields[-1]["text"]
+
+    @pytest.mark.asyncio
+    async def test_default_batch_sends_per_approver(self, sample_request):
+        """Test that non-batching adapters send a batch one message per approver."""
+        adapter = RecordingAdapter(delay=0.01)
+
+        sent = await adapter.send_approval_request_batch(
+            sample_request, self._approvers(3)
+        )
+        failing = await RecordingAdapter(succeed=False).send_approval_request_batch(
+            sample_request, self._approvers(2)
+        )
+
+        assert sent is True
+        assert sorted(adapter.sent) == ["admin-0", "admin-1", "admin-2"]
+        assert adapter.max_in_flight == 3
+        assert failing is False
+
+    @pytest.mark.asyncio
+    async def test_latency_is_recorded_per_channel(self, sample_request):
+        """Test that each message is counted in its channel's statistics."""
+        email = RecordingAdapter(delay=0.01)
+        webhook = RecordingAdapter(succeed=False)
+        dispatcher = NotificationDispatcher({"email": email, "webhook": webhook})
+        approvers = self._approvers(2) + self._approvers(1, channels=["webhook"])
+
+        await dispatcher.dispatch(sample_request, approvers)
+
+        assert dispatcher.latency["email"].messages == 2
+        assert dispatcher.latency["email"].failures == 0
+        assert dispatcher.latency["email"].mean_seconds >= 0.01
+        assert dispatcher.latency["webhook"].failures == 1
+
+    @pytest.mark.asyncio
+    async def test_service_close_closes_adapters(self):
+        """Test that closing the service releases adapter sessions."""
+        service = ApprovalNotificationService()
+        adapter = SlackNotificationAdapter(webhook_url="https://hooks.slack.com/services/test")
+        service.register_adapter("slack", adapter)
+
+        with patch.object(adapter, "close", new_callable=AsyncMock) as mock_close:
+            await service.close()
+
+        mock_close.assert_awaited_once()
@@ -551,3 +551,103 @@ class TestPolicyEvaluationTiming:
         result = await engine.evaluate_policies(context)
 
         assert result.evaluation_time_ms >= 0
+
+
+class TestPolicyEngineIndex:
+    """Tests for compiled and indexed policy evaluation."""
+
+    def _context(self, environment="production", team_id=None, ip_address=None):
+        """Create test context."""
+        return ExternalAgentPolicyContext(
+            principal=ExternalAgentPrincipal(
+                external_agent_id="agent-001",
+                provider="custom",
+                environment=environment,
+                org_id="org-001",
+                team_id=team_id,
+                ip_address=ip_address
+            ),
+            action="invoke",
+            resource="agent-001"
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("ip_address,allowed", [
+        ("10.1.2.3", True),
+        ("10.2.0.1", False),
+        ("192.168.0.7", True),
+        ("2001:db8::1", True),
+        ("not-an-ip", False),
+        (None, False),
+    ])
+    async def test_ip_ranges(self, ip_address, allowed):
+        """Test single IPs and IPv4/IPv6 CIDR ranges."""
+        engine = ExternalAgentPolicyEngine()
+        engine.add_policy(ExternalAgentPolicy(
+            policy_id="office",
+            name="Office",
+            effect=PolicyEffect.ALLOW,
+            conditions=[
+                PolicyCondition(
+                    type="ip",
+                    ip_ranges=["10.1.0.0/16", "192.168.0.7", "2001:db8::/32", "bad/8"]
+                )
+            ]
+        ))
+
+        result = await engine.evaluate_policies(self._context(ip_address=ip_address))
+
+        assert (result.effect == PolicyEffect.ALLOW) is allowed
+
+    @pytest.mark.asyncio
+    async def test_priority_order_across_buckets(self):
+        """Test that environment, team and unindexed policies keep priority order."""
+        engine = ExternalAgentPolicyEngine(
+            conflict_resolution_strategy=ConflictResolutionStrategy.FIRST_MATCH
+        )
+        for policy_id, priority, condition in [
+            ("any", 1, PolicyCondition(type="role", roles=[])),
+            ("env", 5, PolicyCondition(type="environment", environments=["production"])),
+            ("team", 10, PolicyCondition(type="team", teams=["team-a"])),
+        ]:
+            engine.add_policy(ExternalAgentPolicy(
+                policy_id=policy_id,
+                name=policy_id,
+                effect=PolicyEffect.ALLOW,
+                priority=priority,
+                conditions=[condition]
+            ))
+
+        assert (await engine.evaluate_policies(
+            self._context(team_id="team-a")
+        )).matched_policies == ["team"]
+        assert (await engine.evaluate_policies(
+            self._context(team_id="team-b")
+        )).matched_policies == ["env"]
+        assert (await engine.evaluate_policies(
+            self._context(environment="staging")
+        )).matched_policies == ["any"]
+
+    @pytest.mark.asyncio
+    async def test_remove_and_replace_update_index(self):
+        """Test that removed or replaced policies leave their buckets."""
+        engine = ExternalAgentPolicyEngine()
+        engine.add_policy(ExternalAgentPolicy(
+            policy_id="pol-001",
+            name="Staging",
+            effect=PolicyEffect.ALLOW,
+            conditions=[PolicyCondition(type="environment", environments=["staging"])]
+        ))
+        engine.add_policy(ExternalAgentPolicy(
+            policy_id="pol-001",
+            name="Production",
+            effect=PolicyEffect.ALLOW,
+            conditions=[PolicyCondition(type="environment", environments=["production"])]
+        ))
+
+        result = await engine.evaluate_policies(self._context())
+        assert result.matched_policies == ["pol-001"]
+        assert "staging" not in engine._by_environment
+
+        engine.remove_policy("pol-001")
+        assert engine._by_environment == {}
@@ -164,6 +164,22 @@ class TestRateLimiterExceeded:
         assert "minute" in result.current_usage
         assert result.current_usage["minute"] == 3
 
+    @pytest.mark.asyncio
+    async def test_zero_limit_blocks_first_request(self):
+        """Test a limit of 0 blocks a key that has no recorded usage yet."""
+        limiter = ExternalAgentRateLimiter(
+            config=RateLimitConfig(requests_per_minute=0)
+        )
+
+        result = await limiter.check_rate_limit(
+            agent_id="agent-001",
+            user_id="user-001"
+        )
+
+        assert result.allowed is False
+        assert result.limit_exceeded == "requests_per_minute"
+        assert result.retry_after_seconds == 1
+
 
 class TestRateLimiterWindowExpiry:
     """Tests for rate limit window expiration."""
@@ -203,6 +219,64 @@ class TestRateLimiterWindowExpiry:
             assert result.remaining == 5
 
 
+    @pytest.mark.asyncio
+    async def test_window_slides_per_second(self, limiter):
+        """Test that invocations leave the minute window one by one."""
+        with patch.object(time, 'time', return_value=1000.0):
+            for i in range(3):
+                await limiter.record_invocation(agent_id="agent-001", user_id="user-001")
+        with patch.object(time, 'time', return_value=1030.0):
+            for i in range(2):
+                await limiter.record_invocation(agent_id="agent-001", user_id="user-001")
+            result = await limiter.check_rate_limit(agent_id="agent-001", user_id="user-001")
+            assert result.allowed is False
+            assert result.retry_after_seconds == 30
+
+        with patch.object(time, 'time', return_value=1060.0):
+            result = await limiter.check_rate_limit(agent_id="agent-001", user_id="user-001")
+            assert result.allowed is True
+            assert result.current_usage == {"minute": 2, "hour": 5, "day": 5}
+
+    @pytest.mark.asyncio
+    async def test_idle_keys_evicted(self, limiter):
+        """Test that keys idle for a full day are dropped from memory."""
+        with patch.object(time, 'time', return_value=1000.0):
+            await limiter.record_invocation(agent_id="agent-001", user_id="user-001")
+        with patch.object(time, 'time', return_value=1000.0 + 2 * 86400):
+            await limiter.record_invocation(agent_id="agent-002", user_id="user-001")
+
+        assert len(limiter._counters) == 1
+
+    @pytest.mark.asyncio
+    async def test_acquire_records_only_allowed(self, limiter):
+        """Test that acquire records allowed calls and not denied ones."""
+        with patch.object(time, 'time', return_value=1000.0):
+            results = [
+                await limiter.acquire(agent_id="agent-001", user_id="user-001")
+                for _ in range(7)
+            ]
+
+        assert [r.allowed for r in results] == [True] * 5 + [False] * 2
+        assert results[-1].current_usage["minute"] == 5
+
+    @pytest.mark.asyncio
+    async def test_release_gives_back_acquired_slot(self, limiter):
+        """Test that release uncounts an acquired invocation."""
+        with patch.object(time, 'time', return_value=1000.0):
+            acquired = await limiter.acquire(agent_id="agent-001", user_id="user-001")
+        with patch.object(time, 'time', return_value=1030.0):
+            await limiter.release(
+                acquired.acquired_at, agent_id="agent-001", user_id="user-001"
+            )
+            result = await limiter.check_rate_limit(
+                agent_id="agent-001",
+                user_id="user-001"
+            )
+
+        assert acquired.acquired_at == 1000.0
+        assert result.current_usage == {"minute": 0, "hour": 0, "day": 0}
+
+
 class TestRateLimiterKeyGeneration:
     """Tests for rate limit key generation."""
 
@@ -281,3 +355,115 @@ class TestRateLimiterInitialization:
             user_id="user-001"
         )
         assert result.remaining == 5
+
+
+class TestRateLimiterRedisBuckets:
+    """Tests for the Lua bucket limiter (fakeredis with Lua support)."""
+
+    @pytest.fixture
+    async def limiter(self):
+        """Create rate limiter backed by fakeredis."""
+        pytest.importorskip("lupa")
+        fakeredis = pytest.importorskip("fakeredis")
+
+        server = fakeredis.FakeServer()
+        limiter = ExternalAgentRateLimiter(
+            redis_url="redis://fake",
+            config=RateLimitConfig(
+                requests_per_minute=5,
+                requests_per_hour=8,
+                requests_per_day=1000
+            )
+        )
+        with patch(
+            "redis.asyncio.from_url",
+            return_value=fakeredis.aioredis.FakeRedis(server=server)
+        ):
+            await limiter.initialize()
+        yield limiter
+        await limiter.close()
+
+    @pytest.mark.asyncio
+    async def test_acquire_checks_and_records_atomically(self, limiter):
+        """Test acquire records allowed calls and stops at the limit."""
+        with patch.object(time, 'time', return_value=1000.0):
+            results = [
+                await limiter.acquire(agent_id="agent-001", user_id="user-001")
+                for _ in range(6)
+            ]
+
+        assert [r.allowed for r in results] == [True] * 5 + [False]
+        assert results[4].remaining == 0
+        assert results[5].limit_exceeded == "requests_per_minute"
+        assert results[5].current_usage == {"minute": 5, "hour": 5, "day": 5}
+
+    @pytest.mark.asyncio
+    async def test_release_gives_back_acquired_slot(self, limiter):
+        """Test release frees the slot of an acquired invocation."""
+        with patch.object(time, 'time', return_value=1000.0):
+            results = [
+                await limiter.acquire(agent_id="agent-001", user_id="user-001")
+                for _ in range(5)
+            ]
+        with patch.object(time, 'time', return_value=1030.0):
+            await limiter.release(
+                results[0].acquired_at, agent_id="agent-001", user_id="user-001"
+            )
+            result = await limiter.acquire(agent_id="agent-001", user_id="user-001")
+
+        assert result.allowed is True
+        assert result.current_usage == {"minute": 5, "hour": 5, "day": 5}
+
+    @pytest.mark.asyncio
+    async def test_release_without_acquire_is_ignored(self, limiter):
+        """Test releasing from an empty bucket does not go negative."""
+        with patch.object(time, 'time', return_value=1000.0):
+            await limiter.release(1000.0, agent_id="agent-001", user_id="user-001")
+            result = await limiter.check_rate_limit(
+                agent_id="agent-001",
+                user_id="user-001"
+            )
+
+        assert result.current_usage == {"minute": 0, "hour": 0, "day": 0}
+
+    @pytest.mark.asyncio
+    async def test_minute_window_slides(self, limiter):
+        """Test minute buckets age out one second at a time."""
+        with patch.object(time, 'time', return_value=1000.0):
+            for _ in range(5):
+                await limiter.record_invocation(agent_id="agent-001", user_id="user-001")
+            result = await limiter.check_rate_limit(agent_id="agent-001", user_id="user-001")
+
+        assert result.allowed is False
+        assert result.retry_after_seconds == 60
+
+        with patch.object(time, 'time', return_value=1060.0):
+            result = await limiter.check_rate_limit(agent_id="agent-001", user_id="user-001")
+
+        assert result.allowed is True
+        assert result.current_usage["minute"] == 0
+        assert result.current_usage["hour"] == 5
+
+    @pytest.mark.asyncio
+    async def test_hour_limit_across_minutes(self, limiter):
+        """Test hour limit counts calls recorded in earlier minutes."""
+        for second in (1000.0, 1100.0):
+            with patch.object(time, 'time', return_value=second):
+                for _ in range(4):
+                    await limiter.acquire(agent_id="agent-001", user_id="user-001")
+
+        with patch.object(time, 'time', return_value=1200.0):
+            result = await limiter.acquire(agent_id="agent-001", user_id="user-001")
+
+        assert result.allowed is False
+        assert result.limit_exceeded == "requests_per_hour"
+
+    @pytest.mark.asyncio
+    async def test_memory_is_constant(self, limiter):
+        """Test the bucket hash stays bounded no matter the call volume."""
+        for step in range(300):
+            with patch.object(time, 'time', return_value=1000.0 + step * 7):
+                await limiter.record_invocation(agent_id="agent-001", user_id="user-001")
+
+        key = f"{limiter._get_key(agent_id='agent-001', user_id='user-001')}:buckets"
+        assert await limiter._redis.hlen(key) <= 60 + 60 + 24
@@ -5,13 +5,18 @@ Tests trigger evaluation without any infrastructure dependencies.
 """
 
 import pytest
+import re
+import time
 from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
 
 from studio_kaizen.trust.governance.triggers import (
+    PayloadScanner,
     TriggerContext,
     TriggerResult,
     ApprovalTriggerEvaluator,
     InMemoryHistoryProvider,
+    InvocationHistoryIndex,
 )
 from studio_kaizen.trust.governance.config import ApprovalTriggerConfig
 
@@ -150,6 +155,63 @@ class TestApprovalTriggerConfig:
         assert "production" in config.environments_requiring_approval
 
 
+class TestPayloadScanner:
+    """Tests for single-pass multi-pattern payload scanning."""
+
+    def test_overlapping_patterns_all_reported(self):
+        """Test that patterns matching the same text are all found."""
+        scanner = PayloadScanner({"delete": "delete.*", "admin": ".*admin.*"})
+
+        assert scanner.scan({"action": "delete_admin"}) == ["delete", "admin"]
+
+    def test_keys_and_nested_leaves_scanned(self):
+        """Test that dict keys and nested scalar values are scanned."""
+        scanner = PayloadScanner({
+            "password": "password",
+            "card": r"^\d{16}$",
+            "flag": "^true$",
+        })
+
+        payload = {"user": {"password": "x"}, "items": [[{"n": 4111111111111111}]], "ok": True}
+
+        assert scanner.scan(payload) == ["password", "card", "flag"]
+
+    def test_first_only_short_circuits(self):
+        """Test that boolean checks stop at the first match."""
+        scanner = PayloadScanner({"a": "alpha", "b": "beta"})
+
+        assert scanner.scan(["alpha beta"], first_only=True) == ["a"]
+        assert scanner.matches_any({"text": "beta"}) is True
+        assert scanner.matches_any({"text": "gamma"}) is False
+
+    def test_flags_stay_scoped(self):
+        """Test that inline and compile flags only apply to their pattern."""
+        scanner = PayloadScanner(
+            {"inline": "(?i)secret", "flagged": "token", "plain": "Key"},
+            flags={"flagged": re.IGNORECASE},
+        )
+
+        assert scanner.scan(["SECRET TOKEN key"]) == ["inline", "flagged"]
+
+    def test_backreferences_and_invalid_patterns(self):
+        """Test numbered backreferences still work and invalid patterns are skipped."""
+        scanner = PayloadScanner({"repeat": r"(\w)\1", "invalid": "(", "word": "hello"})
+
+        assert scanner.names == ["repeat", "word"]
+        assert scanner.scan(["hello"]) == ["repeat", "word"]
+
+    def test_combined_patterns_cache_bounded(self):
+        """Test that alternations of matched subsets are cached up to a bound."""
+        patterns = {f"p{i}": f"word{i}" for i in range(8)}
+        scanner = PayloadScanner(patterns, max_combined=4)
+
+        for i in range(8):
+            assert scanner.scan([f"word{i}"]) == [f"p{i}"]
+        assert scanner.scan([" ".join(f"word{i}" for i in range(8))]) == list(patterns)
+
+        assert len(scanner._combined) == 4
+
+
 class TestInMemoryHistoryProvider:
     """Tests for InMemoryHistoryProvider."""
 
@@ -535,3 +597,173 @@ class TestApprovalTriggerEvaluator:
         assert "cost_threshold" in result.triggers_matched
         assert "production_environment" in result.triggers_matched
         assert len(result.triggers_matched) >= 2
+
+
+class TestApprovalTriggerEvaluatorScanning:
+    """Tests for combined payload and sensitive data scanning."""
+
+    @pytest.mark.asyncio
+    async def test_payload_and_sensitive_matches_reported(self):
+        """Test that one scan reports both payload patterns and data types."""
+        config = ApprovalTriggerConfig(
+            payload_patterns=["DELETE"],
+            sensitive_data_patterns=["\\b\\d{3}-\\d{2}-\\d{4}\\b", "internal"],
+        )
+        evaluator = ApprovalTriggerEvaluator(config=config)
+        context = TriggerContext(
+            agent_id="agent-001",
+            user_id="user-001",
+            organization_id="org-001",
+            payload={
+                "action": "delete",
+                "documents": [{"body": "ssn 123-45-6789, api_key=abcdefghijklmnopqrstuvwxyz"}],
+            },
+        )
+
+        result = await evaluator.evaluate(context)
+
+        assert result.details["payload_patterns"] == ["DELETE"]
+        assert result.details["sensitive_data_types"] == ["SSN", "API Key"]
+
+    def test_has_restricted_content(self):
+        """Test the short-circuiting boolean check."""
+        evaluator = ApprovalTriggerEvaluator(
+            config=ApprovalTriggerConfig(payload_patterns=["drop table"])
+        )
+
+        assert evaluator.has_restricted_content({"sql": "DROP TABLE users"}) is True
+        assert evaluator.has_restricted_content({"card": "4111 1111 1111 1111"}) is True
+        assert evaluator.has_restricted_content({"message": "Hello, world!"}) is False
+
+
+class TestInvocationHistoryIndex:
+    """Tests for InvocationHistoryIndex without Redis."""
+
+    @pytest.fixture
+    def history(self):
+        """Create an in-memory history index (1 minute buckets)."""
+        return InvocationHistoryIndex(window_seconds=3600, max_keys=3)
+
+    @pytest.mark.asyncio
+    async def test_first_invocation(self, history):
+        """Test agents are first invoked until an invocation is recorded."""
+        assert await history.is_first_invocation("agent-001", "user-001", "org-001") is True
+
+        await history.record_invocation("agent-001", "user-001", "org-001")
+
+        assert await history.is_first_invocation("agent-001", "user-002", "org-001") is False
+        assert await history.is_first_invocation("agent-001", "user-001", "org-002") is True
+
+    @pytest.mark.asyncio
+    async def test_counts_per_user_and_agent(self, history):
+        """Test counts per agent/user and for all users of an agent."""
+        with patch.object(time, 'time', return_value=100_000.0):
+            for user_id in ("user-001", "user-001", "user-002"):
+                await history.record_invocation("agent-001", user_id, "org-001")
+
+            user_count = await history.get_invocation_count(
+                "agent-001", "user-001", "org-001", window_seconds=3600
+            )
+            agent_count = await history.get_invocation_count(
+                "agent-001", None, "org-001", window_seconds=3600
+            )
+
+        assert user_count == 2
+        assert agent_count == 3
+
+    @pytest.mark.asyncio
+    async def test_window_expires_old_buckets(self, history):
+        """Test invocations older than the window are not counted."""
+        with patch.object(time, 'time', return_value=100_000.0):
+            await history.record_invocation("agent-001", "user-001", "org-001")
+        with patch.object(time, 'time', return_value=101_800.0):
+            await history.record_invocation("agent-001", "user-001", "org-001")
+
+            short = await history.get_invocation_count(
+                "agent-001", "user-001", "org-001", window_seconds=600
+            )
+            full = await history.get_invocation_count(
+                "agent-001", "user-001", "org-001", window_seconds=3600
+            )
+        with patch.object(time, 'time', return_value=103_700.0):
+            later = await history.get_invocation_count(
+                "agent-001", "user-001", "org-001", window_seconds=3600
+            )
+
+        assert (short, full, later) == (1, 2, 1)
+
+    @pytest.mark.asyncio
+    async def test_memory_is_bounded(self, history):
+        """Test least recently used agents are evicted beyond max_keys."""
+        for i in range(10):
+            await history.record_invocation(f"agent-{i}", "user-001", "org-001")
+
+        assert len(history._seen) == 3
+        assert len(history._counters) == 3
+        assert await history.is_first_invocation("agent-0", None, "org-001") is True
+        assert await history.is_first_invocation("agent-9", None, "org-001") is False
+
+
+class TestInvocationHistoryIndexRedis:
+    """Tests for InvocationHistoryIndex shared through Redis (fakeredis with Lua)."""
+
+    @pytest.fixture
+    async def workers(self):
+        """Create two history indexes sharing one fakeredis server."""
+        pytest.importorskip("lupa")
+        fakeredis = pytest.importorskip("fakeredis")
+
+        server = fakeredis.FakeServer()
+        indexes = []
+        for _ in range(2):
+            history = InvocationHistoryIndex(redis_url="redis://fake", window_seconds=3600)
+            with patch(
+                "redis.asyncio.from_url",
+                return_value=fakeredis.aioredis.FakeRedis(server=server)
+            ):
+                await history.initialize()
+            indexes.append(history)
+        yield indexes
+        for history in indexes:
+            await history.close()
+
+    @pytest.mark.asyncio
+    async def test_workers_share_history(self, workers):
+        """Test invocations recorded by one worker are seen by the other."""
+        first, second = workers
+
+        assert await second.is_first_invocation("agent-001", "user-001", "org-001") is True
+        with patch.object(time, 'time', return_value=100_000.0):
+            for _ in range(3):
+                await first.record_invocation("agent-001", "user-001", "org-001")
+            count = await second.get_invocation_count(
+                "agent-001", "user-001", "org-001", window_seconds=3600
+            )
+
+        assert count == 3
+        assert await second.is_first_invocation("agent-001", "user-001", "org-001") is False
+
+    @pytest.mark.asyncio
+    async def test_ring_slots_are_reused(self, workers):
+        """Test a slot of an expired bucket restarts its count."""
+        first, _ = workers
+
+        with patch.object(time, 'time', return_value=100_000.0):
+            await first.record_invocation("agent-001", None, "org-001")
+        # Same ring slot one full window later
+        with patch.object(time, 'time', return_value=103_600.0):
+            await first.record_invocation("agent-001", None, "org-001")
+            count = await first.get_invocation_count(
+                "agent-001", None, "org-001", window_seconds=3600
+            )
+
+        assert count == 1
+
+    @pytest.mark.asyncio
+    async def test_known_agents_answered_from_memory(self, workers):
+        """Test known agents need no Redis round-trip."""
+        first, _ = workers
+        await first.record_invocation("agent-001", "user-001", "org-001")
+        first._script = AsyncMock(side_effect=AssertionError("no round-trip expected"))
+
+        assert await first.is_first_invocation("agent-001", "user-001", "org-001") is False
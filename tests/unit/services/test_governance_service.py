@@ -5,10 +5,12 @@ Tests governance logic in isolation with mocked dependencies.
 Intent: Verify budget, rate limiting, and policy evaluation logic.
 """
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from studio_kaizen.trust.governance import (
+    BudgetCheckResult,
     ExternalAgentBudget,
     ExternalAgentPolicyContext,
     ExternalAgentPrincipal,
@@ -520,5 +522,349 @@ class TestGovernanceServiceStatus:
         assert isinstance(status["timestamp"], str)
 
 
+class TestGovernanceServiceApprovalExpiry:
+    """Test the approval expiry background task lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_initialize_starts_and_close_stops_expiry_scheduler(self):
+        """
+        Intent: Ensure expired approvals are processed while the service runs.
+
+        Verifies that initialize() starts the expiry scheduler and close()
+        stops it, so no background task outlives the service.
+        """
+        # Arrange
+        service = GovernanceService(redis_url="redis://localhost:1/0")
+
+        # Act
+        await service.initialize()
+        scheduler = service.expiry_scheduler
+        running = scheduler.running
+        await service.close()
+
+        # Assert
+        assert running is True
+        assert scheduler.running is False
+        assert service.expiry_scheduler is None
+
+
+class TestGovernanceServiceContainerLifecycle:
+    """Test that the service container runs the governance lifecycle."""
+
+    @staticmethod
+    def _container():
+        from studio.container import ServiceContainer
+
+        return ServiceContainer(
+            runtime=MagicMock(), redis_client=MagicMock(), reads=AsyncMock()
+        )
+
+    @pytest.mark.asyncio
+    async def test_container_start_and_aclose_run_write_behind(self):
+        """
+        Intent: Ensure the app lifecycle starts and stops governance.
+
+        Verifies that starting GovernanceService through the service container
+        starts the write-behind workers and that closing the container stops
+        them.
+        """
+        # Arrange
+        container = self._container()
+
+        # Act
+        await container.start(GovernanceService)
+        service = container.get(GovernanceService)
+        started = service.write_behind.running
+        await container.aclose()
+
+        # Assert
+        assert started is True
+        assert service.write_behind.running is False
+
+    @pytest.mark.asyncio
+    async def test_container_start_and_aclose_run_expiry_scheduler(self):
+        """
+        Intent: Ensure pending approvals expire in a running app.
+
+        Verifies that starting GovernanceService through the service container
+        starts the approval expiry scheduler and that closing the container
+        stops it.
+        """
+        # Arrange
+        container = self._container()
+        scheduler = MagicMock(stop=AsyncMock())
+
+        # Act
+        with patch(
+            "studio.services.governance_service.ApprovalExpiryScheduler",
+            return_value=scheduler,
+        ):
+            await container.start(GovernanceService)
+        service = container.get(GovernanceService)
+        started = service.expiry_scheduler
+        await container.aclose()
+
+        # Assert
+        assert started is scheduler
+        scheduler.start.assert_called_once()
+        scheduler.stop.assert_awaited_once()
+        assert service.expiry_scheduler is None
+
+    @pytest.mark.asyncio
+    async def test_container_start_connects_budget_counters(self):
+        """
+        Intent: Ensure budget spend is counted in Redis in a running app.
+
+        Verifies that starting GovernanceService through the service container
+        connects the cached budget store to Redis and that closing the
+        container releases the connection.
+        """
+        # Arrange
+        pytest.importorskip("lupa")
+        fakeredis = pytest.importorskip("fakeredis")
+        container = self._container()
+
+        # Act
+        with patch(
+            "redis.asyncio.from_url",
+            return_value=fakeredis.aioredis.FakeRedis(),
+        ):
+            await container.start(GovernanceService)
+        service = container.get(GovernanceService)
+        connected = service.budget_store._redis is not None
+        await container.aclose()
+
+        # Assert
+        assert connected is True
+        assert service.budget_store._redis is None
+
+
+class TestGovernanceServicePipeline:
+    """Test concurrent pre-checks and write-behind bookkeeping."""
+
+    @staticmethod
+    def _slow(result, delay):
+        async def check(*args, **kwargs):
+            await asyncio.sleep(delay)
+            return result
+
+        return check
+
+    @pytest.mark.asyncio
+    async def test_run_pre_checks_runs_checks_concurrently(self):
+        """
+        Intent: Ensure pre-check latency is the slowest check, not the sum.
+
+        Verifies that rate limit and budget checks overlap and both results
+        are returned when every check allows the invocation.
+        """
+        # Arrange
+        service = GovernanceService()
+        service.acquire_rate_limit = self._slow(
+            RateLimitCheckResult(allowed=True), 0.05
+        )
+        service.check_budget = self._slow(BudgetCheckResult(allowed=True), 0.05)
+
+        # Act
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        result = await service.run_pre_checks("agent-001", "org-001", "user-001", 1.0)
+        elapsed = loop.time() - start
+
+        # Assert
+        assert result.allowed is True
+        assert result.denied_by is None
+        assert result.rate_limit.allowed is True
+        assert result.budget.allowed is True
+        assert elapsed < 0.09
+
+    @pytest.mark.asyncio
+    async def test_run_pre_checks_stops_at_first_denial(self):
+        """
+        Intent: Ensure a denial does not wait for the remaining checks.
+
+        Verifies that a fast rate limit denial cancels the slow budget check
+        and reports the denying check with the existing error message.
+        """
+        # Arrange
+        service = GovernanceService()
+        service.acquire_rate_limit = self._slow(
+            RateLimitCheckResult(
+                allowed=False, limit_exceeded="per_minute", retry_after_seconds=30
+            ),
+            0,
+        )
+        service.check_budget = self._slow(BudgetCheckResult(allowed=True), 1)
+
+        # Act
+        result = await asyncio.wait_for(
+            service.run_pre_checks("agent-001", "org-001", "user-001", 1.0), 0.5
+        )
+
+        # Assert
+        assert result.allowed is False
+        assert result.denied_by == "rate_limit"
+        assert result.budget is None
+        assert result.reason == "Rate limit exceeded - retry after 30 seconds"
+
+    @pytest.mark.asyncio
+    async def test_run_pre_checks_includes_policy_when_given(self):
+        """
+        Intent: Ensure policy denials are part of the pipeline.
+
+        Verifies that a policy context adds policy evaluation to the checks.
+        """
+        # Arrange
+        service = GovernanceService()
+        service.acquire_rate_limit = self._slow(RateLimitCheckResult(allowed=True), 0)
+        service.check_budget = self._slow(BudgetCheckResult(allowed=True), 0)
+        service.evaluate_policy = self._slow(
+            PolicyEvaluationResult(
+                effect=PolicyEffect.DENY, reason="Outside hours", matched_policies=[]
+            ),
+            0,
+        )
+        context = ExternalAgentPolicyContext(
+            principal=ExternalAgentPrincipal(
+                external_agent_id="agent-001",
+                provider="custom",
+                environment="production",
+                org_id="org-001",
+            ),
+            action="invoke",
+            resource="agent-001",
+        )
+
+        # Act
+        result = await service.run_pre_checks(
+            "agent-001", "org-001", "user-001", 1.0, policy_context=context
+        )
+
+        # Assert
+        assert result.denied_by == "policy"
+        assert result.reason == "Policy denied: Outside hours"
+
+    @pytest.mark.asyncio
+    async def test_record_invocation_is_written_behind(self):
+        """
+        Intent: Ensure bookkeeping does not block the invocation.
+
+        Verifies that record_invocation() returns before the writes finish
+        and that close() completes the queued writes.
+        """
+        # Arrange
+        service = GovernanceService(redis_url="redis://localhost:1/0")
+        await service.initialize()
+        recorded = []
+
+        async def record_cost(**kwargs):
+            await asyncio.sleep(0.01)
+            recorded.append("cost")
+
+        async def record_history(**kwargs):
+            await asyncio.sleep(0.01)
+            recorded.append("history")
+
+        service.record_invocation_cost = record_cost
+        service.invocation_history.record_invocation = record_history
+
+        # Act
+        await service.record_invocation(
+            external_agent_id="agent-001",
+            organization_id="org-001",
+            user_id="user-001",
+            actual_cost=0.5,
+            execution_success=True,
+        )
+        queued = list(recorded)
+        await service.close()
+
+        # Assert
+        assert queued == []
+        assert sorted(recorded) == ["cost", "history"]
+
+    @staticmethod
+    async def _limited_service(requests_per_minute):
+        from studio_kaizen.trust.governance import RateLimitConfig
+
+        service = GovernanceService(
+            redis_url="redis://localhost:1/0",
+            rate_limit_config=RateLimitConfig(requests_per_minute=requests_per_minute),
+        )
+        await service.initialize()
+        service.check_budget = AsyncMock(return_value=BudgetCheckResult(allowed=True))
+        return service
+
+    @pytest.mark.asyncio
+    async def test_run_pre_checks_acquires_rate_limit_slot(self):
+        """
+        Intent: Ensure concurrent invocations cannot share the last slot.
+
+        Verifies that the pre-checks take the rate limit slot atomically, so
+        of two concurrent invocations with one free slot only one passes.
+        """
+        # Arrange
+        service = await self._limited_service(1)
+
+        # Act
+        results = await asyncio.gather(
+            *(
+                service.run_pre_checks("agent-001", "org-001", "user-001", 1.0)
+                for _ in range(2)
+            )
+        )
+        await service.close()
+
+        # Assert
+        assert sorted(r.allowed for r in results) == [False, True]
+
+    @pytest.mark.asyncio
+    async def test_run_pre_checks_releases_slot_on_denial(self):
+        """
+        Intent: Ensure denied invocations do not use up the rate limit.
+
+        Verifies that a budget denial gives back the slot acquired by the
+        rate limit check.
+        """
+        # Arrange
+        service = await self._limited_service(1)
+        service.check_budget = AsyncMock(
+            return_value=BudgetCheckResult(allowed=False, reason="Over budget")
+        )
+
+        # Act
+        denied = await service.run_pre_checks("agent-001", "org-001", "user-001", 1.0)
+        status = await service.check_rate_limit(
+            "agent-001", "user-001", org_id="org-001"
+        )
+        await service.close()
+
+        # Assert
+        assert denied.denied_by == "budget"
+        assert status.allowed is True
+
+    @pytest.mark.asyncio
+    async def test_release_rate_limit_gives_back_slot(self):
+        """
+        Intent: Ensure failed invocations do not count against the rate limit.
+
+        Verifies that releasing an acquired slot lets the next invocation pass.
+        """
+        # Arrange
+        service = await self._limited_service(1)
+        checks = await service.run_pre_checks("agent-001", "org-001", "user-001", 1.0)
+
+        # Act
+        await service.release_rate_limit(
+            checks.rate_limit, "agent-001", "user-001", org_id="org-001"
+        )
+        again = await service.run_pre_checks("agent-001", "org-001", "user-001", 1.0)
+        await service.close()
+
+        # Assert
+        assert checks.allowed is True
+        assert again.allowed is True
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -298,9 +298,8 @@ class TestAgentToolValidation:
 class TestAgentServiceLogic:
     """Test agent service business logic."""
 
-    @patch("studio.services.agent_service.WorkflowBuilder")
     @patch("studio.services.agent_service.AsyncLocalRuntime")
-    def test_agent_create_generates_id(self, mock_runtime, mock_builder):
+    def test_agent_create_generates_id(self, mock_runtime):
         """Agent create should generate new ID if not provided."""
         from studio.services.agent_service import AgentService
 
@@ -537,3 +536,134 @@ class TestAgentAuditFields:
         tool = agent_tool_factory()
         assert "created_at" in tool
         assert tool["created_at"]
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(1)
+class TestAgentBatchedReads:
+    """Test batched agent prefetch."""
+
+    @pytest.mark.asyncio
+    async def test_get_many_uses_single_list_query(self, agent_factory):
+        """get_many should fetch all agents with one AgentListNode workflow."""
+        from unittest.mock import AsyncMock
+
+        from studio.services.agent_service import AgentService
+
+        agent1 = agent_factory()
+        agent2 = agent_factory()
+
+        with patch(
+            "studio.services.workflow_templates.get_template_cache"
+        ) as mock_templates:
+            service = AgentService()
+            service.runtime.execute_workflow_async = AsyncMock(
+                return_value=({"list": {"records": [agent1, agent2]}}, "run-1")
+            )
+
+            agents = await service.get_many(
+                [agent1["id"], agent2["id"], agent1["id"], "missing"]
+            )
+
+        service.runtime.execute_workflow_async.assert_awaited_once()
+        node_type, _, _ = mock_templates.return_value.get.call_args.args
+        params = service.runtime.execute_workflow_async.call_args.kwargs["inputs"][
+            "list"
+        ]
+        assert node_type == "AgentListNode"
+        assert params["filter"] == {
+            "id": {"$in": [agent1["id"], agent2["id"], "missing"]}
+        }
+        assert agents == {agent1["id"]: agent1, agent2["id"]: agent2, "missing": None}
+
+    @pytest.mark.asyncio
+    async def test_get_many_empty_ids_skips_query(self):
+        """get_many with no IDs should not hit the database."""
+        from unittest.mock import AsyncMock
+
+        from studio.services.agent_service import AgentService
+
+        service = AgentService()
+        service.runtime.execute_workflow_async = AsyncMock()
+
+        assert await service.get_many(["", ""]) == {}
+        service.runtime.execute_workflow_async.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_details_are_batched(self, agent_factory):
+        """Concurrent get_with_details calls should share one query per kind."""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        from studio.services.agent_service import AgentService
+
+        agent1 = agent_factory()
+        agent2 = agent_factory()
+        tool = {"id": "tool-1", "agent_id": agent2["id"]}
+
+        async def execute(runtime, node_type, node_id, params):
+            records = {
+                "AgentListNode": [agent1, agent2],
+                "AgentContextListNode": [],
+                "AgentToolListNode": [tool],
+            }[node_type]
+            return {node_id: {"records": records}}
+
+        with patch(
+            "studio.services.agent_service.execute_node",
+            new=AsyncMock(side_effect=execute),
+        ) as mock_execute:
+            service = AgentService()
+            first, second, again = await asyncio.gather(
+                service.get_with_details(agent1["id"]),
+                service.get_with_details(agent2["id"]),
+                service.get_with_details(agent1["id"]),
+            )
+
+        assert mock_execute.await_count == 3
+        list_params = mock_execute.await_args_list[0].args[3]
+        assert list_params["filter"] == {"id": {"$in": [agent1["id"], agent2["id"]]}}
+        assert first == again
+        assert first["tools"] == [] and second["tools"] == [tool]
+        assert "tools" not in agent1
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(1)
+class TestAgentDirectReads:
+    """Test the opt-in direct read path."""
+
+    @pytest.mark.asyncio
+    async def test_direct_get_skips_workflow(self, agent_factory):
+        """get(direct=True) should read through the repository."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        from studio.services.agent_service import AgentService
+
+        agent = agent_factory()
+        reads = MagicMock(enabled=True)
+        reads.get_agent = AsyncMock(return_value=agent)
+        service = AgentService(reads=reads)
+        service.runtime.execute_workflow_async = AsyncMock()
+
+        assert await service.get(agent["id"], direct=True) == agent
+        reads.get_agent.assert_awaited_once_with(agent["id"])
+        service.runtime.execute_workflow_async.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_direct_get_falls_back_to_workflow(self, agent_factory):
+        """A failing direct read should fall back to AgentReadNode."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        from studio.services.agent_service import AgentService
+
+        agent = agent_factory()
+        reads = MagicMock(enabled=True)
+        reads.get_agent = AsyncMock(side_effect=OSError("connection refused"))
+        service = AgentService(reads=reads)
+        service.runtime.execute_workflow_async = AsyncMock(
+            return_value=({"read": agent}, "run-1")
+        )
+
+        assert await service.get(agent["id"], direct=True) == agent
+        service.runtime.execute_workflow_async.assert_awaited_once()
@@ -0,0 +1,106 @@
+"""
+Tier 1: Cascade Write Unit Tests
+
+Tests the transactional bulk workflow built for cascade deletes/updates.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(1)
+class TestCascadeSteps:
+    """Test bulk node types and parameters of cascade steps."""
+
+    def test_delete_step(self):
+        """delete_where should map to a confirmed filtered bulk delete."""
+        from studio.services.cascade import delete_where
+
+        step = delete_where("TeamMembership", team_id="team-1")
+
+        assert step.node_type == "TeamMembershipBulkDeleteNode"
+        assert step.node_id == "delete_team_memberships"
+        assert step.params() == {"filter": {"team_id": "team-1"}, "confirmed": True}
+
+    def test_update_step(self):
+        """update_where should map to a filtered bulk update."""
+        from studio.services.cascade import update_where
+
+        step = update_where("TrustDelegation", {"status": "active"}, {"status": "x"})
+
+        assert step.node_type == "TrustDelegationBulkUpdateNode"
+        assert step.params() == {
+            "filter": {"status": "active"},
+            "fields": {"status": "x"},
+        }
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(1)
+class TestCascadeWorkflow:
+    """Test the single-transaction cascade workflow."""
+
+    def test_steps_are_chained_inside_transaction(self):
+        """Steps should run in order between transaction scope and commit."""
+        from studio.services.cascade import build_cascade, delete_where
+
+        with patch("studio.services.cascade.WorkflowBuilder") as builder:
+            _, node_ids = build_cascade(
+                [
+                    delete_where("PipelineConnection", pipeline_id="p-1"),
+                    delete_where("PipelineNode", pipeline_id="p-1"),
+                    delete_where("Pipeline", id="p-1"),
+                ]
+            )
+
+        workflow = builder.return_value
+        node_types = [call.args[0] for call in workflow.add_node.call_args_list]
+        edges = [call.args[:3:2] for call in workflow.add_connection.call_args_list]
+        assert node_types == [
+            "TransactionScopeNode",
+            "PipelineConnectionBulkDeleteNode",
+            "PipelineNodeBulkDeleteNode",
+            "PipelineBulkDeleteNode",
+            "TransactionCommitNode",
+        ]
+        assert node_ids == [
+            "delete_pipeline_connections",
+            "delete_pipeline_nodes",
+            "delete_pipelines",
+        ]
+        assert edges == [
+            ("tx", "delete_pipeline_connections"),
+            ("delete_pipeline_connections", "delete_pipeline_nodes"),
+            ("delete_pipeline_nodes", "delete_pipelines"),
+            ("delete_pipelines", "commit"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_cascade_runs_one_workflow_and_invalidates(self):
+        """A cascade should be one execution and bump every touched model."""
+        from studio.services.cascade import delete_where, execute_cascade
+
+        runtime = MagicMock()
+        runtime.execute_workflow_async = AsyncMock(
+            return_value=({"delete_agents": {"deleted": 1}}, "run-1")
+        )
+
+        with (
+            patch("studio.services.cascade.WorkflowBuilder"),
+            patch(
+                "studio.services.cascade.bump_model_version", new_callable=AsyncMock
+            ) as bump,
+        ):
+            results = await execute_cascade(
+                runtime,
+                [
+                    delete_where("AgentTool", agent_id="a-1"),
+                    delete_where("Agent", id="a-1"),
+                ],
+            )
+
+        runtime.execute_workflow_async.assert_awaited_once()
+        assert [call.args[0] for call in bump.call_args_list] == ["AgentTool", "Agent"]
+        assert results == {"AgentTool": None, "Agent": {"deleted": 1}}
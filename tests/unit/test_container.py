@@ -0,0 +1,200 @@
+"""
+Tier 1: Service Container Unit Tests
+
+Tests shared resource injection, service reuse and client lifecycle
+of the process-wide service container.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+
+class _RuntimeService:
+    def __init__(self, runtime=None):
+        self.runtime = runtime
+
+
+class _RedisService:
+    def __init__(self, redis_client=None):
+        self.redis_client = redis_client
+
+
+class _LLMLikeService:
+    HTTP_CLIENT = "llm"
+
+    def __init__(self, http_client=None):
+        self.http_client = http_client
+
+
+class _ReadsService:
+    def __init__(self, runtime=None, reads=None):
+        self.runtime = runtime
+        self.reads = reads
+
+
+class _PlainService:
+    def __init__(self):
+        self.created = True
+
+
+class _LifecycleService:
+    events: list[str] = []
+
+    def __init__(self, runtime=None):
+        self.runtime = runtime
+
+    async def initialize(self):
+        self.events.append(f"start {type(self).__name__}")
+
+    async def close(self):
+        self.events.append(f"close {type(self).__name__}")
+
+
+class _OtherLifecycleService(_LifecycleService):
+    pass
+
+
+def _container():
+    from studio.container import ServiceContainer
+
+    return ServiceContainer(
+        runtime=MagicMock(), redis_client=MagicMock(), reads=AsyncMock()
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(1)
+class TestServiceContainer:
+    """Test service construction and injection."""
+
+    def test_services_are_shared(self):
+        """The same instance should be returned for repeated lookups."""
+        container = _container()
+
+        assert container.get(_RuntimeService) is container.get(_RuntimeService)
+
+    def test_shared_runtime_is_injected(self):
+        """Services accepting a runtime should receive the shared runtime."""
+        container = _container()
+
+        assert container.get(_RuntimeService).runtime is container.runtime
+
+    def test_shared_redis_is_injected(self):
+        """Services accepting a redis_client should receive the shared client."""
+        container = _container()
+
+        assert container.get(_RedisService).redis_client is container.redis
+
+    def test_named_http_client_is_injected(self):
+        """Services should receive the HTTP client named by HTTP_CLIENT."""
+        container = _container()
+
+        service = container.get(_LLMLikeService)
+
+        assert service.http_client is container.http.get("llm")
+        assert service.http_client.timeout.read == 120.0
+
+    def test_shared_read_repository_is_injected(self):
+        """Services accepting reads should receive the shared repository."""
+        container = _container()
+
+        service = container.get(_ReadsService)
+
+        assert service.reads is container.reads
+        assert service.runtime is container.runtime
+
+    def test_services_without_resources(self):
+        """Services without injectable parameters should be built as-is."""
+        container = _container()
+
+        assert container.get(_PlainService).created is True
+
+    @pytest.mark.asyncio
+    async def test_aclose_releases_services_and_clients(self):
+        """Closing should close HTTP clients and drop cached services."""
+        container = _container()
+        service = container.get(_RuntimeService)
+        client = container.http.get()
+
+        await container.aclose()
+
+        assert client.is_closed
+        container.reads.close.assert_awaited_once()
+        assert container.get(_RuntimeService) is not service
+
+    @pytest.mark.asyncio
+    async def test_started_services_are_initialized_and_closed(self):
+        """start() should initialize once; aclose() closes in reverse order."""
+        container = _container()
+        events = _LifecycleService.events = []
+
+        await container.start(_LifecycleService, _OtherLifecycleService)
+        await container.start(_LifecycleService)
+        service = container.get(_LifecycleService)
+        await container.aclose()
+
+        assert service.runtime is container.runtime
+        assert events == [
+            "start _LifecycleService",
+            "start _OtherLifecycleService",
+            "close _OtherLifecycleService",
+            "close _LifecycleService",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_services_not_started_are_not_closed(self):
+        """Services only looked up with get() should not be closed."""
+        container = _container()
+        events = _LifecycleService.events = []
+        container.get(_LifecycleService)
+
+        await container.aclose()
+
+        assert events == []
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(1)
+class TestHTTPClientRegistry:
+    """Test pooled HTTP clients."""
+
+    def test_clients_are_reused_per_name(self):
+        """Each name should map to one client."""
+        from studio.container import HTTPClientRegistry
+
+        http = HTTPClientRegistry()
+
+        assert http.get("llm") is http.get("llm")
+        assert http.get("llm") is not http.get("default")
+
+    @pytest.mark.asyncio
+    async def test_closed_clients_are_recreated(self):
+        """A closed client should be replaced on the next lookup."""
+        from studio.container import HTTPClientRegistry
+
+        http = HTTPClientRegistry()
+        client = http.get()
+        await client.aclose()
+
+        assert http.get() is not client
+        await http.aclose()
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(1)
+class TestProcessContainer:
+    """Test installation of the process-wide container."""
+
+    @pytest.mark.asyncio
+    async def test_init_and_close(self):
+        """The installed container should be returned until it is closed."""
+        from studio.container import close_container, get_container, init_container
+
+        container = init_container(_container())
+
+        assert get_container() is container
+
+        await close_container()
+
+        assert container.http._clients == {}
@@ -0,0 +1,106 @@
+"""
+Tier 1: Data Loader Unit Tests
+
+Tests batching, de-duplication, batch size limits and error propagation of
+the DataLoader.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+
+def _batch_load():
+    return AsyncMock(side_effect=lambda keys: {key: key.upper() for key in keys})
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(1)
+class TestDataLoader:
+    """Test tick-scoped batching."""
+
+    @pytest.mark.asyncio
+    async def test_same_tick_loads_share_one_batch(self):
+        """Concurrent loads should be fetched with one de-duplicated batch."""
+        from studio.services.dataloader import DataLoader
+
+        batch_load = _batch_load()
+        loader = DataLoader(batch_load)
+
+        results = await asyncio.gather(
+            loader.load("a"), loader.load("b"), loader.load("a")
+        )
+
+        assert results == ["A", "B", "A"]
+        batch_load.assert_awaited_once_with(["a", "b"])
+
+    @pytest.mark.asyncio
+    async def test_later_ticks_query_again(self):
+        """Results should not be kept once their batch resolved."""
+        from studio.services.dataloader import DataLoader
+
+        batch_load = _batch_load()
+        loader = DataLoader(batch_load)
+
+        await loader.load("a")
+        await loader.load("a")
+
+        assert batch_load.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_batches_are_split_by_max_size(self):
+        """Batches larger than max_batch_size should be split."""
+        from studio.services.dataloader import DataLoader
+
+        batch_load = _batch_load()
+        loader = DataLoader(batch_load, max_batch_size=2)
+
+        assert await loader.load_many(["a", "b", "c"]) == ["A", "B", "C"]
+        assert [call.args[0] for call in batch_load.await_args_list] == [
+            ["a", "b"],
+            ["c"],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_missing_keys_resolve_to_none(self):
+        """Keys absent from the batch result should load as None."""
+        from studio.services.dataloader import DataLoader
+
+        loader = DataLoader(AsyncMock(return_value={}))
+
+        assert await loader.load("a") is None
+
+    @pytest.mark.asyncio
+    async def test_batch_errors_reach_every_load(self):
+        """A failing batch query should fail all of its loads."""
+        from studio.services.dataloader import DataLoader
+
+        loader = DataLoader(AsyncMock(side_effect=RuntimeError("db down")))
+
+        results = await asyncio.gather(
+            loader.load("a"), loader.load("b"), return_exceptions=True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(1)
+class TestGroupRecords:
+    """Test grouping of batch query records."""
+
+    def test_every_key_gets_a_list(self):
+        """Records should be grouped by key; keys without records get []."""
+        from studio.services.dataloader import group_records
+
+        records = [
+            {"id": "t1", "agent_id": "a"},
+            {"id": "t2", "agent_id": "a"},
+            {"id": "t3", "agent_id": "other"},
+        ]
+
+        assert group_records(records, "agent_id", ["a", "b"]) == {
+            "a": [records[0], records[1]],
+            "b": [],
+        }
@@ -435,6 +435,88 @@ class TestExternalAgentServiceValidation:
         assert result["external_agent_id"] == "ext_agent_123"
         assert result["status"] == "pending"
 
+    # ==================
+    # Cost Estimation Tests
+    # ==================
+
+    def test_estimate_invocation_cost_defaults_to_flat_cost(
+        self, external_agent_service
+    ):
+        """
+        Intent: Agents without a configured model fall back to a flat cost.
+        """
+        agent = {"config": "{}"}
+
+        cost = external_agent_service.estimate_invocation_cost(
+            agent, {"input": "test query"}
+        )
+
+        assert cost == 0.05
+
+    def test_estimate_invocation_cost_uses_model_pricing(
+        self, external_agent_service
+    ):
+        """
+        Intent: Agents with a model are priced by counted request tokens.
+        """
+        agent = {"config": json.dumps({"model": "gpt-4o"})}
+
+        small = external_agent_service.estimate_invocation_cost(agent, {"input": "hi"})
+        large = external_agent_service.estimate_invocation_cost(
+            agent, {"input": "hi " * 1000}
+        )
+
+        assert 0 < small < large
+
+    def test_calculate_actual_cost_uses_reported_usage(self, external_agent_service):
+        """
+        Intent: Reported usage overrides the pre-invocation estimate.
+        """
+        agent = {"config": json.dumps({"model": "gpt-4o"})}
+        response_data = {
+            "result": "ok",
+            "usage": {"prompt_tokens": 1000, "completion_tokens": 1000},
+        }
+
+        cost = external_agent_service.calculate_actual_cost(
+            agent, response_data, estimated_cost=0.05
+        )
+
+        # gpt-4o: $2.50 / 1M input + $10.00 / 1M output
+        assert cost == pytest.approx(0.0125)
+
+    def test_calculate_actual_cost_falls_back_to_estimate(
+        self, external_agent_service
+    ):
+        """
+        Intent: Without reported usage the estimate is recorded as actual cost.
+        """
+        cost = external_agent_service.calculate_actual_cost(
+            {"config": "{}"}, {"result": "ok"}, estimated_cost=0.05
+        )
+
+        assert cost == 0.05
+
+    def test_calculate_actual_cost_null_metadata(self, external_agent_service):
+        """
+        Intent: A null metadata block falls back to the estimate instead of failing.
+        """
+        cost = external_agent_service.calculate_actual_cost(
+            {"config": "{}"}, {"result": "ok", "metadata": None}, estimated_cost=0.05
+        )
+
+        assert cost == 0.05
+
+    def test_calculate_actual_cost_non_dict_usage(self, external_agent_service):
+        """
+        Intent: A usage value that is not an object falls back to the estimate.
+        """
+        cost = external_agent_service.calculate_actual_cost(
+            {"config": "{}"}, {"result": "ok", "usage": 42}, estimated_cost=0.05
+        )
+
+        assert cost == 0.05
+
 
 @pytest.fixture
 def external_agent_service():
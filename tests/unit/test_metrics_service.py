@@ -6,7 +6,7 @@ Tests metric recording, aggregations, and calculations in isolation.
 """
 
 from datetime import UTC, datetime, timedelta
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from studio.services.metrics_service import MetricsService
@@ -310,17 +310,10 @@ class TestMetricsSummary:
 
     @pytest.mark.asyncio
     async def test_get_summary_with_date_range_filter(self):
-        """Test summary filters by date range."""
+        """Test summary pushes the date range into the list query."""
         service = MetricsService()
         now = datetime.now(UTC)
         metrics = [
-            {
-                "status": "success",
-                "latency_ms": 100,
-                "total_tokens": 0,
-                "cost_usd": 0,
-                "created_at": (now - timedelta(days=1)).isoformat(),
-            },
             {
                 "status": "success",
                 "latency_ms": 100,
@@ -328,13 +321,6 @@ class TestMetricsSummary:
                 "cost_usd": 0,
                 "created_at": now.isoformat(),
             },
-            {
-                "status": "success",
-                "latency_ms": 100,
-                "total_tokens": 0,
-                "cost_usd": 0,
-                "created_at": (now + timedelta(days=1)).isoformat(),
-            },
         ]
         service.list = AsyncMock(return_value=metrics)
 
@@ -345,9 +331,32 @@ class TestMetricsSummary:
             organization_id="org-123", start_date=start_date, end_date=end_date
         )
 
-        # Only the middle metric should be included
+        call_kwargs = service.list.call_args.kwargs
+        assert call_kwargs["start_date"] == start_date
+        assert call_kwargs["end_date"] == end_date
         assert result["total_executions"] == 1
 
+    @pytest.mark.asyncio
+    async def test_list_filters_created_at_in_database(self):
+        """Test list sends the date window as created_at range operators."""
+        service = MetricsService()
+        service.runtime.execute_workflow_async = AsyncMock(
+            return_value=({"list_metrics": {"records": []}}, "run-1")
+        )
+
+        with patch("studio.services.metrics_service.WorkflowBuilder") as builder:
+            await service.list(
+                organization_id="org-123",
+                start_date="2026-01-01T00:00:00Z",
+                end_date="2026-01-02T00:00:00Z",
+            )
+
+        params = builder.return_value.add_node.call_args.args[2]
+        assert params["filter"]["created_at"] == {
+            "$gte": datetime(2026, 1, 1),
+            "$lte": datetime(2026, 1, 2),
+        }
+
 
 @pytest.mark.timeout(1)
 class TestMetricsTimeseries:
@@ -0,0 +1,147 @@
+"""
+Tier 1: Model Index Unit Tests
+
+Tests index declaration, DDL generation, table naming and the startup
+create/check of declared model indexes without a database.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(1)
+class TestIndexDeclaration:
+    """Test index definitions and DDL."""
+
+    def test_composite_index_sql(self):
+        """Composite indexes should be created concurrently and idempotently."""
+        from studio.models.indexes import Index
+
+        sql = Index("organization_id", "created_at").create_sql("audit_logs")
+
+        assert sql == (
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS "idx_audit_logs_organization_id'
+            '_created_at" ON "audit_logs" ("organization_id", "created_at")'
+        )
+
+    def test_partial_unique_index_sql(self):
+        """Partial indexes should carry their predicate."""
+        from studio.models.indexes import Index
+
+        index = Index("delegator_id", where="status = 'active'", unique=True)
+
+        sql = index.create_sql("trust_delegations")
+
+        assert sql.startswith("CREATE UNIQUE INDEX CONCURRENTLY")
+        assert sql.endswith("WHERE status = 'active'")
+
+    def test_long_names_are_truncated(self):
+        """Index names should fit PostgreSQL's identifier limit."""
+        from studio.models.indexes import MAX_IDENTIFIER_LENGTH, Index
+
+        name = Index("a" * 40, "b" * 40).index_name("table")
+
+        assert len(name) == MAX_IDENTIFIER_LENGTH
+
+    def test_index_requires_columns(self):
+        """An index without columns should be rejected."""
+        from studio.models.indexes import Index
+
+        with pytest.raises(ValueError):
+            Index()
+
+    @pytest.mark.parametrize(
+        "model_name,table",
+        [
+            ("APIKey", "api_keys"),
+            ("PolicyAssignment", "policy_assignments"),
+            ("InvocationLineage", "invocation_lineages"),
+            ("TrustDelegation", "trust_delegations"),
+            ("Policy", "policies"),
+            ("Run", "runs"),
+        ],
+    )
+    def test_table_names(self, model_name, table):
+        """Table names should follow DataFlow's naming."""
+        from studio.models.indexes import table_name
+
+        assert table_name(model_name) == table
+
+    def test_indexed_registers_model(self):
+        """@indexed should register the model's indexes by table."""
+        from studio.models.indexes import Index, declared_indexes, indexed
+
+        with patch("studio.models.indexes._MODEL_INDEXES", {}):
+
+            @indexed(Index("principal_type", "principal_id"))
+            class PolicyAssignment:
+                id: str
+
+            declared = declared_indexes()
+
+        table, index = declared["idx_policy_assignments_principal_type_principal_id"]
+        assert table == "policy_assignments"
+        assert PolicyAssignment.__studio_indexes__ == (index,)
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(1)
+class TestStartupIndexes:
+    """Test startup creation and checking of indexes."""
+
+    @pytest.mark.asyncio
+    async def test_ensure_creates_each_index(self):
+        """Every declared index should be created; failures are skipped."""
+        import asyncpg
+
+        from studio.models.indexes import Index, ensure_indexes
+
+        conn = AsyncMock()
+        conn.execute.side_effect = [None, asyncpg.PostgresError("boom")]
+        declared = {
+            "idx_a": ("a_table", Index("a")),
+            "idx_b": ("b_table", Index("b")),
+        }
+
+        with (
+            patch("studio.models.indexes.declared_indexes", return_value=declared),
+            patch("studio.models.indexes.asyncpg.connect", return_value=conn),
+        ):
+            ensured = await ensure_indexes("postgresql://db/test")
+
+        assert ensured == 1
+        assert conn.execute.await_count == 2
+        conn.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_check_reports_missing_indexes(self):
+        """Declared indexes absent from the database should be reported."""
+        from studio.models.indexes import Index, check_indexes
+
+        conn = AsyncMock()
+        conn.fetch.return_value = [{"relname": "idx_a"}, {"relname": "users_pkey"}]
+        declared = {
+            "idx_a": ("a_table", Index("a")),
+            "idx_b": ("b_table", Index("b")),
+        }
+
+        with (
+            patch("studio.models.indexes.declared_indexes", return_value=declared),
+            patch("studio.models.indexes.asyncpg.connect", return_value=conn),
+        ):
+            missing = await check_indexes("postgresql://db/test")
+
+        assert missing == ["idx_b"]
+
+    @pytest.mark.asyncio
+    async def test_non_postgres_database_is_skipped(self):
+        """Index management should be skipped on a non-PostgreSQL database."""
+        from studio.models.indexes import check_indexes, ensure_indexes
+
+        with patch("studio.models.indexes.asyncpg.connect") as connect:
+            assert await ensure_indexes("sqlite:///studio.db") == 0
+            assert await check_indexes("sqlite:///studio.db") == []
+
+        connect.assert_not_called()
@@ -0,0 +1,144 @@
+"""
+Tier 1: Cursor Pagination Unit Tests
+
+Tests cursor encoding, keyset filters and merging of keyset pages.
+"""
+
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+def _record(created_at: str, record_id: str) -> dict:
+    return {"id": record_id, "created_at": created_at}
+
+
+@pytest.fixture(autouse=True)
+def text_timestamps():
+    """Bind cursor keys as on non-native timestamp columns."""
+    with patch(
+        "studio.services.timestamps.get_settings",
+        return_value=MagicMock(native_timestamps=False),
+    ):
+        yield
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(1)
+class TestCursorEncoding:
+    """Test opaque cursor encoding."""
+
+    def test_round_trip(self):
+        """A cursor should decode to the record's (created_at, id) key."""
+        from studio.services.pagination import decode_cursor, encode_cursor
+
+        cursor = encode_cursor(_record("2026-01-01T00:00:00+00:00", "agent-1"))
+
+        assert decode_cursor(cursor) == ("2026-01-01T00:00:00+00:00", "agent-1")
+        assert "=" not in cursor
+
+    def test_datetime_keys_are_encoded(self):
+        """datetime created_at values should be encoded as ISO strings."""
+        from studio.services.pagination import decode_cursor, encode_cursor
+
+        cursor = encode_cursor({"id": "a", "created_at": datetime(2026, 1, 1)})
+
+        assert decode_cursor(cursor) == ("2026-01-01T00:00:00", "a")
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "W10", "WzEsMl0"])
+    def test_malformed_cursor_raises(self, cursor):
+        """Garbage, wrong arity or wrong types should raise ValueError."""
+        from studio.services.pagination import decode_cursor
+
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(1)
+class TestKeysetQuery:
+    """Test keyset ListNode parameters."""
+
+    def test_first_page(self):
+        """The first page should order by (created_at, id) and fetch one extra."""
+        from studio.services.pagination import KEYSET_ORDER, keyset_params
+
+        params = keyset_params({"organization_id": "org-1"}, None, 20)
+
+        assert params == {
+            "filter": {"organization_id": "org-1"},
+            "order_by": KEYSET_ORDER,
+            "limit": 21,
+        }
+
+    def test_cursor_page_filters_after_key(self):
+        """A cursor should add (created_at, id) < key and drop the offset."""
+        from studio.services.pagination import encode_cursor, keyset_params
+
+        cursor = encode_cursor(_record("2026-01-01T00:00:00+00:00", "agent-5"))
+
+        params = keyset_params({"organization_id": "org-1"}, cursor, 20, offset=40)
+
+        bound = datetime(2026, 1, 1)
+        assert params["filter"] == {
+            "organization_id": "org-1",
+            "$or": [
+                {"created_at": {"$lt": bound}},
+                {"created_at": bound, "id": {"$lt": "agent-5"}},
+            ],
+        }
+        assert "offset" not in params
+
+    def test_offset_without_cursor(self):
+        """Legacy offsets should still apply without a cursor."""
+        from studio.services.pagination import keyset_params
+
+        assert keyset_params({}, None, 20, offset=40)["offset"] == 40
+
+    def test_page_and_next_cursor(self):
+        """The extra record should be trimmed and yield the next cursor."""
+        from studio.services.pagination import decode_cursor, keyset_page
+
+        records = [_record(f"2026-01-0{day}", f"r{day}") for day in (3, 2, 1)]
+
+        page, next_cursor = keyset_page(records, 2)
+
+        assert [r["id"] for r in page] == ["r3", "r2"]
+        assert decode_cursor(next_cursor) == ("2026-01-02", "r2")
+        assert keyset_page(records, 3) == (records, None)
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(1)
+class TestMergedPages:
+    """Test merging of keyset pages of several sources."""
+
+    def test_sources_are_interleaved_newest_first(self):
+        """Merged records should follow the global (created_at, id) order."""
+        from studio.services.pagination import decode_cursor, merge_pages
+
+        agents = [
+            _record("2026-01-04T00:00:00+00:00", "a4"),
+            _record("2026-01-01T00:00:00+00:00", "a1"),
+        ]
+        pipelines = [
+            _record("2026-01-03T00:00:00Z", "p3"),
+            _record("2026-01-02T00:00:00", "p2"),
+        ]
+
+        page, next_cursor = merge_pages([agents, pipelines], 3)
+
+        assert [r["id"] for r in page] == ["a4", "p3", "p2"]
+        assert decode_cursor(next_cursor)[1] == "p2"
+
+    def test_last_merged_page_has_no_cursor(self):
+        """No cursor should be returned once all sources are exhausted."""
+        from studio.services.pagination import merge_pages
+
+        page, next_cursor = merge_pages(
+            [[_record("2026-01-02", "a")], [], [_record("2026-01-01", "b")]], 5
+        )
+
+        assert [r["id"] for r in page] == ["a", "b"]
+        assert next_cursor is None
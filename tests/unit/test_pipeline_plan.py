@@ -0,0 +1,170 @@
+"""
+Tier 1: Pipeline Plan Unit Tests
+
+Tests plan compilation (ordering, predecessors, validation) and the
+two-level plan cache in isolation.
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+
+def _node(node_id, node_type="agent", agent_id="agent-1"):
+    return {
+        "id": node_id,
+        "node_type": node_type,
+        "agent_id": agent_id if node_type == "agent" else "",
+        "label": node_id,
+    }
+
+
+def _conn(source, target):
+    return {
+        "id": f"{source}-{target}",
+        "source_node_id": source,
+        "target_node_id": target,
+    }
+
+
+def _fake_redis():
+    store = {}
+    client = AsyncMock()
+    client.get.side_effect = store.get
+    client.setex.side_effect = lambda key, ttl, value: store.__setitem__(key, value)
+    return client, store
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(1)
+class TestCompilePlan:
+    """Test compilation of pipeline graphs into execution plans."""
+
+    def test_nodes_are_topologically_ordered(self):
+        """Nodes saved out of order should run after their predecessors."""
+        from studio.services.pipeline_plan import compile_plan
+
+        nodes = [_node("out", "output"), _node("agent"), _node("in", "input")]
+        connections = [_conn("in", "agent"), _conn("agent", "out")]
+
+        plan = compile_plan({"id": "pipe-1"}, nodes, connections)
+
+        assert plan["order"] == ["in", "agent", "out"]
+        assert [n["id"] for n in plan["nodes"]] == ["in", "agent", "out"]
+        assert plan["predecessors"] == {"out": ["agent"], "agent": ["in"], "in": []}
+        assert plan["valid"] is True
+
+    def test_plan_holds_agent_ids_not_configs(self):
+        """Plans should list referenced agents without caching their configs."""
+        from studio.services.pipeline_plan import compile_plan
+
+        nodes = [
+            _node("in", "input"),
+            _node("a", agent_id="agent-1"),
+            _node("b", agent_id="agent-2"),
+            _node("c", agent_id="agent-1"),
+        ]
+
+        plan = compile_plan({"id": "pipe-1"}, nodes, [])
+
+        assert plan["agent_ids"] == ["agent-1", "agent-2"]
+        assert "agents" not in plan
+
+    def test_independent_nodes_keep_saved_order(self):
+        """Nodes without dependencies should keep their saved order."""
+        from studio.services.pipeline_plan import topological_order
+
+        nodes = [_node("b"), _node("a"), _node("c")]
+
+        assert topological_order(nodes, []) == ["b", "a", "c"]
+
+    def test_cycle_makes_plan_invalid(self):
+        """Cyclic graphs should compile to an invalid plan."""
+        from studio.services.pipeline_plan import compile_plan
+
+        nodes = [_node("a"), _node("b")]
+        connections = [_conn("a", "b"), _conn("b", "a")]
+
+        plan = compile_plan({"id": "pipe-1"}, nodes, connections)
+
+        assert plan["valid"] is False
+        assert "Pipeline contains cycles" in plan["errors"]
+
+    def test_validation_matches_graph_checks(self):
+        """Validation should report missing agents and invalid references."""
+        from studio.services.pipeline_plan import validate_graph
+
+        result = validate_graph([_node("a", agent_id="")], [_conn("a", "missing")])
+
+        assert result["valid"] is False
+        assert "Agent node 'a' has no agent assigned" in result["errors"]
+        assert "Connection references invalid target node: missing" in result["errors"]
+        assert "Pipeline has no input node" in result["warnings"]
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(1)
+class TestPipelinePlanCache:
+    """Test the in-memory and Redis plan cache."""
+
+    def _plan(self, updated_at="v1"):
+        from studio.services.pipeline_plan import compile_plan
+
+        return compile_plan(
+            {"id": "pipe-1", "updated_at": updated_at}, [_node("in", "input")], []
+        )
+
+    @pytest.mark.asyncio
+    async def test_hit_for_same_version(self):
+        """A cached plan should be returned for the same updated_at."""
+        from studio.services.pipeline_plan import PipelinePlanCache
+
+        client, _ = _fake_redis()
+        cache = PipelinePlanCache(redis_client=client)
+        plan = self._plan()
+
+        await cache.set(plan)
+
+        assert await cache.get("pipe-1", "v1") is plan
+        client.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_miss_for_new_version(self):
+        """An edited pipeline (new updated_at) should not match the old plan."""
+        from studio.services.pipeline_plan import PipelinePlanCache
+
+        client, _ = _fake_redis()
+        cache = PipelinePlanCache(redis_client=client)
+        await cache.set(self._plan("v1"))
+
+        assert await cache.get("pipe-1", "v2") is None
+
+    @pytest.mark.asyncio
+    async def test_redis_shares_plans_between_caches(self):
+        """Plans cached by one worker should be readable by another."""
+        from studio.services.pipeline_plan import PipelinePlanCache
+
+        client, _ = _fake_redis()
+        await PipelinePlanCache(redis_client=client).set(self._plan())
+
+        plan = await PipelinePlanCache(redis_client=client).get("pipe-1", "v1")
+
+        assert plan is not None
+        assert plan["order"] == ["in"]
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_are_cache_misses(self):
+        """Redis failures should not break plan lookups."""
+        import redis
+
+        from studio.services.pipeline_plan import PipelinePlanCache
+
+        client = AsyncMock()
+        client.get.side_effect = redis.ConnectionError("down")
+        client.setex.side_effect = redis.ConnectionError("down")
+        cache = PipelinePlanCache(redis_client=client)
+
+        await cache.set(self._plan())
+        cache.invalidate("pipe-1")
+
+        assert await cache.get("pipe-1", "v1") is None
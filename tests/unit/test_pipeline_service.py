@@ -680,3 +680,187 @@ class TestPipelineRelationships:
         )
         assert conn["source_node_id"] == node1["id"]
         assert conn["target_node_id"] == node2["id"]
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(1)
+class TestGraphDiff:
+    """Test incremental graph diffing used by save_graph."""
+
+    def _service(self):
+        from unittest.mock import patch
+
+        with patch("studio.services.pipeline_service.AsyncLocalRuntime"):
+            from studio.services.pipeline_service import PipelineService
+
+            return PipelineService()
+
+    def test_unchanged_graph_has_no_changes(
+        self, pipeline_node_factory, pipeline_connection_factory
+    ):
+        """Saving the stored graph again should write nothing."""
+        pipeline_id = str(uuid.uuid4())
+        node1 = pipeline_node_factory(pipeline_id=pipeline_id, node_type="input")
+        node2 = pipeline_node_factory(pipeline_id=pipeline_id, node_type="output")
+        conn = pipeline_connection_factory(
+            pipeline_id=pipeline_id,
+            source_node_id=node1["id"],
+            target_node_id=node2["id"],
+        )
+
+        diff = self._service().diff_graph(
+            pipeline_id, [node1, node2], [conn], [node1, node2], [conn]
+        )
+
+        assert diff["changed"] is False
+        assert diff["upsert_nodes"] == []
+        assert diff["removed_node_ids"] == []
+        assert diff["nodes"] == [node1, node2]
+        assert diff["connections"] == [conn]
+
+    def test_moved_node_is_updated(self, pipeline_node_factory):
+        """Only the node whose position changed should be written."""
+        pipeline_id = str(uuid.uuid4())
+        node1 = pipeline_node_factory(pipeline_id=pipeline_id)
+        node2 = pipeline_node_factory(pipeline_id=pipeline_id)
+        moved = {**node2, "position_x": 150.0}
+
+        diff = self._service().diff_graph(
+            pipeline_id, [node1, node2], [], [node1, moved], [], now="2030-01-01"
+        )
+
+        assert [n["id"] for n in diff["upsert_nodes"]] == [node2["id"]]
+        assert diff["upsert_nodes"][0]["position_x"] == 150.0
+        assert diff["upsert_nodes"][0]["created_at"] == node2["created_at"]
+        assert diff["upsert_nodes"][0]["updated_at"] == "2030-01-01"
+
+    def test_added_and_removed_items(
+        self, pipeline_node_factory, pipeline_connection_factory
+    ):
+        """New items are created and missing items are removed."""
+        pipeline_id = str(uuid.uuid4())
+        kept = pipeline_node_factory(pipeline_id=pipeline_id)
+        removed = pipeline_node_factory(pipeline_id=pipeline_id)
+        old_conn = pipeline_connection_factory(
+            pipeline_id=pipeline_id,
+            source_node_id=kept["id"],
+            target_node_id=removed["id"],
+        )
+        new_node = {"node_type": "output", "label": "Output", "config": {"a": 1}}
+
+        diff = self._service().diff_graph(
+            pipeline_id, [kept, removed], [old_conn], [kept, new_node], []
+        )
+
+        assert diff["removed_node_ids"] == [removed["id"]]
+        assert diff["removed_connection_ids"] == [old_conn["id"]]
+        assert len(diff["upsert_nodes"]) == 1
+        created = diff["upsert_nodes"][0]
+        uuid.UUID(created["id"])
+        assert created["pipeline_id"] == pipeline_id
+        assert json.loads(created["config"]) == {"a": 1}
+        assert [n["id"] for n in diff["nodes"]] == [kept["id"], created["id"]]
+
+    def test_foreign_ids_get_new_ids(
+        self, pipeline_node_factory, pipeline_connection_factory
+    ):
+        """IDs outside the stored graph must not be upserted as given."""
+        pipeline_id = str(uuid.uuid4())
+        kept = pipeline_node_factory(pipeline_id=pipeline_id)
+        foreign = pipeline_node_factory()
+        foreign_conn = pipeline_connection_factory(
+            source_node_id=kept["id"],
+            target_node_id=foreign["id"],
+        )
+
+        diff = self._service().diff_graph(
+            pipeline_id, [kept], [], [kept, foreign], [foreign_conn]
+        )
+
+        created = diff["upsert_nodes"][0]
+        assert created["id"] != foreign["id"]
+        assert created["pipeline_id"] == pipeline_id
+        conn = diff["upsert_connections"][0]
+        assert conn["id"] != foreign_conn["id"]
+        assert conn["source_node_id"] == kept["id"]
+        assert conn["target_node_id"] == created["id"]
+
+    async def test_save_graph_runs_in_one_transaction(self, pipeline_node_factory):
+        """Graph writes should be chained between transaction scope and commit."""
+        from unittest.mock import AsyncMock, patch
+
+        service = self._service()
+        pipeline_id = str(uuid.uuid4())
+        stored = pipeline_node_factory(pipeline_id=pipeline_id)
+        service.get_with_graph = AsyncMock(
+            return_value={"id": pipeline_id, "nodes": [stored], "connections": []}
+        )
+        service.runtime.execute_workflow_async = AsyncMock(return_value=({}, "run-1"))
+
+        with patch("studio.services.pipeline_service.WorkflowBuilder") as builder:
+            await service.save_graph(
+                pipeline_id,
+                [{"node_type": "input"}, {"node_type": "output"}],
+                [],
+            )
+
+        workflow = builder.return_value
+        node_ids = [call.args[1] for call in workflow.add_node.call_args_list]
+        edges = [call.args[:3:2] for call in workflow.add_connection.call_args_list]
+        assert node_ids == ["tx", "remove_nodes", "upsert_nodes", "touch", "commit"]
+        assert edges == [
+            ("tx", "remove_nodes"),
+            ("remove_nodes", "upsert_nodes"),
+            ("upsert_nodes", "touch"),
+            ("touch", "commit"),
+        ]
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(1)
+class TestGraphEditVersions:
+    """Test that single graph edits bump the pipeline version."""
+
+    def _service(self):
+        from unittest.mock import AsyncMock, patch
+
+        with patch("studio.services.pipeline_service.AsyncLocalRuntime"):
+            from studio.services.pipeline_service import PipelineService
+
+            service = PipelineService()
+        service.runtime.execute_workflow_async = AsyncMock(return_value=({}, "run-1"))
+        return service
+
+    @staticmethod
+    def _touched(builder):
+        return [
+            call.args[2]["filter"]["id"]
+            for call in builder.return_value.add_node.call_args_list
+            if call.args[1] == "touch"
+        ]
+
+    async def test_remove_node_looks_up_pipeline(self):
+        """Removing a node without a pipeline ID should still bump its version."""
+        from unittest.mock import AsyncMock, patch
+
+        service = self._service()
+        pipeline_id = str(uuid.uuid4())
+        service.get_node = AsyncMock(return_value={"pipeline_id": pipeline_id})
+
+        with patch("studio.services.pipeline_service.WorkflowBuilder") as builder:
+            await service.remove_node("node-1")
+
+        assert self._touched(builder) == [pipeline_id]
+
+    async def test_remove_connection_looks_up_pipeline(self):
+        """Removing a connection without a pipeline ID should bump its version."""
+        from unittest.mock import AsyncMock, patch
+
+        service = self._service()
+        pipeline_id = str(uuid.uuid4())
+        service.get_connection = AsyncMock(return_value={"pipeline_id": pipeline_id})
+
+        with patch("studio.services.pipeline_service.WorkflowBuilder") as builder:
+            await service.remove_connection("conn-1")
+
+        assert self._touched(builder) == [pipeline_id]
@@ -0,0 +1,207 @@
+"""
+Tier 1: Query Cache Unit Tests
+
+Tests node type parsing, type-preserving serialization, version-keyed reads
+and write invalidation of the DataFlow query cache.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+
+def _fake_redis():
+    store = {}
+    client = AsyncMock()
+    client.get.side_effect = store.get
+    client.setex.side_effect = lambda key, ttl, value: store.__setitem__(key, value)
+    client.incr.side_effect = lambda key: store.__setitem__(
+        key, str(int(store.get(key, 0)) + 1)
+    )
+    return client, store
+
+
+def _runtime(result):
+    runtime = MagicMock()
+    runtime.execute_workflow_async = AsyncMock(return_value=(result, "run-1"))
+    return runtime
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(1)
+class TestNodeTypes:
+    """Test parsing of DataFlow node types."""
+
+    @pytest.mark.parametrize(
+        "node_type,expected",
+        [
+            ("AgentReadNode", ("Agent", "Read")),
+            ("AgentVersionListNode", ("AgentVersion", "List")),
+            ("AuditLogCountNode", ("AuditLog", "Count")),
+            ("AgentBulkDeleteNode", ("Agent", "BulkDelete")),
+            ("AgentToolUpsertNode", ("AgentTool", "Upsert")),
+            ("PythonCodeNode", None),
+        ],
+    )
+    def test_parse_node_type(self, node_type, expected):
+        """Generated CRUD nodes should split into model and operation."""
+        from studio.services.query_cache import parse_node_type
+
+        assert parse_node_type(node_type) == expected
+
+    def test_serialization_keeps_types(self):
+        """Datetimes and decimals should survive a cache round trip."""
+        from studio.services.query_cache import dumps, loads
+
+        record = {"created_at": datetime(2026, 1, 1, 12), "cost": Decimal("1.50")}
+
+        assert loads(dumps({"records": [record]})) == {"records": [record]}
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(1)
+class TestQueryCache:
+    """Test version-keyed caching."""
+
+    @pytest.mark.asyncio
+    async def test_hit_at_same_version(self):
+        """A result cached at a version should be returned at that version."""
+        from studio.services.query_cache import QueryCache
+
+        client, _ = _fake_redis()
+        cache = QueryCache(redis_client=client)
+        version = await cache.get_version("Agent")
+
+        await cache.set("Agent", version, "AgentReadNode", {"id": "a"}, {"id": "a"})
+
+        assert version == 0
+        assert await cache.get("Agent", version, "AgentReadNode", {"id": "a"}) == {
+            "id": "a"
+        }
+        assert await cache.get("Agent", version, "AgentReadNode", {"id": "b"}) is None
+
+    @pytest.mark.asyncio
+    async def test_bump_hides_older_entries(self):
+        """A write should make entries of earlier versions unreachable."""
+        from studio.services.query_cache import QueryCache
+
+        client, _ = _fake_redis()
+        cache = QueryCache(redis_client=client)
+        await cache.set("Agent", 0, "AgentReadNode", {"id": "a"}, {"id": "a"})
+
+        await cache.bump_version("Agent")
+
+        version = await cache.get_version("Agent")
+        assert version == 1
+        assert await cache.get("Agent", version, "AgentReadNode", {"id": "a"}) is None
+
+    def test_opted_out_models_are_not_cached(self):
+        """Models without a TTL (or with 0) should be opted out."""
+        from studio.services.query_cache import QueryCache
+
+        client, _ = _fake_redis()
+        cache = QueryCache(redis_client=client, ttl_seconds={"Agent": 0})
+
+        assert not cache.is_cached("Agent")
+        assert not cache.is_cached("User")
+
+    def test_default_client_is_async_with_timeouts(self):
+        """The app Redis should be used through the asyncio client."""
+        from studio.services.query_cache import (
+            QUERY_CACHE_SOCKET_TIMEOUT_SECONDS,
+            QueryCache,
+        )
+
+        with patch("studio.services.query_cache.aioredis.from_url") as from_url:
+            cache = QueryCache()
+
+        assert cache.redis_client is from_url.return_value
+        assert from_url.call_args.kwargs == {
+            "socket_timeout": QUERY_CACHE_SOCKET_TIMEOUT_SECONDS,
+            "socket_connect_timeout": QUERY_CACHE_SOCKET_TIMEOUT_SECONDS,
+        }
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_are_cache_misses(self):
+        """Redis failures should not break reads or writes."""
+        import redis
+
+        from studio.services.query_cache import QueryCache
+
+        client = AsyncMock()
+        client.get.side_effect = redis.ConnectionError("down")
+        client.incr.side_effect = redis.ConnectionError("down")
+        cache = QueryCache(redis_client=client)
+
+        await cache.bump_version("Agent")
+
+        assert await cache.get_version("Agent") is None
+        assert await cache.get("Agent", 0, "AgentReadNode", {"id": "a"}) is None
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(1)
+class TestCachedExecuteNode:
+    """Test read-through and invalidation in execute_node."""
+
+    def _patches(self, cache):
+        return (
+            patch(
+                "studio.services.workflow_templates.get_query_cache", return_value=cache
+            ),
+            patch("studio.services.workflow_templates.WorkflowBuilder"),
+        )
+
+    @pytest.mark.asyncio
+    async def test_repeated_read_is_served_from_cache(self):
+        """The second identical read should not reach the database."""
+        from studio.services.query_cache import QueryCache
+        from studio.services.workflow_templates import execute_node
+
+        client, _ = _fake_redis()
+        runtime = _runtime({"read": {"id": "a", "name": "Agent"}})
+        cache_patch, builder_patch = self._patches(QueryCache(redis_client=client))
+
+        with cache_patch, builder_patch:
+            first = await execute_node(runtime, "AgentReadNode", "read", {"id": "a"})
+            second = await execute_node(runtime, "AgentReadNode", "read", {"id": "a"})
+
+        assert first == second == {"read": {"id": "a", "name": "Agent"}}
+        runtime.execute_workflow_async.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_reads(self):
+        """A write node should force the next read back to the database."""
+        from studio.services.query_cache import QueryCache
+        from studio.services.workflow_templates import execute_node
+
+        client, _ = _fake_redis()
+        runtime = _runtime({"read": {"id": "a"}})
+        cache_patch, builder_patch = self._patches(QueryCache(redis_client=client))
+
+        with cache_patch, builder_patch:
+            await execute_node(runtime, "AgentReadNode", "read", {"id": "a"})
+            await execute_node(runtime, "AgentUpdateNode", "update", {"id": "a"})
+            await execute_node(runtime, "AgentReadNode", "read", {"id": "a"})
+
+        assert runtime.execute_workflow_async.await_count == 3
+        client.incr.assert_called_once_with("dataflow:version:Agent")
+
+    @pytest.mark.asyncio
+    async def test_opted_out_model_bypasses_cache(self):
+        """Reads of models without a TTL should always run the node."""
+        from studio.services.query_cache import QueryCache
+        from studio.services.workflow_templates import execute_node
+
+        client, _ = _fake_redis()
+        runtime = _runtime({"read": {"id": "u"}})
+        cache_patch, builder_patch = self._patches(QueryCache(redis_client=client))
+
+        with cache_patch, builder_patch:
+            await execute_node(runtime, "UserReadNode", "read", {"id": "u"})
+            await execute_node(runtime, "UserReadNode", "read", {"id": "u"})
+
+        assert runtime.execute_workflow_async.await_count == 2
+        client.get.assert_not_called()
@@ -0,0 +1,124 @@
+"""
+Tier 1: Read Repository Unit Tests
+
+Tests hot-query dispatch, row shapes and database URL handling of the
+direct-read repository without a database.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+
+class _Record(dict):
+    """Stand-in for asyncpg.Record (a mapping)."""
+
+
+def _repository(fetchrow=None, fetch=None):
+    from studio.services.read_repository import ReadRepository
+
+    pool = MagicMock()
+    pool.fetchrow = AsyncMock(return_value=fetchrow)
+    pool.fetch = AsyncMock(return_value=fetch or [])
+    pool.close = AsyncMock()
+
+    repository = ReadRepository(database_url="postgresql://db/test", max_size=2)
+    repository._pool = pool
+    return repository, pool
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(1)
+class TestHotQueries:
+    """Test the prepared hot queries."""
+
+    @pytest.mark.asyncio
+    async def test_get_user_returns_row_dict(self):
+        """A single-row read should return the row as a plain dict."""
+        from studio.services.read_repository import HOT_QUERIES
+
+        repository, pool = _repository(fetchrow=_Record(id="user-1", role="admin"))
+
+        user = await repository.get_user("user-1")
+
+        assert user == {"id": "user-1", "role": "admin"}
+        assert type(user) is dict
+        pool.fetchrow.assert_awaited_once_with(HOT_QUERIES["user_by_id"], "user-1")
+
+    @pytest.mark.asyncio
+    async def test_missing_row_returns_none(self):
+        """A read without a match should return None like a missing record."""
+        repository, _ = _repository(fetchrow=None)
+
+        assert await repository.get_agent("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_api_key_lookup_by_prefix(self):
+        """API keys should be looked up by prefix with a single-row query."""
+        from studio.services.read_repository import HOT_QUERIES
+
+        repository, pool = _repository(fetchrow=_Record(key_prefix="sk_live_ab"))
+
+        await repository.find_api_key("sk_live_ab")
+
+        query = pool.fetchrow.call_args.args[0]
+        assert query == HOT_QUERIES["api_key_by_prefix"]
+        assert query.endswith("LIMIT 1")
+
+    @pytest.mark.asyncio
+    async def test_policy_assignments_return_all_rows(self):
+        """Assignment lists should return every matching row."""
+        rows = [_Record(id="a1"), _Record(id="a2")]
+        repository, pool = _repository(fetch=rows)
+
+        assignments = await repository.list_policy_assignments("role", "admin")
+
+        assert assignments == [{"id": "a1"}, {"id": "a2"}]
+        assert pool.fetch.call_args.args[1:] == ("role", "admin")
+
+    @pytest.mark.asyncio
+    async def test_close_releases_pool(self):
+        """Closing should close the pool so it can be reopened later."""
+        repository, pool = _repository()
+
+        await repository.close()
+
+        pool.close.assert_awaited_once()
+        assert repository._pool is None
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(1)
+class TestDatabaseURL:
+    """Test database URL handling."""
+
+    def test_driver_suffix_is_stripped(self):
+        """SQLAlchemy-style driver suffixes should be removed for asyncpg."""
+        from studio.services.read_repository import get_direct_database_url
+
+        with patch.dict(
+            "os.environ",
+            {"ENVIRONMENT": "production", "DATABASE_URL": "postgresql+asyncpg://h/db"},
+        ):
+            assert get_direct_database_url() == "postgresql://h/db"
+
+    def test_pool_size_defaults_to_direct_read_setting(self):
+        """The pool should use its own small size, not the DataFlow pool size."""
+        from studio.config import get_settings
+        from studio.services.read_repository import ReadRepository
+
+        repository = ReadRepository(database_url="postgresql://db/test")
+
+        assert repository.max_size == get_settings().direct_read_pool_size
+
+    @pytest.mark.asyncio
+    async def test_non_postgres_database_disables_repository(self):
+        """A non-PostgreSQL database should disable direct reads."""
+        from studio.services.read_repository import ReadRepository
+
+        repository = ReadRepository(database_url="sqlite:///studio.db", max_size=1)
+
+        with pytest.raises(RuntimeError):
+            await repository.get_user("user-1")
+
+        assert repository.enabled is False
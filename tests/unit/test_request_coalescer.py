@@ -0,0 +1,153 @@
+"""
+Tier 1: Request Coalescer Unit Tests
+
+Tests singleflight coalescing of LLM calls and stream multicasting in isolation.
+"""
+
+import asyncio
+
+import pytest
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(1)
+class TestRequestKey:
+    """Test canonical request hashing and coalescing policy."""
+
+    def test_request_key_ignores_argument_order(self):
+        """Equivalent requests should produce the same key."""
+        from studio.services.request_coalescer import request_key
+
+        key_a = request_key(model="gpt-4o", prompt="hi", temperature=0)
+        key_b = request_key(temperature=0, prompt="hi", model="gpt-4o")
+
+        assert key_a == key_b
+
+    def test_request_key_differs_for_different_prompts(self):
+        """Different requests should produce different keys."""
+        from studio.services.request_coalescer import request_key
+
+        assert request_key(prompt="a") != request_key(prompt="b")
+
+    def test_should_coalesce_deterministic_only_by_default(self):
+        """Sampled requests should not coalesce unless explicitly allowed."""
+        from studio.services.request_coalescer import should_coalesce
+
+        assert should_coalesce(0.0) is True
+        assert should_coalesce(0.7) is False
+        assert should_coalesce(0.7, allow_nondeterministic=True) is True
+        assert should_coalesce(0.0, enabled=False) is False
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(1)
+class TestRequestCoalescerRun:
+    """Test coalescing of non-streaming calls."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_share_one_upstream_call(self):
+        """N concurrent callers should trigger a single upstream call."""
+        from studio.services.request_coalescer import RequestCoalescer
+
+        coalescer = RequestCoalescer()
+        calls = 0
+
+        async def upstream():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"content": "hello", "usage": {"total_tokens": 3}}
+
+        results = await asyncio.gather(
+            *[coalescer.run("key", upstream) for _ in range(5)]
+        )
+
+        assert calls == 1
+        assert all(r["content"] == "hello" for r in results)
+        assert sum(1 for r in results if r.get("coalesced")) == 4
+        assert coalescer.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_results_are_independent_copies(self):
+        """Mutating one caller's result should not affect another's."""
+        from studio.services.request_coalescer import RequestCoalescer
+
+        coalescer = RequestCoalescer()
+
+        async def upstream():
+            await asyncio.sleep(0.01)
+            return {"usage": {"total_tokens": 3}}
+
+        first, second = await asyncio.gather(
+            coalescer.run("key", upstream), coalescer.run("key", upstream)
+        )
+        first["usage"]["total_tokens"] = 0
+
+        assert second["usage"]["total_tokens"] == 3
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_to_all_callers(self):
+        """An upstream failure should be raised to every waiting caller."""
+        from studio.services.request_coalescer import RequestCoalescer
+
+        coalescer = RequestCoalescer()
+
+        async def upstream():
+            await asyncio.sleep(0.01)
+            raise ValueError("provider down")
+
+        results = await asyncio.gather(
+            coalescer.run("key", upstream),
+            coalescer.run("key", upstream),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert coalescer.in_flight == 0
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(1)
+class TestRequestCoalescerStream:
+    """Test multicasting of streaming calls."""
+
+    @pytest.mark.asyncio
+    async def test_stream_is_multicast_to_all_subscribers(self):
+        """Subscribers should all receive every chunk from one upstream stream."""
+        from studio.services.request_coalescer import RequestCoalescer
+
+        coalescer = RequestCoalescer()
+        opened = 0
+
+        async def upstream():
+            nonlocal opened
+            opened += 1
+            for chunk in ["a", "b", "c"]:
+                await asyncio.sleep(0.005)
+                yield chunk
+
+        async def consume():
+            return [chunk async for chunk in coalescer.stream("key", upstream)]
+
+        results = await asyncio.gather(consume(), consume(), consume())
+
+        assert opened == 1
+        assert results == [["a", "b", "c"]] * 3
+
+    @pytest.mark.asyncio
+    async def test_stream_error_reaches_subscribers(self):
+        """An upstream stream failure should be raised after buffered chunks."""
+        from studio.services.request_coalescer import RequestCoalescer
+
+        coalescer = RequestCoalescer()
+
+        async def upstream():
+            yield "a"
+            raise RuntimeError("stream broke")
+
+        received = []
+        with pytest.raises(RuntimeError, match="stream broke"):
+            async for chunk in coalescer.stream("key", upstream):
+                received.append(chunk)
+
+        assert received == ["a"]
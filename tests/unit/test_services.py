@@ -527,8 +527,18 @@ class TestTeamService:
                     {
                         "members": {
                             "records": [
-                                {"id": "m-1", "user_id": "u-1", "role": "team_lead"},
-                                {"id": "m-2", "user_id": "u-2", "role": "member"},
+                                {
+                                    "id": "m-1",
+                                    "team_id": "team-123",
+                                    "user_id": "u-1",
+                                    "role": "team_lead",
+                                },
+                                {
+                                    "id": "m-2",
+                                    "team_id": "team-123",
+                                    "user_id": "u-2",
+                                    "role": "member",
+                                },
                             ]
                         }
                     },
@@ -572,35 +582,16 @@ class TestTeamService:
 
     @pytest.mark.asyncio
     async def test_delete_team_cascades_memberships(self, team_service):
-        """Test deleting a team cascades to memberships."""
+        """Test deleting a team cascades to memberships in one workflow."""
         with patch.object(
             team_service.runtime, "execute_workflow_async", new_callable=AsyncMock
         ) as mock_execute:
-            mock_execute.side_effect = [
-                # Find members
-                (
-                    {
-                        "find_members": {
-                            "records": [
-                                {"id": "m-1"},
-                                {"id": "m-2"},
-                            ]
-                        }
-                    },
-                    "run-1",
-                ),
-                # Delete membership 1
-                ({}, "run-2"),
-                # Delete membership 2
-                ({}, "run-3"),
-                # Delete team
-                ({}, "run-4"),
-            ]
+            mock_execute.return_value = ({}, "run-1")
 
             result = await team_service.delete_team("team-123")
 
             assert result is True
-            assert mock_execute.call_count == 4
+            assert mock_execute.call_count == 1
 
     @pytest.mark.asyncio
     async def test_list_teams(self, team_service):
@@ -0,0 +1,134 @@
+"""
+Tier 1: Stream Framer Unit Tests
+
+Tests SSE encoding, delta coalescing, and backpressure in isolation.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+
+def _parse(frame: bytes) -> tuple[str, dict]:
+    """Split an encoded SSE event into its name and JSON payload."""
+    event_line, data_line = frame.decode().rstrip("\n").split("\n")
+    return event_line.removeprefix("event: "), json.loads(
+        data_line.removeprefix("data: ")
+    )
+
+
+async def _deltas(chunks, delay=0.0):
+    for chunk in chunks:
+        if delay:
+            await asyncio.sleep(delay)
+        yield chunk
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(1)
+class TestEncoding:
+    """Test SSE event encoding."""
+
+    def test_encode_event(self):
+        """Events should be encoded as SSE with a JSON payload."""
+        from studio.services.stream_framer import encode_event
+
+        event, data = _parse(encode_event("done", {"type": "done", "usage": {}}))
+
+        assert event == "done"
+        assert data == {"type": "done", "usage": {}}
+
+    def test_content_frame_envelope(self):
+        """Content frames should carry type, thread_id and escaped content."""
+        from studio.services.stream_framer import StreamFramer
+
+        event, data = _parse(StreamFramer("thread-1").encode('say "hi"\n'))
+
+        assert event == "content"
+        assert data == {
+            "type": "content",
+            "thread_id": "thread-1",
+            "content": 'say "hi"\n',
+        }
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(1)
+class TestStreamFramer:
+    """Test coalescing of content deltas into frames."""
+
+    @pytest.mark.asyncio
+    async def test_fast_deltas_are_coalesced(self):
+        """Deltas arriving within the window should share one frame."""
+        from studio.services.stream_framer import StreamFramer
+
+        framer = StreamFramer("t", max_bytes=1024, max_delay=0.05)
+
+        frames = [f async for f in framer.frames(_deltas(["He", "llo", " ", "world"]))]
+
+        assert len(frames) == 1
+        assert _parse(frames[0])[1]["content"] == "Hello world"
+
+    @pytest.mark.asyncio
+    async def test_byte_budget_flushes_frames(self):
+        """A frame should be flushed once it reaches the byte budget."""
+        from studio.services.stream_framer import StreamFramer
+
+        framer = StreamFramer("t", max_bytes=4, max_delay=10)
+
+        frames = [f async for f in framer.frames(_deltas(["ab", "cd", "ef", "g"]))]
+
+        assert [_parse(f)[1]["content"] for f in frames] == ["abcd", "efg"]
+
+    @pytest.mark.asyncio
+    async def test_time_window_flushes_slow_deltas(self):
+        """Slow deltas should be flushed when the time window expires."""
+        from studio.services.stream_framer import StreamFramer
+
+        framer = StreamFramer("t", max_bytes=1024, max_delay=0.005)
+
+        frames = [f async for f in framer.frames(_deltas(["a", "b", "c"], 0.03))]
+
+        assert [_parse(f)[1]["content"] for f in frames] == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_upstream_error_raised_after_flush(self):
+        """Content received before an upstream error should still be delivered."""
+        from studio.services.stream_framer import StreamFramer
+
+        async def failing():
+            yield "partial"
+            raise RuntimeError("provider down")
+
+        framer = StreamFramer("t", max_delay=10)
+        frames = []
+
+        with pytest.raises(RuntimeError, match="provider down"):
+            async for frame in framer.frames(failing()):
+                frames.append(frame)
+
+        assert [_parse(f)[1]["content"] for f in frames] == ["partial"]
+
+    @pytest.mark.asyncio
+    async def test_slow_client_pauses_upstream(self):
+        """The upstream stream should not be read far ahead of the client."""
+        from studio.services.stream_framer import StreamFramer
+
+        produced = 0
+
+        async def upstream():
+            nonlocal produced
+            for _ in range(1000):
+                produced += 1
+                yield "x"
+
+        framer = StreamFramer("t", max_bytes=1, queue_size=4)
+        frames = framer.frames(upstream())
+
+        await frames.__anext__()
+        await asyncio.sleep(0.01)
+
+        # One frame consumed, queue full, one delta waiting to be queued
+        assert produced <= 1 + 4 + 1
+        await frames.aclose()
@@ -122,16 +122,12 @@ class TestPipelineTestExecution:
         test_service = TestService()
 
         # Mock pipeline service
-        test_service.pipeline_service.get_with_graph = AsyncMock(
+        test_service.pipeline_service.get_plan = AsyncMock(
             return_value={
-                "id": "pipe-1",
+                "pipeline_id": "pipe-1",
                 "organization_id": "org-1",
                 "name": "Test Pipeline",
                 "nodes": [],
-            }
-        )
-        test_service.pipeline_service.validate = AsyncMock(
-            return_value={
                 "valid": True,
                 "errors": [],
             }
@@ -173,7 +169,7 @@ class TestPipelineTestExecution:
         from studio.services.test_service import TestService
 
         test_service = TestService()
-        test_service.pipeline_service.get_with_graph = AsyncMock(return_value=None)
+        test_service.pipeline_service.get_plan = AsyncMock(return_value=None)
 
         with pytest.raises(ValueError, match="Pipeline .* not found"):
             await test_service.run_pipeline_test(
@@ -188,14 +184,10 @@ class TestPipelineTestExecution:
         from studio.services.test_service import TestService
 
         test_service = TestService()
-        test_service.pipeline_service.get_with_graph = AsyncMock(
+        test_service.pipeline_service.get_plan = AsyncMock(
             return_value={
-                "id": "pipe-1",
+                "pipeline_id": "pipe-1",
                 "organization_id": "org-1",
-            }
-        )
-        test_service.pipeline_service.validate = AsyncMock(
-            return_value={
                 "valid": False,
                 "errors": ["Missing required connection"],
             }
@@ -233,6 +225,35 @@ class TestPipelineTestExecution:
         assert "_token_usage" in result
         assert "nodes_executed" in result
 
+    @pytest.mark.asyncio
+    async def test_execute_pipeline_reads_agents_per_run(self):
+        """Should read the plan's agents on every run, not from the plan."""
+        from studio.services.test_service import TestService
+
+        test_service = TestService()
+        test_service.agent_service.get_many = AsyncMock(return_value={})
+
+        plan = {
+            "pipeline_id": "pipe-1",
+            "pattern": "sequential",
+            "nodes": [
+                {"id": "node-1", "node_type": "input", "label": "Input"},
+                {
+                    "id": "node-2",
+                    "node_type": "agent",
+                    "agent_id": "agent-1",
+                    "label": "Agent",
+                },
+            ],
+            "agent_ids": ["agent-1"],
+        }
+
+        await test_service._execute_pipeline(plan, {"data": "test"}, {})
+        await test_service._execute_pipeline(plan, {"data": "test"}, {})
+
+        assert test_service.agent_service.get_many.await_count == 2
+        test_service.agent_service.get_many.assert_awaited_with(["agent-1"])
+
 
 @pytest.mark.unit
 @pytest.mark.timeout(1)
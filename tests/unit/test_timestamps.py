@@ -0,0 +1,101 @@
+"""
+Tier 1: Timestamp Unit Tests
+
+Tests timestamp parsing, the canonical UTC form and database time windows.
+"""
+
+from datetime import UTC, datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(1)
+class TestCanonicalTimestamps:
+    """Test parsing and canonical formatting."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "2026-01-01T12:00:00Z",
+            "2026-01-01T12:00:00",
+            "2026-01-01T12:00:00+00:00",
+            "2026-01-01T14:00:00+02:00",
+            datetime(2026, 1, 1, 12, tzinfo=UTC),
+        ],
+    )
+    def test_formats_normalize_to_utc(self, value):
+        """Every ISO-8601 variant should map to the same canonical string."""
+        from studio.services.timestamps import format_timestamp
+
+        assert format_timestamp(value) == "2026-01-01T12:00:00.000000+00:00"
+
+    def test_canonical_strings_sort_chronologically(self):
+        """Text order of canonical timestamps should equal time order."""
+        from studio.services.timestamps import format_timestamp
+
+        base = datetime(2026, 1, 1, 23, 59, 59, tzinfo=timezone(timedelta(hours=-5)))
+        times = [base + timedelta(microseconds=step) for step in (0, 1, 999_999)]
+        times.append(datetime(2026, 1, 2, 4, 59, 59, tzinfo=UTC))
+
+        canonical = [format_timestamp(t) for t in times]
+
+        assert sorted(canonical) == [format_timestamp(t) for t in sorted(times)]
+
+    def test_invalid_value_raises(self):
+        """Non-ISO values should raise ValueError."""
+        from studio.services.timestamps import parse_timestamp
+
+        with pytest.raises(ValueError):
+            parse_timestamp("yesterday")
+        with pytest.raises(ValueError):
+            parse_timestamp("")
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(1)
+class TestTimeRange:
+    """Test database time window filters."""
+
+    def _settings(self, native: bool):
+        return patch(
+            "studio.services.timestamps.get_settings",
+            return_value=MagicMock(native_timestamps=native),
+        )
+
+    def test_text_column_uses_canonical_strings(self):
+        """Text columns should be bounded by canonical strings ($gte/$lt)."""
+        from studio.services.timestamps import time_range
+
+        with self._settings(native=False):
+            window = time_range(
+                "recorded_at", "2026-01-01T00:00:00Z", "2026-02-01T00:00:00Z"
+            )
+
+        assert window == {
+            "$gte": "2026-01-01T00:00:00.000000+00:00",
+            "$lt": "2026-02-01T00:00:00.000000+00:00",
+        }
+
+    def test_managed_column_uses_naive_utc(self):
+        """DataFlow-managed created_at should be bounded by naive UTC datetimes."""
+        from studio.services.timestamps import time_range
+
+        with self._settings(native=False):
+            window = time_range(
+                "created_at", "2026-01-01T02:00:00+02:00", inclusive_end=False
+            )
+
+        assert window == {"$gte": datetime(2026, 1, 1)}
+
+    def test_native_timestamps_use_aware_datetimes(self):
+        """After conversion to timestamptz, bounds should be aware datetimes."""
+        from studio.services.timestamps import time_range
+
+        with self._settings(native=True):
+            window = time_range(
+                "recorded_at", end="2026-01-01T00:00:00Z", inclusive_end=True
+            )
+
+        assert window == {"$lte": datetime(2026, 1, 1, tzinfo=UTC)}
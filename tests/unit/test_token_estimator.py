@@ -0,0 +1,99 @@
+"""
+Tier 1: Token Estimator Unit Tests
+
+Tests local token counting, usage normalization, and cost estimation.
+"""
+
+import pytest
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(1)
+class TestNormalizeUsage:
+    """Test normalization of provider usage blocks."""
+
+    def test_normalizes_openai_usage(self):
+        """OpenAI prompt/completion tokens map to input/output."""
+        from studio.services.token_estimator import normalize_usage
+
+        usage = normalize_usage(
+            {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}
+        )
+
+        assert usage == {"input": 10, "output": 5, "total": 15}
+
+    def test_normalizes_anthropic_usage(self):
+        """Anthropic input/output tokens map to input/output with a computed total."""
+        from studio.services.token_estimator import normalize_usage
+
+        usage = normalize_usage({"input_tokens": 7, "output_tokens": 3})
+
+        assert usage == {"input": 7, "output": 3, "total": 10}
+
+    def test_empty_usage(self):
+        """Missing usage normalizes to zeros."""
+        from studio.services.token_estimator import normalize_usage
+
+        assert normalize_usage(None) == {"input": 0, "output": 0, "total": 0}
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(1)
+class TestTokenEstimator:
+    """Test token counting and cost estimation."""
+
+    def test_count_empty_text_is_zero(self):
+        """Empty text has no tokens."""
+        from studio.services.token_estimator import TokenEstimator
+
+        assert TokenEstimator().count("", model="gpt-4o") == 0
+
+    def test_count_grows_with_text_length(self):
+        """Longer text should have more tokens."""
+        from studio.services.token_estimator import TokenEstimator
+
+        estimator = TokenEstimator()
+
+        assert estimator.count("hello " * 100) > estimator.count("hello")
+
+    def test_count_batch_matches_individual_counts(self):
+        """Batched counting should match counting each text separately."""
+        from studio.services.token_estimator import TokenEstimator
+
+        estimator = TokenEstimator()
+        texts = ["hello world", "", "a longer piece of text to count"]
+
+        assert estimator.count_batch(texts, "gpt-4o") == [
+            estimator.count(t, "gpt-4o") for t in texts
+        ]
+
+    def test_count_messages_includes_all_messages(self):
+        """Prompt token counts should include system prompt and history."""
+        from studio.services.token_estimator import TokenEstimator
+
+        estimator = TokenEstimator()
+        base = estimator.count_messages("gpt-4o", user_message="hi")
+        with_history = estimator.count_messages(
+            "gpt-4o",
+            system_prompt="You are helpful.",
+            user_message="hi",
+            conversation_history=[{"role": "assistant", "content": "Hello!"}],
+        )
+
+        assert with_history > base
+
+    def test_estimate_cost_uses_model_pricing(self):
+        """Known models are priced per million input and output tokens."""
+        from studio.services.token_estimator import TokenEstimator
+
+        cost = TokenEstimator().estimate_cost("gpt-4o", 1_000_000, 1_000_000)
+
+        assert cost == pytest.approx(12.50)
+
+    def test_estimate_cost_unknown_model_uses_default_price(self):
+        """Unknown models use the default billing token price."""
+        from studio.services.token_estimator import TokenEstimator
+
+        cost = TokenEstimator().estimate_cost("unknown-model", 1000, 0)
+
+        assert cost == pytest.approx(0.002)
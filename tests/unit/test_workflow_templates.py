@@ -0,0 +1,131 @@
+"""
+Tier 1: Workflow Template Unit Tests
+
+Tests shape keying, placeholder configs, LRU eviction and parameter binding
+of the single-node workflow template cache.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(1)
+class TestParameterShape:
+    """Test parameter shape computation."""
+
+    def test_values_do_not_change_shape(self):
+        """Parameters differing only in values should share a shape."""
+        from studio.services.workflow_templates import parameter_shape
+
+        assert parameter_shape({"id": "a", "limit": 1}) == parameter_shape(
+            {"limit": 50, "id": "b"}
+        )
+
+    def test_keys_and_types_change_shape(self):
+        """Different keys, nesting or leaf types should give different shapes."""
+        from studio.services.workflow_templates import parameter_shape
+
+        base = parameter_shape({"filter": {"id": "a"}})
+
+        assert parameter_shape({"filter": {"name": "a"}}) != base
+        assert parameter_shape({"filter": {"id": {"$in": ["a"]}}}) != base
+        assert parameter_shape({"filter": "a"}) != base
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(1)
+class TestWorkflowTemplateCache:
+    """Test template reuse and eviction."""
+
+    def test_same_shape_reuses_workflow(self):
+        """Calls with the same node and shape should build once."""
+        from studio.services.workflow_templates import WorkflowTemplateCache
+
+        with patch("studio.services.workflow_templates.WorkflowBuilder") as builder:
+            templates = WorkflowTemplateCache()
+            first = templates.get("AgentReadNode", "read", {"id": "agent-1"})
+            second = templates.get("AgentReadNode", "read", {"id": "agent-2"})
+
+        assert first is second
+        builder.assert_called_once()
+
+    def test_different_shape_builds_new_workflow(self):
+        """A new parameter shape or node ID should build a new template."""
+        from studio.services.workflow_templates import WorkflowTemplateCache
+
+        with patch("studio.services.workflow_templates.WorkflowBuilder") as builder:
+            builder.return_value.build.side_effect = lambda: MagicMock()
+            templates = WorkflowTemplateCache()
+            templates.get("AgentListNode", "list", {"filter": {"id": "a"}})
+            templates.get("AgentListNode", "list", {"filter": {"name": "a"}})
+            templates.get("AgentListNode", "find", {"filter": {"id": "a"}})
+
+        assert len(templates) == 3
+
+    def test_template_config_holds_no_caller_data(self):
+        """Template node configs should contain typed placeholders only."""
+        from studio.services.workflow_templates import WorkflowTemplateCache
+
+        with patch("studio.services.workflow_templates.WorkflowBuilder") as builder:
+            WorkflowTemplateCache().get(
+                "UserListNode",
+                "find",
+                {"filter": {"email": "a@example.com"}, "limit": 1, "tags": ["x"]},
+            )
+
+        _, _, config = builder.return_value.add_node.call_args.args
+        assert config == {"filter": {"email": ""}, "limit": 0, "tags": []}
+
+    def test_least_recently_used_template_is_evicted(self):
+        """The cache should drop the least recently used template when full."""
+        from studio.services.workflow_templates import WorkflowTemplateCache
+
+        with patch("studio.services.workflow_templates.WorkflowBuilder") as builder:
+            builder.return_value.build.side_effect = lambda: MagicMock()
+            templates = WorkflowTemplateCache(max_entries=2)
+            read = templates.get("AgentReadNode", "read", {"id": "a"})
+            templates.get("UserReadNode", "read", {"id": "a"})
+            templates.get("AgentReadNode", "read", {"id": "b"})
+            templates.get("AuditLogReadNode", "read", {"id": "a"})
+
+            assert len(templates) == 2
+            assert templates.get("AgentReadNode", "read", {"id": "c"}) is read
+            assert builder.call_count == 3
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(1)
+class TestExecuteNode:
+    """Test execution through templates."""
+
+    @pytest.mark.asyncio
+    async def test_params_are_bound_through_inputs(self):
+        """Call parameters should be passed as node-scoped runtime inputs."""
+        from studio.services.workflow_templates import (
+            WorkflowTemplateCache,
+            execute_node,
+        )
+
+        runtime = MagicMock()
+        runtime.execute_workflow_async = AsyncMock(
+            return_value=({"read": {"id": "agent-1"}}, "run-1")
+        )
+
+        with (
+            patch("studio.services.workflow_templates.WorkflowBuilder") as builder,
+            patch(
+                "studio.services.workflow_templates.get_template_cache",
+                return_value=WorkflowTemplateCache(),
+            ),
+        ):
+            results = await execute_node(
+                runtime, "AgentReadNode", "read", {"id": "agent-1"}
+            )
+
+        assert results == {"read": {"id": "agent-1"}}
+        runtime.execute_workflow_async.assert_awaited_once_with(
+            builder.return_value.build.return_value,
+            inputs={"read": {"id": "agent-1"}},
+        )
@@ -0,0 +1,104 @@
+"""
+Tier 1: Write-Behind Queue Unit Tests
+
+Tests background execution, backpressure, error handling and shutdown of the
+WriteBehindQueue.
+"""
+
+import asyncio
+
+import pytest
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(1)
+class TestWriteBehindQueue:
+    """Test background bookkeeping writes."""
+
+    @pytest.mark.asyncio
+    async def test_submit_returns_before_write_runs(self):
+        """Queued writes should run in the background and finish on close."""
+        from studio.services.write_behind import WriteBehindQueue
+
+        written = []
+
+        async def write(value):
+            await asyncio.sleep(0.01)
+            written.append(value)
+
+        queue = WriteBehindQueue("test")
+        queue.start()
+        await queue.submit(write, "a")
+        await queue.submit(write, value="b")
+
+        assert written == []
+
+        await queue.close()
+
+        assert sorted(written) == ["a", "b"]
+        assert queue.running is False
+
+    @pytest.mark.asyncio
+    async def test_writes_run_inline_when_not_started(self):
+        """Without workers a write should complete before submit returns."""
+        from studio.services.write_behind import WriteBehindQueue
+
+        written = []
+
+        async def write(value):
+            written.append(value)
+
+        await WriteBehindQueue("test").submit(write, "a")
+
+        assert written == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_full_queue_writes_inline(self):
+        """A full queue should apply backpressure instead of dropping writes."""
+        from studio.services.write_behind import WriteBehindQueue
+
+        release = asyncio.Event()
+        written = []
+
+        async def blocked(value):
+            await release.wait()
+            written.append(value)
+
+        async def write(value):
+            written.append(value)
+
+        queue = WriteBehindQueue("test", max_size=1, workers=1)
+        queue.start()
+        await queue.submit(blocked, "worker")
+        await asyncio.sleep(0)  # worker picks up the first write
+        await queue.submit(blocked, "queued")
+        await queue.submit(write, "inline")
+
+        assert written == ["inline"]
+
+        release.set()
+        await queue.close()
+
+        assert written == ["inline", "worker", "queued"]
+
+    @pytest.mark.asyncio
+    async def test_failed_writes_are_logged_not_raised(self, caplog):
+        """A failing write should not stop the worker or reach the caller."""
+        from studio.services.write_behind import WriteBehindQueue
+
+        written = []
+
+        async def failing():
+            raise RuntimeError("db down")
+
+        async def write(value):
+            written.append(value)
+
+        queue = WriteBehindQueue("test", workers=1)
+        queue.start()
+        await queue.submit(failing)
+        await queue.submit(write, "a")
+        await queue.close()
+
+        assert written == ["a"]
+        assert "db down" in caplog.text